@@ -0,0 +1,101 @@
+"""
+Benchmark - Read-Modify-Write JSON Array vs Append-Only JSONL Activity Log
+
+Appends --entries entries to one day's /Logs file and reports the average
+cost of an append at increasing entry counts:
+
+    array   previous log_action(): load the day's JSON array, append,
+            rewrite the whole file with indent=2 (O(n) per append)
+    jsonl   ActivityLog.append(): one line appended (O(1) per append)
+
+The array run stops at --array-entries; it is quadratic over the day.
+
+Usage:
+    python benchmarks/bench_activity_log.py
+    python benchmarks/bench_activity_log.py --entries 100000 --array-entries 10000
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime, timezone
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import isolated_workspace
+
+CHECKPOINTS = (1000, 2500, 5000, 10000, 25000, 50000, 100000)
+WINDOW = 200  # Appends averaged at each checkpoint
+
+
+def array_log_action(logs: Path, action_data: dict) -> None:
+    """The previous orchestrator_claude.Orchestrator.log_action()."""
+    log_file = logs / f"{datetime.now(timezone.utc).strftime('%Y-%m-%d')}.json"
+    log_entry = {"timestamp": datetime.now(timezone.utc).isoformat(), **action_data}
+    try:
+        logs_list = json.loads(log_file.read_text(encoding='utf-8')) if log_file.exists() else []
+    except json.JSONDecodeError:
+        logs_list = []
+    logs_list.append(log_entry)
+    log_file.write_text(json.dumps(logs_list, indent=2, ensure_ascii=False), encoding='utf-8')
+
+
+def entry(i: int) -> dict:
+    return {
+        "action_type": "social_post",
+        "platform": "linkedin",
+        "task_id": f"TASK_{i:06d}",
+        "status": "success",
+        "result": {"status": "posted", "post_id": f"urn:li:share:{7000000000 + i}"}
+    }
+
+
+def run(append, total: int) -> dict:
+    """Average append time (µs) over WINDOW appends ending at each checkpoint."""
+    averages = {}
+    window = []
+    for i in range(1, total + 1):
+        started = time.perf_counter()
+        append(entry(i))
+        window.append(time.perf_counter() - started)
+        window = window[-WINDOW:]
+        if i in CHECKPOINTS:
+            averages[i] = sum(window) / len(window) * 1e6
+    return averages
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--entries", type=int, default=50000)
+    parser.add_argument("--array-entries", type=int, default=5000)
+    args = parser.parse_args()
+    
+    with isolated_workspace(vault_from_repo=False) as workspace:
+        from orchestration.activity_log import ActivityLog
+        
+        (workspace / "array").mkdir()
+        started = time.perf_counter()
+        array = run(lambda data: array_log_action(workspace / "array", data), args.array_entries)
+        array_total = time.perf_counter() - started
+        
+        activity = ActivityLog(workspace / "jsonl")
+        started = time.perf_counter()
+        jsonl = run(activity.append, args.entries)
+        jsonl_total = time.perf_counter() - started
+        
+        day = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        assert len(activity.read_day(day)) == args.entries
+    
+    print(f"{'entries in day':>14} {'array':>12} {'jsonl':>10}")
+    for checkpoint in CHECKPOINTS:
+        if checkpoint in array or checkpoint in jsonl:
+            array_us = f"{array[checkpoint]:>10.0f}us" if checkpoint in array else f"{'-':>12}"
+            jsonl_us = f"{jsonl[checkpoint]:>8.1f}us" if checkpoint in jsonl else f"{'-':>10}"
+            print(f"{checkpoint:>14} {array_us} {jsonl_us}")
+    print(f"\ntotal: array {args.array_entries} entries in {array_total:.1f}s, jsonl {args.entries} entries in {jsonl_total:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
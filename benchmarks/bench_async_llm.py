@@ -0,0 +1,99 @@
+"""
+Benchmark - Sync vs Async LLM Client Against a Rate-Limited Provider
+
+Fires --requests reason() calls from a --threads worker pool (like the
+concurrent orchestrator) at benchmarks/fake_llm_server.py, which enforces
+an RPM budget and a cap on concurrent requests the way real providers do.
+
+    sync    LLMInterface: shared SDK client, no client-side limits
+            (the SDK retries 429s/529s after the server tells it to)
+    async   AsyncLLMInterface: one event loop, concurrency cap, RPM bucket
+
+Reports sustained requests/sec, 429/529 responses seen by the server,
+failed calls, connections opened and per-call latency.
+
+Usage:
+    python benchmarks/bench_async_llm.py
+    python benchmarks/bench_async_llm.py --requests 600 --rpm 1200 --threads 32 --latency 0.2
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize
+from benchmarks.fake_llm_server import FakeLLMServer
+
+
+def run(mode: str, args) -> dict:
+    server = FakeLLMServer(rpm=args.rpm, latency=args.latency, max_inflight=args.server_concurrency).start()
+    os.environ.update({
+        "LLM_PROVIDER": "anthropic",
+        "ANTHROPIC_API_KEY": "bench",
+        "ANTHROPIC_BASE_URL": server.base_url,
+        "ANTHROPIC_RPM_LIMIT": str(args.rpm),
+        "ANTHROPIC_MAX_CONCURRENCY": str(args.server_concurrency),
+    })
+    
+    from orchestration import async_llm_interface
+    from orchestration.llm_interface import LLMInterface
+    async_llm_interface._provider_limits.clear()
+    llm = async_llm_interface.AsyncLLMInterface() if mode == "async" else LLMInterface()
+    
+    latencies = []
+    
+    def call(i: int) -> bool:
+        started = time.perf_counter()
+        result = llm.reason({"task_id": f"bench_{i}", "type": "email", "data": {"subject": f"Message {i}"}}, {})
+        latencies.append(time.perf_counter() - started)
+        return "error" not in result
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        succeeded = sum(pool.map(call, range(args.requests)))
+    elapsed = time.perf_counter() - started
+    
+    if mode == "async":
+        llm.close()
+    server.stop()
+    
+    latency = summarize(latencies)
+    return {
+        "rps": succeeded / elapsed,
+        "failed": args.requests - succeeded,
+        "rate_limited": server.stats["rate_limited"],
+        "overloaded": server.stats["overloaded"],
+        "connections": server.stats["connections"],
+        "p50_ms": latency["p50"] * 1000,
+        "p99_ms": latency["p99"] * 1000
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--threads", type=int, default=32, help="Orchestrator worker threads")
+    parser.add_argument("--rpm", type=float, default=1200, help="Provider requests-per-minute budget")
+    parser.add_argument("--server-concurrency", type=int, default=16, help="Provider concurrent-request cap")
+    parser.add_argument("--latency", type=float, default=0.2, help="Provider seconds per response")
+    args = parser.parse_args()
+    
+    print(f"{args.requests} calls from {args.threads} threads; provider: {args.rpm:.0f} RPM "
+          f"({args.rpm / 60:.1f}/s), {args.server_concurrency} concurrent, {args.latency}s latency\n")
+    print(f"{'client':>6} {'req/s':>7} {'failed':>7} {'429s':>6} {'529s':>6} {'conns':>6} {'p50':>9} {'p99':>9}")
+    
+    for mode in ("sync", "async"):
+        r = run(mode, args)
+        print(
+            f"{mode:>6} {r['rps']:>7.1f} {r['failed']:>7} {r['rate_limited']:>6} {r['overloaded']:>6} "
+            f"{r['connections']:>6} {r['p50_ms']:>7.0f}ms {r['p99_ms']:>7.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark - Synchronous vs Buffered AuditLogger
+
+Calls AuditLogger.log() from --threads threads (like orchestrator workers
+logging claims, reasoning and per-action results) and reports log()
+calls/sec and caller-side latency for:
+
+    sync              open/append/close per call on the caller's thread
+    buffered/never    background flusher, no fsync
+    buffered/interval background flusher, fsync at most every second
+    buffered/batch    background flusher, fsync after every batch
+
+Every run ends with verify_all_logs(), so the entry count and signatures
+are checked after the drain.
+
+Usage:
+    python benchmarks/bench_audit_logger.py
+    python benchmarks/bench_audit_logger.py --calls 50000 --threads 8
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import isolated_workspace, reset_singletons, summarize
+
+MODES = {
+    "sync": {"AUDIT_LOG_BUFFERED": "false"},
+    "buffered/never": {"AUDIT_LOG_BUFFERED": "true", "AUDIT_LOG_FSYNC": "never"},
+    "buffered/interval": {"AUDIT_LOG_BUFFERED": "true", "AUDIT_LOG_FSYNC": "interval"},
+    "buffered/batch": {"AUDIT_LOG_BUFFERED": "true", "AUDIT_LOG_FSYNC": "batch"},
+}
+
+
+def run(mode: str, args) -> dict:
+    with isolated_workspace(vault_from_repo=False):
+        os.environ.update(MODES[mode])
+        reset_singletons()
+        
+        from orchestration.audit_logger import get_audit_logger
+        audit = get_audit_logger()
+        per_thread = args.calls // args.threads
+        
+        def worker(worker_id: int) -> list:
+            latencies = []
+            for i in range(per_thread):
+                started = time.perf_counter()
+                audit.log(
+                    action="mcp_action_email_server_send",
+                    task_id=f"task_{worker_id}_{i // 4}",
+                    result="success",
+                    details={"action_id": f"task_{worker_id}_{i // 4}_action_{i % 4}", "parameters": {"to": "a@b.example"}}
+                )
+                latencies.append(time.perf_counter() - started)
+            return latencies
+        
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            latencies = [sample for samples in pool.map(worker, range(args.threads)) for sample in samples]
+        elapsed = time.perf_counter() - started
+        
+        drain_started = time.perf_counter()
+        audit.close()
+        drain = time.perf_counter() - drain_started
+        
+        verified = audit.verify_all_logs()
+        stats = dict(audit.writer_stats)
+        reset_singletons()
+    
+    latency = summarize(latencies)
+    return {
+        "calls_per_sec": len(latencies) / elapsed,
+        "p50_us": latency["p50"] * 1e6,
+        "p99_us": latency["p99"] * 1e6,
+        "drain_ms": drain * 1000,
+        "entries": verified["total_entries"],
+        "integrity": verified["integrity"],
+        "batches": stats["batches"],
+        "fsyncs": stats["fsyncs"]
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=20000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+    
+    print(f"{args.calls} log() calls from {args.threads} threads\n")
+    print(f"{'mode':<18} {'calls/s':>9} {'p50':>8} {'p99':>8} {'drain':>8} {'batches':>8} {'fsyncs':>7} {'entries':>8}")
+    
+    for mode in MODES:
+        r = run(mode, args)
+        print(
+            f"{mode:<18} {r['calls_per_sec']:>9.0f} {r['p50_us']:>6.0f}us {r['p99_us']:>6.0f}us "
+            f"{r['drain_ms']:>6.0f}ms {r['batches']:>8} {r['fsyncs']:>7} {r['entries']:>8} {r['integrity']}"
+        )
+
+
+if __name__ == "__main__":
+    main()
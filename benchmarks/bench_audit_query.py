@@ -0,0 +1,150 @@
+"""
+Benchmark - Indexed vs Full-Scan Audit Log Queries
+
+Writes a synthetic year of daily audit logs (--days x --per-day entries,
+shaped like real orchestrator entries) and times AuditLogger.get_logs()
+against the previous implementation, which opened and parsed every
+audit_*.jsonl for every query:
+
+    scan      previous get_logs(): every file, every line, filters in Python
+    cold      new AuditLogger: date pruning + per-day .idx sidecars from disk
+    warm      same instance again (indexes already in memory)
+
+The sidecars are built by one catch-up pass (reported separately); in
+normal operation they are written at append time.
+
+Usage:
+    python benchmarks/bench_audit_query.py
+    python benchmarks/bench_audit_query.py --days 365 --per-day 8000
+"""
+
+import sys
+import json
+import time
+import random
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import isolated_workspace, reset_singletons
+
+ACTIONS = [
+    ("task_claimed", 1), ("llm_reasoning", 1), ("mcp_action_email_server_send", 2),
+    ("mcp_action_odoo_server_search_read", 1), ("task_completed", 1), ("hitl_approval_requested", 0.1)
+]
+
+
+def write_year(log_path: Path, days: int, per_day: int, seed: int = 7) -> int:
+    """Synthetic daily logs ending today; returns the number of entries."""
+    rng = random.Random(seed)
+    actions = [name for name, weight in ACTIONS for _ in range(int(weight * 10))]
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    total = 0
+    
+    for day_number in range(days):
+        day = today - timedelta(days=days - 1 - day_number)
+        lines = []
+        for i in range(per_day):
+            timestamp = day + timedelta(seconds=i * 86400 / per_day)
+            task_id = f"task_{day_number:03d}_{i // 6:05d}"
+            entry = {
+                "timestamp": timestamp.isoformat(),
+                "action": rng.choice(actions),
+                "task_id": task_id,
+                "result": "success",
+                "details": {"action_id": f"{task_id}_action_{i % 6}", "latency_ms": rng.randint(5, 900)},
+                "error": None,
+                "signature": hashlib.sha256(f"{day_number}:{i}".encode()).hexdigest()
+            }
+            lines.append(json.dumps(entry) + "\n")
+        with open(log_path / f"audit_{day.strftime('%Y-%m-%d')}.jsonl", "w", encoding="utf-8") as f:
+            f.write("".join(lines))
+        total += per_day
+    
+    return total
+
+
+def scan_get_logs(log_path: Path, task_id=None, action=None, start_date=None, end_date=None) -> list:
+    """The previous AuditLogger.get_logs(): full scan of every file."""
+    matching_entries = []
+    for log_file in sorted(log_path.glob("audit_*.jsonl")):
+        with open(log_file, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = json.loads(line.strip())
+                if task_id and entry.get("task_id") != task_id:
+                    continue
+                if action and entry.get("action") != action:
+                    continue
+                if start_date or end_date:
+                    entry_time = datetime.fromisoformat(entry["timestamp"])
+                    if start_date and entry_time < start_date:
+                        continue
+                    if end_date and entry_time > end_date:
+                        continue
+                matching_entries.append(entry)
+    return matching_entries
+
+
+def timed(function, *args, **kwargs):
+    started = time.perf_counter()
+    result = function(*args, **kwargs)
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--per-day", type=int, default=3000)
+    parser.add_argument("--skip-scan", action="store_true", help="Skip the (slow) full-scan baseline")
+    args = parser.parse_args()
+    
+    with isolated_workspace(vault_from_repo=False) as workspace:
+        log_path = workspace / "audit_logs"
+        log_path.mkdir(exist_ok=True)
+        
+        elapsed, total = timed(write_year, log_path, args.days, args.per_day)
+        size_mb = sum(f.stat().st_size for f in log_path.glob("*.jsonl")) / 1e6
+        print(f"{total:,} entries over {args.days} days ({size_mb:.0f} MB) written in {elapsed:.1f}s")
+        
+        from orchestration.audit_logger import AuditLogger
+        now = datetime.now(timezone.utc)
+        middle_task = f"task_{args.days // 2:03d}_00042"
+        
+        # One catch-up pass writes every sidecar (normally done at append time)
+        elapsed, _ = timed(lambda: [AuditLogger().index.lookup(f, action="task_claimed") for f in sorted(log_path.glob("*.jsonl"))])
+        index_mb = sum(f.stat().st_size for f in log_path.glob("*.idx")) / 1e6
+        print(f"Index built in {elapsed:.1f}s ({index_mb:.0f} MB of sidecars)\n")
+        
+        queries = [
+            ("one task, whole year", {"task_id": middle_task}),
+            ("one task, last 30 days", {"task_id": "task_000_00001", "start_date": now - timedelta(days=30)}),
+            ("action, last 7 days", {"action": "hitl_approval_requested", "start_date": now - timedelta(days=7)}),
+            ("action + task", {"action": "task_completed", "task_id": middle_task}),
+            ("all entries, last day", {"start_date": now - timedelta(days=1)}),
+        ]
+        
+        print(f"{'query':<26} {'matches':>8} {'scan':>10} {'cold':>10} {'warm':>10} {'speedup':>8}")
+        for name, filters in queries:
+            audit = AuditLogger()
+            cold, indexed = timed(audit.get_logs, **filters)
+            warm, _ = timed(audit.get_logs, **filters)
+            
+            if args.skip_scan:
+                scan, scanned = float("nan"), indexed
+            else:
+                scan, scanned = timed(scan_get_logs, log_path, **filters)
+            assert len(scanned) == len(indexed), (name, len(scanned), len(indexed))
+            
+            print(
+                f"{name:<26} {len(indexed):>8} {scan * 1000:>8.0f}ms {cold * 1000:>8.1f}ms "
+                f"{warm * 1000:>8.2f}ms {scan / warm:>7.0f}x"
+            )
+        
+        reset_singletons()
+
+
+if __name__ == "__main__":
+    main()
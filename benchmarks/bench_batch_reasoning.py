@@ -0,0 +1,116 @@
+"""
+Benchmark - Batched vs Per-Task LLM Reasoning
+
+Replays the social/Odoo bursts in task_queue/inbox_archived (repeated up to
+--tasks) through LLMInterface against a simulated Anthropic endpoint, once
+with one reason() call per task and once per LLM_BATCH_SIZE, grouping
+tasks the way the orchestrator does (priority, type, trigger, skills).
+
+Reports per task: requests, input tokens (billed-equivalent, cache reads
+0.1x and writes 1.25x), output tokens and wall time.
+
+Usage:
+    python benchmarks/bench_batch_reasoning.py
+    python benchmarks/bench_batch_reasoning.py --tasks 300 --batch-sizes 1 5 10 --decode-us 5000
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import REPO_ROOT, StubLLM, SimulatedAnthropic, isolated_workspace, install_llm, reset_singletons
+
+
+def load_burst(count: int) -> list:
+    """Archived watcher tasks, cycled with fresh IDs."""
+    archived = [
+        json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted((REPO_ROOT / "task_queue" / "inbox_archived").glob("*.json"))
+    ]
+    tasks = []
+    for i in range(count):
+        task = dict(archived[i % len(archived)])
+        task["task_id"] = f"{task['task_id']}_{i}"
+        tasks.append(task)
+    return tasks
+
+
+def run(tasks: list, batch_size: int, args) -> dict:
+    with isolated_workspace():
+        os.environ["LLM_PROVIDER"] = "anthropic"
+        os.environ["ANTHROPIC_API_KEY"] = "bench"
+        os.environ["LLM_BATCH_SIZE"] = str(batch_size)
+        
+        install_llm(StubLLM(latency=0))
+        from orchestration.orchestrator import Orchestrator
+        from orchestration.llm_interface import LLMInterface
+        from orchestration.inbox_index import task_group
+        
+        orchestrator = Orchestrator()
+        llm = LLMInterface()
+        llm.client = SimulatedAnthropic(args.base_ms, args.prefill_us, args.decode_us, args.plan_tokens)
+        context = orchestrator._get_vault_context()
+        
+        # Group like claim_batch(): consecutive tasks of the same group, up to batch_size
+        groups: dict = {}
+        for task in tasks:
+            task = orchestrator.skill_mapper.add_skills_to_task(dict(task))
+            groups.setdefault(task_group(task), []).append(task)
+        
+        started = time.perf_counter()
+        
+        for group in groups.values():
+            skills = orchestrator.load_agent_skills(group[0]["required_skills"])
+            for i in range(0, len(group), batch_size):
+                chunk = group[i:i + batch_size]
+                if len(chunk) == 1:
+                    results = [llm.reason(chunk[0], skills, context)]
+                else:
+                    results = llm.reason_batch(chunk, skills, context)
+                assert all("error" not in r for r in results)
+        
+        elapsed = time.perf_counter() - started
+        stats = llm.get_stats()
+        fresh = stats["input_tokens"] - stats["cached_input_tokens"] - stats["cache_write_tokens"]
+        billed = fresh + stats["cached_input_tokens"] * 0.1 + stats["cache_write_tokens"] * 1.25
+        output_tokens = stats["output_tokens"]
+        reset_singletons()
+        
+        return {
+            "requests": llm.client.requests,
+            "input_per_task": billed / len(tasks),
+            "output_per_task": output_tokens / len(tasks),
+            "ms_per_task": elapsed * 1000 / len(tasks)
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=200)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 5, 10])
+    parser.add_argument("--base-ms", type=float, default=300.0, help="Simulated fixed latency per request")
+    parser.add_argument("--prefill-us", type=float, default=20.0, help="Simulated prefill cost per uncached input token")
+    parser.add_argument("--decode-us", type=float, default=1000.0, help="Simulated decode cost per output token")
+    parser.add_argument("--plan-tokens", type=int, default=150, help="Output tokens per plan")
+    args = parser.parse_args()
+    
+    tasks = load_burst(args.tasks)
+    print(f"{len(tasks)} archived burst tasks, simulated provider "
+          f"({args.base_ms}ms + {args.prefill_us}us/in token + {args.decode_us}us/out token)\n")
+    print(f"{'batch':>6} {'requests':>9} {'in tok/task':>12} {'out tok/task':>13} {'ms/task':>9}")
+    
+    for batch_size in args.batch_sizes:
+        r = run(tasks, batch_size, args)
+        print(
+            f"{batch_size:>6} {r['requests']:>9} {r['input_per_task']:>12.0f} "
+            f"{r['output_per_task']:>13.0f} {r['ms_per_task']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
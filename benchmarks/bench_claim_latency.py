@@ -0,0 +1,107 @@
+"""
+Benchmark - Watcher → Orchestrator Claim Latency
+
+Drops tasks through BaseWatcher.create_task at random intervals and reads
+claim latency percentiles (p50/p99) back from the audit log, once with
+fixed-interval polling and once with event-driven wakeup. Also counts
+directory scans made by an idle orchestrator.
+
+Usage:
+    python benchmarks/bench_claim_latency.py
+    python benchmarks/bench_claim_latency.py --tasks 50 --poll-interval 10
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import threading
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "watchers"))
+
+from benchmarks.common import StubLLM, isolated_workspace, install_llm
+
+
+def run(mode: str, task_count: int, poll_interval: float, idle_seconds: float) -> dict:
+    with isolated_workspace():
+        os.environ["ORCHESTRATOR_EVENT_WAKEUP"] = "true" if mode == "event" else "false"
+        os.environ["TASK_QUEUE_CHECK_INTERVAL"] = str(poll_interval)
+        install_llm(StubLLM(latency=0.005))
+        
+        from base_watcher import BaseWatcher
+        from orchestration.orchestrator import Orchestrator
+        from orchestration.audit_logger import get_audit_logger
+        
+        class BenchWatcher(BaseWatcher):
+            def on_event(self, event_data: Any) -> None:
+                self.create_task("file_process", {"n": event_data}, required_skills=["planning_skills"])
+            
+            def start(self) -> None:
+                self.running = True
+            
+            def stop(self) -> None:
+                self.running = False
+        
+        orchestrator = Orchestrator()
+        watcher = BenchWatcher("bench_watcher")
+        
+        # Count directory scans (every queue scan goes through Path.glob)
+        scans = {"count": 0}
+        original_glob = Path.glob
+        
+        def counting_glob(self, pattern):
+            scans["count"] += 1
+            return original_glob(self, pattern)
+        
+        Path.glob = counting_glob
+        try:
+            runner = threading.Thread(target=orchestrator.start, daemon=True)
+            runner.start()
+            time.sleep(0.5)
+            
+            # Idle window: no tasks arriving
+            scans["count"] = 0
+            time.sleep(idle_seconds)
+            idle_scans = scans["count"]
+            
+            rng = random.Random(42)
+            for n in range(task_count):
+                watcher.on_event(n)
+                time.sleep(rng.uniform(0.05, 0.3))
+            
+            while orchestrator.archive.count() < task_count:
+                time.sleep(0.05)
+            
+            orchestrator.stop()
+            runner.join()
+        finally:
+            Path.glob = original_glob
+        
+        stats = get_audit_logger().get_claim_latency_stats()
+        stats["idle_scans_per_sec"] = idle_scans / idle_seconds
+        return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=30)
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="TASK_QUEUE_CHECK_INTERVAL for polling mode")
+    parser.add_argument("--idle-seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    
+    print(f"{args.tasks} tasks, polling interval {args.poll_interval}s\n")
+    print(f"{'mode':>8} {'p50 ms':>10} {'p99 ms':>10} {'max ms':>10} {'idle scans/s':>13}")
+    for mode in ["poll", "event"]:
+        stats = run(mode, args.tasks, args.poll_interval, args.idle_seconds)
+        print(
+            f"{mode:>8} {stats['p50_ms']:>10.1f} {stats['p99_ms']:>10.1f} "
+            f"{stats['max_ms']:>10.1f} {stats['idle_scans_per_sec']:>13.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
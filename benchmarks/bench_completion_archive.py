@@ -0,0 +1,132 @@
+"""
+Benchmark - Completed-Task Reads: Flat Directory vs Day Shards vs Segments
+
+Builds a completed/ archive of --tasks task files spread evenly over --days
+days, then times the reads the hot paths make and counts their filesystem
+calls, in three layouts of the same data:
+
+    flat        the previous layout: every file directly in completed/
+                (reads as the old code did: glob, stat() every file, sort)
+    sharded     after CompletionArchive.migrate(): completed/YYYY-MM-DD/
+    compacted   after compact(): shards older than --compact-days packed
+                into gzip segments with a manifest
+
+Reads:
+    last 24h    LinkedIn/Twitter "recent completions" window
+    latest 10   dashboard recent-completions ring at startup
+    count       tenant stats / dashboard total (first call, then repeated)
+
+Runs with a warm page cache.
+
+Usage:
+    python benchmarks/bench_completion_archive.py
+    python benchmarks/bench_completion_archive.py --tasks 1000000 --days 365
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import counting_fs_calls, isolated_workspace
+
+DAY = 86400
+
+
+def fill_flat(completed: Path, tasks: int, days: int) -> None:
+    """Write task files with mtimes spread evenly over the last `days` days."""
+    completed.mkdir(parents=True, exist_ok=True)
+    now = time.time()
+    for i in range(tasks):
+        task_file = completed / f"TASK_{i:07d}.json"
+        with open(task_file, 'w', encoding='utf-8') as f:
+            json.dump({"task_id": f"TASK_{i:07d}", "type": "file_process", "status": "completed"}, f)
+        when = now - (tasks - i) * days * DAY / tasks
+        os.utime(task_file, (when, when))
+
+
+def flat_reads(completed: Path) -> dict:
+    """The previous readers (LinkedIn watcher, update_dashboard, tenant stats)."""
+    cutoff = time.time() - DAY
+    return {
+        "last 24h": lambda: [f for f in completed.glob("*.json") if f.stat().st_mtime > cutoff],
+        "latest 10": lambda: sorted(completed.glob("*.json"), key=lambda f: f.stat().st_mtime, reverse=True)[:10],
+        "count": lambda: len(list(completed.glob("*.json"))),
+        "count again": lambda: len(list(completed.glob("*.json")))
+    }
+
+
+def archive_reads(archive) -> dict:
+    return {
+        "last 24h": lambda: list(archive.iter_entries(since=time.time() - DAY)),
+        "latest 10": lambda: archive.latest(10),
+        "count": archive.count,
+        "count again": archive.count
+    }
+
+
+def measure(reads: dict) -> dict:
+    results = {}
+    for name, read in reads.items():
+        counts: dict = {}
+        started = time.perf_counter()
+        with counting_fs_calls(counts):
+            found = read()
+        elapsed = time.perf_counter() - started
+        results[name] = {
+            "seconds": elapsed,
+            "found": found if isinstance(found, int) else len(found),
+            "stat": counts.get("stat", 0),
+            "entries": counts.get("entries", 0),
+            "scandir": counts.get("scandir", 0),
+            "open": counts.get("open", 0)
+        }
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--compact-days", type=int, default=7)
+    args = parser.parse_args()
+    
+    with isolated_workspace(vault_from_repo=False) as workspace:
+        from orchestration.completion_archive import CompletionArchive
+        
+        completed = workspace / "task_queue" / "completed"
+        started = time.perf_counter()
+        fill_flat(completed, args.tasks, args.days)
+        print(f"{args.tasks} tasks over {args.days} days written in {time.perf_counter() - started:.0f}s\n")
+        
+        layouts = {"flat": measure(flat_reads(completed))}
+        
+        archive = CompletionArchive(completed)
+        started = time.perf_counter()
+        archive.migrate()
+        migrate_seconds = time.perf_counter() - started
+        layouts["sharded"] = measure(archive_reads(archive))
+        
+        started = time.perf_counter()
+        archive.compact(args.compact_days)
+        compact_seconds = time.perf_counter() - started
+        layouts["compacted"] = measure(archive_reads(archive))
+        segment_mb = sum(p.stat().st_size for p in archive.segments.glob("*.jsonl.gz")) / 1024 / 1024
+    
+    print(f"{'read':<11} {'layout':<10} {'time':>10} {'found':>8} {'stat':>9} {'entries':>9} {'scandir':>8} {'open':>6}")
+    for read in ("last 24h", "latest 10", "count", "count again"):
+        for layout, results in layouts.items():
+            r = results[read]
+            print(
+                f"{read:<11} {layout:<10} {r['seconds'] * 1000:>8.1f}ms {r['found']:>8} "
+                f"{r['stat']:>9} {r['entries']:>9} {r['scandir']:>8} {r['open']:>6}"
+            )
+    print(f"\nmigrate: {migrate_seconds:.0f}s, compact: {compact_seconds:.0f}s, segments: {segment_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
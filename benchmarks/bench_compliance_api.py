@@ -0,0 +1,97 @@
+"""
+Benchmark - Compliance Logging Cost per API Request vs Day-File Size
+
+Every platinum/api.py request that logs (e.g. create_task) used to build a
+new ComplianceLogger(tenant_id), whose constructor readlines() the whole
+day file to find the chain head. Times the compliance part of a request
+for growing day files:
+
+    before      new logger per request, head read with readlines()
+    per-request new logger per request, head read from the file tail
+    registry    get_compliance_logger(): head kept in memory
+
+The day file is filled with copies of one signed entry; only its size
+matters here (chain correctness is covered by tests/test_compliance_logger.py).
+
+Usage:
+    python benchmarks/bench_compliance_api.py
+    python benchmarks/bench_compliance_api.py --sizes-mb 1 10 100 1000 --requests 500
+"""
+
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import isolated_workspace, reset_singletons, summarize
+
+TENANT = "tenant_bench"
+
+
+def legacy_logger_class():
+    from platinum.compliance_logger import ComplianceLogger
+    
+    class LegacyComplianceLogger(ComplianceLogger):
+        """ComplianceLogger with the previous readlines() chain-head lookup."""
+        
+        def _get_last_log_hash(self) -> str:
+            log_file = self._get_log_file_path()
+            if not log_file.exists():
+                return "0" * 64
+            with open(log_file, 'r') as f:
+                lines = f.readlines()
+                if lines:
+                    return json.loads(lines[-1]).get('chain_hash', "0" * 64)
+            return "0" * 64
+    
+    return LegacyComplianceLogger
+
+
+def fill_day_file(size_mb: int) -> None:
+    from platinum.compliance_logger import ComplianceLogger
+    seed = ComplianceLogger(TENANT)
+    seed.log_action("task_created_via_api", {"task_id": "TASK_seed", "title": "Seed " + "x" * 200})
+    log_file = seed._get_log_file_path()
+    
+    line = log_file.read_bytes()
+    copies = max(1, size_mb * 1024 * 1024 // len(line))
+    with open(log_file, 'wb') as f:
+        for written in range(0, copies, 10000):
+            f.write(line * min(10000, copies - written))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", type=int, nargs="+", default=[1, 10, 100, 500])
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    
+    print(f"{'day file':>9} {'mode':<12} {'p50':>9} {'p99':>9}")
+    for size_mb in args.sizes_mb:
+        with isolated_workspace(vault_from_repo=False):
+            reset_singletons()
+            from platinum.compliance_logger import ComplianceLogger, get_compliance_logger
+            fill_day_file(size_mb)
+            legacy = legacy_logger_class()
+            
+            modes = {
+                "before": lambda: legacy(TENANT),
+                "per-request": lambda: ComplianceLogger(TENANT),
+                "registry": lambda: get_compliance_logger(TENANT),
+            }
+            for mode, make in modes.items():
+                latencies = []
+                for i in range(args.requests):
+                    started = time.perf_counter()
+                    make().log_action("task_created_via_api", {"task_id": f"TASK_{i}", "title": "Bench"}, "low")
+                    latencies.append(time.perf_counter() - started)
+                stats = summarize(latencies)
+                print(f"{size_mb:>7}MB {mode:<12} {stats['p50'] * 1000:>7.2f}ms {stats['p99'] * 1000:>7.2f}ms")
+            reset_singletons()
+
+
+if __name__ == "__main__":
+    main()
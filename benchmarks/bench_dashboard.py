@@ -0,0 +1,144 @@
+"""
+Benchmark - Filesystem Calls per Idle Orchestrator Loop vs completed/ Size
+
+Fills task_queue/completed/ with --completed task files, then runs idle
+main-loop passes (what a fallback/polling wakeup does when there is no
+work) and counts the filesystem calls each pass makes:
+
+    before   previous update_dashboard(): globs every queue, stat()s and
+             sorts all of completed/ for the 10 newest, rewrites Dashboard.md
+    after    QueueState counters; Dashboard.md re-rendered only when its
+             content changes, via temp file + rename
+
+Calls are counted at the Python level (os.stat/lstat, os.scandir, open,
+os.replace/rename); "entries" is the number of directory entries those
+scans returned, and syscr/syscw are the read()/write() syscalls from
+/proc/self/io (Linux only).
+
+Usage:
+    python benchmarks/bench_dashboard.py
+    python benchmarks/bench_dashboard.py --completed 100000 --passes 20
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime, timezone
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import StubLLM, counting_fs_calls, install_llm, isolated_workspace, summarize
+
+
+def legacy_orchestrator_class():
+    from orchestration.orchestrator import Orchestrator
+    
+    class LegacyOrchestrator(Orchestrator):
+        """Orchestrator with the previous glob-and-sort dashboard."""
+        
+        def update_dashboard(self) -> None:
+            inbox_count = len(list(self.inbox.glob("*.json")))
+            pending_count = len(list(self.pending.glob("*.json")))
+            approval_count = len(list(self.approvals.glob("*.json")))
+            completed_files = sorted(
+                self.completed.glob("*.json"),
+                key=lambda x: x.stat().st_mtime,
+                reverse=True
+            )[:10]
+            dashboard = (
+                f"**Last Updated**: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC\n"
+                f"{self._legacy_active_task_summary()}\n"
+                f"{inbox_count} {pending_count} {approval_count} {len(completed_files)}\n"
+                f"{self.vault_path.exists()} {Path('./audit_logs').exists()}\n"
+            )
+            with open(self.dashboard_path, 'w', encoding='utf-8') as f:
+                f.write(dashboard)
+        
+        def _legacy_active_task_summary(self) -> str:
+            pending_files = list(self.pending.glob("*.json"))
+            if not pending_files:
+                return "*None - waiting for new tasks*"
+            with open(pending_files[0], 'r') as f:
+                task = json.load(f)
+            return f"**{task.get('type')}** (ID: {task.get('task_id')[:8]}...)"
+    
+    return LegacyOrchestrator
+
+
+def idle_pass(orchestrator, legacy: bool) -> None:
+    """One polling-mode loop pass with nothing to do (all wake reasons set)."""
+    orchestrator._cleanup_stuck_tasks()
+    orchestrator._check_hitl_approvals()
+    if not legacy:
+        orchestrator.queue_state.rescan()
+    orchestrator.claim_tasks(limit=orchestrator.max_workers)
+    orchestrator.update_dashboard()
+
+
+def proc_io() -> dict:
+    try:
+        with open("/proc/self/io") as f:
+            return {k: int(v) for k, v in (line.split(": ") for line in f)}
+    except OSError:
+        return {"syscr": 0, "syscw": 0}
+
+
+def fill_completed(completed: Path, count: int) -> None:
+    completed.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        with open(completed / f"TASK_{i:07d}.json", 'w', encoding='utf-8') as f:
+            json.dump({"task_id": f"TASK_{i:07d}", "type": "file_process", "status": "completed"}, f)
+
+
+def run(mode: str, completed: int, passes: int) -> dict:
+    with isolated_workspace(vault_from_repo=False) as workspace:
+        os.environ["ORCHESTRATOR_EVENT_WAKEUP"] = "false"
+        install_llm(StubLLM(latency=0))
+        fill_completed(workspace / "task_queue" / "completed", completed)
+        
+        from orchestration.orchestrator import Orchestrator
+        started = time.perf_counter()
+        orchestrator = legacy_orchestrator_class()() if mode == "before" else Orchestrator()
+        startup = time.perf_counter() - started
+        
+        idle_pass(orchestrator, mode == "before")  # Warm up: first render
+        
+        counts: dict = {}
+        latencies = []
+        io_before = proc_io()
+        with counting_fs_calls(counts):
+            for _ in range(passes):
+                started = time.perf_counter()
+                idle_pass(orchestrator, mode == "before")
+                latencies.append(time.perf_counter() - started)
+        io_after = proc_io()
+        
+        per_pass = {name: value / passes for name, value in counts.items()}
+        per_pass["syscr"] = (io_after["syscr"] - io_before["syscr"]) / passes
+        per_pass["syscw"] = (io_after["syscw"] - io_before["syscw"]) / passes
+        return {"startup": startup, "latency": summarize(latencies), "calls": per_pass}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--completed", type=int, default=100000)
+    parser.add_argument("--passes", type=int, default=20)
+    args = parser.parse_args()
+    
+    columns = ("stat", "scandir", "entries", "open", "replace", "syscr", "syscw")
+    print(f"completed/: {args.completed} files, {args.passes} idle passes\n")
+    print(f"{'mode':<7} " + " ".join(f"{c:>8}" for c in columns) + f" {'p50':>9} {'p99':>9} {'startup':>8}")
+    for mode in ("before", "after"):
+        result = run(mode, args.completed, args.passes)
+        calls, stats = result["calls"], result["latency"]
+        print(
+            f"{mode:<7} " + " ".join(f"{calls.get(c, 0):>8.0f}" for c in columns)
+            + f" {stats['p50'] * 1000:>7.2f}ms {stats['p99'] * 1000:>7.2f}ms {result['startup']:>7.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""
+Benchmark - Watcher Processed-Key State: JSON State File vs DedupeStore
+
+Seeds --keys processed keys, then measures what a watcher pays:
+
+    startup     loading the state when the watcher starts
+    check       one watcher check: --lookups membership tests (new keys
+                and already-processed ones), then --new keys marked processed
+                and persisted
+
+    json-state    previous watchers: task_queue/.<name>_watcher_state.json
+                  loaded into a set; every save rewrites the whole list
+    dedupe-store  orchestration/dedupe_store.DedupeStore (SQLite WAL),
+                  seeded by importing that JSON file once
+
+Usage:
+    python benchmarks/bench_dedupe_store.py
+    python benchmarks/bench_dedupe_store.py --keys 100000 --checks 50
+"""
+
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+from pathlib import Path
+from datetime import datetime
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import isolated_workspace, summarize
+from orchestration.dedupe_store import DedupeStore
+
+
+def key(i: int) -> str:
+    return f"done_invoice:project_report_{i:08d}.md"
+
+
+class LegacyState:
+    """The old _load_state/_save_state pair."""
+    
+    def __init__(self, state_file: Path):
+        self.state_file = state_file
+        with open(self.state_file, 'r') as f:
+            self.processed_items = set(json.load(f).get('processed_items', []))
+    
+    def save(self) -> None:
+        with open(self.state_file, 'w') as f:
+            json.dump({
+                'processed_items': list(self.processed_items),
+                'last_updated': datetime.now().isoformat()
+            }, f, indent=2)
+
+
+def run(mode: str, args: argparse.Namespace, state_file: Path) -> dict:
+    rng = random.Random(args.seed)
+    result = {}
+    
+    started = time.perf_counter()
+    if mode == "json-state":
+        working_copy = state_file.with_name(".bench_watcher_state.run.json")
+        shutil.copyfile(state_file, working_copy)  # Saves must not leak into the next mode
+        started = time.perf_counter()
+        legacy = LegacyState(working_copy)
+        processed = legacy.processed_items
+    else:
+        store_path = state_file.with_name(".bench_watcher.keys.db")
+        if not store_path.exists():
+            import_started = time.perf_counter()
+            DedupeStore(store_path, legacy_state=state_file).close()
+            result["import"] = time.perf_counter() - import_started
+            started = time.perf_counter()
+        store = DedupeStore(store_path)
+        processed = store
+    result["startup"] = time.perf_counter() - started
+    
+    next_key = args.keys
+    checks = []
+    for _ in range(args.checks):
+        candidates = [key(rng.randrange(next_key)) for _ in range(args.lookups - args.new)]
+        candidates += [key(next_key + i) for i in range(args.new)]
+        
+        started = time.perf_counter()
+        new = [k for k in candidates if k not in processed]
+        if mode == "json-state":
+            processed.update(new)
+            legacy.save()
+        else:
+            store.add_many(new)
+        checks.append(time.perf_counter() - started)
+        
+        assert len(new) == args.new
+        next_key += args.new
+    
+    if mode == "dedupe-store":
+        store.close()
+        result["size"] = sum(p.stat().st_size for p in state_file.parent.glob(".bench_watcher.keys.db*"))
+    else:
+        result["size"] = working_copy.stat().st_size
+    result["check"] = summarize(checks)
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=1_000_000, help="Processed keys already stored")
+    parser.add_argument("--checks", type=int, default=20, help="Watcher checks measured")
+    parser.add_argument("--lookups", type=int, default=50, help="Membership tests per check")
+    parser.add_argument("--new", type=int, default=5, help="Keys marked processed per check")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    
+    with isolated_workspace(vault_from_repo=False) as workspace:
+        state_file = workspace / "task_queue" / ".bench_watcher_state.json"
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(state_file, 'w') as f:
+            json.dump({'processed_items': [key(i) for i in range(args.keys)]}, f, indent=2)
+        
+        print(f"{args.keys:,} processed keys; {args.lookups} lookups + {args.new} new keys per check\n")
+        print(f"{'mode':<14} {'startup':>9} {'check p50':>10} {'check p99':>10} {'on disk':>9}")
+        for mode in ("json-state", "dedupe-store"):
+            r = run(mode, args, state_file)
+            check = r["check"]
+            print(
+                f"{mode:<14} {r['startup']:>8.3f}s {check['p50'] * 1000:>8.2f}ms {check['p99'] * 1000:>8.2f}ms "
+                f"{r['size'] / 1e6:>7.1f}MB"
+            )
+            if "import" in r:
+                print(f"{'':<14} (one-time import of the JSON state: {r['import']:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+Benchmark - Finance Polling: Date-Range Gets per Account vs Cursor Sync
+
+Seeds --accounts accounts with --transactions transactions each (all
+within the last day) on a local Plaid stand-in (benchmarks/fake_finance_api.py)
+with --latency seconds per HTTP round trip, then runs --checks watcher
+checks, posting --new transactions per account before each one:
+
+    before   previous watcher: /transactions/get for the last 24 hours
+             (7 days on the first check), one account after another, a
+             task for every transaction returned (here following every
+             page; it used to read only the first)
+    sync     watchers/finance_watcher.py: /transactions/sync from each
+             account's saved cursor, accounts concurrently, one task per
+             transaction_id
+
+Then replays --replay transactions spread over the accounts through the
+sync watcher with three injected mid-pagination mutation errors and a
+crash half-way through the second account, restarts it, and checks that
+every transaction became exactly one task.
+
+Usage:
+    python benchmarks/bench_finance_sync.py
+    python benchmarks/bench_finance_sync.py --accounts 8 --transactions 5000 --latency 0.1
+    python benchmarks/bench_finance_sync.py --replay 0
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "watchers"))
+
+from benchmarks.common import isolated_workspace, summarize
+from benchmarks.fake_finance_api import FakeFinanceAPI
+from base_watcher import BaseWatcher
+from finance_watcher import FinanceWatcher
+
+
+def legacy_check(watcher: FinanceWatcher, session: requests.Session, first: bool) -> int:
+    """The old check: every account's recent transactions, each one a new task."""
+    end_date = datetime.now().date()
+    start_date = end_date - timedelta(days=7 if first else 1)
+    transactions: List[Dict[str, Any]] = []
+    for account_id in watcher.account_ids:
+        offset = 0
+        while True:
+            response = session.post(f"{watcher.api_url}/transactions/get", json={
+                "client_id": watcher.api_key, "secret": watcher.api_secret, "access_token": account_id,
+                "start_date": str(start_date), "end_date": str(end_date),
+                "options": {"count": 500, "offset": offset}
+            }).json()
+            transactions += response["transactions"]
+            offset += len(response["transactions"])
+            if not response["transactions"] or offset >= response["total_transactions"]:
+                break
+    for transaction in transactions:
+        metadata = watcher._categorize_transaction(transaction)
+        BaseWatcher.create_task(
+            watcher, "finance_transaction", {**transaction, **metadata},
+            priority=metadata['priority'], required_skills=["finance_skills"],
+            hitl_required=metadata['hitl_required']
+        )
+    return len(transactions)
+
+
+def run(mode: str, args: argparse.Namespace) -> dict:
+    api = FakeFinanceAPI(latency=args.latency, item_latency=args.item_latency).start()
+    accounts = [f"access-bench-{i}" for i in range(args.accounts)]
+    for account in accounts:
+        api.post(account, args.transactions)
+    os.environ.update({
+        "FINANCE_API_URL": api.base_url, "FINANCE_API_KEY": "bench", "FINANCE_API_SECRET": "bench",
+        "FINANCE_ACCOUNT_IDS": ",".join(accounts), "FINANCE_SYNC_CONCURRENCY": str(args.concurrency)
+    })
+    try:
+        with isolated_workspace(vault_from_repo=False) as workspace:
+            watcher = FinanceWatcher()
+            watcher._connect()
+            session = requests.Session()
+            
+            started = time.perf_counter()
+            tasks = legacy_check(watcher, session, first=True) if mode == "before" else watcher.check_accounts()
+            initial = time.perf_counter() - started
+            
+            checks = []
+            for _ in range(args.checks):
+                for account in accounts:
+                    api.post(account, args.new)
+                started = time.perf_counter()
+                tasks += legacy_check(watcher, session, first=False) if mode == "before" else watcher.check_accounts()
+                checks.append(time.perf_counter() - started)
+            
+            task_files = len(list((workspace / "task_queue" / "inbox").glob("*.json")))
+            watcher.processed_ids.close()
+        return {"initial": initial, "check": summarize(checks), "tasks": tasks, "task_files": task_files,
+                "requests": api.stats["http_requests"], "max_in_flight": api.stats["max_in_flight"]}
+    finally:
+        api.stop()
+
+
+def replay(args: argparse.Namespace) -> dict:
+    """Crash/restart replay of args.replay transactions; counts tasks per transaction."""
+    api = FakeFinanceAPI(latency=0.002).start()
+    accounts = [f"access-replay-{i}" for i in range(args.accounts)]
+    per_account = args.replay // len(accounts)
+    for account in accounts:
+        api.post(account, per_account)
+    api.inject_mutations(3)
+    os.environ.update({
+        "FINANCE_API_URL": api.base_url, "FINANCE_API_KEY": "bench", "FINANCE_API_SECRET": "bench",
+        "FINANCE_ACCOUNT_IDS": ",".join(accounts), "FINANCE_SYNC_CONCURRENCY": str(args.concurrency)
+    })
+    
+    crash_at = f"{accounts[min(1, len(accounts) - 1)]}-tx-{per_account // 2:08d}"
+    created: Dict[str, int] = {}
+    create_task = FinanceWatcher.create_task
+    
+    def counting_create_task(self, **kwargs):
+        transaction_id = kwargs["context"]["transaction_id"]
+        if transaction_id == crash_at and transaction_id not in created:
+            created[transaction_id] = 0
+            raise OSError("disk full")  # The first watcher dies here
+        created[transaction_id] = created.get(transaction_id, 0) + 1
+        return create_task(self, **kwargs)
+    
+    FinanceWatcher.create_task = counting_create_task
+    try:
+        with isolated_workspace(vault_from_repo=False) as workspace:
+            started = time.perf_counter()
+            for _ in range(2):  # The crashed run, then the restart
+                watcher = FinanceWatcher()
+                watcher._connect()
+                watcher.check_accounts()
+                watcher.processed_ids.close()
+            elapsed = time.perf_counter() - started
+            task_files = len(list((workspace / "task_queue" / "inbox").glob("*.json")))
+        return {"elapsed": elapsed, "transactions": per_account * len(accounts), "task_files": task_files,
+                "duplicates": sum(count - 1 for count in created.values() if count > 1),
+                "sync_calls": api.stats["sync_calls"], "restarts": api.stats["errors"]}
+    finally:
+        FinanceWatcher.create_task = create_task
+        api.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--accounts", type=int, default=4, help="Accounts watched")
+    parser.add_argument("--transactions", type=int, default=2000, help="Transactions per account at the start")
+    parser.add_argument("--checks", type=int, default=5, help="Checks after the first")
+    parser.add_argument("--new", type=int, default=10, help="New transactions per account before each check")
+    parser.add_argument("--concurrency", type=int, default=4, help="FINANCE_SYNC_CONCURRENCY")
+    parser.add_argument("--latency", type=float, default=0.05, help="API time per round trip (seconds)")
+    parser.add_argument("--item-latency", type=float, default=0.00002, help="API time per transaction returned")
+    parser.add_argument("--replay", type=int, default=100_000, help="Transactions in the crash/restart replay (0 = skip)")
+    args = parser.parse_args()
+    
+    unique = args.accounts * (args.transactions + args.checks * args.new)
+    print(f"{args.accounts} accounts x {args.transactions} transactions, then {args.checks} checks "
+          f"with {args.new} new per account ({unique} unique transactions)\n")
+    print(f"{'mode':<7} {'first check':>12} {'check p50':>10} {'requests':>9} {'in flight':>10} "
+          f"{'tasks':>7} {'duplicates':>11}")
+    for mode in ("before", "sync"):
+        r = run(mode, args)
+        print(
+            f"{mode:<7} {r['initial']:>11.2f}s {r['check']['p50'] * 1000:>8.0f}ms {r['requests']:>9} "
+            f"{r['max_in_flight']:>10} {r['tasks']:>7} {r['task_files'] - unique:>11}"
+        )
+    
+    if args.replay:
+        r = replay(args)
+        print(
+            f"\nreplay: {r['transactions']} transactions, crash + restart, {r['restarts']} mutation restarts: "
+            f"{r['elapsed']:.1f}s, {r['sync_calls']} sync calls, {r['task_files']} tasks, {r['duplicates']} duplicates"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark - Gmail Polling: messages.list + get per Message vs History Sync and Batches
+
+Delivers --messages new INBOX messages (every --important-every-th one
+IMPORTANT) to a local Gmail API stand-in (benchmarks/fake_gmail_api.py)
+with --latency seconds per HTTP round trip, then runs one watcher check
+that picks them all up, and one more check with nothing new:
+
+    before        previous watchers: messages.list for unread mail (10 per
+                  page, here followed through every page so nothing is
+                  missed), an in-memory seen set, then one
+                  messages.get(format='full') per new message
+    history       GmailSync as in watchers/gmail_watcher.py: history.list
+                  from the saved history ID, batched format='metadata'
+                  gets, batched format='full' gets for unread mail
+    history+triage  GmailSync as in watcher_gmail.py: bodies only for
+                  important or starred unread mail
+
+Quota units are Gmail's per-method costs (messages.get 5, messages.list 5,
+history.list 2).
+
+Usage:
+    python benchmarks/bench_gmail_sync.py
+    python benchmarks/bench_gmail_sync.py --messages 5000 --latency 0.1
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "watchers"))
+
+from benchmarks.common import isolated_workspace
+from benchmarks.fake_gmail_api import FakeGmailAPI, gmail_service
+from gmail_sync import GmailSync, get_message_body
+
+QUERY = "label:INBOX is:unread"
+
+
+def legacy_check(service: Any, seen: Set[str]) -> List[Dict[str, Any]]:
+    """The old check: list unread mail, then get each unseen message in full."""
+    message_ids, page_token = [], None
+    while True:
+        params = {"userId": "me", "q": QUERY, "maxResults": 10}
+        if page_token:
+            params["pageToken"] = page_token
+        results = service.users().messages().list(**params).execute()
+        message_ids += [m["id"] for m in results.get("messages", []) if m["id"] not in seen]
+        page_token = results.get("nextPageToken")
+        if not page_token:
+            break
+    
+    messages = []
+    for message_id in message_ids:
+        message = service.users().messages().get(userId="me", id=message_id, format="full").execute()
+        headers = {h["name"]: h["value"] for h in message["payload"]["headers"]}
+        messages.append({"message_id": message_id, "subject": headers.get("Subject"),
+                         "body": get_message_body(message["payload"])})
+        seen.add(message_id)
+    return messages
+
+
+def run(mode: str, args: argparse.Namespace) -> dict:
+    api = FakeGmailAPI(latency=args.latency, item_latency=args.item_latency).start()
+    try:
+        with isolated_workspace(vault_from_repo=False) as workspace:
+            service = gmail_service(api)
+            seen: Set[str] = set()
+            sync = GmailSync(service, workspace / "task_queue" / ".gmail_state.json",
+                             label_ids=["INBOX"], resync_query=QUERY)
+            triage = (lambda m: "UNREAD" in m["labels"] and "IMPORTANT" in m["labels"]) \
+                if mode == "history+triage" else (lambda m: "UNREAD" in m["labels"])
+            
+            def check() -> int:
+                if mode == "before":
+                    return len(legacy_check(service, seen))
+                messages = sync.poll(keep=triage)
+                sync.fetch_bodies(messages)
+                sync.commit()
+                return len(messages)
+            
+            check()  # Empty mailbox: initial sync
+            api.deliver(args.messages, important_every=args.important_every)
+            
+            before = dict(api.stats)
+            started = time.perf_counter()
+            found = check()
+            elapsed = time.perf_counter() - started
+            delta = {k: api.stats[k] - before[k] for k in api.stats}
+            
+            before = dict(api.stats)
+            idle_started = time.perf_counter()
+            assert check() == 0
+            idle_elapsed = time.perf_counter() - idle_started
+            idle_calls = api.stats["api_calls"] - before["api_calls"]
+        return {"found": found, "elapsed": elapsed, "idle_calls": idle_calls, "idle_elapsed": idle_elapsed, **delta}
+    finally:
+        api.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=1000, help="New messages delivered")
+    parser.add_argument("--important-every", type=int, default=5, help="Every n-th message is IMPORTANT")
+    parser.add_argument("--latency", type=float, default=0.03, help="Gmail time per HTTP round trip (seconds)")
+    parser.add_argument("--item-latency", type=float, default=0.001, help="Gmail time per batched call (seconds)")
+    args = parser.parse_args()
+    
+    print(f"{args.messages} new messages, 1 in {args.important_every} important; "
+          f"{args.latency * 1000:.0f}ms per round trip\n")
+    print(f"{'mode':<15} {'tasks':>6} {'round trips':>12} {'API calls':>10} {'quota':>7} {'MB':>6} "
+          f"{'time':>8} {'idle calls':>11} {'idle time':>10}")
+    for mode in ("before", "history", "history+triage"):
+        r = run(mode, args)
+        print(
+            f"{mode:<15} {r['found']:>6} {r['http_requests']:>12} {r['api_calls']:>10} {r['quota_units']:>7} "
+            f"{r['bytes_sent'] / 1e6:>6.2f} {r['elapsed']:>7.2f}s {r['idle_calls']:>11} {r['idle_elapsed']:>9.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
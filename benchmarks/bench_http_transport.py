@@ -0,0 +1,86 @@
+"""
+Benchmark - Social MCP Server Calls: Module-Level requests vs Shared Keep-Alive Transport
+
+Posts --posts times to each of Facebook, Twitter and LinkedIn and reads
+the Instagram account, all against a local HTTPS fake
+(benchmarks/fake_social_api.py):
+
+    per-call   previous behaviour: requests.get/post, a new TCP + TLS
+               handshake for every call, no timeout
+    pooled     mcp_servers/http_transport.py: one keep-alive session per
+               host, default timeouts, per-endpoint latency
+
+Usage:
+    python benchmarks/bench_http_transport.py
+    python benchmarks/bench_http_transport.py --posts 200 --latency 0.01
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+from benchmarks.common import isolated_workspace, summarize
+from benchmarks.fake_social_api import FakeSocialAPI, social_servers
+import http_transport
+
+
+def run(mode: str, args: argparse.Namespace) -> dict:
+    api = FakeSocialAPI(latency=args.latency).start()
+    try:
+        with isolated_workspace(vault_from_repo=False) as workspace:
+            os.environ["REQUESTS_CA_BUNDLE"] = api.ca_file
+            facebook, instagram, twitter, linkedin = social_servers(api, workspace / "secrets")
+            http_transport.close_all()
+            real_request = http_transport.request
+            if mode == "per-call":
+                http_transport.request = requests.request
+            
+            calls = (
+                lambda i: facebook.post_message(f"Update {i}"),
+                lambda i: twitter.post_tweet(f"Tweet {i}"),
+                lambda i: linkedin.post_update(f"News {i}"),
+                lambda i: instagram.get_account_info()
+            )
+            latencies = []
+            started = time.perf_counter()
+            try:
+                for i in range(args.posts):
+                    for call in calls:
+                        call_started = time.perf_counter()
+                        call(i)
+                        latencies.append(time.perf_counter() - call_started)
+            finally:
+                http_transport.request = real_request
+            elapsed = time.perf_counter() - started
+            http_transport.close_all()
+        return {"elapsed": elapsed, "latency": summarize(latencies), **api.stats}
+    finally:
+        api.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--posts", type=int, default=200, help="Rounds of one call per server")
+    parser.add_argument("--latency", type=float, default=0.0, help="Server think time per request")
+    args = parser.parse_args()
+    
+    print(f"{args.posts * 4} calls over TLS, server latency {args.latency * 1000:.0f}ms\n")
+    print(f"{'mode':<9} {'total':>8} {'calls/s':>8} {'p50':>9} {'p99':>9} {'handshakes':>11}")
+    for mode in ("per-call", "pooled"):
+        r = run(mode, args)
+        stats = r["latency"]
+        print(
+            f"{mode:<9} {r['elapsed']:>7.2f}s {r['requests'] / r['elapsed']:>8.0f} "
+            f"{stats['p50'] * 1000:>7.2f}ms {stats['p99'] * 1000:>7.2f}ms {r['handshakes']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
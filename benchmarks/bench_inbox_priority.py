@@ -0,0 +1,108 @@
+"""
+Benchmark - Priority-Aware Claiming Under Load
+
+Queues N normal/low tasks, then drains the inbox one claim at a time while
+injecting a critical task every --inject-every claims. Reports per-claim
+cost and priority inversion (how many lower-priority claims happened while
+a critical task was waiting) for:
+
+    legacy        sorted(inbox.glob("*.json"))[0]    (pre-index behaviour)
+    index/poll    InboxIndex.refresh() + pop()       (no filesystem events)
+    index/event   InboxIndex.pop(), fed by note()    (event-driven wakeup)
+
+Usage:
+    python benchmarks/bench_inbox_priority.py
+    python benchmarks/bench_inbox_priority.py --tasks 10000 --task-seconds 2
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import StubLLM, isolated_workspace, install_llm, write_inbox_tasks, summarize
+
+
+def run(mode: str, task_count: int, inject_every: int) -> dict:
+    with isolated_workspace(vault_from_repo=False):
+        os.environ["ORCHESTRATOR_MAX_WORKERS"] = str(task_count * 2)
+        install_llm(StubLLM(latency=0))
+        
+        from orchestration.orchestrator import Orchestrator
+        orchestrator = Orchestrator()
+        inbox, pending = orchestrator.inbox, orchestrator.pending
+        index = orchestrator.inbox_index
+        
+        rng = random.Random(7)
+        for _ in range(task_count):
+            write_inbox_tasks(inbox, 1, priority=rng.choice(["normal", "low"]))
+        index.refresh()
+        
+        claim_costs = []
+        waiting = {}  # critical task_id -> lower-priority claims seen so far
+        inversions = []
+        claims = 0
+        
+        while True:
+            if claims % inject_every == 0 and claims // inject_every < 20:
+                for task_id in write_inbox_tasks(inbox, 1, priority="critical"):
+                    waiting[task_id] = 0
+                    index.note(inbox / f"{task_id}.json")
+            
+            started = time.perf_counter()
+            if mode == "legacy":
+                files = sorted(inbox.glob("*.json"))
+                task = orchestrator._claim_file(files[0]) if files else None
+            else:
+                if mode == "index/poll":
+                    index.refresh()
+                task_file = index.pop()
+                task = orchestrator._claim_file(task_file) if task_file else None
+            claim_costs.append(time.perf_counter() - started)
+            
+            if task is None:
+                break
+            claims += 1
+            (pending / f"{task['task_id']}.json").unlink()
+            
+            if task["priority"] == "critical":
+                inversions.append(waiting.pop(task["task_id"]))
+            else:
+                for task_id in waiting:
+                    waiting[task_id] += 1
+        
+        cost = summarize(claim_costs)
+        return {
+            "claims": claims,
+            "claim_mean_us": cost["mean"] * 1e6,
+            "claim_p99_us": cost["p99"] * 1e6,
+            "inversion_mean": sum(inversions) / len(inversions),
+            "inversion_max": max(inversions),
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=10000)
+    parser.add_argument("--inject-every", type=int, default=250)
+    parser.add_argument("--task-seconds", type=float, default=2.0, help="Per-task processing time used to express inversion as wall time")
+    args = parser.parse_args()
+    
+    print(f"{args.tasks} queued tasks, critical task injected every {args.inject_every} claims\n")
+    print(f"{'mode':>12} {'claim mean':>11} {'claim p99':>11} {'inversion':>10} {'worst':>7} {'worst wait':>11}")
+    for mode in ["legacy", "index/poll", "index/event"]:
+        r = run(mode, args.tasks, args.inject_every)
+        print(
+            f"{mode:>12} {r['claim_mean_us']:>9.0f}us {r['claim_p99_us']:>9.0f}us "
+            f"{r['inversion_mean']:>10.1f} {r['inversion_max']:>7} "
+            f"{r['inversion_max'] * args.task_seconds / 60:>9.1f}min"
+        )
+    print("\ninversion = lower-priority tasks claimed while a critical task waited")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+Benchmark - Instagram Publishing: Fixed Sleeps vs Async Container Pipeline
+
+Publishes --photos photos and --carousels carousels (--items images each)
+to a local Graph API stand-in (benchmarks/fake_social_api.py) whose media
+containers take a random --min-delay..--max-delay seconds to process:
+
+    fixed-sleep  previous behaviour: posts one after another; carousel
+                 items created one at a time 1s apart, then a flat 2s
+                 sleep before media_publish (which fails if the
+                 container is still processing)
+    pipeline     InstagramServer.post_many(): every post in flight at
+                 once, carousel items created concurrently, each
+                 container polled and published as soon as it is FINISHED
+
+Latency is end to end per post (submitted -> published); lag is how long
+a ready container waited before media_publish.
+
+Usage:
+    python benchmarks/bench_instagram_pipeline.py
+    python benchmarks/bench_instagram_pipeline.py --photos 40 --carousels 10 --max-delay 5
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+from benchmarks.common import isolated_workspace, summarize
+from benchmarks.fake_social_api import FakeSocialAPI, social_servers
+import http_transport
+
+
+def legacy_post(instagram, post: Dict) -> None:
+    """The old post_photo/post_carousel: fixed sleeps, one item at a time."""
+    if 'image_urls' in post:
+        item_ids = []
+        for image_url in post['image_urls']:
+            result = instagram._make_request('POST', f"{instagram.instagram_id}/media",
+                                             params={'image_url': image_url, 'is_carousel_item': True})
+            item_ids.append(result['id'])
+            time.sleep(1)  # Rate limiting
+        params = {'media_type': 'CAROUSEL', 'caption': post['caption'], 'children': ','.join(item_ids)}
+    else:
+        params = {'image_url': post['image_url'], 'caption': post['caption']}
+    container_id = instagram._make_request('POST', f"{instagram.instagram_id}/media", params=params)['id']
+    time.sleep(2)
+    instagram._make_request('POST', f"{instagram.instagram_id}/media_publish", params={'creation_id': container_id})
+
+
+def make_posts(args: argparse.Namespace) -> List[Dict]:
+    posts = [{"image_url": f"https://img.example/{i}.jpg", "caption": f"Photo {i}"} for i in range(args.photos)]
+    posts += [
+        {"image_urls": [f"https://img.example/c{i}_{j}.jpg" for j in range(args.items)], "caption": f"Carousel {i}"}
+        for i in range(args.carousels)
+    ]
+    return posts
+
+
+def run(mode: str, args: argparse.Namespace) -> dict:
+    api = FakeSocialAPI(processing_delay=(args.min_delay, args.max_delay), seed=args.seed).start()
+    try:
+        with isolated_workspace(vault_from_repo=False) as workspace:
+            os.environ["REQUESTS_CA_BUNDLE"] = api.ca_file
+            _, instagram, _, _ = social_servers(api, workspace / "secrets")
+            http_transport.close_all()
+            posts = make_posts(args)
+            latencies, failed = [], 0
+            
+            started = time.perf_counter()
+            if mode == "fixed-sleep":
+                for post in posts:
+                    try:
+                        legacy_post(instagram, post)
+                        latencies.append(time.perf_counter() - started)
+                    except Exception:
+                        failed += 1  # Published before processing finished
+            else:
+                wall_started = time.time()
+                results = instagram.post_many(posts)
+                failed = sum(r["status"] != "success" for r in results)
+                latencies = [
+                    datetime.fromisoformat(r["timestamp"]).timestamp() - wall_started
+                    for r in results if r["status"] == "success"
+                ]
+            elapsed = time.perf_counter() - started
+            
+            instagram.close()
+            http_transport.close_all()
+        return {"elapsed": elapsed, "latency": summarize(latencies), "failed": failed,
+                "lag": summarize(api.publish_lag()), **api.stats}
+    finally:
+        api.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--photos", type=int, default=8, help="Single-photo posts")
+    parser.add_argument("--carousels", type=int, default=2, help="Carousel posts")
+    parser.add_argument("--items", type=int, default=4, help="Images per carousel")
+    parser.add_argument("--min-delay", type=float, default=0.5, help="Shortest container processing time")
+    parser.add_argument("--max-delay", type=float, default=3.0, help="Longest container processing time")
+    parser.add_argument("--seed", type=int, default=1, help="Processing delay seed")
+    args = parser.parse_args()
+    
+    print(
+        f"{args.photos} photos + {args.carousels} carousels x {args.items} images, "
+        f"processing {args.min_delay:.1f}-{args.max_delay:.1f}s per container\n"
+    )
+    print(f"{'mode':<12} {'total':>8} {'published':>10} {'failed':>7} {'p50':>8} {'p99':>8} "
+          f"{'lag p50':>8} {'polls':>6}")
+    for mode in ("fixed-sleep", "pipeline"):
+        r = run(mode, args)
+        latency, lag = r["latency"], r["lag"]
+        print(
+            f"{mode:<12} {r['elapsed']:>7.2f}s {latency['count']:>10} {r['failed']:>7} "
+            f"{latency['p50']:>7.2f}s {latency['p99']:>7.2f}s {lag['p50']:>7.2f}s {r['status_polls']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark - Odoo Actions: Server per Call vs Pooled MCP Client
+
+Runs --actions Odoo actions (invoices, bills, payments in turn) through
+ActionExecutor.execute_action against a local fake Odoo JSON-RPC server
+(benchmarks/fake_odoo_server.py):
+
+    per-call   previous behaviour: a new OdooServer() per action, so a
+               fresh /web/session/authenticate and TCP connection each time
+    pooled     ClientPool: one warm, authenticated OdooServer reused; it
+               logs in again only when Odoo reports the session expired
+
+--auth-latency models the password hashing a real Odoo does on login;
+--session-ttl expires sessions to exercise the lazy re-authentication.
+
+Usage:
+    python benchmarks/bench_mcp_clients.py
+    python benchmarks/bench_mcp_clients.py --actions 500 --auth-latency 0.05 --session-ttl 2
+"""
+
+import os
+import sys
+import time
+import argparse
+import contextlib
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import isolated_workspace, summarize
+from benchmarks.fake_odoo_server import FakeOdooServer
+
+
+class PerCallPool:
+    """The previous executor behaviour: construct the server for every action."""
+    
+    @contextlib.contextmanager
+    def client(self, name, tenant_id=None):
+        from odoo_server import OdooServer
+        yield OdooServer()
+
+
+def odoo_action(i: int) -> dict:
+    kind = ("odoo_invoice", "odoo_bill", "odoo_payment")[i % 3]
+    data = {
+        "odoo_invoice": {"partner_name": f"Client {i % 20}", "amount": 1200.0, "description": f"Retainer {i}"},
+        "odoo_bill": {"vendor_name": f"Vendor {i % 20}", "amount": 300.0, "reference": f"Bill {i}"},
+        "odoo_payment": {"invoice_id": 1, "amount": 1200.0}
+    }[kind]
+    return {"action_type": kind, "task_id": f"TASK_{i:05d}", "data": data,
+            "requires_approval": False, "risk_level": "low"}
+
+
+def run(mode: str, args: argparse.Namespace) -> dict:
+    odoo = FakeOdooServer(auth_latency=args.auth_latency, latency=args.latency, session_ttl=args.session_ttl).start()
+    try:
+        with isolated_workspace(vault_from_repo=False) as workspace:
+            os.environ.update({"ODOO_URL": odoo.base_url, "ODOO_DB": "bench", "ODOO_PASSWORD": "bench"})
+            from orchestration.action_executor import ActionExecutor
+            from orchestration.mcp_clients import ClientPool
+            
+            executor = ActionExecutor(workspace / "obsidian_vault")
+            executor.clients = PerCallPool() if mode == "per-call" else ClientPool()
+            
+            latencies = []
+            failed = 0
+            started = time.perf_counter()
+            for i in range(args.actions):
+                action_started = time.perf_counter()
+                result = executor.execute_action(odoo_action(i))
+                latencies.append(time.perf_counter() - action_started)
+                failed += result["status"] != "success" or result["result"].get("status") != "success"
+            elapsed = time.perf_counter() - started
+            if mode == "pooled":
+                executor.clients.close()
+        return {"elapsed": elapsed, "latency": summarize(latencies), "failed": failed, **odoo.stats}
+    finally:
+        odoo.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actions", type=int, default=500)
+    parser.add_argument("--auth-latency", type=float, default=0.0, help="Seconds the fake Odoo spends per login")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per call_kw")
+    parser.add_argument("--session-ttl", type=float, default=0.0, help="Expire sessions after this many seconds")
+    args = parser.parse_args()
+    
+    print(f"{args.actions} Odoo actions, auth latency {args.auth_latency * 1000:.0f}ms, "
+          f"session TTL {args.session_ttl or 'none'}\n")
+    print(f"{'mode':<9} {'total':>8} {'actions/s':>10} {'p50':>9} {'p99':>9} {'logins':>7} {'conns':>6} {'expired':>8} {'failed':>7}")
+    for mode in ("per-call", "pooled"):
+        r = run(mode, args)
+        stats = r["latency"]
+        print(
+            f"{mode:<9} {r['elapsed']:>7.2f}s {args.actions / r['elapsed']:>10.0f} "
+            f"{stats['p50'] * 1000:>7.2f}ms {stats['p99'] * 1000:>7.2f}ms "
+            f"{r['authenticate']:>7} {r['connections']:>6} {r['expired']:>8} {r['failed']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
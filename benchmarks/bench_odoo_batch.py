@@ -0,0 +1,127 @@
+"""
+Benchmark - Odoo Weekly Review: search + read per Query vs search_read, Batches and Read Cache
+
+Runs a weekly-review workload against a local fake Odoo JSON-RPC server
+(benchmarks/fake_odoo_server.py) with --latency seconds per call:
+--invoices invoices for --partners clients are created, then the review
+(run twice, as a dashboard refresh would) lists the week's invoices,
+reads the receivable and payable balances and each client's balance.
+
+    before        previous OdooServer: search then read for every query,
+                  a partner search before every invoice
+    per-invoice   current OdooServer, invoices created one at a time:
+                  search_read queries, cached partner and account lookups
+    batched       current OdooServer.create_invoices(): all invoices in
+                  one batch (partner lookup, partner create, create, post)
+
+Usage:
+    python benchmarks/bench_odoo_batch.py
+    python benchmarks/bench_odoo_batch.py --invoices 500 --latency 0.01
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+from benchmarks.common import isolated_workspace
+from benchmarks.fake_odoo_server import FakeOdooServer
+from odoo_server import OdooServer
+
+
+class LegacyOdooServer(OdooServer):
+    """The previous queries: two round trips each, no partner cache."""
+    
+    def _find_or_create_partner(self, name, is_vendor=False):
+        partner_ids = self._call_odoo('res.partner', 'search', [[['name', 'ilike', name]]], {'limit': 1})
+        if partner_ids:
+            return partner_ids[0]
+        return self._call_odoo('res.partner', 'create', [{
+            'name': name, 'customer_rank': 0 if is_vendor else 1, 'supplier_rank': 1 if is_vendor else 0
+        }])
+    
+    def get_balance(self, account_type='asset_receivable'):
+        account_ids = self._call_odoo('account.account', 'search', [[['account_type', '=', account_type]]], {'limit': 10})
+        accounts = self._call_odoo('account.account', 'read', [account_ids], {'fields': ['name', 'code', 'current_balance']})
+        return {'status': 'success', 'balance': sum(a.get('current_balance', 0) for a in accounts)}
+    
+    def list_invoices(self, limit=10, state='posted'):
+        domain = [['move_type', '=', 'out_invoice'], ['state', '=', state]]
+        invoice_ids = self._call_odoo('account.move', 'search', [domain], {'limit': limit, 'order': 'id desc'})
+        invoices = self._call_odoo('account.move', 'read', [invoice_ids], {'fields': [
+            'name', 'partner_id', 'amount_total', 'amount_residual', 'invoice_date', 'state'
+        ]})
+        return {'status': 'success', 'invoices': invoices, 'count': len(invoices)}
+    
+    def get_partner_balance(self, partner_name):
+        partner_ids = self._call_odoo('res.partner', 'search', [[['name', 'ilike', partner_name]]], {'limit': 1})
+        partner = self._call_odoo('res.partner', 'read', [[partner_ids[0]]], {'fields': ['name', 'debit', 'credit']})[0]
+        return {'status': 'success', 'partner': partner['name']}
+
+
+def weekly_review(client: OdooServer, args: argparse.Namespace) -> None:
+    assert client.list_invoices(limit=args.invoices)["count"] == args.invoices
+    client.get_balance('asset_receivable')
+    client.get_balance('liability_payable')
+    for p in range(args.partners):
+        assert client.get_partner_balance(f"Client {p:02d}")["status"] == "success"
+
+
+def run(mode: str, args: argparse.Namespace) -> dict:
+    odoo = FakeOdooServer(latency=args.latency).start()
+    try:
+        with isolated_workspace(vault_from_repo=False):
+            os.environ.update({"ODOO_URL": odoo.base_url, "ODOO_DB": "bench", "ODOO_PASSWORD": "bench"})
+            client = LegacyOdooServer() if mode == "before" else OdooServer()
+            invoices = [
+                {"partner_name": f"Client {i % args.partners:02d}", "amount": 100.0 + i, "description": f"Week 42 #{i}"}
+                for i in range(args.invoices)
+            ]
+            
+            started = time.perf_counter()
+            calls = odoo.stats["calls"]
+            if mode == "batched":
+                assert client.create_invoices(invoices)["count"] == args.invoices
+            else:
+                for invoice in invoices:
+                    assert client.create_invoice(**invoice)["status"] == "success"
+            create_seconds = time.perf_counter() - started
+            create_calls = odoo.stats["calls"] - calls
+            
+            started = time.perf_counter()
+            calls = odoo.stats["calls"]
+            for _ in range(2):
+                weekly_review(client, args)
+            review_seconds = time.perf_counter() - started
+            review_calls = odoo.stats["calls"] - calls
+            client.close()
+        return {"create_seconds": create_seconds, "create_calls": create_calls,
+                "review_seconds": review_seconds, "review_calls": review_calls}
+    finally:
+        odoo.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invoices", type=int, default=200, help="Invoices created in the week")
+    parser.add_argument("--partners", type=int, default=25, help="Distinct clients")
+    parser.add_argument("--latency", type=float, default=0.005, help="Odoo time per call (seconds)")
+    args = parser.parse_args()
+    
+    print(f"{args.invoices} invoices for {args.partners} clients, then 2 review passes; "
+          f"{args.latency * 1000:.0f}ms per Odoo call\n")
+    print(f"{'mode':<12} {'create calls':>13} {'create':>9} {'review calls':>13} {'review':>9} {'total':>9}")
+    for mode in ("before", "per-invoice", "batched"):
+        r = run(mode, args)
+        print(
+            f"{mode:<12} {r['create_calls']:>13} {r['create_seconds']:>8.2f}s {r['review_calls']:>13} "
+            f"{r['review_seconds']:>8.2f}s {r['create_seconds'] + r['review_seconds']:>8.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
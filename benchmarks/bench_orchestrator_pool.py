@@ -0,0 +1,79 @@
+"""
+Benchmark - Orchestrator Worker Pool Throughput
+
+Drains an inbox of N tasks against a stubbed LLM and reports tasks/sec
+for several ORCHESTRATOR_MAX_WORKERS settings.
+
+Usage:
+    python benchmarks/bench_orchestrator_pool.py
+    python benchmarks/bench_orchestrator_pool.py --tasks 1000 --latency 0.05 --pools 1 4 16
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import StubLLM, isolated_workspace, install_llm, write_inbox_tasks
+
+
+def drain(task_count: int, pool_size: int, latency: float) -> dict:
+    """Run one orchestrator until the inbox is drained."""
+    with isolated_workspace():
+        os.environ["ORCHESTRATOR_MAX_WORKERS"] = str(pool_size)
+        os.environ["TASK_QUEUE_CHECK_INTERVAL"] = "0.05"
+        
+        llm = StubLLM(latency=latency)
+        install_llm(llm)
+        
+        from orchestration.orchestrator import Orchestrator
+        orchestrator = Orchestrator()
+        
+        write_inbox_tasks(orchestrator.inbox, task_count)
+        
+        runner = threading.Thread(target=orchestrator.start, daemon=True)
+        started = time.perf_counter()
+        runner.start()
+        
+        while orchestrator.archive.count() < task_count:
+            time.sleep(0.01)
+        
+        elapsed = time.perf_counter() - started
+        orchestrator.running = False
+        runner.join()
+        
+        return {
+            "pool_size": pool_size,
+            "tasks": task_count,
+            "llm_calls": llm.calls,
+            "seconds": elapsed,
+            "tasks_per_sec": task_count / elapsed,
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Stub LLM latency in seconds")
+    parser.add_argument("--pools", type=int, nargs="+", default=[1, 4, 16, 32])
+    args = parser.parse_args()
+    
+    print(f"Draining {args.tasks} tasks, stub LLM latency {args.latency * 1000:.0f} ms\n")
+    print(f"{'workers':>8} {'seconds':>10} {'tasks/sec':>10} {'speedup':>8}")
+    
+    baseline = None
+    for pool_size in args.pools:
+        result = drain(args.tasks, pool_size, args.latency)
+        baseline = baseline or result["tasks_per_sec"]
+        print(
+            f"{result['pool_size']:>8} {result['seconds']:>10.2f} "
+            f"{result['tasks_per_sec']:>10.1f} {result['tasks_per_sec'] / baseline:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Benchmark - Reasoning Cache Replay
+
+Replays task_queue/inbox_archived in created_at order (repeated --rounds
+times with fresh task IDs) through the orchestrator's cache-then-reason
+path against a simulated Anthropic endpoint, for:
+
+    off         every task calls LLMInterface.reason()
+    exact       exact-payload hash tier only
+    semantic    exact + hashed-trigram similarity tier
+
+Reports hit rate by tier, LLM calls, input tokens and wall time per task.
+
+Usage:
+    python benchmarks/bench_reasoning_cache.py
+    python benchmarks/bench_reasoning_cache.py --rounds 5 --similarity 0.9
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import REPO_ROOT, StubLLM, SimulatedAnthropic, isolated_workspace, install_llm, reset_singletons
+
+
+def load_replay(rounds: int) -> list:
+    archived = sorted(
+        (json.loads(path.read_text(encoding="utf-8"))
+         for path in (REPO_ROOT / "task_queue" / "inbox_archived").glob("*.json")),
+        key=lambda task: task.get("created_at", "")
+    )
+    replay = []
+    for round_number in range(rounds):
+        for task in archived:
+            task = dict(task)
+            task["task_id"] = f"{task['task_id']}_r{round_number}"
+            replay.append(task)
+    return replay
+
+
+def run(tasks: list, mode: str, args) -> dict:
+    with isolated_workspace():
+        os.environ["LLM_PROVIDER"] = "anthropic"
+        os.environ["ANTHROPIC_API_KEY"] = "bench"
+        os.environ["REASONING_CACHE_ENABLED"] = "false" if mode == "off" else "true"
+        os.environ["REASONING_CACHE_EMBEDDINGS"] = "hashing" if mode == "semantic" else "none"
+        os.environ["REASONING_CACHE_SIMILARITY"] = str(args.similarity)
+        
+        install_llm(StubLLM(latency=0))
+        from orchestration.orchestrator import Orchestrator
+        from orchestration.llm_interface import LLMInterface
+        
+        orchestrator = Orchestrator()
+        llm = LLMInterface()
+        llm.client = SimulatedAnthropic(args.base_ms, args.prefill_us, args.decode_us, args.plan_tokens)
+        cache = orchestrator.reasoning_cache
+        context = orchestrator._get_vault_context()
+        
+        started = time.perf_counter()
+        for task in tasks:
+            task = orchestrator.skill_mapper.add_skills_to_task(task)
+            skills = orchestrator.load_agent_skills(task["required_skills"])
+            
+            if cache.lookup(task, skills, context) is None:
+                cache.store(task, skills, context, llm.reason(task, skills, context))
+        elapsed = time.perf_counter() - started
+        
+        cache_stats = cache.get_stats()
+        llm_stats = llm.get_stats()
+        reset_singletons()
+        
+        return {
+            "exact": cache_stats["exact_hits"] / len(tasks),
+            "semantic": cache_stats["semantic_hits"] / len(tasks),
+            "llm_calls": llm_stats["calls"],
+            "input_per_task": llm_stats["input_tokens"] / len(tasks),
+            "ms_per_task": elapsed * 1000 / len(tasks)
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=3, help="Times the archive is replayed")
+    parser.add_argument("--similarity", type=float, default=0.95)
+    parser.add_argument("--base-ms", type=float, default=300.0)
+    parser.add_argument("--prefill-us", type=float, default=20.0)
+    parser.add_argument("--decode-us", type=float, default=1000.0)
+    parser.add_argument("--plan-tokens", type=int, default=150)
+    args = parser.parse_args()
+    
+    tasks = load_replay(args.rounds)
+    print(f"{len(tasks)} replayed tasks ({args.rounds} rounds of inbox_archived)\n")
+    print(f"{'mode':>9} {'exact hits':>11} {'semantic':>9} {'llm calls':>10} {'in tok/task':>12} {'ms/task':>8}")
+    
+    for mode in ("off", "exact", "semantic"):
+        r = run([dict(t) for t in tasks], mode, args)
+        print(
+            f"{mode:>9} {r['exact']:>11.1%} {r['semantic']:>9.1%} {r['llm_calls']:>10} "
+            f"{r['input_per_task']:>12.0f} {r['ms_per_task']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Benchmark - Posting at a Platform Rate Limit: Flat Backoff vs Social Scheduler
+
+Offers twice as many tweets as the platform allows over --windows
+rate-limit windows to a local HTTPS fake (benchmarks/fake_social_api.py)
+that allows --limit posts per --window seconds and answers
+x-rate-limit-* headers and 429s, like Twitter's 15-minute windows in
+miniature:
+
+    flat-backoff  previous behaviour (PlatinumOrchestrator): up to 3
+                  attempts per post, sleeping a flat backoff after each
+                  429 (60s, scaled to the window as 60s is to Twitter's
+                  900s), then the post fails
+    scheduler     mcp_servers/social_scheduler.py: posts are queued with
+                  the end of the run as deadline and each waits exactly
+                  until x-rate-limit-reset; what cannot fit is dropped
+                  with DeadlineExceeded, never sent
+
+Throughput is published posts per hour, also as a share of the platform
+ceiling (limit / window).
+
+Usage:
+    python benchmarks/bench_social_scheduler.py
+    python benchmarks/bench_social_scheduler.py --limit 20 --window 2 --windows 10
+"""
+
+import os
+import sys
+import time
+import argparse
+from pathlib import Path
+from concurrent.futures import wait
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+from benchmarks.common import isolated_workspace
+from benchmarks.fake_social_api import FakeSocialAPI, social_servers
+import http_transport
+from social_scheduler import get_social_scheduler
+
+
+def post_with_flat_backoff(twitter, text: str, backoff: float, deadline: float) -> bool:
+    """The old retry loop: 3 attempts, flat sleep after a rate-limit error."""
+    for attempt in range(1, 4):
+        try:
+            twitter.post_tweet(text)
+            return True
+        except Exception as e:
+            if "Too Many" not in str(e) or attempt == 3 or time.monotonic() + backoff > deadline:
+                return False
+            time.sleep(backoff)
+    return False
+
+
+def run(mode: str, args: argparse.Namespace) -> dict:
+    api = FakeSocialAPI(post_limit=args.limit, post_window=args.window).start()
+    try:
+        with isolated_workspace(vault_from_repo=False) as workspace:
+            os.environ["REQUESTS_CA_BUNDLE"] = api.ca_file
+            os.environ["RATE_LIMIT_RESET_SKEW_SECONDS"] = "0"  # Same clock as the fake
+            _, _, twitter, _ = social_servers(api, workspace / "secrets")
+            http_transport.close_all()
+            real_request = http_transport.request
+            offered = args.limit * args.windows * 2
+            
+            # Start on a window boundary so every run sees the same windows
+            time.sleep(args.window - time.time() % args.window)
+            deadline = time.monotonic() + args.window * args.windows
+            try:
+                if mode == "flat-backoff":
+                    http_transport.request = lambda method, url, rate_limit=None, publish=False, **kwargs: real_request(method, url, **kwargs)
+                    backoff = args.window * 60 / 900
+                    published = 0
+                    for i in range(offered):
+                        if time.monotonic() >= deadline:
+                            break
+                        published += post_with_flat_backoff(twitter, f"Tweet {i}", backoff, deadline)
+                else:
+                    scheduler = get_social_scheduler()
+                    futures = [
+                        scheduler.submit("twitter", lambda i=i: twitter.post_tweet(f"Tweet {i}"), deadline=deadline)
+                        for i in range(offered)
+                    ]
+                    wait(futures)
+                    published = sum(1 for f in futures if f.exception() is None)
+            finally:
+                http_transport.request = real_request
+            http_transport.close_all()
+        return {"offered": offered, "published": published, **api.stats}
+    finally:
+        api.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--limit", type=int, default=10, help="Posts allowed per window")
+    parser.add_argument("--window", type=int, default=2, help="Rate-limit window in seconds")
+    parser.add_argument("--windows", type=int, default=5, help="Windows to run for")
+    args = parser.parse_args()
+    
+    ceiling = args.limit / args.window * 3600
+    duration = args.window * args.windows
+    print(f"{duration}s run, platform ceiling {args.limit} per {args.window}s ({ceiling:,.0f} posts/hour)\n")
+    print(f"{'mode':<13} {'offered':>8} {'published':>10} {'posts/hour':>11} {'of ceiling':>11} {'429s':>6}")
+    for mode in ("flat-backoff", "scheduler"):
+        r = run(mode, args)
+        per_hour = r["published"] / duration * 3600
+        print(
+            f"{mode:<13} {r['offered']:>8} {r['published']:>10} {per_hour:>11,.0f} "
+            f"{per_hour / ceiling:>10.0%} {r['rate_limited']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
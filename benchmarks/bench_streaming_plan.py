@@ -0,0 +1,122 @@
+"""
+Benchmark - Streamed vs Buffered Plans on Recorded Responses
+
+Replays benchmarks/recordings/plan_responses.json through
+benchmarks/fake_llm_server.py (fixed time-to-first-token, then
+--decode-tps output tokens/second) and calls LLMInterface.reason() with
+LLM_STREAMING off and on, through the real provider SDK.
+
+    time to first action   buffered: the whole response; streamed: the
+                           moment the first action's closing brace arrives
+    time to full plan      end of the response (both modes)
+    time to error          malformed responses: buffered fails after the
+                           last token, streamed at the first bad character
+
+Usage:
+    python benchmarks/bench_streaming_plan.py
+    python benchmarks/bench_streaming_plan.py --provider openai --decode-tps 40 --rounds 3
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import summarize
+from benchmarks.fake_llm_server import FakeLLMServer
+
+RECORDINGS = Path(__file__).resolve().parent / "recordings" / "plan_responses.json"
+
+# Malformed recordings log an error per call by design
+logging.getLogger("llm_interface").setLevel(logging.CRITICAL)
+
+
+def run(mode: str, recordings: List[Dict[str, str]], args) -> Dict[str, Dict[str, List[float]]]:
+    """Replay every recording --rounds times; per-recording timings in seconds."""
+    server = FakeLLMServer(
+        latency=args.ttft,
+        decode_tps=args.decode_tps,
+        replay=[recording["text"] for recording in recordings]
+    ).start()
+    
+    prefix = args.provider.upper()
+    os.environ.update({
+        "LLM_PROVIDER": args.provider,
+        f"{prefix}_API_KEY": "bench",
+        f"{prefix}_BASE_URL": server.base_url + ("/v1" if args.provider == "openai" else ""),
+        "LLM_STREAMING": "true" if mode == "streamed" else "false",
+    })
+    
+    from orchestration.llm_interface import LLMInterface
+    llm = LLMInterface()
+    llm.client = llm.client.with_options(max_retries=0)
+    
+    timings: Dict[str, Dict[str, List[float]]] = {}
+    for round_number in range(args.rounds):
+        for i, recording in enumerate(recordings):
+            task = {"task_id": f"bench_{round_number}_{i}", "type": "email", "data": {"subject": recording["name"]}}
+            
+            started = time.perf_counter()
+            result = llm.reason(task, {})
+            elapsed = time.perf_counter() - started
+            
+            entry = timings.setdefault(recording["name"], {"first_action": [], "full": [], "error": []})
+            if "error" in result:
+                entry["error"].append(elapsed)
+                continue
+            
+            entry["full"].append(elapsed)
+            if result.get("actions"):
+                first_action_ms = result["usage"].get("first_action_ms")
+                entry["first_action"].append(first_action_ms / 1000 if first_action_ms is not None else elapsed)
+    
+    server.stop()
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--provider", choices=["anthropic", "openai"], default="anthropic")
+    parser.add_argument("--ttft", type=float, default=0.4, help="Provider seconds to first token")
+    parser.add_argument("--decode-tps", type=float, default=100, help="Provider output tokens per second")
+    parser.add_argument("--rounds", type=int, default=1)
+    parser.add_argument("--recordings", type=Path, default=RECORDINGS)
+    args = parser.parse_args()
+    
+    recordings = json.loads(args.recordings.read_text(encoding="utf-8"))
+    print(f"{len(recordings)} recorded responses x {args.rounds} rounds via {args.provider} SDK; "
+          f"provider: {args.ttft}s to first token, {args.decode_tps:.0f} tokens/s\n")
+    
+    results = {mode: run(mode, recordings, args) for mode in ("buffered", "streamed")}
+    
+    def mean_ms(samples: List[float]) -> str:
+        return f"{summarize(samples)['mean'] * 1000:>7.0f}ms" if samples else f"{'-':>9}"
+    
+    print(f"{'response':<28} {'mode':>8} {'1st action':>10} {'full plan':>10} {'error':>9}")
+    for recording in recordings:
+        for mode in ("buffered", "streamed"):
+            entry = results[mode][recording["name"]]
+            print(
+                f"{recording['name']:<28} {mode:>8} {mean_ms(entry['first_action']):>10} "
+                f"{mean_ms(entry['full']):>10} {mean_ms(entry['error'])}"
+            )
+    
+    print()
+    for mode in ("buffered", "streamed"):
+        first = [t for entry in results[mode].values() for t in entry["first_action"]]
+        full = [t for entry in results[mode].values() for t in entry["full"]]
+        errors = [t for entry in results[mode].values() for t in entry["error"]]
+        print(
+            f"{mode:>8}: time to first action {mean_ms(first).strip()}, "
+            f"time to full plan {mean_ms(full).strip()}, time to error {mean_ms(errors).strip()}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+"""
+Benchmark - Content-Triggered Watcher Cycle: Done/ Rescans vs the Vault Index
+
+Fills Done/ with --files markdown notes spread over --days day shards
+(one in --trigger-every mentions a client project), then runs one cycle
+of the Odoo, Twitter, Facebook, Instagram and LinkedIn watchers (their
+real check methods, task creation included) in three situations:
+
+    first     watchers start with no state
+    steady    --new notes archived since the previous cycle
+    restart   watchers restarted (new process), --new more notes
+
+The modes differ only in how the checks read Done/ and Business_Goals.md:
+
+    rescan          the original watchers: every check lists and reads all
+                    of Done/, every watcher reads Business_Goals.md
+    archive-cursor  in-memory ArchiveCursor per check (24h window for
+                    Twitter quick wins and LinkedIn); a restart reads all
+                    of Done/ again
+    vault-index     orchestration/vault_index.py: one persisted index and
+                    a cursor per check; Business_Goals.md via VaultCache
+
+Usage:
+    python benchmarks/bench_vault_index.py
+    python benchmarks/bench_vault_index.py --files 200000 --days 365
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import counting_fs_calls, isolated_workspace
+
+DAY = 86400
+
+FILLER = "Routine note, archived for the record; nothing to announce. " * 16
+
+
+class UncachedReads:
+    """Stand-in for VaultCache: every read opens the file (previous watchers)."""
+    
+    def read(self, path: Path) -> Optional[str]:
+        return path.read_text(encoding='utf-8') if path.exists() else None
+
+
+class RescanCursor:
+    """Every check reads the whole folder."""
+    
+    def __init__(self, archive: Any):
+        self.archive = archive
+    
+    def new_entries(self):
+        return self.archive.iter_entries()
+    
+    def commit(self) -> None:
+        pass
+
+
+class WindowCursor(RescanCursor):
+    """Last 24 hours on every check (Twitter quick wins, LinkedIn)."""
+    
+    def new_entries(self):
+        return self.archive.iter_entries(since=time.time() - DAY)
+
+
+class counting_reads:
+    """Count file content reads (Path.read_bytes / read_text) while active."""
+    
+    def __init__(self):
+        self.reads = 0
+        self._originals = {}
+    
+    def __enter__(self) -> "counting_reads":
+        for name in ("read_bytes", "read_text"):
+            original = getattr(Path, name)
+            self._originals[name] = original
+            
+            def counted(path, *args, _original=original, **kwargs):
+                self.reads += 1
+                return _original(path, *args, **kwargs)
+            setattr(Path, name, counted)
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        for name, original in self._originals.items():
+            setattr(Path, name, original)
+
+
+def fill_done(done: Path, files: int, days: int, trigger_every: int, start: int = 0, today: bool = False) -> None:
+    now = time.time()
+    for i in range(start, start + files):
+        when = now - 60 if today else now - (files - (i - start)) * days * DAY / files
+        day = datetime.fromtimestamp(when, tz=timezone.utc).strftime("%Y-%m-%d")
+        note = done / day / f"TASK_{i:07d}.md"
+        note.parent.mkdir(parents=True, exist_ok=True)
+        text = "Client project delivered, invoice sent.\n" if i % trigger_every == 0 else ""
+        note.write_text(f"# Task {i}\n\n{text}{FILLER}\n", encoding="utf-8")
+        os.utime(note, (when, when))
+
+
+def build_watchers(mode: str, vault: Path) -> Dict[str, Any]:
+    from orchestration import vault_cache
+    from orchestration.completion_archive import ArchiveCursor, CompletionArchive
+    from watcher_odoo import OdooWatcher
+    from watcher_twitter import TwitterWatcher
+    from watcher_facebook import FacebookWatcher
+    from watcher_instagram import InstagramWatcher
+    from watcher_linkedin import LinkedInWatcher
+    
+    watchers = {
+        "odoo": OdooWatcher(),
+        "twitter": TwitterWatcher(),
+        "facebook": FacebookWatcher(vault),
+        "instagram": InstagramWatcher(),
+        "linkedin": LinkedInWatcher(vault_path=str(vault))
+    }
+    logging.getLogger().setLevel(logging.WARNING)
+    
+    if mode != "vault-index":
+        vault_cache._vault_cache = UncachedReads()
+        archive = CompletionArchive(vault / "Done")
+        cursor = RescanCursor if mode == "rescan" else (lambda archive: ArchiveCursor(archive))
+        window = RescanCursor if mode == "rescan" else WindowCursor
+        watchers["odoo"].done_cursor = cursor(archive)
+        watchers["instagram"].done_cursor = cursor(archive)
+        watchers["facebook"].done_cursor = cursor(archive)
+        watchers["twitter"].insight_cursor = cursor(archive)
+        watchers["twitter"].quick_win_cursor = window(archive)
+        watchers["linkedin"].done_cursor = window(archive)
+    return watchers
+
+
+def cycle(watchers: Dict[str, Any]) -> int:
+    """One pass of each watcher's loop body."""
+    tasks = 0
+    
+    odoo = watchers["odoo"]
+    triggers = odoo.check_done_folder() + odoo.check_business_goals()
+    for trigger in triggers:
+        odoo._create_task(trigger['type'], trigger['content'])
+        odoo.processed_items.add(trigger['key'])
+    odoo.done_cursor.commit()
+    tasks += len(triggers)
+    
+    twitter = watchers["twitter"]
+    triggers = twitter.check_breaking_news() + twitter.check_quick_wins() + twitter.check_insights()
+    for trigger in triggers:
+        twitter._create_task(trigger['type'], trigger['content'])
+        twitter.processed_items.add(trigger['key'])
+        twitter._track_tweet(trigger['type'], trigger['key'])
+    twitter.quick_win_cursor.commit()
+    twitter.insight_cursor.commit()
+    tasks += len(triggers)
+    
+    instagram = watchers["instagram"]
+    triggers = instagram.check_visual_content() + instagram.check_business_milestones()
+    for trigger in triggers:
+        instagram._create_task(trigger['type'], trigger['content'])
+        instagram.processed_items.add(trigger['key'])
+    instagram.done_cursor.commit()
+    tasks += len(triggers)
+    
+    watchers["facebook"].run_check()
+    
+    linkedin = watchers["linkedin"]
+    opportunities = linkedin.check_for_posting_opportunities()
+    if opportunities:
+        linkedin.create_linkedin_post_task(opportunities)
+    linkedin.done_cursor.commit()
+    return tasks
+
+
+def close(watchers: Dict[str, Any]) -> None:
+    from benchmarks.common import reset_singletons
+    
+    for name in ("odoo", "twitter", "instagram"):
+        watchers[name].processed_items.close()
+    watchers["facebook"].processed_tasks.close()
+    reset_singletons()  # Also drops the process's vault index: a restart
+
+
+def run(mode: str, args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    results = {}
+    with isolated_workspace(vault_from_repo=False) as workspace:
+        (workspace / "logs").mkdir()
+        vault = workspace / "obsidian_vault"
+        (vault / "Business_Goals.md").write_text(
+            "# Business Goals\n\n- [x] ✅ Milestone: first 10 clients achieved\n- [ ] Revenue target $50k\n",
+            encoding="utf-8"
+        )
+        fill_done(vault / "Done", args.files, args.days, args.trigger_every)
+        next_file = args.files
+        
+        watchers = build_watchers(mode, vault)
+        for situation in ("first", "steady", "restart"):
+            if situation != "first":
+                fill_done(vault / "Done", args.new, args.days, args.trigger_every, start=next_file, today=True)
+                next_file += args.new
+                time.sleep(1.1)  # Past VAULT_INDEX_REFRESH_SECONDS and coarse mtimes
+            if situation == "restart":
+                close(watchers)
+                watchers = build_watchers(mode, vault)
+            
+            counts: dict = {}
+            started = time.perf_counter()
+            with counting_fs_calls(counts), counting_reads() as reads:
+                cycle(watchers)
+            results[situation] = {"seconds": time.perf_counter() - started, "reads": reads.reads,
+                                  "stat": counts.get("stat", 0)}
+        close(watchers)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=50000, help="Notes in Done/")
+    parser.add_argument("--days", type=int, default=90, help="Days the notes are spread over")
+    parser.add_argument("--new", type=int, default=20, help="Notes archived before each later cycle")
+    parser.add_argument("--trigger-every", type=int, default=500, help="Every n-th note mentions a client project")
+    args = parser.parse_args()
+    
+    os.environ["VAULT_INDEX_REFRESH_SECONDS"] = "1"
+    
+    print(f"{args.files} notes over {args.days} days in Done/; {args.new} new before each later cycle\n")
+    print(f"{'mode':<15} {'situation':<9} {'cycle':>9} {'reads':>8} {'stats':>8}")
+    for mode in ("rescan", "archive-cursor", "vault-index"):
+        for situation, r in run(mode, args).items():
+            print(f"{mode:<15} {situation:<9} {r['seconds']:>8.2f}s {r['reads']:>8} {r['stat']:>8}")
+
+
+if __name__ == "__main__":
+    main()
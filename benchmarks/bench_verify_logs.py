@@ -0,0 +1,131 @@
+"""
+Benchmark - Full-Retention Compliance Log Verification
+
+Generates a tenant's compliance logs (--days daily files, --mb in total,
+correctly signed and chained like ComplianceLogger writes them) and times:
+
+    before            the previous verify_log_integrity() run for every day
+                      (readlines, HMAC + chain hash per line, one process)
+    full/1 proc       LogVerifier in-process, streaming, writes checkpoints
+    full/N procs      LogVerifier over a process pool (--workers)
+    re-verify         after one more day is appended: checkpointed days are
+                      skipped, only the new day is read
+
+Usage:
+    python benchmarks/bench_verify_logs.py
+    python benchmarks/bench_verify_logs.py --mb 4096 --days 365 --workers 8
+"""
+
+import os
+import sys
+import json
+import hmac
+import time
+import hashlib
+import argparse
+from pathlib import Path
+from datetime import date, timedelta
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import isolated_workspace
+
+GENESIS = "0" * 64
+KEY = b"bench-signing-key"
+
+
+def write_day(log_file: Path, day: date, count: int) -> None:
+    """One day of signed entries, chained from the genesis hash like a logger started that day."""
+    previous_hash = GENESIS
+    lines = []
+    for i in range(count):
+        entry = {
+            "timestamp": f"{day.isoformat()}T{i * 86400 // count // 3600:02d}:00:00Z",
+            "tenant_id": "tenant_bench",
+            "action": ("task_created", "email_sent", "payment_approved", "social_post_published")[i % 4],
+            "risk_level": ("low", "medium", "high", "low")[i % 4],
+            "details": {"task_id": f"TASK_{day:%Y%m%d}_{i:06d}", "recipient": "client@example.com", "amount": i * 7 % 5000},
+            "previous_hash": previous_hash
+        }
+        entry["signature"] = hmac.new(KEY, json.dumps(entry, sort_keys=True).encode('utf-8'), hashlib.sha256).hexdigest()
+        previous_hash = hashlib.sha256(previous_hash.encode('utf-8') + json.dumps(entry, sort_keys=True).encode('utf-8')).hexdigest()
+        entry["chain_hash"] = previous_hash
+        lines.append(json.dumps(entry) + "\n")
+    
+    with open(log_file, 'a', encoding='utf-8') as f:
+        f.write("".join(lines))
+
+
+def legacy_verify_day(log_file: Path) -> int:
+    """The previous ComplianceLogger.verify_log_integrity() loop; returns failures."""
+    with open(log_file, 'r') as f:
+        lines = f.readlines()
+    
+    failures = 0
+    previous_hash = GENESIS
+    for line in lines:
+        entry = json.loads(line)
+        signature = entry.pop('signature')
+        chain_hash = entry.pop('chain_hash')
+        expected = hmac.new(KEY, json.dumps(entry, sort_keys=True).encode('utf-8'), hashlib.sha256).hexdigest()
+        if signature != expected:
+            failures += 1
+        if entry.get('previous_hash') != previous_hash:
+            failures += 1
+        hashlib.sha256(previous_hash.encode('utf-8') + json.dumps(entry, sort_keys=True).encode('utf-8')).hexdigest()
+        previous_hash = chain_hash
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mb", type=int, default=2048, help="Total size of the generated logs")
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+    
+    with isolated_workspace(vault_from_repo=False) as workspace:
+        log_dir = workspace / "audit_logs" / "tenant_bench"
+        log_dir.mkdir(parents=True)
+        
+        per_day = max(1, args.mb * 1024 * 1024 // 430 // args.days)  # ~430 bytes per entry
+        today = date.today()
+        started = time.perf_counter()
+        for offset in range(args.days, 0, -1):
+            day = today - timedelta(days=offset)
+            write_day(log_dir / f"compliance_audit_{day.isoformat()}.jsonl", day, per_day)
+        size = sum(f.stat().st_size for f in log_dir.glob("*.jsonl"))
+        print(
+            f"{per_day * args.days:,} entries, {args.days} days, {size / 1e9:.2f} GB "
+            f"(generated in {time.perf_counter() - started:.0f}s); {os.cpu_count()} CPUs\n"
+        )
+        
+        from orchestration.log_verifier import LogVerifier
+        files = sorted(log_dir.glob("compliance_audit_*.jsonl"))
+        
+        def run(label, function):
+            started = time.perf_counter()
+            outcome = function()
+            elapsed = time.perf_counter() - started
+            print(f"{label:<28} {elapsed:>8.2f}s  {outcome}")
+        
+        def verify(workers, checkpoint_name, full=True):
+            verifier = LogVerifier("compliance", KEY, log_dir / checkpoint_name, workers=workers)
+            reports = verifier.verify(sorted(log_dir.glob("compliance_audit_*.jsonl")), full=full)
+            failures = sum(len(r["failures"]) for r in reports.values())
+            checked = sum(r["checked"] for r in reports.values())
+            return f"{checked:,} entries read, {failures} failures"
+        
+        run("before (per-day readlines)", lambda: f"{sum(legacy_verify_day(f) for f in files)} failures")
+        run("full / 1 process", lambda: verify(1, "checkpoints_serial.jsonl"))
+        if args.workers > 1:
+            run(f"full / {args.workers} processes", lambda: verify(args.workers, "checkpoints.jsonl"))
+        else:
+            (log_dir / "checkpoints.jsonl").write_bytes((log_dir / "checkpoints_serial.jsonl").read_bytes())
+        
+        write_day(log_dir / f"compliance_audit_{today.isoformat()}.jsonl", today, per_day)
+        run("re-verify (+1 day)", lambda: verify(args.workers, "checkpoints.jsonl", full=False))
+
+
+if __name__ == "__main__":
+    main()
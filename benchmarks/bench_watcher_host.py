@@ -0,0 +1,141 @@
+"""
+Benchmark - Idle Watchers: One Process per Watcher vs the Watcher Host
+
+Starts every watcher pm2 used to run (filesystem, gmail, linkedin,
+facebook, instagram, twitter, odoo) in a throwaway workspace, waits
+until startup and the first checks are over (no CPU used for a second),
+then samples the processes from /proc for --seconds of idle time:
+
+    processes   previous ecosystem.config.js: python watcher_<name>.py
+                for each watcher (seven interpreters)
+    host        watcher_host.py: all seven as plugins in one process
+
+Reported: resident memory (RSS; PSS counts pages shared between the
+processes once), threads, time and CPU seconds spent starting up
+(interpreter, imports, dotenv and logging setup, first checks) and idle
+CPU.
+
+Linux only (/proc).
+
+Usage:
+    python benchmarks/bench_watcher_host.py
+    python benchmarks/bench_watcher_host.py --seconds 120
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+from pathlib import Path
+from typing import Dict, List
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import REPO_ROOT, isolated_workspace
+from watcher_host import DEFAULT_WATCHERS
+
+WATCHERS = DEFAULT_WATCHERS.split(",")
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+def cpu_seconds(pid: int) -> float:
+    """User + system CPU time of a process so far."""
+    fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def memory(pid: int) -> Dict[str, int]:
+    """RSS, PSS (kB) and thread count of a process."""
+    status = dict(
+        line.split(":", 1) for line in Path(f"/proc/{pid}/status").read_text().splitlines() if ":" in line
+    )
+    pss = 0
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+        if line.startswith("Pss:"):
+            pss = int(line.split()[1])
+    return {"rss": int(status["VmRSS"].split()[0]), "pss": pss, "threads": int(status["Threads"])}
+
+
+def settle(pids: List[int], timeout: float) -> float:
+    """Wait until the processes used no CPU for a second; returns seconds waited."""
+    started = time.monotonic()
+    used = sum(cpu_seconds(pid) for pid in pids)
+    while time.monotonic() - started < timeout:
+        time.sleep(1)
+        previous, used = used, sum(cpu_seconds(pid) for pid in pids)
+        if used - previous < 0.02:
+            break
+    return time.monotonic() - started
+
+
+def launch(mode: str, workspace: Path) -> List[subprocess.Popen]:
+    env = dict(os.environ, LOG_LEVEL="WARNING", PYTHONUNBUFFERED="1")
+    if mode == "host":
+        commands = [[sys.executable, str(REPO_ROOT / "watcher_host.py")]]
+    else:
+        commands = [[sys.executable, str(REPO_ROOT / f"watcher_{name}.py")] for name in WATCHERS]
+    return [
+        subprocess.Popen(command, cwd=workspace, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        for command in commands
+    ]
+
+
+def run(mode: str, args: argparse.Namespace) -> Dict[str, float]:
+    with isolated_workspace() as workspace:
+        (workspace / "logs").mkdir()
+        (workspace / "watch_inbox").mkdir()
+        processes = launch(mode, workspace)
+        try:
+            pids = [p.pid for p in processes]
+            ready = settle(pids, args.warmup)
+            dead = [p.args[-1] for p in processes if p.poll() is not None]
+            if dead:
+                raise RuntimeError(f"{mode}: exited during startup: {', '.join(dead)}")
+            
+            startup = sum(cpu_seconds(pid) for pid in pids)
+            started = time.monotonic()
+            time.sleep(args.seconds)
+            idle = sum(cpu_seconds(pid) for pid in pids) - startup
+            window = time.monotonic() - started
+            
+            samples = [memory(pid) for pid in pids]
+        finally:
+            for p in processes:
+                p.terminate()
+            for p in processes:
+                try:
+                    p.wait(timeout=15)
+                except subprocess.TimeoutExpired:
+                    p.kill()
+    
+    return {
+        "processes": len(samples),
+        "rss_mb": sum(s["rss"] for s in samples) / 1024,
+        "pss_mb": sum(s["pss"] for s in samples) / 1024,
+        "threads": sum(s["threads"] for s in samples),
+        "ready": ready,
+        "startup_cpu": startup,
+        "idle_cpu_pct": 100 * idle / window
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--warmup", type=float, default=120, help="Longest wait for startup and first checks")
+    parser.add_argument("--seconds", type=float, default=60, help="Idle seconds sampled")
+    args = parser.parse_args()
+    
+    print(f"{len(WATCHERS)} watchers ({DEFAULT_WATCHERS}); {os.cpu_count()} CPUs; idle for {args.seconds:.0f}s\n")
+    print(f"{'mode':<10} {'procs':>5} {'RSS':>9} {'PSS':>9} {'threads':>8} {'ready':>7} {'startup CPU':>12} {'idle CPU':>9}")
+    for mode in ("processes", "host"):
+        r = run(mode, args)
+        print(
+            f"{mode:<10} {r['processes']:>5} {r['rss_mb']:>6.1f} MB {r['pss_mb']:>6.1f} MB {r['threads']:>8} "
+            f"{r['ready']:>6.1f}s {r['startup_cpu']:>11.2f}s {r['idle_cpu_pct']:>8.3f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,333 @@
+"""
+Benchmark Helpers - Shared Fixtures for Performance Benchmarks
+
+Every benchmark runs inside a throwaway workspace (task_queue/, vault,
+audit_logs/) so the real vault and queues are never touched.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import uuid
+import shutil
+import builtins
+import tempfile
+import statistics
+import contextlib
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+# Keep component logging out of the timings
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+
+class StubLLM:
+    """Drop-in stand-in for LLMInterface that sleeps instead of calling an API."""
+    
+    provider = "stub"
+    
+    def __init__(self, latency: float = 0.02):
+        self.latency = latency
+        self.calls = 0
+        self.batch_calls = 0
+    
+    def reason(
+        self,
+        task: Dict[str, Any],
+        skills: Dict[str, str],
+        context: Optional[str] = None
+    ) -> Dict[str, Any]:
+        self.calls += 1
+        time.sleep(self.latency)
+        return {
+            "thought_process": f"Stub plan for {task.get('task_id')}",
+            "actions": [
+                {
+                    "mcp_server": "email_server",
+                    "command": "send",
+                    "parameters": {},
+                    "description": "Stub action"
+                }
+            ],
+            "requires_approval": False,
+            "confidence": 0.9
+        }
+    
+    def reason_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        skills: Dict[str, str],
+        context: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        self.batch_calls += 1
+        self.calls += 1
+        time.sleep(self.latency)
+        return [
+            {
+                "thought_process": f"Stub plan for {task.get('task_id')}",
+                "actions": [],
+                "requires_approval": False,
+                "confidence": 0.9,
+                "usage": {"batch_size": len(tasks)}
+            }
+            for task in tasks
+        ]
+
+
+def fake_plan(user_prompt: str) -> Tuple[Dict[str, Any], int]:
+    """
+    Canned LLM answer for a reasoning prompt: one plan, or one plan per
+    task for batch prompts ("# Task N of M"). Returns (body, plan count).
+    """
+    plan = {"thought_process": "ok", "actions": [], "requires_approval": False, "confidence": 0.9}
+    task_ids = re.findall(r"\*\*Task ID\*\*: (\S+)", user_prompt)
+    
+    if re.search(r"^# Task \d+ of \d+", user_prompt, re.MULTILINE):
+        return {"plans": [dict(plan, task_id=task_id) for task_id in task_ids]}, len(task_ids)
+    return plan, 1
+
+
+class SimulatedAnthropic:
+    """
+    Stand-in for anthropic.Anthropic with a simple cost/latency model.
+    
+    Prompt cache: each cache_control breakpoint caches everything up to it;
+    a later request with the same prefix reads it back. Latency is a fixed
+    base plus prefill per uncached input token plus decode per output token.
+    Batch prompts ("# Task N of M") get one plan per task ID.
+    """
+    
+    def __init__(self, base_ms: float = 5.0, prefill_us: float = 20.0, decode_us: float = 0.0, plan_tokens: int = 40):
+        self.base_ms = base_ms
+        self.prefill_us = prefill_us
+        self.decode_us = decode_us
+        self.plan_tokens = plan_tokens
+        self.cached_prefixes = set()
+        self.requests = 0
+        self.messages = self
+    
+    def create(self, **kwargs):
+        from types import SimpleNamespace
+        
+        self.requests += 1
+        blocks = [block["text"] for block in kwargs.get("system", [])]
+        tokens = [len(text) // 4 for text in blocks]
+        user_prompt = kwargs["messages"][0]["content"]
+        
+        cache_read = cache_write = 0
+        for i, block in enumerate(kwargs.get("system", [])):
+            if "cache_control" not in block:
+                continue
+            prefix = tuple(blocks[:i + 1])
+            if prefix in self.cached_prefixes:
+                cache_read = sum(tokens[:i + 1])
+            else:
+                self.cached_prefixes.add(prefix)
+                cache_write = sum(tokens[:i + 1]) - cache_read
+        
+        body, plan_count = fake_plan(user_prompt)
+        
+        uncached = sum(tokens) + len(user_prompt) // 4 - cache_read - cache_write
+        output_tokens = self.plan_tokens * plan_count
+        time.sleep((
+            self.base_ms * 1000
+            + (uncached + cache_write) * self.prefill_us
+            + output_tokens * self.decode_us
+        ) / 1e6)
+        
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(body))],
+            usage=SimpleNamespace(
+                input_tokens=uncached,
+                cache_creation_input_tokens=cache_write,
+                cache_read_input_tokens=cache_read,
+                output_tokens=output_tokens
+            )
+        )
+
+
+@contextlib.contextmanager
+def isolated_workspace(vault_from_repo: bool = True) -> Iterator[Path]:
+    """
+    Run inside a temporary working directory with its own task queue,
+    vault and audit logs, and fresh component singletons.
+    """
+    previous_cwd = Path.cwd()
+    previous_env = dict(os.environ)
+    workspace = Path(tempfile.mkdtemp(prefix="ai_employee_bench_"))
+    
+    try:
+        vault = workspace / "obsidian_vault"
+        if vault_from_repo:
+            shutil.copytree(
+                REPO_ROOT / "obsidian_vault",
+                vault,
+                ignore=shutil.ignore_patterns("Done", "Plans", "Logs", ".obsidian")
+            )
+        else:
+            vault.mkdir()
+        
+        os.environ["VAULT_PATH"] = str(vault)
+        os.environ["DASHBOARD_PATH"] = str(vault / "Dashboard.md")
+        os.environ["AUDIT_LOG_PATH"] = str(workspace / "audit_logs")
+        os.environ["DEPLOYMENT_TIER"] = "bronze"
+        os.chdir(workspace)
+        reset_singletons()
+        
+        yield workspace
+    
+    finally:
+        os.chdir(previous_cwd)
+        os.environ.clear()
+        os.environ.update(previous_env)
+        reset_singletons()
+        shutil.rmtree(workspace, ignore_errors=True)
+
+
+def reset_singletons() -> None:
+    """Drop cached component instances so they pick up the current workspace."""
+    from orchestration import audit_logger, ralph_loop, retry_handler, llm_interface, vault_cache, reasoning_cache, mcp_clients
+    from orchestration import vault_index
+    
+    if audit_logger._audit_logger is not None:
+        audit_logger._audit_logger.close()
+    audit_logger._audit_logger = None
+    ralph_loop._ralph_loop = None
+    retry_handler._retry_handler = None
+    llm_interface._llm_interface = None
+    vault_cache._vault_cache = None
+    for index in vault_index._vault_indexes.values():
+        index.close()
+    vault_index._vault_indexes.clear()
+    reasoning_cache._reasoning_cache = None
+    if mcp_clients._client_pool is not None:
+        mcp_clients._client_pool.close()
+    mcp_clients._client_pool = None
+    
+    compliance_logger = sys.modules.get("platinum.compliance_logger")
+    if compliance_logger is not None:
+        compliance_logger._compliance_loggers.clear()
+    social_scheduler = sys.modules.get("social_scheduler")
+    if social_scheduler is not None:
+        social_scheduler._social_scheduler = None
+
+
+def install_llm(llm: Any) -> None:
+    """Make get_llm_interface() return the given stub."""
+    from orchestration import llm_interface
+    
+    llm_interface._llm_interface = llm
+
+
+def write_inbox_tasks(
+    inbox: Path,
+    count: int,
+    priority: str = "normal",
+    task_type: str = "file_process"
+) -> List[str]:
+    """Write `count` BaseWatcher-shaped task files into inbox/."""
+    inbox.mkdir(parents=True, exist_ok=True)
+    task_ids = []
+    
+    for _ in range(count):
+        task_id = str(uuid.uuid4())
+        task = {
+            "task_id": task_id,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "source": "benchmark",
+            "type": task_type,
+            "priority": priority,
+            "context": {"note": "benchmark task"},
+            "required_skills": ["planning_skills"],
+            "hitl_required": False,
+            "status": "pending"
+        }
+        with open(inbox / f"{task_id}.json", "w", encoding="utf-8") as f:
+            json.dump(task, f)
+        task_ids.append(task_id)
+    
+    return task_ids
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile (pct in 0-100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """p50/p99/mean summary of latency samples (seconds)."""
+    return {
+        "count": len(samples),
+        "mean": statistics.fmean(samples) if samples else 0.0,
+        "p50": percentile(samples, 50),
+        "p99": percentile(samples, 99),
+    }
+
+
+@contextlib.contextmanager
+def counting_fs_calls(counts: dict):
+    """
+    Count filesystem calls made while active: os.stat/lstat/replace/rename/
+    unlink, open, os.scandir and DirEntry.stat() (counted as "stat").
+    counts["entries"] is the number of directory entries scandir returned.
+    """
+    patched = {}
+    
+    def wrap(owner, name, on_result=None):
+        original = getattr(owner, name)
+        patched[(owner, name)] = original
+        
+        def counted(*args, **kwargs):
+            counts[name] = counts.get(name, 0) + 1
+            result = original(*args, **kwargs)
+            return on_result(result) if on_result else result
+        setattr(owner, name, counted)
+    
+    class CountingEntry:
+        def __init__(self, entry):
+            self._entry = entry
+        
+        def __getattr__(self, name):
+            return getattr(self._entry, name)
+        
+        def __fspath__(self):
+            return self._entry.path
+        
+        def stat(self, **kwargs):
+            counts["stat"] = counts.get("stat", 0) + 1
+            return self._entry.stat(**kwargs)
+    
+    class CountingScandir:
+        def __init__(self, it):
+            self.it = it
+        
+        def __iter__(self):
+            for entry in self.it:
+                counts["entries"] = counts.get("entries", 0) + 1
+                yield CountingEntry(entry)
+        
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *exc):
+            self.it.close()
+    
+    for name in ("stat", "lstat", "replace", "rename", "unlink"):
+        wrap(os, name)
+    wrap(os, "scandir", CountingScandir)
+    wrap(builtins, "open")
+    try:
+        yield
+    finally:
+        for (owner, name), original in patched.items():
+            setattr(owner, name, original)
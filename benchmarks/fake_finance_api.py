@@ -0,0 +1,253 @@
+"""
+Fake Finance API - Local Plaid Transactions Server for the Finance Watcher
+
+Speaks just enough of the Plaid REST API for watchers/finance_watcher.py
+and the previous date-range polling:
+
+    POST /transactions/sync   access_token, cursor, count (max 500):
+                              added since the cursor, next_cursor, has_more
+    POST /transactions/get    access_token, start_date, end_date,
+                              options.count / options.offset
+
+Transactions are added per access token with post(); the cursor is an
+opaque position in that account's history. inject_mutations(n) answers
+the next n mid-pagination sync calls with
+TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION, as Plaid does when an item
+changes while it is being paged. As with Plaid, pagination must then
+restart from the cursor it started at: cursors handed out with has_more
+true before the mutation are rejected the same way from then on.
+
+Round trips, calls per endpoint and the most requests in flight at once
+are counted in stats.
+
+Usage:
+    python benchmarks/fake_finance_api.py --port 8072 --accounts 4 --transactions 10000
+"""
+
+import sys
+import json
+import time
+import base64
+import argparse
+import threading
+from pathlib import Path
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+PAGE_SIZE_LIMIT = 500
+
+MERCHANTS = ["Amazon.com", "Stripe Payment", "Office Supplies Co", "Client Payment - Invoice #123", "AWS"]
+
+
+class FakeFinanceAPI(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 Plaid stand-in with call and concurrency counters."""
+    
+    daemon_threads = True
+    
+    def __init__(self, port: int = 0, latency: float = 0.0, item_latency: float = 0.0):
+        super().__init__(("127.0.0.1", port), FakeFinanceHandler)
+        self.latency = latency
+        self.item_latency = item_latency
+        
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.accounts: Dict[str, List[Dict[str, Any]]] = {}  # access token -> history
+        self.mutations = 0
+        self.epochs: Dict[str, int] = {}  # access token -> mutations seen (stales mid-pagination cursors)
+        self.in_flight = 0
+        self.stats = {"http_requests": 0, "sync_calls": 0, "get_calls": 0, "errors": 0,
+                      "bytes_sent": 0, "max_in_flight": 0}
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+    
+    def start(self) -> "FakeFinanceAPI":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+    
+    def post(self, access_token: str, count: int = 1, date: Optional[str] = None,
+             days: int = 1) -> List[str]:
+        """
+        Add count transactions to an account.
+        
+        Without date, they are spread over the last days days (newest last).
+        
+        Returns:
+            The new transaction IDs
+        """
+        today = datetime.now().date()
+        ids = []
+        with self._lock:
+            history = self.accounts.setdefault(access_token, [])
+            for i in range(count):
+                n = len(history)
+                day = date or (today - timedelta(days=(days - 1) * (count - 1 - i) // max(count - 1, 1))).isoformat()
+                transaction = {
+                    "transaction_id": f"{access_token}-tx-{n:08d}",
+                    "account_id": f"{access_token}-checking",
+                    "amount": round(12.5 + (n * 37) % 4000, 2),
+                    "date": day,
+                    "name": MERCHANTS[n % len(MERCHANTS)],
+                    "category": ["Shopping"],
+                    "pending": False,
+                    "pending_transaction_id": None
+                }
+                history.append(transaction)
+                ids.append(transaction["transaction_id"])
+        return ids
+    
+    def settle(self, access_token: str, pending_id: str) -> str:
+        """Post the settled version of a pending transaction (new ID, same purchase)."""
+        with self._lock:
+            history = self.accounts[access_token]
+            pending = next(t for t in history if t["transaction_id"] == pending_id)
+            settled = dict(pending, transaction_id=f"{pending_id}-posted", pending=False,
+                           pending_transaction_id=pending_id)
+            history.append(settled)
+        return settled["transaction_id"]
+    
+    def inject_mutations(self, count: int) -> None:
+        """Fail the next count mid-pagination sync calls."""
+        self.mutations = count
+    
+    def call(self, path: str, body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        history = self.accounts.get(body.get("access_token", ""))
+        if history is None:
+            return 400, _error("INVALID_ACCESS_TOKEN", "provided access token is in an invalid format")
+        
+        if path == "/transactions/sync":
+            self.count("sync_calls")
+            return self._sync(body["access_token"], history, body)
+        if path == "/transactions/get":
+            self.count("get_calls")
+            return self._get(history, body)
+        return 404, _error("NOT_FOUND", f"unknown endpoint {path}")
+    
+    def _sync(self, access_token: str, history: List[Dict[str, Any]],
+              body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        cursor = body.get("cursor")
+        position, epoch = _decode_cursor(cursor) if cursor else (0, None)
+        count = min(int(body.get("count", 100)), PAGE_SIZE_LIMIT)
+        
+        with self._lock:
+            current = self.epochs.get(access_token, 0)
+            stale = epoch is not None and epoch < current
+            if stale or (epoch is not None and self.mutations > 0):
+                if not stale:
+                    self.mutations -= 1
+                    self.epochs[access_token] = current + 1
+                return 400, _error("TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION",
+                                   "Underlying transaction data changed since last page was fetched")
+            added = history[position:position + count]
+            end = position + len(added)
+            has_more = end < len(history)
+        
+        time.sleep(self.item_latency * len(added))
+        return 200, {
+            "added": added,
+            "modified": [],
+            "removed": [],
+            "next_cursor": _encode_cursor(end, current if has_more else None),
+            "has_more": has_more,
+            "request_id": f"sync-{end}"
+        }
+    
+    def _get(self, history: List[Dict[str, Any]], body: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        options = body.get("options") or {}
+        count = min(int(options.get("count", 100)), PAGE_SIZE_LIMIT)
+        offset = int(options.get("offset", 0))
+        
+        with self._lock:
+            matching = [t for t in history if body["start_date"] <= t["date"] <= body["end_date"]]
+        # Plaid lists newest first
+        matching.reverse()
+        page = matching[offset:offset + count]
+        
+        time.sleep(self.item_latency * len(page))
+        return 200, {"transactions": page, "total_transactions": len(matching), "request_id": f"get-{offset}"}
+
+
+def _encode_cursor(position: int, epoch: Optional[int] = None) -> str:
+    """Cursor at position; a mid-pagination one also carries the account's mutation epoch."""
+    value = f"v1:{position}" if epoch is None else f"v1:{position}:{epoch}"
+    return base64.urlsafe_b64encode(value.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[int, Optional[int]]:
+    fields = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+    return int(fields[1]), int(fields[2]) if len(fields) > 2 else None
+
+
+def _error(code: str, message: str) -> Dict[str, Any]:
+    return {"error_type": "TRANSACTIONS_ERROR", "error_code": code, "error_message": message}
+
+
+class FakeFinanceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # Headers and body in one write, flushed after each request
+    server: FakeFinanceAPI
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def do_POST(self) -> None:
+        server = self.server
+        with server._lock:
+            server.stats["http_requests"] += 1
+            server.in_flight += 1
+            server.stats["max_in_flight"] = max(server.stats["max_in_flight"], server.in_flight)
+        try:
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            time.sleep(server.latency)
+            status, payload = server.call(self.path, body)
+        finally:
+            with server._lock:
+                server.in_flight -= 1
+        if status != 200:
+            server.count("errors")
+        self._send(status, json.dumps(payload).encode())
+    
+    def _send(self, status: int, body: bytes) -> None:
+        self.server.count("bytes_sent", len(body))
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8072)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per HTTP round trip")
+    parser.add_argument("--accounts", type=int, default=1, help="Access tokens access-fake-0..n-1")
+    parser.add_argument("--transactions", type=int, default=0, help="Transactions seeded per account")
+    args = parser.parse_args()
+    
+    api = FakeFinanceAPI(port=args.port, latency=args.latency)
+    for i in range(args.accounts):
+        api.post(f"access-fake-{i}", args.transactions, days=7)
+    print(f"Fake finance API on {api.base_url}")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,379 @@
+"""
+Fake Gmail - Local Gmail API v1 Server for the Gmail Watchers
+
+Speaks just enough of the Gmail REST API for watchers/gmail_sync.py and
+the previous messages.list polling:
+
+    GET  /gmail/v1/users/me/profile          historyId of the mailbox
+    GET  /gmail/v1/users/me/messages         q (is:unread, is:important, is:starred,
+                                             label:X, OR), maxResults, pageToken
+    GET  /gmail/v1/users/me/messages/<id>    format=full | metadata (+ metadataHeaders)
+    GET  /gmail/v1/users/me/history          startHistoryId, labelId, historyTypes,
+                                             pageToken; messageAdded and labelAdded records
+    POST /batch, /batch/gmail/v1             multipart/mixed batch of the GETs above
+
+Mail is added with deliver() and labelled with add_labels(); each
+delivery or label change is one history record. A
+startHistoryId older than expire_history() answers 404, as Gmail does once
+it has dropped the mailbox history. Queries are read as OR-separated groups
+of ANDed terms. --throttle answers the first N batch sub-requests with
+429 rateLimitExceeded; batch_unavailable answers the next N whole batch
+requests with 503.
+
+Every API call (direct or inside a batch) is counted in stats with its
+Gmail quota cost; HTTP round trips are counted separately.
+
+Usage:
+    python benchmarks/fake_gmail_api.py --port 8071 --messages 1000
+"""
+
+import re
+import sys
+import json
+import time
+import uuid
+import base64
+import argparse
+import threading
+from pathlib import Path
+from email.parser import BytesParser
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Gmail API quota units per method
+QUOTA_UNITS = {"messages.get": 5, "messages.list": 5, "history.list": 2, "getProfile": 1}
+
+PAGE_SIZE_LIMIT = 500
+
+# historyTypes value per history record key
+HISTORY_TYPES = {"messagesAdded": "messageAdded", "labelsAdded": "labelAdded"}
+
+
+def gmail_service(api: "FakeGmailAPI") -> Any:
+    """googleapiclient Gmail service (bundled discovery document) pointed at api."""
+    import httplib2
+    from googleapiclient.discovery import build_from_document
+    from googleapiclient.discovery_cache import get_static_doc
+    
+    document = json.loads(get_static_doc("gmail", "v1"))
+    document["rootUrl"] = f"{api.base_url}/"
+    return build_from_document(document, http=httplib2.Http())
+
+
+class FakeGmailAPI(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 Gmail stand-in with call, quota and round trip counters."""
+    
+    daemon_threads = True
+    
+    def __init__(self, port: int = 0, latency: float = 0.0, item_latency: float = 0.0,
+                 body_size: int = 2000, throttle: int = 0):
+        super().__init__(("127.0.0.1", port), FakeGmailHandler)
+        self.latency = latency
+        self.item_latency = item_latency
+        self.body_size = body_size
+        self.throttle = throttle
+        self.batch_unavailable = 0
+        
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.messages: List[Dict[str, Any]] = []  # Delivery order
+        self.by_id: Dict[str, Dict[str, Any]] = {}
+        self.history: List[Dict[str, Any]] = []
+        self.history_id = 1000
+        self.oldest_history_id = 1000
+        self.stats = {"http_requests": 0, "batch_requests": 0, "api_calls": 0, "quota_units": 0,
+                      "throttled": 0, "bytes_sent": 0}
+        self.methods: Dict[str, int] = {}
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+    
+    def start(self) -> "FakeGmailAPI":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+    
+    def count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[name] += amount
+    
+    def deliver(self, count: int = 1, labels: Sequence[str] = ("INBOX", "UNREAD"),
+                important_every: int = 0) -> List[str]:
+        """
+        Add count messages, one history record each.
+        
+        important_every=n also labels every n-th message IMPORTANT.
+        """
+        ids = []
+        with self._lock:
+            for _ in range(count):
+                n = len(self.messages)
+                message_labels = list(labels)
+                if important_every and n % important_every == 0:
+                    message_labels.append("IMPORTANT")
+                self.history_id += 1
+                body = (f"Message {n} body. " * (self.body_size // 16 + 1))[:self.body_size]
+                message = {
+                    "id": f"{n + 1:016x}",
+                    "threadId": f"{n + 1:016x}",
+                    "historyId": str(self.history_id),
+                    "labelIds": message_labels,
+                    "snippet": body[:100],
+                    "internalDate": str(int(time.time() * 1000)),
+                    "headers": {
+                        "From": f"Sender {n % 37} <sender{n % 37}@example.com>",
+                        "To": "me@example.com",
+                        "Subject": "Invoice overdue" if n % 10 == 0 else f"Update {n}",
+                        "Date": time.strftime("%a, %d %b %Y %H:%M:%S +0000", time.gmtime()),
+                        "Message-ID": f"<{n}@example.com>"
+                    },
+                    "body": body
+                }
+                self.messages.append(message)
+                self.by_id[message["id"]] = message
+                self.history.append({
+                    "id": str(self.history_id),
+                    "messages": [{"id": message["id"], "threadId": message["threadId"]}],
+                    "messagesAdded": [{"message": {"id": message["id"], "threadId": message["threadId"],
+                                                   "labelIds": list(message_labels)}}]
+                })
+                ids.append(message["id"])
+        return ids
+    
+    def add_labels(self, message_ids: Sequence[str], labels: Sequence[str]) -> None:
+        """Label existing messages, one labelAdded history record each."""
+        with self._lock:
+            for message_id in message_ids:
+                message = self.by_id[message_id]
+                added = [label for label in labels if label not in message["labelIds"]]
+                if not added:
+                    continue
+                message["labelIds"].extend(added)
+                self.history_id += 1
+                self.history.append({
+                    "id": str(self.history_id),
+                    "messages": [{"id": message_id, "threadId": message["threadId"]}],
+                    "labelsAdded": [{"message": {"id": message_id, "threadId": message["threadId"],
+                                                 "labelIds": list(message["labelIds"])},
+                                     "labelIds": added}]
+                })
+    
+    def mark_read(self, message_ids: Sequence[str]) -> None:
+        with self._lock:
+            for message_id in message_ids:
+                labels = self.by_id[message_id]["labelIds"]
+                if "UNREAD" in labels:
+                    labels.remove("UNREAD")
+    
+    def expire_history(self) -> None:
+        """Drop the mailbox history: older startHistoryIds now answer 404."""
+        with self._lock:
+            self.history.clear()
+            self.oldest_history_id = self.history_id
+    
+    def call(self, path: str, in_batch: bool = False) -> Tuple[int, Dict[str, Any]]:
+        """Answer one API GET: (status, JSON body)."""
+        parts = urlsplit(path)
+        query = parse_qs(parts.query)
+        route = parts.path
+        
+        if route == "/gmail/v1/users/me/profile":
+            method = "getProfile"
+        elif route == "/gmail/v1/users/me/history":
+            method = "history.list"
+        elif route == "/gmail/v1/users/me/messages":
+            method = "messages.list"
+        elif re.fullmatch(r"/gmail/v1/users/me/messages/[^/]+", route):
+            method = "messages.get"
+        else:
+            return 404, _error(404, f"No route for {route}")
+        
+        with self._lock:
+            if in_batch and self.throttle > 0:
+                self.throttle -= 1
+                self.stats["throttled"] += 1
+                return 429, _error(429, "User-rate limit exceeded", "rateLimitExceeded")
+            self.stats["api_calls"] += 1
+            self.stats["quota_units"] += QUOTA_UNITS[method]
+            self.methods[method] = self.methods.get(method, 0) + 1
+            
+            if method == "getProfile":
+                return 200, {"emailAddress": "me@example.com", "messagesTotal": len(self.messages),
+                             "historyId": str(self.history_id)}
+            if method == "history.list":
+                return self._history_list(query)
+            if method == "messages.list":
+                return self._messages_list(query)
+            return self._messages_get(route.rsplit("/", 1)[1], query)
+    
+    def _history_list(self, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        start = int(query["startHistoryId"][0])
+        if start < self.oldest_history_id:
+            return 404, _error(404, "Requested entity was not found.")
+        label = query.get("labelId", [None])[0]
+        types = query.get("historyTypes")
+        records = []
+        for r in self.history:
+            key = next(k for k in HISTORY_TYPES if k in r)
+            if int(r["id"]) <= start or (types and HISTORY_TYPES[key] not in types):
+                continue
+            if not label or label in r[key][0]["message"]["labelIds"]:
+                records.append(r)
+        offset = int(query.get("pageToken", ["0"])[0])
+        size = min(int(query.get("maxResults", ["100"])[0]), PAGE_SIZE_LIMIT)
+        page = records[offset:offset + size]
+        response: Dict[str, Any] = {"historyId": str(self.history_id)}
+        if page:
+            response["history"] = page
+        if offset + size < len(records):
+            response["nextPageToken"] = str(offset + size)
+        return 200, response
+    
+    def _messages_list(self, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        q = query.get("q", [""])[0]
+        found = [m for m in reversed(self.messages) if _matches(m["labelIds"], q)]  # Newest first
+        offset = int(query.get("pageToken", ["0"])[0])
+        size = min(int(query.get("maxResults", ["100"])[0]), PAGE_SIZE_LIMIT)
+        page = found[offset:offset + size]
+        response: Dict[str, Any] = {"resultSizeEstimate": len(found)}
+        if page:
+            response["messages"] = [{"id": m["id"], "threadId": m["threadId"]} for m in page]
+        if offset + size < len(found):
+            response["nextPageToken"] = str(offset + size)
+        return 200, response
+    
+    def _messages_get(self, message_id: str, query: Dict[str, List[str]]) -> Tuple[int, Dict[str, Any]]:
+        message = self.by_id.get(message_id)
+        if message is None:
+            return 404, _error(404, "Requested entity was not found.")
+        fmt = query.get("format", ["full"])[0]
+        headers = message["headers"]
+        if fmt == "metadata" and "metadataHeaders" in query:
+            wanted = set(query["metadataHeaders"])
+            headers = {k: v for k, v in headers.items() if k in wanted}
+        payload: Dict[str, Any] = {
+            "mimeType": "text/plain",
+            "headers": [{"name": k, "value": v} for k, v in headers.items()]
+        }
+        if fmt == "full":
+            payload["body"] = {
+                "size": len(message["body"]),
+                "data": base64.urlsafe_b64encode(message["body"].encode()).decode()
+            }
+        return 200, {
+            "id": message["id"], "threadId": message["threadId"], "labelIds": list(message["labelIds"]),
+            "snippet": message["snippet"], "historyId": message["historyId"],
+            "internalDate": message["internalDate"], "sizeEstimate": len(message["body"]) + 500,
+            "payload": payload
+        }
+
+
+def _matches(labels: List[str], q: str) -> bool:
+    """OR-separated groups of ANDed is:/label: terms."""
+    if not q.strip():
+        return True
+    for group in q.split(" OR "):
+        wanted = []
+        for term in group.split():
+            kind, _, value = term.partition(":")
+            wanted.append(value.upper())
+        if all(label in labels for label in wanted):
+            return True
+    return False
+
+
+def _error(code: int, message: str, reason: str = "notFound") -> Dict[str, Any]:
+    return {"error": {"code": code, "message": message, "errors": [{"reason": reason, "message": message}]}}
+
+
+class FakeGmailHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # Headers and body in one write, flushed after each request
+    server: FakeGmailAPI
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def do_GET(self) -> None:
+        self.server.count("http_requests")
+        time.sleep(self.server.latency)
+        status, body = self.server.call(self.path)
+        self._send(status, json.dumps(body).encode(), "application/json; charset=UTF-8")
+    
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        content = self.rfile.read(length)
+        self.server.count("http_requests")
+        if urlsplit(self.path).path not in ("/batch", "/batch/gmail/v1"):
+            self._send(404, json.dumps(_error(404, "Not found")).encode(), "application/json")
+            return
+        self.server.count("batch_requests")
+        time.sleep(self.server.latency)
+        with self.server._lock:
+            unavailable = self.server.batch_unavailable > 0
+            self.server.batch_unavailable -= unavailable
+        if unavailable:
+            self._send(503, json.dumps(_error(503, "Backend Error", "backendError")).encode(), "application/json")
+            return
+        
+        envelope = BytesParser().parsebytes(
+            f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode() + content
+        )
+        boundary = f"batch_{uuid.uuid4().hex}"
+        out = []
+        for part in envelope.get_payload():
+            request_line = part.get_payload().split("\n", 1)[0].strip()
+            _, path, _ = request_line.split(" ", 2)
+            time.sleep(self.server.item_latency)
+            status, body = self.server.call(path, in_batch=True)
+            payload = json.dumps(body)
+            out.append(
+                f"--{boundary}\r\nContent-Type: application/http\r\n"
+                f"Content-ID: <response-{part['Content-ID'][1:-1]}>\r\n\r\n"
+                f"HTTP/1.1 {status} {'OK' if status == 200 else 'Error'}\r\n"
+                f"Content-Type: application/json; charset=UTF-8\r\nContent-Length: {len(payload)}\r\n\r\n"
+                f"{payload}\r\n"
+            )
+        out.append(f"--{boundary}--\r\n")
+        self._send(200, "".join(out).encode(), f"multipart/mixed; boundary={boundary}")
+    
+    def _send(self, status: int, body: bytes, content_type: str) -> None:
+        self.server.count("bytes_sent", len(body))
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8071)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds per HTTP round trip")
+    parser.add_argument("--item-latency", type=float, default=0.0, help="Seconds per batched call")
+    parser.add_argument("--messages", type=int, default=0, help="Unread INBOX messages to seed")
+    parser.add_argument("--throttle", type=int, default=0, help="Batch sub-requests answered 429 first")
+    args = parser.parse_args()
+    
+    api = FakeGmailAPI(port=args.port, latency=args.latency, item_latency=args.item_latency,
+                       throttle=args.throttle)
+    api.deliver(args.messages)
+    print(f"Fake Gmail API on {api.base_url}")
+    try:
+        api.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,306 @@
+"""
+Fake LLM Provider - Local Anthropic/OpenAI-Compatible Server
+
+Speaks just enough of POST /v1/messages (Anthropic) and
+POST /v1/chat/completions (OpenAI) for LLMInterface and
+AsyncLLMInterface, with provider-style limits:
+
+    --rpm / --tpm     budgets enforced per second (429 + retry-after when exceeded)
+    --latency         seconds per response (time to first token)
+    --decode-tps      output tokens per second after that (0 = instant)
+    --max-inflight    concurrent requests before 529/503 "overloaded"
+    --replay FILE     JSON list of recorded responses (texts or {"text": ...}), served in turn
+
+"stream": true requests get server-sent events, paced at --decode-tps.
+In-process, hold.clear() keeps every response waiting until hold.set().
+
+Point a client at it with ANTHROPIC_BASE_URL / OPENAI_BASE_URL.
+
+Usage:
+    python benchmarks/fake_llm_server.py --port 8765 --rpm 600 --latency 0.2
+"""
+
+import sys
+import json
+import time
+import uuid
+import argparse
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import fake_plan
+from orchestration.rate_limiter import TokenBucket
+
+
+class FakeLLMServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 server with request, 429 and connection counters."""
+    
+    daemon_threads = True
+    
+    def __init__(
+        self,
+        port: int = 0,
+        rpm: float = 0,
+        tpm: float = 0,
+        latency: float = 0.0,
+        max_inflight: int = 0,
+        decode_tps: float = 0.0,
+        replay: Optional[List[str]] = None
+    ):
+        super().__init__(("127.0.0.1", port), FakeLLMHandler)
+        self.latency = latency
+        self.max_inflight = max_inflight
+        self.decode_tps = decode_tps
+        self.replay = replay or []
+        self.hold = threading.Event()  # Cleared: responses wait until it is set again
+        self.hold.set()
+        self.requests = TokenBucket.per_minute(rpm, name="server RPM", burst_seconds=1.0)
+        self.tokens = TokenBucket.per_minute(tpm, name="server TPM", burst_seconds=1.0)
+        
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.inflight = 0
+        self.stats = {
+            "requests": 0, "ok": 0, "rate_limited": 0, "overloaded": 0,
+            "connections": 0, "peak_inflight": 0, "streams_abandoned": 0
+        }
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+    
+    def start(self) -> "FakeLLMServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+    
+    def handle_error(self, request, client_address):
+        pass  # Clients abandoning requests at their deadline are expected
+    
+    def count(self, key: str, delta: int = 1) -> int:
+        with self._lock:
+            self.stats[key] += delta
+            return self.stats[key]
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """One instance per connection (keep-alive)."""
+    
+    protocol_version = "HTTP/1.1"
+    server: FakeLLMServer
+    
+    def setup(self):
+        super().setup()
+        self.server.count("connections")
+    
+    def log_message(self, format, *args):
+        pass  # Keep benchmark output clean
+    
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        server = self.server
+        number = server.count("requests")
+        
+        if self.path.endswith("/v1/messages"):
+            prompt = request["messages"][-1]["content"]
+            system = "".join(block.get("text", "") for block in request.get("system", []))
+        elif self.path.endswith("/chat/completions"):
+            prompt = request["messages"][-1]["content"]
+            system = "".join(m["content"] for m in request["messages"][:-1])
+        else:
+            self._reply(404, {"error": {"type": "not_found_error", "message": self.path}})
+            return
+        
+        input_tokens = (len(system) + len(prompt)) // 4
+        
+        # Provider-side limits: reject instead of queueing
+        wait = server.requests.reserve(1) or server.tokens.reserve(input_tokens)
+        if wait:
+            server.count("rate_limited")
+            self._reply(429, {"type": "error", "error": {"type": "rate_limit_error", "message": "Rate limited"}},
+                        {"retry-after": f"{wait:.3f}"})
+            return
+        
+        with server._lock:
+            if server.max_inflight and server.inflight >= server.max_inflight:
+                server.stats["overloaded"] += 1
+                overloaded = True
+            else:
+                server.inflight += 1
+                server.stats["peak_inflight"] = max(server.stats["peak_inflight"], server.inflight)
+                overloaded = False
+        if overloaded:
+            self._reply(529, {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}})
+            return
+        
+        if server.replay:
+            text = server.replay[(number - 1) % len(server.replay)]
+            output_tokens = max(1, len(text) // 4)
+        else:
+            body, plans = fake_plan(prompt)
+            text = json.dumps(body)
+            output_tokens = 40 * plans
+        
+        try:
+            time.sleep(server.latency)
+            server.hold.wait()
+            if request.get("stream"):
+                self._stream(request, text, input_tokens, output_tokens)
+                return
+            if server.decode_tps:
+                time.sleep(output_tokens / server.decode_tps)
+        finally:
+            with server._lock:
+                server.inflight -= 1
+        
+        server.count("ok")
+        if self.path.endswith("/v1/messages"):
+            self._reply(200, {
+                "id": f"msg_{uuid.uuid4().hex[:12]}",
+                "type": "message",
+                "role": "assistant",
+                "model": request.get("model", "fake"),
+                "content": [{"type": "text", "text": text}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": input_tokens, "output_tokens": output_tokens}
+            })
+        else:
+            self._reply(200, {
+                "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": request.get("model", "fake"),
+                "choices": [{
+                    "index": 0,
+                    "message": {"role": "assistant", "content": text},
+                    "finish_reason": "stop"
+                }],
+                "usage": {
+                    "prompt_tokens": input_tokens,
+                    "completion_tokens": output_tokens,
+                    "total_tokens": input_tokens + output_tokens
+                }
+            })
+    
+    def _stream(self, request: Dict[str, Any], text: str, input_tokens: int, output_tokens: int) -> None:
+        """Send `text` as server-sent events, a few tokens per event."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        
+        chunk_chars = 12  # ~3 tokens per delta
+        delay = chunk_chars / 4 / self.server.decode_tps if self.server.decode_tps else 0.0
+        
+        if self.path.endswith("/v1/messages"):
+            events = self._anthropic_events(request, text, chunk_chars, input_tokens, output_tokens)
+        else:
+            events = self._openai_events(request, text, chunk_chars, input_tokens, output_tokens)
+        
+        try:
+            for event, is_delta in events:
+                if is_delta and delay:
+                    time.sleep(delay)
+                self._write_chunk(event.encode("utf-8"))
+            self._write_chunk(b"")
+            self.server.count("ok")
+        except (BrokenPipeError, ConnectionResetError):
+            # Client stopped reading (e.g. aborted a malformed plan)
+            self.server.count("streams_abandoned")
+            self.close_connection = True
+    
+    def _anthropic_events(self, request, text, chunk_chars, input_tokens, output_tokens) -> Iterator:
+        def sse(kind: str, data: Dict[str, Any]) -> str:
+            return f"event: {kind}\ndata: {json.dumps(dict(data, type=kind))}\n\n"
+        
+        yield sse("message_start", {"message": {
+            "id": f"msg_{uuid.uuid4().hex[:12]}", "type": "message", "role": "assistant",
+            "model": request.get("model", "fake"), "content": [], "stop_reason": None, "stop_sequence": None,
+            "usage": {"input_tokens": input_tokens, "output_tokens": 1}
+        }}), False
+        yield sse("content_block_start", {"index": 0, "content_block": {"type": "text", "text": ""}}), False
+        for i in range(0, len(text), chunk_chars):
+            yield sse("content_block_delta", {"index": 0, "delta": {"type": "text_delta", "text": text[i:i + chunk_chars]}}), True
+        yield sse("content_block_stop", {"index": 0}), False
+        yield sse("message_delta", {
+            "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+            "usage": {"output_tokens": output_tokens}
+        }), False
+        yield sse("message_stop", {}), False
+    
+    def _openai_events(self, request, text, chunk_chars, input_tokens, output_tokens) -> Iterator:
+        base = {
+            "id": f"chatcmpl-{uuid.uuid4().hex[:12]}",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": request.get("model", "fake")
+        }
+        
+        def sse(choices: List[Dict[str, Any]], **extra: Any) -> str:
+            return f"data: {json.dumps(dict(base, choices=choices, **extra))}\n\n"
+        
+        for i in range(0, len(text), chunk_chars):
+            delta = {"content": text[i:i + chunk_chars]}
+            if i == 0:
+                delta["role"] = "assistant"
+            yield sse([{"index": 0, "delta": delta, "finish_reason": None}]), True
+        yield sse([{"index": 0, "delta": {}, "finish_reason": "stop"}]), False
+        
+        if request.get("stream_options", {}).get("include_usage"):
+            yield sse([], usage={
+                "prompt_tokens": input_tokens,
+                "completion_tokens": output_tokens,
+                "total_tokens": input_tokens + output_tokens
+            }), False
+        yield "data: [DONE]\n\n", False
+    
+    def _write_chunk(self, data: bytes) -> None:
+        """One HTTP/1.1 chunk (empty data = last chunk)."""
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+    
+    def _reply(self, status: int, payload: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rpm", type=float, default=0)
+    parser.add_argument("--tpm", type=float, default=0)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--max-inflight", type=int, default=0)
+    parser.add_argument("--decode-tps", type=float, default=0)
+    parser.add_argument("--replay", type=Path, help="JSON list of response texts")
+    args = parser.parse_args()
+    
+    recorded = json.loads(args.replay.read_text(encoding="utf-8")) if args.replay else []
+    replay = [r["text"] if isinstance(r, dict) else r for r in recorded]
+    server = FakeLLMServer(args.port, args.rpm, args.tpm, args.latency, args.max_inflight, args.decode_tps, replay)
+    print(f"Fake LLM provider on {server.base_url} (RPM {args.rpm or 'unlimited'}, TPM {args.tpm or 'unlimited'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
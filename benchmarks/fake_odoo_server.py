@@ -0,0 +1,266 @@
+"""
+Fake Odoo - Local JSON-RPC Server for OdooServer
+
+Speaks just enough of Odoo's web JSON-RPC for OdooServer:
+
+    POST /web/session/authenticate         login, sets the session_id cookie
+    POST /web/session/get_session_info     uid of the cookie's session
+    POST /web/dataset/call_kw/<model>/<m>  search / read / search_read / create / action_post
+
+Records live in memory; domains support =, !=, in, ilike, =ilike (with %
+and _ wildcards and backslash escapes) and prefix | / & operators,
+create accepts one dict or a list of them, and many2one fields
+(partner_id) read back as [id, name]. Receivable and payable accounts
+are seeded. Sessions expire after --session-ttl seconds and then answer every call with Odoo's "Session Expired" error (code 100).
+--auth-latency adds the time a real server spends hashing the password.
+
+Point OdooServer at it with ODOO_URL.
+
+Usage:
+    python benchmarks/fake_odoo_server.py --port 8069 --auth-latency 0.05
+"""
+
+import re
+import sys
+import json
+import time
+import uuid
+import argparse
+import threading
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+class FakeOdooServer(ThreadingHTTPServer):
+    """Threaded HTTP/1.1 Odoo stand-in with authenticate, call and connection counters."""
+    
+    daemon_threads = True
+    
+    def __init__(self, port: int = 0, auth_latency: float = 0.0, latency: float = 0.0, session_ttl: float = 0.0):
+        super().__init__(("127.0.0.1", port), FakeOdooHandler)
+        self.auth_latency = auth_latency
+        self.latency = latency
+        self.session_ttl = session_ttl
+        
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.sessions: Dict[str, float] = {}  # session_id -> login time
+        self.records: Dict[str, List[Dict[str, Any]]] = {
+            "account.account": [
+                {"id": 1, "name": "Account Receivable", "code": "121000", "account_type": "asset_receivable",
+                 "current_balance": 0.0},
+                {"id": 2, "name": "Account Payable", "code": "211000", "account_type": "liability_payable",
+                 "current_balance": 0.0}
+            ]
+        }
+        self.stats = {"authenticate": 0, "calls": 0, "expired": 0, "connections": 0}
+        self.methods: Dict[str, int] = {}
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+    
+    def start(self) -> "FakeOdooServer":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+    
+    def expire_sessions(self) -> None:
+        """Forget every login, as an Odoo restart or session GC would."""
+        with self._lock:
+            self.sessions.clear()
+    
+    def count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+    
+    def login(self) -> str:
+        time.sleep(self.auth_latency)
+        session_id = uuid.uuid4().hex
+        with self._lock:
+            self.sessions[session_id] = time.monotonic()
+            self.stats["authenticate"] += 1
+        return session_id
+    
+    def session_valid(self, session_id: Optional[str]) -> bool:
+        with self._lock:
+            started = self.sessions.get(session_id or "")
+            if started is None:
+                return False
+            if self.session_ttl and time.monotonic() - started > self.session_ttl:
+                del self.sessions[session_id]
+                return False
+            return True
+    
+    def call_kw(self, model: str, method: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+        time.sleep(self.latency)
+        with self._lock:
+            self.stats["calls"] += 1
+            self.methods[f"{model}.{method}"] = self.methods.get(f"{model}.{method}", 0) + 1
+            records = self.records.setdefault(model, [])
+            if method == "create":
+                created = []
+                for vals in (args[0] if isinstance(args[0], list) else [args[0]]):
+                    record = {"id": len(records) + 1, "state": "draft", **vals}
+                    if model == "account.move":
+                        record.update(self._move_amounts(record))
+                    records.append(record)
+                    created.append(record["id"])
+                return created if isinstance(args[0], list) else created[0]
+            if method in ("search", "search_read"):
+                found = [r for r in records if _matches(r, args[0])]
+                if kwargs.get("order", "").endswith("desc"):
+                    found.reverse()
+                found = found[:kwargs.get("limit") or None]
+                if method == "search":
+                    return [r["id"] for r in found]
+                return [self._read(r, kwargs.get("fields")) for r in found]
+            if method == "read":
+                ids = set(args[0])
+                return [self._read(r, kwargs.get("fields")) for r in records if r["id"] in ids]
+            if method == "action_post":
+                ids = set(args[0])
+                for record in records:
+                    if record["id"] in ids:
+                        record["state"] = "posted"
+            return True  # write, ...
+    
+    @staticmethod
+    def _move_amounts(move: Dict[str, Any]) -> Dict[str, Any]:
+        total = sum(line[2].get("price_unit", 0) * line[2].get("quantity", 1) for line in move.get("invoice_line_ids", []))
+        return {"name": f"{'INV' if move.get('move_type') == 'out_invoice' else 'BILL'}/{move['id']:05d}",
+                "amount_total": total, "amount_residual": total}
+    
+    def _read(self, record: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+        result = {"id": record["id"]}
+        for field in fields or record:
+            value = record.get(field, False)
+            if field == "partner_id" and value:
+                partner = next((p for p in self.records.get("res.partner", []) if p["id"] == value), {})
+                value = [value, partner.get("name", "")]
+            result[field] = value
+        return result
+
+
+def _like(pattern: str) -> "re.Pattern[str]":
+    """Case-insensitive regex for a LIKE pattern (% and _ wildcards, backslash escapes)."""
+    parts = []
+    for escaped, char in re.findall(r"\\(.)|(.)", pattern, re.S):
+        if escaped:
+            parts.append(re.escape(escaped))
+        else:
+            parts.append({"%": ".*", "_": "."}.get(char, re.escape(char)))
+    return re.compile("".join(parts), re.I | re.S)
+
+
+def _matches(record: Dict[str, Any], domain: List[Any]) -> bool:
+    """Evaluate an Odoo domain (prefix | and &, implicit AND) against a record."""
+    stack: List[bool] = []
+    for term in reversed(domain):
+        if term in ("|", "&"):
+            left, right = stack.pop(), stack.pop()
+            stack.append(left or right if term == "|" else left and right)
+            continue
+        field, op, value = term
+        actual = record.get(field)
+        if op == "=":
+            stack.append(actual == value)
+        elif op == "!=":
+            stack.append(actual != value)
+        elif op == "in":
+            stack.append(actual in value)
+        elif op == "ilike":
+            stack.append(str(value).lower() in str(actual or "").lower())
+        elif op == "=ilike":
+            stack.append(_like(str(value)).fullmatch(str(actual or "")) is not None)
+        else:
+            raise ValueError(f"Unsupported domain operator {op}")
+    return all(stack)
+
+
+class FakeOdooHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # Headers and body in one write, flushed after each request
+    server: FakeOdooServer
+    
+    def setup(self) -> None:
+        super().setup()
+        self.server.count("connections")
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        params = request.get("params", {})
+        session_id = self._cookie("session_id")
+        
+        if self.path == "/web/session/authenticate":
+            session_id = self.server.login()
+            self._reply(request, {"result": {"uid": 2, "session_id": session_id}},
+                        {"Set-Cookie": f"session_id={session_id}; Path=/; HttpOnly"})
+            return
+        
+        if not self.server.session_valid(session_id):
+            self.server.count("expired")
+            self._reply(request, {"error": {
+                "code": 100,
+                "message": "Odoo Session Expired",
+                "data": {"name": "odoo.http.SessionExpiredException", "message": "Session expired"}
+            }})
+            return
+        
+        if self.path == "/web/session/get_session_info":
+            self._reply(request, {"result": {"uid": 2}})
+        elif self.path.startswith("/web/dataset/call_kw/"):
+            result = self.server.call_kw(params["model"], params["method"], params.get("args", []), params.get("kwargs", {}))
+            self._reply(request, {"result": result})
+        else:
+            self._reply(request, {"error": {"code": 404, "message": f"Unknown path {self.path}", "data": {}}})
+    
+    def _cookie(self, name: str) -> Optional[str]:
+        for part in (self.headers.get("Cookie") or "").split(";"):
+            key, _, value = part.strip().partition("=")
+            if key == name:
+                return value
+        return None
+    
+    def _reply(self, request: Dict[str, Any], body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> None:
+        data = json.dumps({"jsonrpc": "2.0", "id": request.get("id"), **body}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8069)
+    parser.add_argument("--auth-latency", type=float, default=0.0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--session-ttl", type=float, default=0.0)
+    args = parser.parse_args()
+    
+    server = FakeOdooServer(args.port, args.auth_latency, args.latency, args.session_ttl)
+    print(f"Fake Odoo on {server.base_url} (auth latency {args.auth_latency}s, session TTL {args.session_ttl or 'none'})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
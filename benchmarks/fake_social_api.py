@@ -0,0 +1,328 @@
+"""
+Fake Social APIs - Local HTTPS Server for the Social MCP Servers
+
+Answers the Graph API (Facebook, Instagram), Twitter API v2 and LinkedIn v2
+calls the MCP servers make, over TLS with a throwaway self-signed
+certificate for 127.0.0.1:
+
+    POST <anything>   {"id": N, "data": {"id": N, "text": <posted text>}}
+    GET  <anything>   {"id": ..., "name": ..., "status_code": "FINISHED", "data": []}
+
+With post_limit set, publishing POSTs (every POST except Instagram
+container creation, .../media) share a fixed window of post_limit posts
+per post_window seconds (windows start on multiples of post_window in
+epoch time, like Twitter's 15-minute windows). Graph API paths report the
+window's use in X-App-Usage, the others send x-rate-limit-limit,
+-remaining and -reset; a publishing POST over the limit gets 429 and
+publishes nothing.
+
+Counts TLS handshakes, requests and 429s, so tests can assert that
+keep-alive connections are reused and limits respected.
+
+Instagram media containers (POST .../media) take a random
+processing_delay to process: GET /<container id> answers status_code
+IN_PROGRESS until then, and FINISHED after (ERROR for an image_url
+containing "broken"). media_publish of a container that is not FINISHED
+fails with Graph error 9007, as the real API does. Trust the certificate with
+REQUESTS_CA_BUNDLE=<server.ca_file>; point a server at it by setting its
+base_url / api_base to server.base_url.
+
+Usage:
+    python benchmarks/fake_social_api.py --port 8443 --latency 0.05
+"""
+
+import ssl
+import sys
+import json
+import time
+import random
+import argparse
+import datetime
+import tempfile
+import ipaddress
+import threading
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def self_signed_cert(directory: Path) -> tuple:
+    """Write a self-signed cert/key for 127.0.0.1 and return their paths."""
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_file, key_file = directory / "cert.pem", directory / "key.pem"
+    cert_file.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_file.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ))
+    return cert_file, key_file
+
+
+def social_servers(api: "FakeSocialAPI", secrets: Path) -> tuple:
+    """Facebook, Instagram, Twitter and LinkedIn servers with tokens in `secrets`, pointed at api."""
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+    from facebook_server import FacebookServer
+    from instagram_server import InstagramServer
+    from twitter_server import TwitterServer
+    from linkedin_server import LinkedInMCPServer
+    
+    secrets.mkdir(parents=True, exist_ok=True)
+    tokens = {
+        "facebook": {"page_id": "1001", "page_access_token": "fb"},
+        "instagram": {"instagram_business_account_id": "2002", "access_token": "ig"},
+        "twitter": {"access_token": "tw"},
+        "linkedin": {"access_token": "li", "person_id": "abc"}
+    }
+    for name, token in tokens.items():
+        (secrets / f"{name}_token.json").write_text(json.dumps(token), encoding="utf-8")
+    
+    facebook = FacebookServer(str(secrets / "facebook_token.json"))
+    instagram = InstagramServer(str(secrets / "instagram_token.json"))
+    twitter = TwitterServer(str(secrets / "twitter_token.json"))
+    linkedin = LinkedInMCPServer(str(secrets / "linkedin_token.json"))
+    
+    facebook.base_url = instagram.base_url = f"{api.base_url}/v19.0"
+    twitter.base_url = f"{api.base_url}/2"
+    linkedin.api_base = f"{api.base_url}/v2"
+    return facebook, instagram, twitter, linkedin
+
+
+class FakeSocialAPI(ThreadingHTTPServer):
+    """Threaded HTTPS/1.1 server with handshake and request counters."""
+    
+    daemon_threads = True
+    
+    def __init__(self, port: int = 0, latency: float = 0.0, tls: bool = True,
+                 post_limit: int = 0, post_window: int = 900,
+                 processing_delay: Tuple[float, float] = (0.0, 0.0), seed: int = 0):
+        super().__init__(("127.0.0.1", port), FakeSocialHandler)
+        self.latency = latency
+        self.post_limit = post_limit
+        self.post_window = post_window
+        self.processing_delay = processing_delay
+        self._random = random.Random(seed)
+        self.ca_file: Optional[str] = None
+        self.context: Optional[ssl.SSLContext] = None
+        if tls:
+            self._certs = tempfile.TemporaryDirectory(prefix="fake_social_api_")
+            cert_file, key_file = self_signed_cert(Path(self._certs.name))
+            self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            self.context.load_cert_chain(cert_file, key_file)
+            self.ca_file = str(cert_file)
+        
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._next_id = 1000
+        self.posts: List[Dict[str, Any]] = []
+        self.stats = {"requests": 0, "handshakes": 0, "connections": 0, "rate_limited": 0,
+                      "status_polls": 0, "premature_publishes": 0}
+        self.endpoints: Dict[str, int] = {}
+        self.containers: Dict[str, Dict[str, Any]] = {}
+        self._window_start = 0
+        self._window_posts = 0
+    
+    @property
+    def base_url(self) -> str:
+        scheme = "https" if self.context else "http"
+        return f"{scheme}://127.0.0.1:{self.server_address[1]}"
+    
+    def start(self) -> "FakeSocialAPI":
+        """Serve on a background thread."""
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+    
+    def get_request(self):
+        sock, address = super().get_request()
+        if self.context:
+            # The handshake runs on the handler thread (see FakeSocialHandler.setup)
+            sock = self.context.wrap_socket(sock, server_side=True, do_handshake_on_connect=False)
+        return sock, address
+    
+    def count(self, name: str, endpoint: Optional[str] = None) -> None:
+        with self._lock:
+            self.stats[name] += 1
+            if endpoint:
+                self.endpoints[endpoint] = self.endpoints.get(endpoint, 0) + 1
+    
+    def post_window_state(self, take: bool) -> tuple:
+        """(allowed, posts used, window reset epoch) for the current window, taking a post if asked."""
+        with self._lock:
+            window_start = int(time.time()) // self.post_window * self.post_window
+            if window_start != self._window_start:
+                self._window_start, self._window_posts = window_start, 0
+            allowed = self._window_posts < self.post_limit
+            if take and allowed:
+                self._window_posts += 1
+            if take and not allowed:
+                self.stats["rate_limited"] += 1
+            return allowed, self._window_posts, window_start + self.post_window
+    
+    def new_post(self, path: str, fields: Dict[str, Any]) -> int:
+        with self._lock:
+            self._next_id += 1
+            self.posts.append({"id": self._next_id, "path": path, **fields})
+            if path.endswith("/media"):
+                now = time.monotonic()
+                self.containers[str(self._next_id)] = {
+                    "created_at": now,
+                    "ready_at": now + self._random.uniform(*self.processing_delay),
+                    "failed": "broken" in fields.get("image_url", ""),
+                    "published_at": None
+                }
+            return self._next_id
+    
+    def container_status(self, container_id: str) -> Optional[str]:
+        """status_code of a media container (None if the ID is not one)."""
+        with self._lock:
+            container = self.containers.get(container_id)
+            if container is None:
+                return None
+            if container["published_at"] is not None:
+                return "PUBLISHED"
+            if time.monotonic() < container["ready_at"]:
+                return "IN_PROGRESS"
+            return "ERROR" if container["failed"] else "FINISHED"
+    
+    def publish(self, container_id: str) -> bool:
+        """Publish a FINISHED container; False (and counted) for anything else."""
+        status = self.container_status(container_id)
+        with self._lock:
+            if status != "FINISHED":
+                self.stats["premature_publishes"] += 1
+                return False
+            self.containers[container_id]["published_at"] = time.monotonic()
+            return True
+    
+    def publish_lag(self) -> List[float]:
+        """Seconds each published container waited after it was ready."""
+        with self._lock:
+            return [c["published_at"] - c["ready_at"] for c in self.containers.values() if c["published_at"] is not None]
+
+
+class FakeSocialHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1  # Headers and body in one write, flushed after each request
+    server: FakeSocialAPI
+    
+    def setup(self) -> None:
+        if isinstance(self.request, ssl.SSLSocket):
+            self.request.do_handshake()
+            self.server.count("handshakes")
+        self.server.count("connections")
+        super().setup()
+    
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+    
+    def do_GET(self) -> None:
+        self._answer("GET", {})
+    
+    def do_DELETE(self) -> None:
+        self._answer("DELETE", {})
+    
+    def do_POST(self) -> None:
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length)
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            fields = json.loads(body or b"{}")
+        else:
+            fields = {k: v[0] for k, v in parse_qs(body.decode("utf-8")).items()}
+        self._answer("POST", fields)
+    
+    def _answer(self, method: str, fields: Dict[str, Any]) -> None:
+        parts = urlsplit(self.path)
+        fields.update({k: v[0] for k, v in parse_qs(parts.query).items() if k != "access_token"})
+        self.server.count("requests", f"{method} {parts.path}")
+        time.sleep(self.server.latency)
+        
+        headers = {}
+        publishing = method == "POST" and not parts.path.endswith("/media")
+        if self.server.post_limit:
+            allowed, used, reset = self.server.post_window_state(take=publishing)
+            limit = self.server.post_limit
+            if parts.path.startswith("/v19.0"):
+                usage = min(100, 100 * used // limit)
+                headers["X-App-Usage"] = json.dumps({"call_count": usage, "total_cputime": 0, "total_time": 0})
+            elif method == "POST":
+                headers.update({"x-rate-limit-limit": str(limit), "x-rate-limit-remaining": str(limit - used),
+                                "x-rate-limit-reset": str(reset)})
+            if publishing and not allowed:
+                self._send(429, {"title": "Too Many Requests", "detail": "Too Many Requests"}, headers)
+                return
+        
+        if method == "POST" and parts.path.endswith("/media_publish"):
+            if not self.server.publish(str(fields.get("creation_id"))):
+                error = {"message": "Media ID is not available", "type": "OAuthException", "code": 9007}
+                self._send(400, {"error": error}, headers)
+                return
+        
+        status_code = self.server.container_status(parts.path.rsplit("/", 1)[-1]) if method == "GET" else None
+        if status_code:
+            self.server.count("status_polls")
+        
+        if method == "POST":
+            post_id = self.server.new_post(parts.path, fields)
+            text = fields.get("text") or fields.get("message") or fields.get("caption") or ""
+            payload = {"id": str(post_id), "data": {"id": str(post_id), "text": text}}
+        else:
+            payload = {"id": parts.path.rsplit("/", 1)[-1], "name": "Fake", "localizedFirstName": "Fake",
+                       "status_code": status_code or "FINISHED", "data": []}
+        
+        self._send(200, payload, headers)
+    
+    def _send(self, status: int, payload: Dict[str, Any], headers: Dict[str, str]) -> None:
+        data = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--post-limit", type=int, default=0, help="Posts per window (0 = unlimited)")
+    parser.add_argument("--post-window", type=int, default=900, help="Window length in seconds")
+    args = parser.parse_args()
+    
+    server = FakeSocialAPI(args.port, args.latency, post_limit=args.post_limit, post_window=args.post_window)
+    print(f"Fake social APIs on {server.base_url} (CA bundle: {server.ca_file})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print(json.dumps(server.stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,81 +18,18 @@ module.exports = {
       }
     },
     {
-      name: 'watcher-filesystem',
-      script: 'watcher_filesystem.py',
+      // All watchers in one process (watcher_host.py); choose them with
+      // WATCHER_HOST_WATCHERS. The watcher_*.py scripts still run standalone.
+      name: 'watcher-host',
+      script: 'watcher_host.py',
       interpreter: 'python',
       cwd: './',
       instances: 1,
       autorestart: true,
       watch: false,
-      error_file: './logs/watcher_filesystem_error.log',
-      out_file: './logs/watcher_filesystem_out.log'
-    },
-    {
-      name: 'watcher-gmail',
-      script: 'watcher_gmail.py',
-      interpreter: 'python',
-      cwd: './',
-      instances: 1,
-      autorestart: true,
-      watch: false,
-      error_file: './logs/watcher_gmail_error.log',
-      out_file: './logs/watcher_gmail_out.log'
-    },
-    {
-      name: 'watcher-linkedin',
-      script: 'watcher_linkedin.py',
-      interpreter: 'python',
-      cwd: './',
-      instances: 1,
-      autorestart: true,
-      watch: false,
-      error_file: './logs/watcher_linkedin_error.log',
-      out_file: './logs/watcher_linkedin_out.log'
-    },
-    {
-      name: 'watcher-facebook',
-      script: 'watcher_facebook.py',
-      interpreter: 'python',
-      cwd: './',
-      instances: 1,
-      autorestart: true,
-      watch: false,
-      error_file: './logs/watcher_facebook_error.log',
-      out_file: './logs/watcher_facebook_out.log'
-    },
-    {
-      name: 'watcher-instagram',
-      script: 'watcher_instagram.py',
-      interpreter: 'python',
-      cwd: './',
-      instances: 1,
-      autorestart: true,
-      watch: false,
-      error_file: './logs/watcher_instagram_error.log',
-      out_file: './logs/watcher_instagram_out.log'
-    },
-    {
-      name: 'watcher-twitter',
-      script: 'watcher_twitter.py',
-      interpreter: 'python',
-      cwd: './',
-      instances: 1,
-      autorestart: true,
-      watch: false,
-      error_file: './logs/watcher_twitter_error.log',
-      out_file: './logs/watcher_twitter_out.log'
-    },
-    {
-      name: 'watcher-odoo',
-      script: 'watcher_odoo.py',
-      interpreter: 'python',
-      cwd: './',
-      instances: 1,
-      autorestart: true,
-      watch: false,
-      error_file: './logs/watcher_odoo_error.log',
-      out_file: './logs/watcher_odoo_out.log'
+      kill_timeout: 10000,
+      error_file: './logs/watcher_host_error.log',
+      out_file: './logs/watcher_host_out.log'
     }
   ]
 };
@@ -11,6 +11,7 @@ Actions:
 """
 
 import os
+import sys
 import json
 import requests
 from pathlib import Path
@@ -18,6 +19,10 @@ from typing import Dict, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Shared keep-alive transport (mcp_servers/http_transport.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import http_transport
+
 load_dotenv()
 
 class FacebookServer:
@@ -42,8 +47,8 @@ class FacebookServer:
         with open(self.token_path, 'r') as f:
             return json.load(f)
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
-        """Make API request to Facebook Graph API"""
+    def _make_request(self, method: str, endpoint: str, publish: bool = False, **kwargs) -> Dict:
+        """Make API request to Facebook Graph API (publish=True draws from the posting budget)"""
         url = f"{self.base_url}/{endpoint}"
         
         # Add access token to params
@@ -52,14 +57,9 @@ class FacebookServer:
         kwargs['params'] = params
         
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, **kwargs)
-            elif method.upper() == 'POST':
-                response = requests.post(url, **kwargs)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, **kwargs)
-            else:
+            if method.upper() not in ('GET', 'POST', 'DELETE'):
                 raise ValueError(f"Unsupported HTTP method: {method}")
+            response = http_transport.request(method, url, rate_limit='facebook', publish=publish, **kwargs)
             
             response.raise_for_status()
             return response.json()
@@ -99,7 +99,7 @@ class FacebookServer:
         if link:
             data['link'] = link
         
-        result = self._make_request('POST', endpoint, data=data)
+        result = self._make_request('POST', endpoint, publish=True, data=data)
         
         return {
             'status': 'success',
@@ -138,7 +138,7 @@ class FacebookServer:
             'published': True  # Ensure photo is published publicly, not as draft
         }
         
-        result = self._make_request('POST', endpoint, data=data)
+        result = self._make_request('POST', endpoint, publish=True, data=data)
         
         return {
             'status': 'success',
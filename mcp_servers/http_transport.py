@@ -0,0 +1,204 @@
+"""
+HTTP Transport - Shared Keep-Alive Sessions for the Social MCP Servers
+
+ARCHITECTURAL RULES:
+1. One requests.Session per host (scheme://host:port), shared by every
+   server instance in the process: one TCP + TLS handshake per pooled
+   connection, then keep-alive
+2. Every request has connect and read timeouts (HTTP_CONNECT_TIMEOUT,
+   HTTP_READ_TIMEOUT) unless the caller passes its own
+3. Only idempotent methods (GET, HEAD, DELETE) are retried, on connection
+   errors and 429/502/503/504, honouring Retry-After; a POST is never
+   retried because a replayed post publishes twice (except after a 429
+   on a publishing request, which published nothing)
+4. Each request is timed per endpoint (numeric IDs in the path folded to
+   :id); observers added with add_observer() see every request
+5. Requests made with rate_limit=<platform> update that platform's
+   posting budget (social_scheduler); only those also made with
+   publish=True (the call that publishes content, not media uploads or
+   container creation) draw from it, waiting for budget instead of
+   drawing 429s
+"""
+
+import os
+import re
+import time
+import threading
+from urllib.parse import urlsplit
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
+
+from social_scheduler import get_social_scheduler
+
+load_dotenv()
+
+logger = logging.getLogger("http_transport")
+
+# observer(method, host, endpoint, status or None, seconds)
+Observer = Callable[[str, str, str, Optional[int], float], None]
+
+# Page, media and post IDs; not short version segments like Twitter's /2/
+_ID_SEGMENT = re.compile(r"/\d{3,}(?:_\d+)?(?=/|$)")
+
+_sessions: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+_observers: List[Observer] = []
+_stats: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+_stats_lock = threading.Lock()
+
+
+def default_timeout() -> Tuple[float, float]:
+    """(connect, read) seconds from HTTP_CONNECT_TIMEOUT / HTTP_READ_TIMEOUT."""
+    return (
+        float(os.getenv("HTTP_CONNECT_TIMEOUT", "5")),
+        float(os.getenv("HTTP_READ_TIMEOUT", "30"))
+    )
+
+
+def get_session(url: str) -> requests.Session:
+    """
+    Get the shared keep-alive session for a URL's host.
+    
+    Args:
+        url: Any URL on the host
+    
+    Returns:
+        requests.Session with a pooled, retrying adapter
+    """
+    parts = urlsplit(url)
+    key = f"{parts.scheme}://{parts.netloc}"
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = _new_session()
+        return session
+
+
+def request(method: str, url: str, rate_limit: Optional[str] = None, publish: bool = False,
+            **kwargs) -> requests.Response:
+    """
+    Send a request over the host's shared session.
+    
+    Same arguments as requests.request(); a (connect, read) timeout is
+    added when none is given.
+    
+    Args:
+        rate_limit: Platform whose posting budget (social_scheduler) this
+            request's response updates
+        publish: The request publishes content: it waits for (and takes)
+            rate_limit's posting budget, and one rejected with 429 is sent
+            again once budget frees up (nothing was published)
+    
+    Returns:
+        requests.Response (status is not checked)
+    
+    Raises:
+        DeadlineExceeded: If a publishing request's deadline passes before budget frees up
+    """
+    kwargs.setdefault("timeout", default_timeout())
+    method = method.upper()
+    scheduler = get_social_scheduler() if rate_limit else None
+    gated = scheduler is not None and publish
+    
+    attempts = int(os.getenv("HTTP_MAX_RETRIES", "2")) + 1
+    for _ in range(attempts):
+        if gated:
+            scheduler.acquire(rate_limit)
+        response = _send(method, url, **kwargs)
+        if scheduler is not None:
+            scheduler.observe(rate_limit, method, response.status_code, response.headers)
+        if not gated or response.status_code != 429:
+            break
+    return response
+
+
+def _send(method: str, url: str, **kwargs) -> requests.Response:
+    parts = urlsplit(url)
+    endpoint = _ID_SEGMENT.sub("/:id", parts.path) or "/"
+    
+    started = time.perf_counter()
+    status = None
+    try:
+        response = get_session(url).request(method, url, **kwargs)
+        status = response.status_code
+        return response
+    finally:
+        _record(method, parts.netloc, endpoint, status, time.perf_counter() - started)
+
+
+def add_observer(observer: Observer) -> None:
+    """Call observer(method, host, endpoint, status, seconds) after every request."""
+    _observers.append(observer)
+
+
+def remove_observer(observer: Observer) -> None:
+    if observer in _observers:
+        _observers.remove(observer)
+
+
+def stats() -> Dict[str, Dict[str, float]]:
+    """
+    Per-endpoint request counts and latency.
+    
+    Returns:
+        Dict of "METHOD host/endpoint" -> {count, errors, total_seconds,
+        max_seconds, avg_seconds}; errors are exceptions and 4xx/5xx
+    """
+    with _stats_lock:
+        return {
+            f"{method} {host}{endpoint}": {**entry, "avg_seconds": entry["total_seconds"] / entry["count"]}
+            for (method, host, endpoint), entry in _stats.items()
+        }
+
+
+def close_all() -> None:
+    """Close every pooled session, forget the stats and observers (tests, shutdown)."""
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+    with _stats_lock:
+        _stats.clear()
+    _observers.clear()
+
+
+def _new_session() -> requests.Session:
+    retries = Retry(
+        total=int(os.getenv("HTTP_MAX_RETRIES", "2")),
+        backoff_factor=0.5,
+        status_forcelist=(429, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD", "DELETE"}),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    pool_size = int(os.getenv("HTTP_POOL_SIZE", "10"))
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=retries)
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def _record(method: str, host: str, endpoint: str, status: Optional[int], seconds: float) -> None:
+    key = (method, host, endpoint)
+    with _stats_lock:
+        entry = _stats.get(key)
+        if entry is None:
+            entry = _stats[key] = {"count": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        entry["count"] += 1
+        entry["errors"] += status is None or status >= 400
+        entry["total_seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+    
+    for observer in list(_observers):
+        try:
+            observer(method, host, endpoint, status, seconds)
+        except Exception as e:
+            logger.debug(f"HTTP observer failed: {e}")
@@ -6,19 +6,33 @@ Actions:
 - post_photo: Post single photo with caption
 - post_carousel: Post multiple photos (2-10 images)
 - post_story: Post to Instagram Story (24-hour content)
+- post_many: Publish many photos/carousels concurrently
 - get_media: Retrieve recent posts
 - get_insights: Get post engagement metrics
 - get_account_info: Get account details
+
+Posting runs on an asyncio pipeline: carousel items are created
+concurrently, each container's status_code is polled with growing
+intervals, and it is published as soon as it is FINISHED.
 """
 
 import os
+import sys
 import json
+import time
+import asyncio
+import functools
+import threading
 import requests
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Awaitable, Optional, List
 from datetime import datetime
 from dotenv import load_dotenv
-import time
+
+# Shared keep-alive transport (mcp_servers/http_transport.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import http_transport
 
 load_dotenv()
 
@@ -33,6 +47,21 @@ class InstagramServer:
         self.api_version = 'v19.0'
         self.base_url = f'https://graph.facebook.com/{self.api_version}'
         
+        # Container status polling: first poll at once, then after
+        # poll_backoff x the time processing has taken so far (between
+        # poll_initial and poll_max), so a ready container waits at most
+        # that fraction of its processing time
+        self.poll_initial = float(os.getenv('INSTAGRAM_POLL_INITIAL_SECONDS', '0.5'))
+        self.poll_max = float(os.getenv('INSTAGRAM_POLL_MAX_SECONDS', '5'))
+        self.poll_backoff = float(os.getenv('INSTAGRAM_POLL_BACKOFF', '0.25'))
+        self.container_timeout = float(os.getenv('INSTAGRAM_CONTAINER_TIMEOUT_SECONDS', '300'))
+        self.max_concurrency = int(os.getenv('INSTAGRAM_MAX_CONCURRENCY', os.getenv('HTTP_POOL_SIZE', '10')))
+        
+        # Event loop for the posting pipeline, started on first post
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        
     def _load_tokens(self) -> Dict:
         """Load Instagram tokens from secrets"""
         if not self.token_path.exists():
@@ -44,8 +73,8 @@ class InstagramServer:
         with open(self.token_path, 'r') as f:
             return json.load(f)
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
-        """Make API request to Instagram Graph API"""
+    def _make_request(self, method: str, endpoint: str, publish: bool = False, **kwargs) -> Dict:
+        """Make API request to Instagram Graph API (publish=True draws from the posting budget)"""
         url = f"{self.base_url}/{endpoint}"
         
         # Add access token to params
@@ -54,14 +83,9 @@ class InstagramServer:
         kwargs['params'] = params
         
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, **kwargs)
-            elif method.upper() == 'POST':
-                response = requests.post(url, **kwargs)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, **kwargs)
-            else:
+            if method.upper() not in ('GET', 'POST', 'DELETE'):
                 raise ValueError(f"Unsupported HTTP method: {method}")
+            response = http_transport.request(method, url, rate_limit='instagram', publish=publish, **kwargs)
             
             response.raise_for_status()
             return response.json()
@@ -96,32 +120,22 @@ class InstagramServer:
                 'timestamp': datetime.now().isoformat()
             }
         
+        return self._run(self.post_photo_async(image_url, caption))
+    
+    async def post_photo_async(self, image_url: str, caption: str = "") -> Dict:
+        """post_photo() as a coroutine on the server's event loop."""
         # Step 1: Create media container
-        container_endpoint = f"{self.instagram_id}/media"
-        
-        container_params = {
+        container_id = await self._create_container({
             'image_url': image_url,
             'caption': caption
-        }
-        
-        container_result = self._make_request('POST', container_endpoint, params=container_params)
-        container_id = container_result['id']
+        })
         
-        # Wait a moment for media processing
-        time.sleep(2)
-        
-        # Step 2: Publish media container
-        publish_endpoint = f"{self.instagram_id}/media_publish"
-        
-        publish_params = {
-            'creation_id': container_id
-        }
-        
-        publish_result = self._make_request('POST', publish_endpoint, params=publish_params)
+        # Step 2: Publish as soon as processing finishes
+        media_id = await self._publish_when_ready(container_id)
         
         return {
             'status': 'success',
-            'media_id': publish_result['id'],
+            'media_id': media_id,
             'message': 'Photo posted to Instagram successfully',
             'timestamp': datetime.now().isoformat()
         }
@@ -151,42 +165,26 @@ class InstagramServer:
         if len(image_urls) < 2 or len(image_urls) > 10:
             raise ValueError("Carousel must have 2-10 images")
         
-        # Step 1: Create media containers for each image
-        item_ids = []
-        for image_url in image_urls:
-            container_endpoint = f"{self.instagram_id}/media"
-            container_params = {
-                'image_url': image_url,
-                'is_carousel_item': True
-            }
-            result = self._make_request('POST', container_endpoint, params=container_params)
-            item_ids.append(result['id'])
-            time.sleep(1)  # Rate limiting
+        return self._run(self.post_carousel_async(image_urls, caption))
+    
+    async def post_carousel_async(self, image_urls: List[str], caption: str = "") -> Dict:
+        """post_carousel() as a coroutine on the server's event loop."""
+        # Step 1: Create all item containers at once and wait for them to process
+        item_ids = await asyncio.gather(*(self._create_item(image_url) for image_url in image_urls))
         
         # Step 2: Create carousel container
-        carousel_endpoint = f"{self.instagram_id}/media"
-        carousel_params = {
+        carousel_id = await self._create_container({
             'media_type': 'CAROUSEL',
             'caption': caption,
             'children': ','.join(item_ids)
-        }
-        
-        carousel_result = self._make_request('POST', carousel_endpoint, params=carousel_params)
-        carousel_id = carousel_result['id']
+        })
         
-        time.sleep(2)
-        
-        # Step 3: Publish carousel
-        publish_endpoint = f"{self.instagram_id}/media_publish"
-        publish_params = {
-            'creation_id': carousel_id
-        }
-        
-        publish_result = self._make_request('POST', publish_endpoint, params=publish_params)
+        # Step 3: Publish as soon as the carousel finishes processing
+        media_id = await self._publish_when_ready(carousel_id)
         
         return {
             'status': 'success',
-            'media_id': publish_result['id'],
+            'media_id': media_id,
             'image_count': len(image_urls),
             'message': 'Carousel posted to Instagram successfully',
             'timestamp': datetime.now().isoformat()
@@ -211,34 +209,140 @@ class InstagramServer:
                 'timestamp': datetime.now().isoformat()
             }
         
+        return self._run(self._post_story_async(image_url))
+    
+    async def _post_story_async(self, image_url: str) -> Dict:
         # Step 1: Create story container
-        container_endpoint = f"{self.instagram_id}/media"
-        
-        container_params = {
+        container_id = await self._create_container({
             'image_url': image_url,
             'media_type': 'STORIES'
-        }
+        })
         
-        container_result = self._make_request('POST', container_endpoint, params=container_params)
-        container_id = container_result['id']
-        
-        time.sleep(2)
-        
-        # Step 2: Publish story
-        publish_endpoint = f"{self.instagram_id}/media_publish"
-        publish_params = {
-            'creation_id': container_id
-        }
-        
-        publish_result = self._make_request('POST', publish_endpoint, params=publish_params)
+        # Step 2: Publish story as soon as it is processed
+        media_id = await self._publish_when_ready(container_id)
         
         return {
             'status': 'success',
-            'media_id': publish_result['id'],
+            'media_id': media_id,
             'message': 'Story posted to Instagram successfully (visible for 24 hours)',
             'timestamp': datetime.now().isoformat()
         }
     
+    def post_many(self, posts: List[Dict], dry_run: bool = False) -> List[Dict]:
+        """
+        Publish many posts concurrently
+        
+        Args:
+            posts: Dicts with 'image_url' (photo) or 'image_urls' (carousel)
+                and optional 'caption'
+            dry_run: If True, don't actually post
+        
+        Returns:
+            One result dict per post, in order; a failed post gets
+            status 'error' without affecting the others
+        """
+        if dry_run:
+            return [self.process_action('post_carousel' if 'image_urls' in post else 'post_photo',
+                                        {**post, 'dry_run': True}) for post in posts]
+        
+        async def publish_all() -> List[Any]:
+            return await asyncio.gather(
+                *(self._post_async(post) for post in posts),
+                return_exceptions=True
+            )
+        
+        results = []
+        for post, result in zip(posts, self._run(publish_all())):
+            if isinstance(result, Exception):
+                result = {
+                    'status': 'error',
+                    'message': str(result),
+                    'caption': post.get('caption', '')[:100],
+                    'timestamp': datetime.now().isoformat()
+                }
+            results.append(result)
+        return results
+    
+    async def _post_async(self, post: Dict) -> Dict:
+        if 'image_urls' in post:
+            if len(post['image_urls']) < 2 or len(post['image_urls']) > 10:
+                raise ValueError("Carousel must have 2-10 images")
+            return await self.post_carousel_async(post['image_urls'], post.get('caption', ''))
+        return await self.post_photo_async(post['image_url'], post.get('caption', ''))
+    
+    async def _create_item(self, image_url: str) -> str:
+        """Create a carousel item container and wait until it is processed."""
+        item_id = await self._create_container({
+            'image_url': image_url,
+            'is_carousel_item': True
+        })
+        await self._wait_until_finished(item_id)
+        return item_id
+    
+    async def _create_container(self, params: Dict) -> str:
+        result = await self._request_async('POST', f"{self.instagram_id}/media", params=params)
+        return result['id']
+    
+    async def _publish_when_ready(self, container_id: str) -> str:
+        await self._wait_until_finished(container_id)
+        result = await self._request_async(
+            'POST', f"{self.instagram_id}/media_publish", publish=True, params={'creation_id': container_id}
+        )
+        return result['id']
+    
+    async def _wait_until_finished(self, container_id: str) -> None:
+        """
+        Poll a media container until its status_code is FINISHED
+        
+        Raises:
+            Exception: If processing fails (ERROR/EXPIRED)
+            TimeoutError: If it is still processing after container_timeout
+        """
+        started = time.monotonic()
+        deadline = started + self.container_timeout
+        while True:
+            result = await self._request_async('GET', container_id, params={'fields': 'status_code'})
+            status = result.get('status_code')
+            if status == 'FINISHED':
+                return
+            if status in ('ERROR', 'EXPIRED'):
+                raise Exception(f"Instagram media container {container_id} failed processing: {status}")
+            elapsed = time.monotonic() - started
+            delay = min(self.poll_max, max(self.poll_initial, elapsed * self.poll_backoff))
+            if started + elapsed + delay > deadline:
+                raise TimeoutError(f"Instagram media container {container_id} still {status} after {self.container_timeout:.0f}s")
+            await asyncio.sleep(delay)
+    
+    async def _request_async(self, method: str, endpoint: str, **kwargs) -> Dict:
+        """_make_request() on the pipeline's HTTP threads (shared keep-alive transport)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(self._make_request, method, endpoint, **kwargs))
+    
+    def _run(self, coroutine: Awaitable) -> Any:
+        """Run a coroutine on the server's event loop and wait for it."""
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop.set_default_executor(
+                    ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="instagram-http")
+                )
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="instagram-event-loop", daemon=True
+                )
+                self._loop_thread.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+    
+    def close(self) -> None:
+        """Stop the posting pipeline's event loop and HTTP threads."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = self._loop_thread = None
+        if loop is not None:
+            asyncio.run_coroutine_threadsafe(loop.shutdown_default_executor(), loop).result(timeout=5)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=5)
+            loop.close()
+    
     def get_media(self, limit: int = 10) -> Dict:
         """
         Get recent Instagram posts
@@ -376,6 +480,16 @@ class InstagramServer:
                     dry_run=params.get('dry_run', False)
                 )
             
+            elif action == 'post_many':
+                return {
+                    'status': 'success',
+                    'results': self.post_many(
+                        posts=params.get('posts', []),
+                        dry_run=params.get('dry_run', False)
+                    ),
+                    'timestamp': datetime.now().isoformat()
+                }
+            
             elif action == 'get_media':
                 return self.get_media(
                     limit=params.get('limit', 10)
@@ -394,7 +508,7 @@ class InstagramServer:
                     'status': 'error',
                     'message': f"Unknown action: {action}",
                     'supported_actions': [
-                        'post_photo', 'post_carousel', 'post_story',
+                        'post_photo', 'post_carousel', 'post_story', 'post_many',
                         'get_media', 'get_insights', 'get_account_info'
                     ]
                 }
@@ -13,6 +13,7 @@ Security: All posts require HITL approval (via /Pending_Approval workflow)
 """
 
 import os
+import sys
 import json
 import logging
 from pathlib import Path
@@ -20,6 +21,10 @@ from datetime import datetime, timezone
 import requests
 from dotenv import load_dotenv
 
+# Shared keep-alive transport (mcp_servers/http_transport.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import http_transport
+
 load_dotenv()
 
 logging.basicConfig(
@@ -31,10 +36,11 @@ logger = logging.getLogger(__name__)
 class LinkedInMCPServer:
     """LinkedIn MCP Server for posting business updates"""
     
-    def __init__(self):
-        self.token_path = Path(os.getenv('LINKEDIN_TOKEN_PATH', './secrets/linkedin_token.json'))
+    def __init__(self, token_path: str = None):
+        self.token_path = Path(token_path or os.getenv('LINKEDIN_TOKEN_PATH', './secrets/linkedin_token.json'))
         self.api_base = 'https://api.linkedin.com/v2'
         self.access_token = None
+        self.token_data = {}
         self._load_token()
     
     def _load_token(self):
@@ -42,8 +48,8 @@ class LinkedInMCPServer:
         try:
             if self.token_path.exists():
                 with open(self.token_path, 'r') as f:
-                    token_data = json.load(f)
-                    self.access_token = token_data.get('access_token')
+                    self.token_data = json.load(f)
+                    self.access_token = self.token_data.get('access_token')
                     logger.info("✅ LinkedIn token loaded")
             else:
                 logger.warning("⚠️  LinkedIn token not found. Run: python setup_linkedin.py")
@@ -70,7 +76,7 @@ class LinkedInMCPServer:
         """
         try:
             url = f'{self.api_base}/me'
-            response = requests.get(url, headers=self._get_headers())
+            response = http_transport.request('GET', url, rate_limit='linkedin', headers=self._get_headers())
             response.raise_for_status()
             
             profile = response.json()
@@ -121,8 +127,11 @@ class LinkedInMCPServer:
             
             # Post to LinkedIn
             url = f'{self.api_base}/ugcPosts'
-            response = requests.post(
+            response = http_transport.request(
+                'POST',
                 url,
+                rate_limit='linkedin',
+                publish=True,
                 headers=self._get_headers(),
                 json=post_data
             )
@@ -195,8 +204,11 @@ class LinkedInMCPServer:
             }
             
             url_endpoint = f'{self.api_base}/ugcPosts'
-            response = requests.post(
+            response = http_transport.request(
+                'POST',
                 url_endpoint,
+                rate_limit='linkedin',
+                publish=True,
                 headers=self._get_headers(),
                 json=post_data
             )
@@ -4,24 +4,86 @@ Handles Odoo JSON-RPC interactions for accounting and business management
 
 Actions:
 - create_invoice: Create customer invoice
+- create_invoices: Create many customer invoices in one batch
 - create_bill: Create vendor bill
+- create_bills: Create many vendor bills in one batch
 - record_payment: Record payment for invoice/bill
 - get_balance: Get account balance or financial summary
 - list_invoices: Get recent invoices
 - list_bills: Get recent bills
 - get_partner_balance: Get customer/vendor balance
+
+Queries are single search_read round trips. Partner name -> id and
+account type -> account ids are cached for ODOO_CACHE_TTL_SECONDS and
+dropped when this client writes to a model they depend on; balances and
+amounts are always read live.
 """
 
 import os
 import json
+import time
 import requests
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Methods that only read; anything else is a write and invalidates cached reads
+READ_METHODS = frozenset({'search', 'read', 'search_read', 'search_count', 'read_group', 'fields_get', 'name_search'})
+
+MOVE_FIELDS = ['name', 'partner_id', 'amount_total', 'amount_residual', 'invoice_date', 'state']
+
+
+def _like_literal(text: str) -> str:
+    """Escape LIKE wildcards so an =ilike term matches `text` literally."""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+class ReadCache:
+    """
+    TTL cache for Odoo reads, invalidated by model.
+    
+    Each entry records the models it was read from; a write to any of
+    them drops it. Entries put with keep_on_create (e.g. name -> ID)
+    survive create calls, which add records but change no existing one.
+    A TTL of 0 disables caching.
+    """
+    
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Tuple, Tuple[float, Any, Tuple[str, ...], bool]] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Tuple) -> Any:
+        """Cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+    
+    def put(self, key: Tuple, value: Any, models: Iterable[str], keep_on_create: bool = False) -> None:
+        if self.ttl > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value, tuple(models), keep_on_create)
+    
+    def invalidate(self, model: str, method: str = 'write') -> None:
+        """Drop every entry read from `model` that a `method` call may have changed."""
+        stale = [
+            key for key, (_, _, models, keep_on_create) in self._entries.items()
+            if model in models and not (keep_on_create and method == 'create')
+        ]
+        for key in stale:
+            del self._entries[key]
+    
+    def clear(self) -> None:
+        self._entries.clear()
+
+
 class OdooServer:
     """Odoo JSON-RPC MCP Server"""
     
@@ -37,6 +99,7 @@ class OdooServer:
         self.uid = None
         self.session_id = None
         self.session = requests.Session()  # Persistent session for cookies
+        self.cache = ReadCache(float(os.getenv('ODOO_CACHE_TTL_SECONDS', '300')))
         
         # Authenticate on init
         self._authenticate()
@@ -90,6 +153,10 @@ class OdooServer:
         if not self.uid:
             raise Exception("Not authenticated with Odoo")
         
+        # Drop cached reads first: even a failed write may have changed data
+        if method not in READ_METHODS:
+            self.cache.invalidate(model, method)
+        
         url = f"{self.odoo_url}/web/dataset/call_kw/{model}/{method}"
         
         payload = {
@@ -116,6 +183,13 @@ class OdooServer:
             
             result = response.json()
             
+            # Long-lived clients outlive their Odoo session: log in again once and retry
+            if 'error' in result and self._session_expired(result['error']):
+                self._authenticate()
+                response = self.session.post(url, json=payload, headers=headers)
+                response.raise_for_status()
+                result = response.json()
+            
             if 'error' in result:
                 error_msg = result['error'].get('data', {}).get('message', 'Unknown error')
                 raise Exception(f"Odoo API error: {error_msg}")
@@ -125,6 +199,32 @@ class OdooServer:
         except requests.exceptions.HTTPError as e:
             raise Exception(f"HTTP error calling Odoo: {e}")
     
+    @staticmethod
+    def _session_expired(error: Dict) -> bool:
+        """True for Odoo's 'Session Expired' JSON-RPC error"""
+        name = (error.get('data') or {}).get('name', '')
+        return error.get('code') == 100 or name.endswith('SessionExpiredException')
+    
+    def check_session(self) -> bool:
+        """
+        Health probe: is the Odoo session still valid?
+        
+        Returns:
+            True if Odoo still knows this session's user
+        """
+        url = f"{self.odoo_url}/web/session/get_session_info"
+        payload = {'jsonrpc': '2.0', 'method': 'call', 'params': {}, 'id': 1}
+        
+        response = self.session.post(url, json=payload)
+        response.raise_for_status()
+        result = response.json()
+        return bool((result.get('result') or {}).get('uid'))
+    
+    def close(self):
+        """Close the HTTP session (pooled clients are closed on eviction)"""
+        self.session.close()
+        self.cache.clear()
+    
     def create_invoice(self, partner_name: str, amount: float, 
                       description: str = "", dry_run: bool = False) -> Dict:
         """
@@ -259,6 +359,97 @@ class OdooServer:
                 'timestamp': datetime.now().isoformat()
             }
     
+    def create_invoices(self, invoices: List[Dict], dry_run: bool = False) -> Dict:
+        """
+        Create and post many customer invoices in one batch
+        
+        Partners are resolved in one lookup (missing ones created in one
+        call), then all invoices are created in one call and posted in
+        another: four round trips at most, however many invoices.
+        
+        Args:
+            invoices: Dicts with partner_name, amount and optional description
+            dry_run: If True, don't actually create
+        
+        Returns:
+            Dict with invoice_ids (in input order) and status
+        """
+        return self._create_moves('out_invoice', invoices, 'partner_name', 'Service', dry_run)
+    
+    def create_bills(self, bills: List[Dict], dry_run: bool = False) -> Dict:
+        """
+        Create and post many vendor bills in one batch (see create_invoices)
+        
+        Args:
+            bills: Dicts with vendor_name, amount and optional description
+            dry_run: If True, don't actually create
+        
+        Returns:
+            Dict with bill_ids (in input order) and status
+        """
+        return self._create_moves('in_invoice', bills, 'vendor_name', 'Purchase', dry_run)
+    
+    def _create_moves(self, move_type: str, items: List[Dict], name_key: str,
+                      default_line: str, dry_run: bool) -> Dict:
+        action = 'create_invoices' if move_type == 'out_invoice' else 'create_bills'
+        ids_key = 'invoice_ids' if move_type == 'out_invoice' else 'bill_ids'
+        
+        if dry_run:
+            return {
+                'status': 'dry_run',
+                'action': action,
+                'count': len(items),
+                'amount_total': sum(item.get('amount', 0) for item in items),
+                'timestamp': datetime.now().isoformat()
+            }
+        
+        try:
+            if not items:
+                return {'status': 'success', ids_key: [], 'count': 0, 'timestamp': datetime.now().isoformat()}
+            
+            partner_ids = self._find_or_create_partners(
+                [item[name_key] for item in items], is_vendor=move_type == 'in_invoice'
+            )
+            
+            today = datetime.now().date().isoformat()
+            move_vals = [
+                {
+                    'partner_id': partner_ids[item[name_key]],
+                    'move_type': move_type,
+                    'invoice_date': today,
+                    'invoice_line_ids': [(0, 0, {
+                        'name': item.get('description') or default_line,
+                        'quantity': 1,
+                        'price_unit': item['amount']
+                    })]
+                }
+                for item in items
+            ]
+            
+            # create() takes a list of values and returns the new IDs in order
+            move_ids = self._call_odoo('account.move', 'create', [move_vals])
+            if not isinstance(move_ids, list):
+                move_ids = [move_ids]
+            
+            self._call_odoo('account.move', 'action_post', [move_ids])
+            
+            return {
+                'status': 'success',
+                ids_key: move_ids,
+                'count': len(move_ids),
+                'amount_total': sum(item['amount'] for item in items),
+                'message': f'{len(move_ids)} {"invoices" if move_type == "out_invoice" else "bills"} created and posted',
+                'timestamp': datetime.now().isoformat()
+            }
+        
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': str(e),
+                'action': action,
+                'timestamp': datetime.now().isoformat()
+            }
+    
     def record_payment(self, invoice_id: int, amount: float,
                       payment_date: Optional[str] = None, dry_run: bool = False) -> Dict:
         """
@@ -337,15 +528,24 @@ class OdooServer:
             Dict with balance information
         """
         try:
-            # Search for accounts of specific type
-            account_ids = self._call_odoo(
-                'account.account',
-                'search',
-                [[['account_type', '=', account_type]]],
-                {'limit': 10}
-            )
+            # Balances are always read live (moves posted by anyone change
+            # them); only which accounts have this type is cached
+            fields = ['name', 'code', 'current_balance']
+            account_ids = self.cache.get(('account_ids', account_type))
+            if account_ids is None:
+                accounts = self._call_odoo(
+                    'account.account',
+                    'search_read',
+                    [[['account_type', '=', account_type]]],
+                    {'fields': fields, 'limit': 10}
+                )
+                self.cache.put(('account_ids', account_type), [acc['id'] for acc in accounts], ['account.account'])
+            elif account_ids:
+                accounts = self._call_odoo('account.account', 'read', [account_ids], {'fields': fields})
+            else:
+                accounts = []
             
-            if not account_ids:
+            if not accounts:
                 return {
                     'status': 'success',
                     'account_type': account_type,
@@ -354,14 +554,6 @@ class OdooServer:
                     'timestamp': datetime.now().isoformat()
                 }
             
-            # Get account details
-            accounts = self._call_odoo(
-                'account.account',
-                'read',
-                [account_ids],
-                {'fields': ['name', 'code', 'current_balance']}
-            )
-            
             total_balance = sum(acc.get('current_balance', 0) for acc in accounts)
             
             return {
@@ -399,31 +591,7 @@ class OdooServer:
             Dict with invoices array
         """
         try:
-            domain = [['move_type', '=', 'out_invoice']]
-            if state:
-                domain.append(['state', '=', state])
-            
-            invoice_ids = self._call_odoo(
-                'account.move',
-                'search',
-                [domain],
-                {'limit': limit, 'order': 'id desc'}
-            )
-            
-            if not invoice_ids:
-                return {
-                    'status': 'success',
-                    'invoices': [],
-                    'count': 0,
-                    'timestamp': datetime.now().isoformat()
-                }
-            
-            invoices = self._call_odoo(
-                'account.move',
-                'read',
-                [invoice_ids],
-                {'fields': ['name', 'partner_id', 'amount_total', 'amount_residual', 'invoice_date', 'state']}
-            )
+            invoices = self._search_moves('out_invoice', limit, state)
             
             return {
                 'status': 'success',
@@ -451,6 +619,59 @@ class OdooServer:
                 'timestamp': datetime.now().isoformat()
             }
     
+    def list_bills(self, limit: int = 10, state: str = 'posted') -> Dict:
+        """
+        List recent vendor bills
+        
+        Args:
+            limit: Number of bills to return
+            state: Bill state (draft, posted, cancel)
+        
+        Returns:
+            Dict with bills array
+        """
+        try:
+            bills = self._search_moves('in_invoice', limit, state)
+            
+            return {
+                'status': 'success',
+                'bills': [
+                    {
+                        'bill_id': bill['id'],
+                        'number': bill['name'],
+                        'vendor': bill['partner_id'][1] if bill.get('partner_id') else 'Unknown',
+                        'amount_total': bill.get('amount_total', 0),
+                        'amount_due': bill.get('amount_residual', 0),
+                        'date': bill.get('invoice_date'),
+                        'state': bill.get('state')
+                    }
+                    for bill in bills
+                ],
+                'count': len(bills),
+                'timestamp': datetime.now().isoformat()
+            }
+        
+        except Exception as e:
+            return {
+                'status': 'error',
+                'message': str(e),
+                'action': 'list_bills',
+                'timestamp': datetime.now().isoformat()
+            }
+    
+    def _search_moves(self, move_type: str, limit: int, state: str) -> List[Dict]:
+        """Newest invoices or bills with their fields, in one round trip"""
+        domain = [['move_type', '=', move_type]]
+        if state:
+            domain.append(['state', '=', state])
+        
+        return self._call_odoo(
+            'account.move',
+            'search_read',
+            [domain],
+            {'fields': MOVE_FIELDS, 'limit': limit, 'order': 'id desc'}
+        )
+    
     def get_partner_balance(self, partner_name: str) -> Dict:
         """
         Get customer/vendor balance (accounts receivable/payable)
@@ -462,30 +683,22 @@ class OdooServer:
             Dict with partner balance
         """
         try:
-            # Find partner
-            partner_ids = self._call_odoo(
+            # Find partner with balance in one round trip (balances are never cached)
+            partners = self._call_odoo(
                 'res.partner',
-                'search',
+                'search_read',
                 [[['name', 'ilike', partner_name]]],
-                {'limit': 1}
+                {'fields': ['name', 'debit', 'credit'], 'limit': 1}
             )
             
-            if not partner_ids:
+            if not partners:
                 return {
                     'status': 'error',
                     'message': f'Partner not found: {partner_name}',
                     'timestamp': datetime.now().isoformat()
                 }
             
-            partner_id = partner_ids[0]
-            
-            # Get partner with balance
-            partner = self._call_odoo(
-                'res.partner',
-                'read',
-                [[partner_id]],
-                {'fields': ['name', 'debit', 'credit']}
-            )[0]
+            partner = partners[0]
             
             return {
                 'status': 'success',
@@ -504,27 +717,60 @@ class OdooServer:
             }
     
     def _find_or_create_partner(self, name: str, is_vendor: bool = False) -> int:
-        """Find existing partner or create new one"""
-        # Search for existing partner
-        partner_ids = self._call_odoo(
-            'res.partner',
-            'search',
-            [[['name', 'ilike', name]]],
-            {'limit': 1}
-        )
-        
-        if partner_ids and len(partner_ids) > 0:
-            return partner_ids[0]
+        """Find existing partner or create new one (same matching as _find_or_create_partners)"""
+        return self._find_or_create_partners([name], is_vendor)[name]
+    
+    def _find_or_create_partners(self, names: List[str], is_vendor: bool = False) -> Dict[str, int]:
+        """
+        Resolve many partner names at once: one search_read for the
+        uncached names, one create for those still missing
         
-        # Create new partner
-        partner_vals = {
-            'name': name,
-            'customer_rank': 0 if is_vendor else 1,
-            'supplier_rank': 1 if is_vendor else 0
-        }
+        Names match exactly (case-insensitive, =ilike with % and _
+        escaped) rather than by substring, so an invoice cannot attach
+        to a similarly named partner.
         
-        partner_id = self._call_odoo('res.partner', 'create', [partner_vals])
-        return partner_id
+        Returns:
+            Dict of name -> partner ID for every name given
+        """
+        resolved: Dict[str, int] = {}
+        missing: Dict[str, str] = {}  # lowercased -> name as given
+        for name in names:
+            partner_id = self.cache.get(('partner', name.lower()))
+            if partner_id is not None:
+                resolved[name] = partner_id
+            else:
+                missing.setdefault(name.lower(), name)
+        
+        if missing:
+            # Prefix-notation OR of one =ilike term per name
+            domain = ['|'] * (len(missing) - 1) + [['name', '=ilike', _like_literal(name)] for name in missing.values()]
+            found = self._call_odoo('res.partner', 'search_read', [domain], {'fields': ['name'], 'order': 'id'})
+            ids_by_name: Dict[str, int] = {}
+            for partner in found:
+                ids_by_name.setdefault(partner['name'].lower(), partner['id'])
+            
+            to_create = [name for key, name in missing.items() if key not in ids_by_name]
+            if to_create:
+                created = self._call_odoo('res.partner', 'create', [[
+                    {
+                        'name': name,
+                        'customer_rank': 0 if is_vendor else 1,
+                        'supplier_rank': 1 if is_vendor else 0
+                    }
+                    for name in to_create
+                ]])
+                if not isinstance(created, list):
+                    created = [created]
+                ids_by_name.update({name.lower(): partner_id for name, partner_id in zip(to_create, created)})
+            
+            for key, partner_id in ids_by_name.items():
+                if key in missing:
+                    self.cache.put(('partner', key), partner_id, ['res.partner'], keep_on_create=True)
+            for name in names:
+                if name not in resolved:
+                    resolved[name] = ids_by_name[name.lower()]
+        
+        return resolved
     
     def process_action(self, action: str, params: Dict[str, Any]) -> Dict:
         """
@@ -546,6 +792,12 @@ class OdooServer:
                     dry_run=params.get('dry_run', False)
                 )
             
+            elif action == 'create_invoices':
+                return self.create_invoices(
+                    invoices=params.get('invoices', []),
+                    dry_run=params.get('dry_run', False)
+                )
+            
             elif action == 'create_bill':
                 return self.create_bill(
                     vendor_name=params.get('vendor_name', ''),
@@ -554,6 +806,12 @@ class OdooServer:
                     dry_run=params.get('dry_run', False)
                 )
             
+            elif action == 'create_bills':
+                return self.create_bills(
+                    bills=params.get('bills', []),
+                    dry_run=params.get('dry_run', False)
+                )
+            
             elif action == 'record_payment':
                 return self.record_payment(
                     invoice_id=params.get('invoice_id', 0),
@@ -573,6 +831,12 @@ class OdooServer:
                     state=params.get('state', 'posted')
                 )
             
+            elif action == 'list_bills':
+                return self.list_bills(
+                    limit=params.get('limit', 10),
+                    state=params.get('state', 'posted')
+                )
+            
             elif action == 'get_partner_balance':
                 return self.get_partner_balance(
                     partner_name=params.get('partner_name', '')
@@ -583,8 +847,9 @@ class OdooServer:
                     'status': 'error',
                     'message': f"Unknown action: {action}",
                     'supported_actions': [
-                        'create_invoice', 'create_bill', 'record_payment',
-                        'get_balance', 'list_invoices', 'get_partner_balance'
+                        'create_invoice', 'create_invoices', 'create_bill', 'create_bills',
+                        'record_payment', 'get_balance', 'list_invoices', 'list_bills',
+                        'get_partner_balance'
                     ]
                 }
         
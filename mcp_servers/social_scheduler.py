@@ -0,0 +1,272 @@
+"""
+Social Scheduler - Rate-Limit-Aware Outbound Posting
+
+ARCHITECTURAL RULES:
+1. One budget per platform (twitter, facebook, instagram, linkedin), shared
+   by every server instance in the process
+2. A budget is the configured token bucket (<PLATFORM>_POST_LIMIT posts per
+   <PLATFORM>_POST_WINDOW_SECONDS, 0 = none) narrowed by what the platform
+   last reported: x-rate-limit-remaining/-reset on posts, Graph API usage
+   headers (X-App-Usage, X-Page-Usage, X-Business-Use-Case-Usage) on any
+   call, Retry-After on a 429
+3. A post waits exactly until its budget frees up (no fixed sleeps) and
+   never past its deadline (DeadlineExceeded)
+4. submit() queues posts per platform, earliest deadline first; deadlines
+   are time.monotonic() values, as in rate_limiter
+"""
+
+import os
+import sys
+import json
+import heapq
+import itertools
+import threading
+import contextvars
+import time
+from pathlib import Path
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+import logging
+from dotenv import load_dotenv
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestration.rate_limiter import DeadlineExceeded, TokenBucket
+
+load_dotenv()
+
+logger = logging.getLogger("social_scheduler")
+
+GRAPH_USAGE_HEADERS = ("x-app-usage", "x-page-usage", "x-business-use-case-usage")
+
+# Wait after a 429 that names no reset time
+DEFAULT_RETRY_AFTER = 60.0
+
+# Deadline of the post being sent on this thread (set by submit())
+_deadline: contextvars.ContextVar = contextvars.ContextVar("social_post_deadline", default=None)
+
+
+class PlatformBudget:
+    """Posting budget for one platform: configured bucket plus the platform's own counters."""
+    
+    def __init__(self, platform: str, limit: float = 0, window: float = 3600.0):
+        self.platform = platform
+        self.bucket = TokenBucket(limit, window, name=f"{platform} posts")
+        self.reset_skew = float(os.getenv("RATE_LIMIT_RESET_SKEW_SECONDS", "1"))
+        self.graph_usage_limit = float(os.getenv("GRAPH_USAGE_LIMIT", "95"))
+        self.graph_window = float(os.getenv("GRAPH_USAGE_WINDOW_SECONDS", "3600"))
+        
+        self._cond = threading.Condition()
+        self.remaining: Optional[int] = None  # Posts left in the platform's window, as last reported
+        self.reset_at = 0.0  # Wall clock time that window resets
+        self.blocked_until = 0.0  # Wall clock; set by 429s and Graph usage
+        self.rate_limited = 0
+    
+    def wait_time(self) -> float:
+        """Seconds until the platform will accept another post (nothing is taken)."""
+        with self._cond:
+            return self._platform_wait(time.time())
+    
+    def acquire(self, deadline: Optional[float] = None) -> None:
+        """
+        Block until one post may be sent, then count it.
+        
+        Args:
+            deadline: time.monotonic() value to give up at
+        
+        Raises:
+            DeadlineExceeded: If the budget only frees up after the deadline
+        """
+        with self._cond:
+            while True:
+                wait = self._platform_wait(time.time())
+                if not wait:
+                    wait = self.bucket.reserve()
+                    if not wait:
+                        if self.remaining is not None:
+                            self.remaining -= 1  # Until the response reports the real count
+                        return
+                if deadline is not None and time.monotonic() + wait > deadline:
+                    raise DeadlineExceeded(f"{self.platform}: no posting budget before deadline (needs {wait:.1f}s)")
+                self._cond.wait(wait)
+    
+    def observe(self, method: str, status: int, headers: Mapping[str, str]) -> None:
+        """
+        Update the budget from a platform response.
+        
+        Args:
+            method: HTTP method of the request
+            status: HTTP status code
+            headers: Response headers (case-insensitive mapping)
+        """
+        now = time.time()
+        with self._cond:
+            # Twitter-style counters are per endpoint: only trust them for posts
+            if method.upper() == "POST" and headers.get("x-rate-limit-remaining") is not None:
+                try:
+                    self.remaining = int(headers["x-rate-limit-remaining"])
+                    self.reset_at = float(headers.get("x-rate-limit-reset", 0)) + self.reset_skew
+                except ValueError:
+                    pass
+            
+            self._observe_graph_usage(headers, now)
+            
+            if status == 429:
+                self.rate_limited += 1
+                self.blocked_until = max(self.blocked_until, now + self._retry_after(headers, now))
+                logger.warning(f"{self.platform} rate limited; posting resumes in {self.blocked_until - now:.0f}s")
+            
+            self._cond.notify_all()
+    
+    def _platform_wait(self, now: float) -> float:
+        wait = max(0.0, self.blocked_until - now)
+        if self.remaining is not None:
+            if now >= self.reset_at:
+                self.remaining = None  # Window over; the next response reports the new one
+            elif self.remaining <= 0:
+                wait = max(wait, self.reset_at - now)
+        return wait
+    
+    def _observe_graph_usage(self, headers: Mapping[str, str], now: float) -> None:
+        usage = 0.0
+        for name in GRAPH_USAGE_HEADERS:
+            value = headers.get(name)
+            if not value:
+                continue
+            try:
+                data = json.loads(value)
+            except ValueError:
+                continue
+            # X-Business-Use-Case-Usage nests per-business lists of the same counters
+            entries = [entry for group in data.values() for entry in group] if name == "x-business-use-case-usage" else [data]
+            for entry in entries:
+                usage = max(usage, *(float(entry.get(k, 0)) for k in ("call_count", "total_time", "total_cputime")))
+                regain = float(entry.get("estimated_time_to_regain_access", 0))
+                if regain:
+                    self.blocked_until = max(self.blocked_until, now + regain * 60)
+        
+        # Usage is a percentage of a rolling window: each point over the limit
+        # takes about 1/100th of the window to age out
+        if usage >= self.graph_usage_limit:
+            self.blocked_until = max(
+                self.blocked_until,
+                now + (usage - self.graph_usage_limit + 1) * self.graph_window / 100
+            )
+    
+    def _retry_after(self, headers: Mapping[str, str], now: float) -> float:
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return max(0.0, float(retry_after))
+            except ValueError:
+                try:
+                    return max(0.0, parsedate_to_datetime(retry_after).timestamp() - now)
+                except (TypeError, ValueError):
+                    pass
+        if self.reset_at > now:
+            return self.reset_at - now
+        return DEFAULT_RETRY_AFTER
+
+
+class SocialScheduler:
+    """
+    Per-platform posting budgets and deadline-ordered post queues.
+    
+    The social MCP servers pass rate_limit=<platform> to http_transport,
+    which calls acquire() before each publishing request (publish=True)
+    and observe() after every response; submit() is for callers that want
+    to queue posts.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._budgets: Dict[str, PlatformBudget] = {}
+        self._queues: Dict[str, List[Tuple[float, int, Callable[[], Any], Future, Optional[float]]]] = {}
+        self._queue_ready: Dict[str, threading.Condition] = {}
+        self._sequence = itertools.count()
+    
+    def budget(self, platform: str) -> PlatformBudget:
+        """Shared budget for a platform, configured from .env on first use."""
+        with self._lock:
+            if platform not in self._budgets:
+                prefix = platform.upper()
+                self._budgets[platform] = PlatformBudget(
+                    platform,
+                    limit=float(os.getenv(f"{prefix}_POST_LIMIT", "0")),
+                    window=float(os.getenv(f"{prefix}_POST_WINDOW_SECONDS", "3600"))
+                )
+            return self._budgets[platform]
+    
+    def acquire(self, platform: str, deadline: Optional[float] = None) -> None:
+        """Wait for posting budget (deadline defaults to that of the queued post being sent)."""
+        self.budget(platform).acquire(deadline if deadline is not None else _deadline.get())
+    
+    def observe(self, platform: str, method: str, status: int, headers: Mapping[str, str]) -> None:
+        self.budget(platform).observe(method, status, headers)
+    
+    def wait_time(self, platform: str) -> float:
+        """Seconds until the platform accepts posts again (0 if it does now)."""
+        return self.budget(platform).wait_time()
+    
+    def submit(self, platform: str, post: Callable[[], Any], deadline: Optional[float] = None) -> Future:
+        """
+        Queue a post; posts for a platform go out one at a time, earliest deadline first.
+        
+        Args:
+            platform: Budget to post under
+            post: Callable that sends the post (e.g. lambda: twitter.post_tweet(text))
+            deadline: time.monotonic() value after which the post is dropped
+        
+        Returns:
+            Future with post()'s result, or DeadlineExceeded
+        """
+        future: Future = Future()
+        with self._lock:
+            if platform not in self._queues:
+                self._queues[platform] = []
+                self._queue_ready[platform] = threading.Condition(self._lock)
+                threading.Thread(target=self._drain, args=(platform,), name=f"{platform}-posts", daemon=True).start()
+            order = deadline if deadline is not None else float("inf")
+            heapq.heappush(self._queues[platform], (order, next(self._sequence), post, future, deadline))
+            self._queue_ready[platform].notify()
+        return future
+    
+    def pending(self, platform: str) -> int:
+        """Posts queued for a platform and not yet started."""
+        with self._lock:
+            return len(self._queues.get(platform, []))
+    
+    def _drain(self, platform: str) -> None:
+        while True:
+            with self._lock:
+                while not self._queues[platform]:
+                    self._queue_ready[platform].wait()
+                _, _, post, future, deadline = heapq.heappop(self._queues[platform])
+            
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if deadline is not None and time.monotonic() > deadline:
+                    raise DeadlineExceeded(f"{platform}: post expired in the queue")
+                context = contextvars.copy_context()
+                context.run(_deadline.set, deadline)
+                future.set_result(context.run(post))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+# Singleton instance
+_social_scheduler = None
+_social_scheduler_lock = threading.Lock()
+
+
+def get_social_scheduler() -> SocialScheduler:
+    """Get singleton social scheduler."""
+    global _social_scheduler
+    
+    with _social_scheduler_lock:
+        if _social_scheduler is None:
+            _social_scheduler = SocialScheduler()
+    
+    return _social_scheduler
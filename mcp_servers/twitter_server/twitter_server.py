@@ -12,6 +12,7 @@ Actions:
 """
 
 import os
+import sys
 import json
 import requests
 from pathlib import Path
@@ -19,6 +20,10 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Shared keep-alive transport (mcp_servers/http_transport.py)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import http_transport
+
 load_dotenv()
 
 class TwitterServer:
@@ -49,8 +54,8 @@ class TwitterServer:
             'Content-Type': 'application/json'
         }
     
-    def _make_request(self, method: str, endpoint: str, **kwargs) -> Dict:
-        """Make API request to Twitter API v2"""
+    def _make_request(self, method: str, endpoint: str, publish: bool = False, **kwargs) -> Dict:
+        """Make API request to Twitter API v2 (publish=True draws from the posting budget)"""
         url = f"{self.base_url}/{endpoint}"
         headers = self._get_headers()
         
@@ -59,14 +64,9 @@ class TwitterServer:
         kwargs['headers'] = headers
         
         try:
-            if method.upper() == 'GET':
-                response = requests.get(url, **kwargs)
-            elif method.upper() == 'POST':
-                response = requests.post(url, **kwargs)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, **kwargs)
-            else:
+            if method.upper() not in ('GET', 'POST', 'DELETE'):
                 raise ValueError(f"Unsupported HTTP method: {method}")
+            response = http_transport.request(method, url, rate_limit='twitter', publish=publish, **kwargs)
             
             response.raise_for_status()
             return response.json()
@@ -102,7 +102,7 @@ class TwitterServer:
             'text': text
         }
         
-        result = self._make_request('POST', 'tweets', json=payload)
+        result = self._make_request('POST', 'tweets', publish=True, json=payload)
         
         return {
             'status': 'success',
@@ -154,7 +154,7 @@ class TwitterServer:
                     'in_reply_to_tweet_id': previous_tweet_id
                 }
             
-            result = self._make_request('POST', 'tweets', json=payload)
+            result = self._make_request('POST', 'tweets', publish=True, json=payload)
             tweet_id = result['data']['id']
             tweet_ids.append(tweet_id)
             previous_tweet_id = tweet_id
@@ -200,7 +200,7 @@ class TwitterServer:
             }
         }
         
-        result = self._make_request('POST', 'tweets', json=payload)
+        result = self._make_request('POST', 'tweets', publish=True, json=payload)
         
         return {
             'status': 'success',
@@ -16,14 +16,19 @@ from dotenv import load_dotenv
 # Add MCP servers to path
 sys.path.append(str(Path(__file__).parent.parent / "mcp_servers"))
 
+from orchestration.activity_log import get_activity_log
+from orchestration.mcp_clients import get_client_pool
+
 load_dotenv()
 logger = logging.getLogger(__name__)
 
 class ActionExecutor:
     """Executes actions from Claude-generated plans via MCP servers"""
     
-    def __init__(self, vault_path: Path):
+    def __init__(self, vault_path: Path, tenant_id: Optional[str] = None):
         self.vault_path = vault_path
+        self.tenant_id = tenant_id
+        self.clients = get_client_pool()  # Warm MCP server clients, shared per process
         self.pending_approval = vault_path / "Pending_Approval"
         self.approved = vault_path / "Approved"
         self.rejected = vault_path / "Rejected"
@@ -444,31 +449,27 @@ Move this file to `/Rejected/` folder
         
         try:
             if platform == 'facebook':
-                from facebook_server import FacebookServer
-                server = FacebookServer()
-                result = server.post_message(message=text)
+                with self.clients.client('facebook', self.tenant_id) as server:
+                    result = server.post_message(message=text)
                 
             elif platform == 'instagram':
-                from instagram_server import InstagramServer
-                server = InstagramServer()
-                # Instagram requires image - use Unsplash placeholder
-                result = server.post_photo(
-                    image_url='https://images.unsplash.com/photo-1516116216624-53e697fedbea?w=1080',
-                    caption=text
-                )
+                with self.clients.client('instagram', self.tenant_id) as server:
+                    # Instagram requires image - use Unsplash placeholder
+                    result = server.post_photo(
+                        image_url='https://images.unsplash.com/photo-1516116216624-53e697fedbea?w=1080',
+                        caption=text
+                    )
                 
             elif platform == 'linkedin':
-                from linkedin_server import LinkedInMCPServer
-                server = LinkedInMCPServer()
-                result = server.post_update(
-                    text=text,
-                    visibility=action['data'].get('visibility', 'PUBLIC')
-                )
+                with self.clients.client('linkedin', self.tenant_id) as server:
+                    result = server.post_update(
+                        text=text,
+                        visibility=action['data'].get('visibility', 'PUBLIC')
+                    )
                 
             elif platform == 'twitter':
-                from twitter_server import TwitterServer
-                server = TwitterServer()
-                result = server.post_tweet(text=text)
+                with self.clients.client('twitter', self.tenant_id) as server:
+                    result = server.post_tweet(text=text)
             
             else:
                 raise ValueError(f"Unsupported platform: {platform}")
@@ -505,17 +506,15 @@ Move this file to `/Rejected/` folder
     def _execute_odoo_invoice(self, action: Dict) -> Dict:
         """Execute Odoo invoice creation"""
         try:
-            from odoo_server import OdooServer
-            
             data = action['data']
-            server = OdooServer()
             
             # Create invoice
-            result = server.create_invoice(
-                partner_name=data['partner_name'],
-                amount=data['amount'],
-                description=data.get('description', 'Auto-generated invoice')
-            )
+            with self.clients.client('odoo', self.tenant_id) as server:
+                result = server.create_invoice(
+                    partner_name=data['partner_name'],
+                    amount=data['amount'],
+                    description=data.get('description', 'Auto-generated invoice')
+                )
             
             logger.info(f"Created Odoo invoice: {result}")
             
@@ -547,16 +546,14 @@ Move this file to `/Rejected/` folder
     def _execute_odoo_bill(self, action: Dict) -> Dict:
         """Execute Odoo bill creation"""
         try:
-            from odoo_server import OdooServer
-            
             data = action['data']
-            server = OdooServer()
             
-            result = server.create_bill(
-                vendor_name=data['vendor_name'],
-                amount=data['amount'],
-                description=data.get('reference', 'Auto-generated bill')
-            )
+            with self.clients.client('odoo', self.tenant_id) as server:
+                result = server.create_bill(
+                    vendor_name=data['vendor_name'],
+                    amount=data['amount'],
+                    description=data.get('reference', 'Auto-generated bill')
+                )
             
             logger.info(f"Created Odoo bill: {result}")
             
@@ -588,16 +585,14 @@ Move this file to `/Rejected/` folder
     def _execute_odoo_payment(self, action: Dict) -> Dict:
         """Execute Odoo payment recording"""
         try:
-            from odoo_server import OdooServer
-            
             data = action['data']
-            server = OdooServer()
             
-            result = server.record_payment(
-                invoice_id=data.get('invoice_id', 0),
-                amount=data['amount'],
-                payment_date=datetime.now().strftime('%Y-%m-%d')
-            )
+            with self.clients.client('odoo', self.tenant_id) as server:
+                result = server.record_payment(
+                    invoice_id=data.get('invoice_id', 0),
+                    amount=data['amount'],
+                    payment_date=datetime.now().strftime('%Y-%m-%d')
+                )
             
             logger.info(f"Recorded Odoo payment: {result}")
             
@@ -629,16 +624,14 @@ Move this file to `/Rejected/` folder
     def _execute_email(self, action: Dict) -> Dict:
         """Execute email via Gmail MCP server"""
         try:
-            from email_server import EmailMCP
-            
             data = action['data']
-            server = EmailMCP()
             
-            result = server.send_email(
-                to=data['to'],
-                subject=data['subject'],
-                body=data['body']
-            )
+            with self.clients.client('email', self.tenant_id) as server:
+                result = server.send_email(
+                    to=data['to'],
+                    subject=data['subject'],
+                    body=data['body']
+                )
             
             logger.info(f"Sent email: {result}")
             
@@ -670,26 +663,8 @@ Move this file to `/Rejected/` folder
             }
     
     def _log_action(self, action_data: Dict):
-        """Write action to daily audit log"""
-        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-        log_file = self.logs / f"{today}.json"
-        
-        log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            **action_data
-        }
-        
-        # Append to daily log file
-        if log_file.exists():
-            try:
-                logs = json.loads(log_file.read_text(encoding='utf-8'))
-            except:
-                logs = []
-        else:
-            logs = []
-        
-        logs.append(log_entry)
-        log_file.write_text(json.dumps(logs, indent=2), encoding='utf-8')
+        """Append action to the daily activity log"""
+        get_activity_log(self.logs).append(action_data)
     
     def process_approved_file(self, approved_file: Path) -> Dict:
         """
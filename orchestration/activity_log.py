@@ -0,0 +1,250 @@
+"""
+Activity Log - Append-Only Daily Logs in /Logs
+
+ARCHITECTURAL RULES:
+1. One JSON object per line (Logs/YYYY-MM-DD.jsonl); an append never
+   rewrites earlier entries, so its cost does not grow with the day
+2. A crash can only leave a torn last line: readers skip it and the next
+   append starts on a fresh line
+3. Optional rotation: with ACTIVITY_LOG_SEGMENT_MB set, a full day file is
+   continued in YYYY-MM-DD.1.jsonl, YYYY-MM-DD.2.jsonl, ...
+4. Old Logs/YYYY-MM-DD.json arrays stay readable and are converted by
+   `python orchestration/activity_log.py migrate`
+"""
+
+import os
+import re
+import sys
+import json
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("activity_log")
+
+_DAY = r"\d{4}-\d{2}-\d{2}"
+_SEGMENT = re.compile(rf"^({_DAY})(?:\.(\d+))?\.jsonl$")
+_LEGACY = re.compile(rf"^({_DAY})\.json$")
+
+
+class ActivityLog:
+    """
+    Daily activity log shared by the orchestrator and ActionExecutor.
+    
+    Use get_activity_log() so writers in one process share a lock.
+    """
+    
+    def __init__(self, logs_dir: Path):
+        self.logs_dir = Path(logs_dir)
+        self.logs_dir.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = int(float(os.getenv("ACTIVITY_LOG_SEGMENT_MB", "0")) * 1024 * 1024)
+        self.fsync = os.getenv("ACTIVITY_LOG_FSYNC", "false").lower() == "true"
+        
+        self._lock = threading.Lock()
+        self._segment: Dict[str, int] = {}  # day -> segment being appended to
+        self._ends: Dict[Path, int] = {}  # file -> size after our last append
+    
+    def append(self, action_data: Dict) -> None:
+        """
+        Append one entry (timestamped now, UTC) to today's log.
+        
+        Args:
+            action_data: JSON-serializable fields of the entry
+        """
+        now = datetime.now(timezone.utc)
+        entry = {"timestamp": now.isoformat(), **action_data}
+        line = (json.dumps(entry, ensure_ascii=False, default=str) + "\n").encode('utf-8')
+        day = now.strftime("%Y-%m-%d")
+        
+        with self._lock:
+            log_file, size = self._current_file(day)
+            
+            if size and self._ends.get(log_file) != size and not self._ends_with_newline(log_file):
+                line = b"\n" + line  # Torn line from a crash: leave it on its own line
+            
+            with open(log_file, 'ab') as f:
+                f.write(line)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self._ends[log_file] = size + len(line)
+    
+    def read_day(self, day: str) -> List[Dict]:
+        """
+        All entries for a day: a legacy YYYY-MM-DD.json array first (if not
+        migrated yet), then the JSONL segments in order.
+        
+        Args:
+            day: YYYY-MM-DD
+        """
+        entries: List[Dict] = []
+        
+        legacy = self.logs_dir / f"{day}.json"
+        if legacy.exists():
+            try:
+                entries.extend(json.loads(legacy.read_text(encoding='utf-8')))
+            except (ValueError, TypeError) as e:
+                logger.error(f"Unreadable legacy log {legacy.name}: {e}")
+        
+        for segment in self._segments(day):
+            entries.extend(self._read_jsonl(segment))
+        
+        return entries
+    
+    def iter_entries(self, start_day: Optional[str] = None, end_day: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Entries from start_day to end_day (inclusive, YYYY-MM-DD), oldest first.
+        """
+        for day in self.days():
+            if (start_day and day < start_day) or (end_day and day > end_day):
+                continue
+            yield from self.read_day(day)
+    
+    def days(self) -> List[str]:
+        """Days with a log, in either format."""
+        found = set()
+        for path in self.logs_dir.iterdir():
+            match = _SEGMENT.match(path.name) or _LEGACY.match(path.name)
+            if match:
+                found.add(match.group(1))
+        return sorted(found)
+    
+    def migrate(self, delete_legacy: bool = False) -> Dict[str, int]:
+        """
+        Convert legacy YYYY-MM-DD.json arrays to JSONL.
+        
+        The array's entries go in front of anything already appended to
+        that day's JSONL. The array is renamed to .json.migrated (or
+        deleted). Run it with the orchestrator stopped.
+        
+        Args:
+            delete_legacy: Delete the arrays instead of renaming them
+        
+        Returns:
+            Day → entries migrated
+        """
+        migrated: Dict[str, int] = {}
+        
+        with self._lock:
+            for legacy in sorted(self.logs_dir.glob("*.json")):
+                match = _LEGACY.match(legacy.name)
+                if not match:
+                    continue
+                day = match.group(1)
+                
+                try:
+                    entries = json.loads(legacy.read_text(encoding='utf-8'))
+                    if not isinstance(entries, list):
+                        raise ValueError("not a JSON array")
+                except ValueError as e:
+                    logger.error(f"Skipping {legacy.name}, left in place: {e}")
+                    continue
+                
+                target = self.logs_dir / f"{day}.jsonl"
+                tmp = target.with_name(f".{target.name}.tmp")
+                with open(tmp, 'wb') as f:
+                    for entry in entries:
+                        f.write((json.dumps(entry, ensure_ascii=False, default=str) + "\n").encode('utf-8'))
+                    if target.exists():
+                        existing = target.read_bytes()
+                        f.write(existing if existing.endswith(b"\n") or not existing else existing + b"\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, target)
+                self._ends.pop(target, None)
+                
+                if delete_legacy:
+                    legacy.unlink()
+                else:
+                    legacy.rename(legacy.with_name(legacy.name + ".migrated"))
+                
+                migrated[day] = len(entries)
+                logger.info(f"Migrated {legacy.name}: {len(entries)} entries")
+        
+        return migrated
+    
+    def _current_file(self, day: str) -> Tuple[Path, int]:
+        """Segment to append to and its size, rotating if it is full (lock held)."""
+        segment = self._segment.get(day)
+        if segment is None:
+            existing = self._segments(day)
+            segment = self._segment_number(existing[-1]) if existing else 0
+            self._segment = {day: segment}  # Earlier days are finished
+        
+        log_file = self._segment_path(day, segment)
+        size = log_file.stat().st_size if log_file.exists() else 0
+        
+        if self.segment_bytes and size >= self.segment_bytes:
+            segment += 1
+            self._segment[day] = segment
+            log_file = self._segment_path(day, segment)
+            size = log_file.stat().st_size if log_file.exists() else 0
+        
+        return log_file, size
+    
+    def _segment_path(self, day: str, segment: int) -> Path:
+        return self.logs_dir / (f"{day}.jsonl" if segment == 0 else f"{day}.{segment}.jsonl")
+    
+    @staticmethod
+    def _segment_number(path: Path) -> int:
+        match = _SEGMENT.match(path.name)
+        return int(match.group(2) or 0) if match else 0
+    
+    def _segments(self, day: str) -> List[Path]:
+        return sorted(
+            (p for p in self.logs_dir.glob(f"{day}*.jsonl") if _SEGMENT.match(p.name)),
+            key=self._segment_number
+        )
+    
+    @staticmethod
+    def _ends_with_newline(log_file: Path) -> bool:
+        with open(log_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+    
+    @staticmethod
+    def _read_jsonl(path: Path) -> List[Dict]:
+        entries = []
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    logger.warning(f"Skipping torn line {line_number} in {path.name}")
+        return entries
+
+
+# One ActivityLog per Logs directory
+_activity_logs: Dict[str, ActivityLog] = {}
+_activity_logs_lock = threading.Lock()
+
+
+def get_activity_log(logs_dir: Path) -> ActivityLog:
+    """Get or create the ActivityLog for a Logs directory."""
+    key = str(Path(logs_dir).resolve())
+    with _activity_logs_lock:
+        if key not in _activity_logs:
+            _activity_logs[key] = ActivityLog(Path(logs_dir))
+        return _activity_logs[key]
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+    
+    if len(sys.argv) < 2 or sys.argv[1] != "migrate":
+        print("Usage: python orchestration/activity_log.py migrate [LOGS_DIR] [--delete-legacy]")
+        print("  LOGS_DIR defaults to ./obsidian_vault/Logs")
+        sys.exit(1)
+    
+    args = [arg for arg in sys.argv[2:] if not arg.startswith("--")]
+    logs_dir = Path(args[0]) if args else Path("./obsidian_vault/Logs")
+    result = ActivityLog(logs_dir).migrate(delete_legacy="--delete-legacy" in sys.argv)
+    
+    print(f"Migrated {len(result)} day(s), {sum(result.values())} entries")
@@ -0,0 +1,246 @@
+"""
+Async LLM Interface - Pooled, Rate-Limited Provider Client
+
+ARCHITECTURAL RULES:
+1. Drop-in replacement for LLMInterface (same reason()/reason_batch() contract)
+2. One asyncio event loop and one pooled HTTP client per process
+3. Concurrency capped per provider; RPM/TPM budgets enforced client-side
+4. Every request carries a deadline: queueing, rate limiting and the HTTP
+   call all share it, and a missed deadline fails the call (→ HITL)
+5. Used ONLY for reasoning (no direct actions)
+"""
+
+import os
+import time
+import asyncio
+import threading
+import contextlib
+from typing import Any, Awaitable, Dict, Iterator, List, Optional, Tuple
+import logging
+from dotenv import load_dotenv
+
+from orchestration.llm_interface import LLMInterface
+from orchestration.rate_limiter import TokenBucket, DeadlineExceeded
+
+load_dotenv()
+
+logger = logging.getLogger("async_llm_interface")
+
+# Providers whose limits are shared by every AsyncLLMInterface in the process
+_provider_limits: Dict[str, "ProviderLimits"] = {}
+_provider_limits_lock = threading.Lock()
+
+
+class ProviderLimits:
+    """Concurrency cap and RPM/TPM token buckets for one provider."""
+    
+    def __init__(self, provider: str, max_concurrency: int, rpm: float, tpm: float):
+        self.provider = provider
+        self.max_concurrency = max_concurrency
+        # Spend the budget evenly: providers also enforce it over short
+        # intervals, and a short burst leaves slack for network jitter
+        self.requests = TokenBucket.per_minute(rpm, name=f"{provider} RPM", burst_seconds=0.5)
+        self.tokens = TokenBucket.per_minute(tpm, name=f"{provider} TPM", burst_seconds=0.5)
+    
+    @classmethod
+    def for_provider(cls, provider: str) -> "ProviderLimits":
+        """Shared limits for a provider, configured from .env on first use."""
+        prefix = provider.upper()
+        
+        # Stay just under the provider's budget: clock skew and SDK retries
+        # would otherwise turn an exact match into occasional 429s
+        headroom = float(os.getenv("LLM_RATE_LIMIT_HEADROOM", "0.9"))
+        
+        with _provider_limits_lock:
+            if provider not in _provider_limits:
+                _provider_limits[provider] = cls(
+                    provider,
+                    max_concurrency=int(os.getenv(f"{prefix}_MAX_CONCURRENCY", os.getenv("LLM_MAX_CONCURRENCY", "8"))),
+                    rpm=float(os.getenv(f"{prefix}_RPM_LIMIT", "0")) * headroom,
+                    tpm=float(os.getenv(f"{prefix}_TPM_LIMIT", "0")) * headroom
+                )
+            return _provider_limits[provider]
+
+
+class AsyncLLMInterface(LLMInterface):
+    """
+    LLMInterface backed by the providers' async SDK clients.
+    
+    Worker threads call reason() exactly as before; the request runs on a
+    private event loop, so all threads share one keep-alive connection pool,
+    one concurrency cap and one rate budget instead of each thread opening
+    its own connection and discovering the limits through 429s.
+    """
+    
+    def __init__(self):
+        self.connect_timeout = float(os.getenv("LLM_CONNECT_TIMEOUT", "10"))
+        self.max_retries = int(os.getenv("LLM_MAX_RETRIES", "2"))
+        
+        self._local = threading.local()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="llm-event-loop", daemon=True)
+        self._thread.start()
+        
+        # Parent __init__ calls our _init_* overrides, which need the loop
+        super().__init__()
+        
+        if self.streaming:
+            # Streams would hold a concurrency slot for their whole duration;
+            # pooled requests already overlap, so use buffered responses
+            logger.warning("LLM_STREAMING is not supported with LLM_ASYNC_CLIENT, using buffered responses")
+            self.streaming = False
+        
+        self.limits = ProviderLimits.for_provider(self.provider)
+        self._semaphore: asyncio.Semaphore = self._run(self._create_semaphore())
+        
+        logger.info(
+            f"Async LLM Interface: max concurrency {self.limits.max_concurrency}, "
+            f"RPM {self.limits.requests.capacity or 'unlimited'}, TPM {self.limits.tokens.capacity or 'unlimited'}"
+        )
+    
+    def _init_anthropic(self) -> None:
+        """Initialize async Anthropic Claude API."""
+        super()._init_anthropic()
+        
+        # One client = one keep-alive connection pool for every request
+        from anthropic import AsyncAnthropic, Timeout
+        self.client = AsyncAnthropic(
+            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            timeout=Timeout(self.request_timeout, connect=self.connect_timeout),
+            max_retries=self.max_retries
+        )
+    
+    def _init_openai(self) -> None:
+        """Initialize async OpenAI API."""
+        super()._init_openai()
+        
+        from openai import AsyncOpenAI, Timeout
+        self.client = AsyncOpenAI(
+            api_key=os.getenv("OPENAI_API_KEY"),
+            timeout=Timeout(self.request_timeout, connect=self.connect_timeout),
+            max_retries=self.max_retries
+        )
+    
+    def reason(
+        self,
+        task: Dict[str, Any],
+        skills: Dict[str, str],
+        context: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Same as LLMInterface.reason(), with a deadline.
+        
+        Args:
+            deadline: time.monotonic() value by which the plan must arrive
+                (default: now + LLM_REQUEST_TIMEOUT)
+        """
+        with self._deadline(deadline):
+            return super().reason(task, skills, context)
+    
+    def reason_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        skills: Dict[str, str],
+        context: Optional[str] = None,
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Same as LLMInterface.reason_batch(), with a deadline shared by the batch."""
+        with self._deadline(deadline):
+            return super().reason_batch(tasks, skills, context)
+    
+    def _reason_anthropic(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Use Anthropic Claude for reasoning (on the event loop)."""
+        request = self._anthropic_request(prefix, task_prompt, max_tokens)
+        response = self._run(self._call(
+            lambda timeout: self.client.messages.create(**request, timeout=timeout),
+            prefix, task_prompt, self._current_deadline()
+        ))
+        return self._parse_anthropic_response(response)
+    
+    def _reason_openai(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Use OpenAI GPT for reasoning (on the event loop)."""
+        request = self._openai_request(prefix, task_prompt, max_tokens)
+        response = self._run(self._call(
+            lambda timeout: self.client.chat.completions.create(**request, timeout=timeout),
+            prefix, task_prompt, self._current_deadline()
+        ))
+        return self._parse_openai_response(response)
+    
+    async def _call(self, send, prefix: Tuple[str, str], task_prompt: str, deadline: float) -> Any:
+        """
+        Run one provider request under the concurrency cap, the rate budget
+        and the caller's deadline.
+        """
+        estimate = (sum(len(block) for block in prefix) + len(task_prompt)) // 4
+        
+        await self._wait_for(self._semaphore.acquire(), deadline)
+        try:
+            await self.limits.requests.acquire_async(1, deadline)
+            await self.limits.tokens.acquire_async(estimate, deadline)
+            
+            response = await self._wait_for(send(max(0.001, deadline - time.monotonic())), deadline)
+            
+            # Reconcile the estimate with what the provider actually counted
+            usage = getattr(response, "usage", None)
+            actual = (
+                (getattr(usage, "input_tokens", None) or getattr(usage, "prompt_tokens", None) or 0)
+                + (getattr(usage, "output_tokens", None) or getattr(usage, "completion_tokens", None) or 0)
+            )
+            if actual:
+                self.limits.tokens.adjust(estimate - actual)
+            return response
+        finally:
+            self._semaphore.release()
+    
+    async def _wait_for(self, awaitable: Awaitable, deadline: float) -> Any:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            if asyncio.iscoroutine(awaitable):
+                awaitable.close()  # Never started
+            raise DeadlineExceeded("LLM request deadline passed")
+        try:
+            return await asyncio.wait_for(awaitable, remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("LLM request exceeded its deadline")
+    
+    async def _create_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores belong to the loop they are created on
+        return asyncio.Semaphore(self.limits.max_concurrency)
+    
+    def _run(self, coroutine: Awaitable) -> Any:
+        """Run a coroutine on the interface's event loop and wait for it."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+    
+    def _current_deadline(self) -> float:
+        """This (caller) thread's deadline."""
+        deadline = getattr(self._local, "deadline", None)
+        return deadline if deadline is not None else time.monotonic() + self.request_timeout
+    
+    @contextlib.contextmanager
+    def _deadline(self, deadline: Optional[float]) -> Iterator[None]:
+        """Set this thread's deadline for the enclosed call (nested calls inherit it)."""
+        outer = getattr(self._local, "deadline", None)
+        self._local.deadline = deadline or outer or time.monotonic() + self.request_timeout
+        try:
+            yield
+        finally:
+            self._local.deadline = outer
+    
+    def close(self) -> None:
+        """Close the connection pool and stop the event loop."""
+        try:
+            self._run(self.client.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5)
@@ -0,0 +1,234 @@
+"""
+Audit Index - Per-Day Offset Index for Audit Log Queries
+
+ARCHITECTURAL RULES:
+1. The JSONL audit logs stay the source of truth; an index only points into them
+2. One sidecar per day (audit_YYYY-MM-DD.idx), append-only like the log itself
+3. Written at append time; any gap (older logs, crash, index disabled) is
+   filled from the log on the next query, so a stale index is never wrong
+4. Every indexed line is re-checked when read; a mismatch rebuilds that day
+"""
+
+import os
+import json
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger("audit_index")
+
+# (byte offset, byte length, action, task_id) of one log line
+IndexEntry = Tuple[int, int, str, str]
+
+
+def _clean(value: object) -> str:
+    """Index fields are tab-separated; keep them on one line."""
+    return str(value if value is not None else "").replace("\t", " ").replace("\n", " ")
+
+
+def _format(entries: Iterable[IndexEntry]) -> str:
+    """Sidecar lines: offset, length, action, task_id (tab-separated)."""
+    return "".join(
+        f"{offset}\t{length}\t{_clean(action)}\t{_clean(task_id)}\n"
+        for offset, length, action, task_id in entries
+    )
+
+
+def index_path(log_file: Path) -> Path:
+    """audit_YYYY-MM-DD.jsonl → audit_YYYY-MM-DD.idx"""
+    return log_file.with_suffix(".idx")
+
+
+class _DayIndex:
+    """In-memory lookup tables for one day's log."""
+    
+    __slots__ = ("covered", "idx_read", "by_task", "by_action")
+    
+    def __init__(self):
+        self.covered = 0  # Log bytes the index accounts for
+        self.idx_read = 0  # Index bytes loaded so far
+        self.by_task: Dict[str, List[IndexEntry]] = {}
+        self.by_action: Dict[str, List[IndexEntry]] = {}
+    
+    def add(self, entry: IndexEntry) -> bool:
+        """
+        Add the next line's entry.
+        
+        Returns:
+            False if it does not continue where the index ends (lines
+            missing from the index); already-indexed lines are ignored
+        """
+        offset, length = entry[0], entry[1]
+        if offset + length <= self.covered:
+            return True
+        if offset != self.covered:
+            return False
+        
+        self.by_task.setdefault(entry[3], []).append(entry)
+        self.by_action.setdefault(entry[2], []).append(entry)
+        self.covered = offset + length
+        return True
+
+
+class AuditIndex:
+    """
+    task_id/action → line offsets, per daily audit log.
+    
+    AuditLogger calls record() right after appending lines; get_logs()
+    calls lookup() and seeks straight to the matching lines.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._days: Dict[str, _DayIndex] = {}  # log file path -> loaded index
+    
+    def record(self, log_file: Path, entries: Iterable[IndexEntry]) -> None:
+        """
+        Append index entries for lines just written to log_file.
+        
+        Args:
+            log_file: Daily JSONL log the lines went to
+            entries: (offset, length, action, task_id) per line
+        """
+        lines = _format(entries)
+        if not lines:
+            return
+        
+        try:
+            with open(index_path(log_file), 'a', encoding='utf-8') as f:
+                f.write(lines)
+        except OSError as e:
+            # The next lookup rebuilds the gap from the log
+            logger.warning(f"Could not update audit index for {log_file.name}: {e}")
+    
+    def lookup(
+        self,
+        log_file: Path,
+        task_id: Optional[str] = None,
+        action: Optional[str] = None
+    ) -> List[Tuple[int, int]]:
+        """
+        Offsets of lines matching task_id and/or action, in file order.
+        
+        Args:
+            log_file: Daily JSONL log
+            task_id: Exact task ID (None = any)
+            action: Exact action (None = any)
+        
+        Returns:
+            (offset, length) pairs
+        """
+        with self._lock:
+            day = self._refresh(log_file)
+            
+            if task_id is not None and action is not None:
+                by_task = day.by_task.get(_clean(task_id), [])
+                by_action = day.by_action.get(_clean(action), [])
+                candidates = by_task if len(by_task) <= len(by_action) else by_action
+                matches = [e for e in candidates if e[3] == _clean(task_id) and e[2] == _clean(action)]
+            elif task_id is not None:
+                matches = day.by_task.get(_clean(task_id), [])
+            elif action is not None:
+                matches = day.by_action.get(_clean(action), [])
+            else:
+                raise ValueError("lookup() needs a task_id or an action")
+            
+            return [(offset, length) for offset, length, _, _ in matches]
+    
+    def invalidate(self, log_file: Path) -> None:
+        """Throw away a day's index (memory and disk); the next lookup rebuilds it."""
+        with self._lock:
+            self._days.pop(str(log_file), None)
+            try:
+                index_path(log_file).unlink()
+            except FileNotFoundError:
+                pass
+    
+    def _refresh(self, log_file: Path) -> _DayIndex:
+        """Load new index lines, then index any log bytes the index does not cover (lock held)."""
+        key = str(log_file)
+        day = self._days.setdefault(key, _DayIndex())
+        idx_file = index_path(log_file)
+        
+        # 1. Index lines appended since the last lookup
+        try:
+            with open(idx_file, 'rb') as f:
+                f.seek(day.idx_read)
+                data = f.read()
+        except FileNotFoundError:
+            data = b""
+        
+        complete = data[:data.rfind(b"\n") + 1]  # Ignore a half-written last line
+        for line in complete.decode('utf-8').splitlines():
+            offset, length, action, task_id = line.split("\t", 3)
+            if not day.add((int(offset), int(length), action, task_id)):
+                # Lines were logged but never indexed (e.g. crash in between)
+                return self._rebuild(log_file)
+        day.idx_read += len(complete)
+        
+        # 2. Log lines the index missed
+        try:
+            size = os.path.getsize(log_file)
+        except FileNotFoundError:
+            return day
+        
+        if size > day.covered:
+            missing = self._scan(log_file, day.covered)
+            for entry in missing:
+                day.add(entry)
+            self.record(log_file, missing)
+            day.idx_read = self._idx_size(idx_file)
+        
+        return day
+    
+    def _rebuild(self, log_file: Path) -> _DayIndex:
+        """Re-index a whole day from its log and replace the sidecar (lock held)."""
+        logger.warning(f"Rebuilding audit index for {log_file.name}")
+        
+        day = _DayIndex()
+        entries = self._scan(log_file, 0)
+        for entry in entries:
+            day.add(entry)
+        
+        idx_file = index_path(log_file)
+        tmp_file = idx_file.with_name(f".{idx_file.name}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            f.write(_format(entries))
+        os.replace(tmp_file, idx_file)
+        
+        day.idx_read = self._idx_size(idx_file)
+        self._days[str(log_file)] = day
+        return day
+    
+    def _scan(self, log_file: Path, start: int) -> List[IndexEntry]:
+        """
+        Index entries for complete log lines from byte `start` on.
+        
+        Unparseable lines are indexed with an empty action and task_id, so
+        the index stays contiguous; no query matches them.
+        """
+        entries: List[IndexEntry] = []
+        with open(log_file, 'rb') as f:
+            f.seek(start)
+            offset = start
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Line still being written
+                try:
+                    entry = json.loads(raw)
+                    entries.append((offset, len(raw), _clean(entry.get("action")), _clean(entry.get("task_id"))))
+                except (ValueError, AttributeError):
+                    entries.append((offset, len(raw), "", ""))
+                offset += len(raw)
+        
+        if entries:
+            logger.debug(f"Indexed {len(entries)} unindexed lines in {log_file.name}")
+        return entries
+    
+    @staticmethod
+    def _idx_size(idx_file: Path) -> int:
+        try:
+            return os.path.getsize(idx_file)
+        except FileNotFoundError:
+            return 0
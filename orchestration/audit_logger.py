@@ -6,22 +6,39 @@ ARCHITECTURAL RULES:
 2. Cryptographic signatures for integrity
 3. Every action must be logged
 4. Logs are permanent (respect retention policy)
+5. Buffered mode (AUDIT_LOG_BUFFERED) never drops entries: a full queue
+   blocks the caller, and queries/shutdown drain the queue first
+6. Queries prune daily files by date and seek via the per-day offset index
+7. Verification resumes from signed checkpoints (see log_verifier.py)
 """
 
 import os
 import json
+import time
+import queue
+import atexit
 import hashlib
-from datetime import datetime, timezone
+import threading
+from datetime import date, datetime, timezone
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 
+from orchestration.audit_index import AuditIndex
+from orchestration.log_verifier import LogVerifier
+
 load_dotenv()
 
 # Create module-level logger with unique name
 _module_logger = logging.getLogger("audit_logger_module")
 
+# When the buffered writer fsyncs: after every batch, at most every
+# AUDIT_LOG_FSYNC_INTERVAL_MS, or never (left to the OS)
+FSYNC_POLICIES = ("batch", "interval", "never")
+
+_STOP = object()  # Queue sentinel: drain and exit
+
 
 class AuditLogger:
     """
@@ -44,7 +61,42 @@ class AuditLogger:
         # Secret for signing (in production, use proper key management)
         self.signing_key = os.getenv("AUDIT_SIGNING_KEY", "default_key_change_me")
         
-        _module_logger.info(f"Audit logger initialized. Path: {self.log_path}")
+        # Serialize appends from concurrent orchestrator workers
+        self._write_lock = threading.Lock()
+        
+        # task_id/action → line offsets, kept next to each daily log
+        self.index = AuditIndex()
+        
+        # Parallel verification, resuming from signed per-day checkpoints
+        self.verifier = LogVerifier("audit", self.signing_key, self.log_path / "verify_checkpoints.jsonl")
+        
+        # Buffered writer: log() enqueues, a background thread appends in batches
+        self.buffered = os.getenv("AUDIT_LOG_BUFFERED", "false").lower() == "true"
+        self.batch_size = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "500"))
+        self.flush_interval = float(os.getenv("AUDIT_LOG_FLUSH_INTERVAL_MS", "50")) / 1000
+        self.fsync_policy = os.getenv("AUDIT_LOG_FSYNC", "interval").lower()
+        self.fsync_interval = float(os.getenv("AUDIT_LOG_FSYNC_INTERVAL_MS", "1000")) / 1000
+        if self.fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"AUDIT_LOG_FSYNC must be one of {FSYNC_POLICIES}, got {self.fsync_policy!r}")
+        
+        self._queue: "queue.Queue" = queue.Queue(maxsize=int(os.getenv("AUDIT_LOG_QUEUE_SIZE", "10000")))
+        self._flusher: Optional[threading.Thread] = None
+        # Held to enqueue and to close: once _closed is set nothing follows _STOP into the queue
+        self._enqueue_lock = threading.Lock()
+        self._closed = False
+        self._last_fsync = time.monotonic()
+        self._unsynced: set = set()  # Files written since the last fsync
+        self.writer_stats = {"batches": 0, "entries": 0, "fsyncs": 0, "max_batch": 0}
+        
+        if self.buffered:
+            self._flusher = threading.Thread(target=self._flush_loop, name="audit-flusher", daemon=True)
+            self._flusher.start()
+            atexit.register(self.close)
+        
+        _module_logger.info(
+            f"Audit logger initialized. Path: {self.log_path}"
+            + (f" (buffered, fsync={self.fsync_policy})" if self.buffered else "")
+        )
     
     def log(
         self,
@@ -87,13 +139,135 @@ class AuditLogger:
         log_file = self.log_path / f"audit_{timestamp.strftime('%Y-%m-%d')}.jsonl"
         
         # Append to log (JSONL format - one JSON object per line)
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry, ensure_ascii=False) + '\n')
+        line = (json.dumps(log_entry, ensure_ascii=False) + '\n').encode('utf-8')
+        queued = False
+        if self._flusher is not None:
+            with self._enqueue_lock:
+                if not self._closed:
+                    # Blocks while the queue is full (backpressure, never drops)
+                    self._queue.put((log_file, line, action, task_id))
+                    queued = True
+        if not queued:
+            self._append(log_file, [(line, action, task_id)])
         
-        _module_logger.info(f"Audit log: {action} | {task_id} | {result}")
+        # The entry itself is the record; this is for interactive debugging
+        _module_logger.debug(f"Audit log: {action} | {task_id} | {result}")
         
         return signature[:16]  # Return short ID
     
+    def flush(self) -> None:
+        """Block until every entry logged so far is written (buffered mode)."""
+        flusher = self._flusher
+        if flusher is not None and flusher.is_alive():
+            self._queue.join()
+    
+    def close(self) -> None:
+        """Drain the queue, fsync and stop the flusher; later log() calls write synchronously."""
+        flusher = self._flusher
+        if flusher is None:
+            return
+        
+        # New entries go straight to disk from here on; _STOP is the last
+        # item ever queued, so the flusher writes everything before it
+        with self._enqueue_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        flusher.join()
+        self._flusher = None
+        
+        # Sync whatever the flusher's last batch left unsynced
+        self._write_batch([], fsync_due=True)
+    
+    def _flush_loop(self) -> None:
+        """Background writer: one append (and optional fsync) per batch."""
+        while True:
+            try:
+                first = self._queue.get(timeout=self.fsync_interval if self.fsync_policy == "interval" else None)
+            except queue.Empty:
+                self._write_batch([], fsync_due=True)  # Idle: sync what the last batches left
+                continue
+            
+            # Give concurrent callers a moment to fill the batch
+            if first is not _STOP and self._queue.qsize() < self.batch_size and self.flush_interval:
+                time.sleep(self.flush_interval)
+            
+            batch = [first]
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = batch[-1] is _STOP
+            entries = [item for item in batch if item is not _STOP]
+            try:
+                self._write_batch(entries, fsync_due=stop)
+            except Exception as e:
+                _module_logger.error(f"Audit flush failed, writing entries one by one: {e}")
+                self._write_entries_unbuffered(entries)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            
+            if stop:
+                return
+    
+    def _append(self, log_file: Path, lines: List[Tuple[bytes, str, str]]) -> None:
+        """
+        Append encoded lines to a daily log in one write and index them.
+        
+        Args:
+            log_file: Daily JSONL file
+            lines: (encoded line, action, task_id) tuples
+        """
+        with self._write_lock:
+            with open(log_file, 'ab') as f:
+                offset = f.seek(0, os.SEEK_END)
+                f.write(b"".join(line for line, _, _ in lines))
+            
+            index_entries = []
+            for line, action, task_id in lines:
+                index_entries.append((offset, len(line), action, task_id))
+                offset += len(line)
+            self.index.record(log_file, index_entries)
+    
+    def _write_batch(self, entries: List[Tuple[Path, bytes, str, str]], fsync_due: bool = False) -> None:
+        """Append a batch (one write per daily file), then fsync per policy."""
+        by_file: Dict[Path, List[Tuple[bytes, str, str]]] = {}
+        for log_file, line, action, task_id in entries:
+            by_file.setdefault(log_file, []).append((line, action, task_id))
+        
+        for log_file, lines in by_file.items():
+            self._append(log_file, lines)
+            self._unsynced.add(log_file)
+        
+        if entries:
+            self.writer_stats["batches"] += 1
+            self.writer_stats["entries"] += len(entries)
+            self.writer_stats["max_batch"] = max(self.writer_stats["max_batch"], len(entries))
+        
+        if not self._unsynced or self.fsync_policy == "never":
+            return
+        if self.fsync_policy == "interval" and not fsync_due and time.monotonic() - self._last_fsync < self.fsync_interval:
+            return
+        
+        with self._write_lock:
+            for log_file in self._unsynced:
+                with open(log_file, 'a', encoding='utf-8') as f:
+                    os.fsync(f.fileno())
+            self.writer_stats["fsyncs"] += len(self._unsynced)
+            self._unsynced.clear()
+        self._last_fsync = time.monotonic()
+    
+    def _write_entries_unbuffered(self, entries: List[Tuple[Path, bytes, str, str]]) -> None:
+        for log_file, line, action, task_id in entries:
+            try:
+                self._append(log_file, [(line, action, task_id)])
+            except Exception as e:
+                _module_logger.error(f"Lost audit entry for {log_file.name}: {e}")
+    
     def _sign_entry(self, entry: Dict[str, Any]) -> str:
         """
         Create cryptographic signature for log entry.
@@ -151,81 +325,222 @@ class AuditLogger:
         """
         matching_entries = []
         
-        # Determine which log files to read
-        log_files = sorted(self.log_path.glob("audit_*.jsonl"))
+        # Read-your-writes in buffered mode
+        self.flush()
+        
+        start_date = _as_utc(start_date)
+        end_date = _as_utc(end_date)
+        
+        # Determine which log files to read (one per UTC day)
+        log_files = [
+            log_file for log_file in sorted(self.log_path.glob("audit_*.jsonl"))
+            if _file_in_range(log_file, start_date, end_date)
+        ]
         
         for log_file in log_files:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    try:
-                        entry = json.loads(line.strip())
-                        
-                        # Apply filters
-                        if task_id and entry.get("task_id") != task_id:
-                            continue
-                        
-                        if action and entry.get("action") != action:
-                            continue
-                        
-                        if start_date or end_date:
-                            entry_time = datetime.fromisoformat(entry["timestamp"])
-                            if start_date and entry_time < start_date:
-                                continue
-                            if end_date and entry_time > end_date:
-                                continue
-                        
-                        matching_entries.append(entry)
-                        
-                    except json.JSONDecodeError:
-                        _module_logger.warning(f"Invalid JSON in {log_file}")
+            if task_id or action:
+                entries = self._read_indexed(log_file, task_id, action)
+            else:
+                entries = self._read_all(log_file)
+            
+            for entry in entries:
+                # Apply filters
+                if task_id and entry.get("task_id") != task_id:
+                    continue
+                
+                if action and entry.get("action") != action:
+                    continue
+                
+                if start_date or end_date:
+                    entry_time = _as_utc(datetime.fromisoformat(entry["timestamp"]))
+                    if start_date and entry_time < start_date:
                         continue
+                    if end_date and entry_time > end_date:
+                        continue
+                
+                matching_entries.append(entry)
         
         return matching_entries
     
-    def verify_all_logs(self) -> Dict[str, Any]:
+    def _read_all(self, log_file: Path) -> Iterator[Dict[str, Any]]:
+        """Every valid entry of a daily log, in order."""
+        with open(log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    yield json.loads(line.strip())
+                except json.JSONDecodeError:
+                    _module_logger.warning(f"Invalid JSON in {log_file}")
+    
+    def _read_indexed(
+        self,
+        log_file: Path,
+        task_id: Optional[str],
+        action: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Entries matching task_id/action, read by seeking to indexed offsets."""
+        entries = []
+        
+        with open(log_file, 'rb') as f:
+            for offset, length in self.index.lookup(log_file, task_id or None, action or None):
+                f.seek(offset)
+                try:
+                    entry = json.loads(f.read(length))
+                except ValueError:
+                    entry = None
+                
+                if (
+                    not isinstance(entry, dict)
+                    or (task_id and entry.get("task_id") != task_id)
+                    or (action and entry.get("action") != action)
+                ):
+                    # Index does not match the log (e.g. file rewritten): rebuild it
+                    _module_logger.warning(f"Stale audit index for {log_file.name}, rebuilding")
+                    self.index.invalidate(log_file)
+                    return list(self._read_all(log_file))
+                
+                entries.append(entry)
+        
+        return entries
+    
+    def get_claim_latency_stats(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Claim latency percentiles: watcher create_task → task_claimed.
+        
+        Args:
+            start_date: Filter by start date
+            end_date: Filter by end date
+        
+        Returns:
+            Dict with count, p50_ms, p99_ms and max_ms
+        """
+        samples = sorted(
+            entry["details"]["claim_latency_ms"]
+            for entry in self.get_logs(action="task_claimed", start_date=start_date, end_date=end_date)
+            if isinstance(entry.get("details", {}).get("claim_latency_ms"), (int, float))
+        )
+        
+        return {
+            "count": len(samples),
+            "p50_ms": _percentile(samples, 50),
+            "p99_ms": _percentile(samples, 99),
+            "max_ms": samples[-1] if samples else None
+        }
+    
+    def get_llm_usage_stats(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        LLM cost and latency from llm_reasoning entries.
+        
+        Args:
+            start_date: Filter by start date
+            end_date: Filter by end date
+        
+        Returns:
+            Dict with count, input/cached token totals, cached_input_ratio
+            and latency p50_ms/p99_ms
+        """
+        input_tokens = 0
+        cached_tokens = 0
+        latencies = []
+        
+        for entry in self.get_logs(action="llm_reasoning", start_date=start_date, end_date=end_date):
+            details = entry.get("details", {})
+            if not isinstance(details.get("latency_ms"), (int, float)):
+                continue  # Logged before usage tracking
+            
+            input_tokens += details.get("input_tokens") or 0
+            cached_tokens += details.get("cached_input_tokens") or 0
+            latencies.append(details["latency_ms"])
+        
+        latencies.sort()
+        return {
+            "count": len(latencies),
+            "input_tokens": input_tokens,
+            "cached_input_tokens": cached_tokens,
+            "cached_input_ratio": round(cached_tokens / input_tokens, 4) if input_tokens else 0.0,
+            "p50_ms": _percentile(latencies, 50),
+            "p99_ms": _percentile(latencies, 99)
+        }
+    
+    def verify_all_logs(self, full: bool = False) -> Dict[str, Any]:
         """
         Verify integrity of all audit logs.
         
+        Days verified clean before are checkpointed; only lines appended
+        since are re-read unless full=True.
+        
+        Args:
+            full: Re-verify every file from the start
+        
         Returns:
             Dict with verification results
         """
-        total = 0
-        valid = 0
-        invalid = []
+        self.flush()
         
         log_files = sorted(self.log_path.glob("audit_*.jsonl"))
+        reports = self.verifier.verify(log_files, full=full)
         
+        total = 0
+        checked = 0
+        invalid = []
         for log_file in log_files:
-            with open(log_file, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        entry = json.loads(line.strip())
-                        total += 1
-                        
-                        if self.verify_entry(entry):
-                            valid += 1
-                        else:
-                            invalid.append({
-                                "file": log_file.name,
-                                "line": line_num,
-                                "task_id": entry.get("task_id")
-                            })
-                    except:
-                        invalid.append({
-                            "file": log_file.name,
-                            "line": line_num,
-                            "error": "parse_error"
-                        })
+            report = reports[log_file.name]
+            total += report["entries"]
+            checked += report["checked"]
+            for failure in report["failures"]:
+                if failure["kind"] == "signature":
+                    invalid.append({"file": log_file.name, "line": failure["line"], "task_id": failure.get("task_id")})
+                elif failure["kind"] == "unreadable":
+                    invalid.append({"file": log_file.name, "line": failure["line"], "error": "parse_error"})
+                else:
+                    invalid.append({"file": log_file.name, "line": failure["line"], "error": failure["error"]})
         
         return {
             "total_entries": total,
-            "valid_entries": valid,
+            "valid_entries": total - sum(1 for item in invalid if item["line"]),
+            "checked_entries": checked,
             "invalid_entries": len(invalid),
             "integrity": "OK" if len(invalid) == 0 else "COMPROMISED",
             "invalid_details": invalid
         }
 
 
+def _as_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    """Naive datetimes are taken as UTC (the audit log's timezone)."""
+    if moment is not None and moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def _file_in_range(log_file: Path, start_date: Optional[datetime], end_date: Optional[datetime]) -> bool:
+    """Whether a daily log (audit_YYYY-MM-DD.jsonl) can hold entries in the range."""
+    try:
+        day = date.fromisoformat(log_file.stem[len("audit_"):])
+    except ValueError:
+        return True  # Not a daily file: always read it
+    
+    if start_date and day < start_date.astimezone(timezone.utc).date():
+        return False
+    if end_date and day > end_date.astimezone(timezone.utc).date():
+        return False
+    return True
+
+
+def _percentile(ordered: list, pct: float) -> Optional[float]:
+    """Nearest-rank percentile of an already-sorted list."""
+    if not ordered:
+        return None
+    index = max(0, min(len(ordered) - 1, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
 # Global instance
 _audit_logger = None
 
@@ -260,3 +575,7 @@ if __name__ == "__main__":
     # Query logs
     logs = logger.get_logs(task_id="test-123")
     print(f"\nFound {len(logs)} logs for task test-123")
+    
+    # Claim latency (watcher → orchestrator)
+    print(f"Claim latency: {logger.get_claim_latency_stats()}")
+    print(f"LLM usage: {logger.get_llm_usage_stats()}")
@@ -0,0 +1,523 @@
+"""
+Completion Archive - Date-Sharded task_queue/completed/ and Done/
+
+ARCHITECTURAL RULES:
+1. Each completion lands in the shard of the (UTC) day it was archived:
+   <root>/YYYY-MM-DD/<name>; its mtime is the archive time
+2. Readers go through iter_entries(since, until): shard names and the
+   segment manifest bound a query by time, so recent-window checks never
+   list the whole history
+3. Optional compaction: with ARCHIVE_COMPACT_DAYS set, shards older than
+   that are packed into one gzip JSONL segment per day under
+   <root>/.segments/, indexed by .segments/manifest.json (count and time
+   bounds per segment)
+4. Files left in <root> by the old flat layout stay readable and are moved
+   into shards by `python orchestration/completion_archive.py migrate`
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import time
+import base64
+import threading
+from collections import deque
+from pathlib import Path
+from datetime import datetime, timezone, timedelta
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("completion_archive")
+
+SEGMENTS_DIR = ".segments"
+MANIFEST_FILE = "manifest.json"
+
+# Overlap for readers that poll with a "since last check" cursor: a file's
+# mtime is set just before it becomes visible in its shard
+SETTLE_SECONDS = 60
+
+_DAY = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+LOOSE = "."  # Day key of files left in the root by the flat layout
+
+
+def _day_of(timestamp: float) -> str:
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def _timestamp(value: Union[datetime, float, None]) -> Optional[float]:
+    """Datetime (naive = local time) or epoch seconds → epoch seconds."""
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return value.timestamp()
+
+
+class ArchivedItem:
+    """One archived file, either still in its shard or inside a segment."""
+    
+    __slots__ = ("name", "mtime", "day", "path", "size", "_data")
+    
+    def __init__(self, name: str, mtime: float, day: str, path: Optional[Path] = None, data: Optional[bytes] = None,
+                 size: Optional[int] = None):
+        self.name = name
+        self.mtime = mtime
+        self.day = day
+        self.path = path  # None once compacted
+        self.size = len(data) if data is not None else size
+        self._data = data
+    
+    @property
+    def stem(self) -> str:
+        return Path(self.name).stem
+    
+    @property
+    def suffix(self) -> str:
+        return Path(self.name).suffix
+    
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes() if self.path is not None else self._data
+    
+    def read_text(self, encoding: str = 'utf-8') -> str:
+        return self.read_bytes().decode(encoding)
+    
+    def __str__(self) -> str:
+        return str(self.path) if self.path is not None else f"{SEGMENTS_DIR}/{self.day}.jsonl.gz#{self.name}"
+    
+    def __repr__(self) -> str:
+        return f"ArchivedItem({self.name!r}, day={self.day!r})"
+
+
+class CompletionArchive:
+    """
+    Date-sharded archive of completed task files.
+    
+    Used for task_queue/completed/ (orchestrator) and the vault's Done/
+    (Claude orchestrator, social/Odoo watchers, tenant stats).
+    """
+    
+    def __init__(self, root: Path, compact_days: Optional[int] = None):
+        self.root = Path(root)
+        self.segments = self.root / SEGMENTS_DIR
+        self.compact_days = int(os.getenv("ARCHIVE_COMPACT_DAYS", "0")) if compact_days is None else compact_days
+        
+        self._lock = threading.Lock()
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._manifest_mtime: Optional[int] = None
+        self._shard_counts: Dict[str, Tuple[int, int]] = {}  # day -> (dir mtime_ns, files)
+    
+    def add(self, name: str, content: Union[str, bytes]) -> Path:
+        """
+        Write a completion into today's shard (atomically).
+        
+        Args:
+            name: File name (e.g. "<task_id>.json"); replaces a same-named
+                file archived earlier the same day
+            content: File content
+        
+        Returns:
+            Path of the archived file
+        """
+        shard = self._shard(_day_of(datetime.now(timezone.utc).timestamp()))
+        dest = shard / name
+        tmp_path = shard / f".{name}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(content.encode('utf-8') if isinstance(content, str) else content)
+        os.replace(tmp_path, dest)
+        return dest
+    
+    def move_in(self, path: Path) -> Path:
+        """
+        Move a finished file into today's shard (rename, mtime set to now).
+        
+        Returns:
+            Path of the archived file
+        """
+        dest = self._shard(_day_of(datetime.now(timezone.utc).timestamp())) / Path(path).name
+        Path(path).rename(dest)
+        os.utime(dest)
+        return dest
+    
+    def iter_entries(
+        self,
+        since: Union[datetime, float, None] = None,
+        until: Union[datetime, float, None] = None,
+        newest_first: bool = False
+    ) -> Iterator[ArchivedItem]:
+        """
+        Archived files with since <= mtime < until, ordered by day and mtime.
+        
+        Only shards and segments whose day overlaps the window are opened.
+        
+        Args:
+            since: Lower bound (datetime or epoch seconds, None = everything)
+            until: Upper bound (exclusive)
+            newest_first: Reverse order (e.g. "latest N completions")
+        """
+        since_ts, until_ts = _timestamp(since), _timestamp(until)
+        first_day = _day_of(since_ts) if since_ts is not None else None
+        last_day = _day_of(until_ts) if until_ts is not None else None
+        
+        shard_days, loose = self._listing()
+        manifest = self._load_manifest()
+        days = sorted(
+            (day for day in set(shard_days) | manifest.keys()
+             if (first_day is None or day >= first_day) and (last_day is None or day <= last_day)),
+            reverse=newest_first
+        )
+        
+        def in_window(item: ArchivedItem) -> bool:
+            return (since_ts is None or item.mtime >= since_ts) and (until_ts is None or item.mtime < until_ts)
+        
+        # Old flat-layout files: not sharded, so order them in with a sort
+        loose_items = deque(sorted(
+            (item for item in (self._loose_item(entry) for entry in loose) if item and in_window(item)),
+            key=lambda item: item.mtime,
+            reverse=newest_first
+        ))
+        
+        for day in days:
+            segment = manifest.get(day)
+            if segment is not None and not self._overlaps(segment, since_ts, until_ts) and day not in shard_days:
+                continue
+            
+            items = self._read_day(day, segment, shard_days.get(day))
+            for item in sorted(items, key=lambda item: item.mtime, reverse=newest_first):
+                if not in_window(item):
+                    continue
+                while loose_items and (loose_items[0].mtime > item.mtime if newest_first else loose_items[0].mtime < item.mtime):
+                    yield loose_items.popleft()
+                yield item
+        
+        yield from loose_items
+    
+    def latest(self, limit: int) -> List[ArchivedItem]:
+        """The `limit` most recently archived files, newest first."""
+        items = []
+        for item in self.iter_entries(newest_first=True):
+            if len(items) >= limit:
+                break
+            items.append(item)
+        return items
+    
+    def count(self) -> int:
+        """Number of archived files (segments are counted from the manifest)."""
+        shard_days, loose = self._listing()
+        manifest = self._load_manifest()
+        
+        today = _day_of(time.time())
+        
+        total = len(loose)
+        for day, segment in manifest.items():
+            if day not in shard_days:
+                total += segment["count"]
+        for day, shard in shard_days.items():
+            if day in manifest:
+                # Shard left behind by an interrupted compaction
+                names = self._shard_names(shard) | {item.name for item in self._read_segment(day, manifest[day])}
+                total += len(names)
+                continue
+            
+            # Past shards rarely change: re-list one only if its mtime moved
+            # (today's is always listed; coarse mtimes could hide an add)
+            try:
+                mtime = os.stat(shard).st_mtime_ns
+            except FileNotFoundError:
+                continue
+            cached = self._shard_counts.get(day)
+            if cached is None or cached[0] != mtime or day >= today:
+                cached = (mtime, len(self._shard_names(shard)))
+                self._shard_counts[day] = cached
+            total += cached[1]
+        return total
+    
+    def day_signatures(self) -> Dict[str, Optional[Tuple[Optional[int], Optional[int], Optional[int]]]]:
+        """
+        Day → value that changes when files are added to or removed from it.
+        
+        The value is (shard directory mtime, segment bytes, segment count).
+        Edits in place keep a shard's mtime, so callers re-read today's shard
+        (and occasionally every shard) regardless. Loose files are under
+        LOOSE, with no signature.
+        """
+        shard_days, loose = self._listing()
+        manifest = self._load_manifest()
+        
+        signatures: Dict[str, Optional[Tuple[Optional[int], Optional[int], Optional[int]]]] = {}
+        for day in set(shard_days) | manifest.keys():
+            shard_mtime = None
+            if day in shard_days:
+                try:
+                    shard_mtime = os.stat(shard_days[day]).st_mtime_ns
+                except FileNotFoundError:
+                    pass
+            segment = manifest.get(day)
+            signatures[day] = (shard_mtime, segment["bytes"] if segment else None, segment["count"] if segment else None)
+        if loose:
+            signatures[LOOSE] = None
+        return signatures
+    
+    def read_day(self, day: str) -> List[ArchivedItem]:
+        """All files of one day (shard and segment), or the loose files for LOOSE."""
+        shard_days, loose = self._listing()
+        if day == LOOSE:
+            return [item for item in (self._loose_item(entry) for entry in loose) if item]
+        return self._read_day(day, self._load_manifest().get(day), shard_days.get(day))
+    
+    def compact(self, older_than_days: Optional[int] = None) -> Dict[str, int]:
+        """
+        Pack day shards older than `older_than_days` into gzip segments.
+        
+        A shard is merged into an existing segment for its day (same-named
+        files in the shard win). The segment and manifest are replaced
+        atomically before the shard's files are removed, so a crash leaves
+        at worst a shard the next compaction finishes.
+        
+        Args:
+            older_than_days: Age threshold (default: ARCHIVE_COMPACT_DAYS;
+                0 disables compaction)
+        
+        Returns:
+            Day → entries in its segment, for each day compacted
+        """
+        days = self.compact_days if older_than_days is None else older_than_days
+        if days <= 0:
+            return {}
+        
+        cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).strftime("%Y-%m-%d")
+        compacted: Dict[str, int] = {}
+        
+        with self._lock:
+            shard_days, _ = self._listing()
+            for day in sorted(shard_days):
+                if day >= cutoff:
+                    continue
+                
+                manifest = self._load_manifest()
+                records = {item.name: item for item in self._read_segment(day, manifest.get(day))}
+                shard_items = self._read_shard(day, shard_days[day])
+                records.update((item.name, item) for item in shard_items)
+                
+                if records:
+                    manifest[day] = self._write_segment(day, list(records.values()))
+                    self._save_manifest(manifest)
+                
+                for item in shard_items:
+                    item.path.unlink()
+                try:
+                    shard_days[day].rmdir()
+                except OSError:
+                    logger.warning(f"Left non-archive files in shard {day}")
+                
+                compacted[day] = len(records)
+                logger.info(f"Compacted {self.root.name}/{day}: {len(records)} entries")
+        
+        return compacted
+    
+    def migrate(self) -> int:
+        """
+        Move files from the old flat layout into the shards of their mtime day.
+        
+        Returns:
+            Files moved
+        """
+        moved = 0
+        _, loose = self._listing()
+        for entry in loose:
+            item = self._loose_item(entry)
+            if item is None:
+                continue
+            dest = self._shard(item.day) / item.name
+            if dest.exists():
+                logger.warning(f"Not migrating {item.name}: {item.day}/{item.name} exists")
+                continue
+            os.rename(entry.path, dest)
+            moved += 1
+        return moved
+    
+    def _shard(self, day: str) -> Path:
+        shard = self.root / day
+        shard.mkdir(parents=True, exist_ok=True)
+        return shard
+    
+    def _listing(self) -> Tuple[Dict[str, Path], List[os.DirEntry]]:
+        """Day shard directories and loose (flat-layout) files in the root."""
+        shard_days: Dict[str, Path] = {}
+        loose: List[os.DirEntry] = []
+        try:
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        if _DAY.match(entry.name):
+                            shard_days[entry.name] = Path(entry.path)
+                    elif entry.is_file():
+                        loose.append(entry)
+        except FileNotFoundError:
+            pass
+        return shard_days, loose
+    
+    @staticmethod
+    def _loose_item(entry: os.DirEntry) -> Optional[ArchivedItem]:
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            return None
+        return ArchivedItem(entry.name, stat.st_mtime, _day_of(stat.st_mtime), Path(entry.path), size=stat.st_size)
+    
+    @staticmethod
+    def _overlaps(segment: Dict[str, Any], since_ts: Optional[float], until_ts: Optional[float]) -> bool:
+        return (since_ts is None or segment["last"] >= since_ts) and (until_ts is None or segment["first"] < until_ts)
+    
+    def _read_day(self, day: str, segment: Optional[Dict[str, Any]], shard: Optional[Path]) -> List[ArchivedItem]:
+        items = {item.name: item for item in self._read_segment(day, segment)}
+        if shard is not None:
+            items.update((item.name, item) for item in self._read_shard(day, shard))
+        return list(items.values())
+    
+    @staticmethod
+    def _shard_names(shard: Path) -> set:
+        try:
+            with os.scandir(shard) as entries:
+                return {e.name for e in entries if not e.name.startswith(".") and e.is_file()}
+        except FileNotFoundError:
+            return set()
+    
+    @staticmethod
+    def _read_shard(day: str, shard: Path) -> List[ArchivedItem]:
+        items = []
+        try:
+            with os.scandir(shard) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.is_file():
+                        continue
+                    try:
+                        stat = entry.stat()
+                        items.append(ArchivedItem(entry.name, stat.st_mtime, day, Path(entry.path), size=stat.st_size))
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            pass
+        return items
+    
+    def _read_segment(self, day: str, segment: Optional[Dict[str, Any]]) -> List[ArchivedItem]:
+        if segment is None:
+            return []
+        
+        items = []
+        try:
+            with gzip.open(self.segments / segment["file"], 'rt', encoding='utf-8') as f:
+                for line in f:
+                    record = json.loads(line)
+                    data = record["text"].encode('utf-8') if "text" in record else base64.b64decode(record["data"])
+                    items.append(ArchivedItem(record["name"], record["mtime"], day, data=data))
+        except (OSError, ValueError) as e:
+            logger.error(f"Unreadable segment {segment['file']}: {e}")
+        return items
+    
+    def _write_segment(self, day: str, items: List[ArchivedItem]) -> Dict[str, Any]:
+        """Write one day's segment atomically; returns its manifest entry."""
+        self.segments.mkdir(parents=True, exist_ok=True)
+        name = f"{day}.jsonl.gz"
+        tmp_path = self.segments / f".{name}.tmp"
+        
+        with open(tmp_path, 'wb') as raw:
+            with gzip.open(raw, 'wt', encoding='utf-8') as f:
+                for item in sorted(items, key=lambda item: item.mtime):
+                    data = item.read_bytes()
+                    record: Dict[str, Any] = {"name": item.name, "mtime": item.mtime}
+                    try:
+                        record["text"] = data.decode('utf-8')
+                    except UnicodeDecodeError:
+                        record["data"] = base64.b64encode(data).decode('ascii')
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            raw.flush()
+            os.fsync(raw.fileno())
+        os.replace(tmp_path, self.segments / name)
+        
+        return {
+            "file": name,
+            "count": len(items),
+            "first": min(item.mtime for item in items),
+            "last": max(item.mtime for item in items),
+            "bytes": (self.segments / name).stat().st_size
+        }
+    
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Day → segment entry (re-read only when the manifest changes)."""
+        manifest_file = self.segments / MANIFEST_FILE
+        try:
+            mtime = manifest_file.stat().st_mtime_ns
+        except FileNotFoundError:
+            self._manifest, self._manifest_mtime = {}, None
+            return self._manifest
+        
+        if mtime != self._manifest_mtime:
+            try:
+                with open(manifest_file, 'r', encoding='utf-8') as f:
+                    self._manifest = json.load(f)["segments"]
+                self._manifest_mtime = mtime
+            except (OSError, ValueError, KeyError) as e:
+                logger.error(f"Unreadable archive manifest {manifest_file}: {e}")
+                self._manifest = {}
+        return self._manifest
+    
+    def _save_manifest(self, manifest: Dict[str, Dict[str, Any]]) -> None:
+        manifest_file = self.segments / MANIFEST_FILE
+        tmp_path = self.segments / f".{MANIFEST_FILE}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"segments": dict(sorted(manifest.items()))}, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, manifest_file)
+        self._manifest, self._manifest_mtime = manifest, manifest_file.stat().st_mtime_ns
+
+
+class ArchiveCursor:
+    """
+    "New since the last check" reads for polling watchers.
+    
+    commit() after the entries were handled; until then the next check
+    sees them again. The first check (or the first after a restart) reads
+    everything, so watchers still dedupe with their processed-items state.
+    """
+    
+    def __init__(self, archive: CompletionArchive):
+        self.archive = archive
+        self.since: Optional[float] = None
+        self._next: Optional[float] = None
+    
+    def new_entries(self) -> Iterator[ArchivedItem]:
+        self._next = time.time() - SETTLE_SECONDS
+        return self.archive.iter_entries(since=self.since)
+    
+    def commit(self) -> None:
+        if self._next is not None:
+            self.since = self._next
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s - %(message)s')
+    
+    commands = ("migrate", "compact", "stats")
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    if not args or args[0] not in commands:
+        print("Usage: python orchestration/completion_archive.py {migrate|compact|stats} ROOT [--older-than-days=N]")
+        print("  ROOT is task_queue/completed or a vault's Done folder")
+        sys.exit(1)
+    
+    archive = CompletionArchive(Path(args[1]) if len(args) > 1 else Path("./task_queue/completed"))
+    
+    if args[0] == "migrate":
+        print(f"Moved {archive.migrate()} file(s) into day shards")
+    elif args[0] == "compact":
+        days = next((int(arg.split("=", 1)[1]) for arg in sys.argv if arg.startswith("--older-than-days=")), None)
+        result = archive.compact(days)
+        print(f"Compacted {len(result)} day(s), {sum(result.values())} entries")
+    else:
+        print(f"{archive.count()} archived file(s) in {archive.root}")
@@ -0,0 +1,169 @@
+"""
+Dedupe Store - Persistent "Already Processed" Keys for Watchers
+
+ARCHITECTURAL RULES:
+1. One SQLite database per watcher (task_queue/.<name>.keys.db) in WAL
+   mode: an add is an append to the write-ahead log, never a rewrite of
+   the whole state
+2. Nothing is loaded at startup; membership is a primary-key lookup, so
+   opening and checking cost the same at 10 or 10M keys
+3. Keys may expire (TTL); expired keys read as absent and are deleted by
+   a sweep at most every DEDUPE_SWEEP_SECONDS
+4. Old JSON state files ({"processed_items": [...]}) are imported once,
+   into an empty store; the JSON file is left as it was
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+import logging
+
+logger = logging.getLogger("dedupe_store")
+
+NEVER = 0  # Expiry of keys without a TTL
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS processed (
+    key TEXT PRIMARY KEY,
+    expires INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS processed_expiry ON processed (expires) WHERE expires > 0;
+"""
+
+
+class DedupeStore:
+    """
+    Set of processed keys, persisted in SQLite.
+    
+    Usage:
+        seen = DedupeStore(Path('./task_queue/.odoo_watcher.keys.db'))
+        if key not in seen:
+            ...create task...
+            seen.add(key)
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        ttl_seconds: Optional[float] = None,
+        legacy_state: Optional[Path] = None
+    ):
+        """
+        Args:
+            path: Database file
+            ttl_seconds: Default lifetime of a key (None: keys never expire)
+            legacy_state: Old JSON state file, imported if the store is empty
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.sweep_seconds = float(os.getenv("DEDUPE_SWEEP_SECONDS", "3600"))
+        
+        self._lock = threading.Lock()
+        self._next_sweep = 0.0
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")  # WAL: fsync at checkpoints, not per add
+        self._db.executescript(SCHEMA)
+        
+        if legacy_state and self._db.execute("SELECT 1 FROM processed LIMIT 1").fetchone() is None:
+            self._import_legacy(Path(legacy_state))
+    
+    def __contains__(self, key: object) -> bool:
+        with self._lock:
+            row = self._db.execute("SELECT expires FROM processed WHERE key = ?", (key,)).fetchone()
+        return row is not None and (row[0] == NEVER or row[0] > time.time())
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM processed WHERE expires = 0 OR expires > ?", (int(time.time()),)
+            ).fetchone()[0]
+    
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key FROM processed WHERE expires = 0 OR expires > ?", (int(time.time()),)
+            ).fetchall()
+        return iter([row[0] for row in rows])
+    
+    def add(self, key: str, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        Mark key as processed.
+        
+        Args:
+            key: Key to store
+            ttl_seconds: Lifetime of this key (default: the store's TTL)
+        
+        Returns:
+            False if the key was already present (its expiry is left as it was)
+        """
+        if key in self:
+            return False
+        self.add_many([key], ttl_seconds)
+        return True
+    
+    def add_many(self, keys: Iterable[str], ttl_seconds: Optional[float] = None) -> None:
+        """Mark several keys as processed in one transaction."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires = int(time.time() + ttl) + 1 if ttl else NEVER
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO processed (key, expires) VALUES (?, ?)",
+                    ((key, expires) for key in keys)
+                )
+                self._db.execute("COMMIT")
+            except Exception:
+                self._db.execute("ROLLBACK")
+                raise
+            self._maybe_sweep()
+    
+    def discard(self, key: str) -> None:
+        """Forget key (it may be processed again)."""
+        with self._lock:
+            self._db.execute("DELETE FROM processed WHERE key = ?", (key,))
+    
+    def sweep(self) -> int:
+        """Delete expired keys; returns how many."""
+        with self._lock:
+            return self._sweep()
+    
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+    
+    def _maybe_sweep(self) -> None:
+        """Sweep at most every sweep_seconds (lock held)."""
+        now = time.time()
+        if now >= self._next_sweep:
+            self._next_sweep = now + self.sweep_seconds
+            self._sweep()
+    
+    def _sweep(self) -> int:
+        """Delete expired keys (lock held)."""
+        deleted = self._db.execute(
+            "DELETE FROM processed WHERE expires > 0 AND expires <= ?", (int(time.time()),)
+        ).rowcount
+        if deleted:
+            logger.info(f"Expired {deleted} keys from {self.path.name}")
+        return deleted
+    
+    def _import_legacy(self, state_file: Path) -> None:
+        """Carry over processed_items from the old JSON state file."""
+        if not state_file.exists():
+            return
+        try:
+            with open(state_file, 'r', encoding='utf-8') as f:
+                items = json.load(f).get('processed_items', [])
+        except Exception as e:
+            logger.warning(f"Could not import {state_file}: {e}")
+            return
+        self.add_many(str(item) for item in items)
+        logger.info(f"Imported {len(items)} processed items from {state_file.name}")
@@ -0,0 +1,216 @@
+"""
+Inbox Index - Priority-Aware Claim Order
+
+ARCHITECTURAL RULES:
+1. task_queue/inbox/ stays the source of truth (index is in-memory only)
+2. Each task file is read ONCE when it enters the index, never per tick
+3. Claim order: priority first, then age (oldest first)
+4. Optional starvation aging so low-priority tasks eventually run
+5. Tasks of the same batch group can be popped together (batched reasoning)
+"""
+
+import os
+import json
+import heapq
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger("inbox_index")
+
+# Lower rank is claimed first
+PRIORITY_RANKS = {
+    "critical": 0,
+    "high": 1,
+    "normal": 2,
+    "medium": 2,  # Odoo watcher uses "medium"
+    "low": 3
+}
+DEFAULT_RANK = PRIORITY_RANKS["normal"]
+
+# Only these ranks are eligible for batched reasoning (normal/medium, low)
+BATCHABLE_RANKS = {PRIORITY_RANKS["normal"], PRIORITY_RANKS["low"]}
+
+
+def parse_created_at(value: Any) -> Optional[datetime]:
+    """Parse a task's created_at (naive timestamps are local time)."""
+    try:
+        created_at = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    
+    if created_at.tzinfo is None:
+        created_at = created_at.astimezone()
+    return created_at
+
+
+def task_group(task: Dict[str, Any]) -> Optional[Tuple]:
+    """
+    Batch group of a task: same priority rank, type, trigger and explicit
+    skills. None if the task must be reasoned about on its own.
+    """
+    rank = PRIORITY_RANKS.get(str(task.get("priority", "normal")).lower(), DEFAULT_RANK)
+    if rank not in BATCHABLE_RANKS or task.get("hitl_required"):
+        return None
+    
+    return (
+        rank,
+        task.get("task_type") or task.get("type") or "generic",
+        task.get("trigger"),
+        tuple(sorted(task.get("required_skills") or []))
+    )
+
+
+class InboxIndex:
+    """
+    Incrementally maintained priority-plus-age heap over inbox/.
+    
+    Files enter the index through note() (filesystem events) or refresh()
+    (directory diff for polling mode and the fallback rescan). Either way
+    only new files are opened; known files are never re-read or re-sorted.
+    
+    Starvation aging (aging_seconds > 0): every aging_seconds a task waits
+    counts as one priority level, so a "low" task queued 3 * aging_seconds
+    ago is claimed before a "critical" task that just arrived.
+    """
+    
+    def __init__(self, inbox: Path, aging_seconds: float = 0):
+        self.inbox = inbox
+        self.aging_seconds = aging_seconds
+        
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple] = {}  # file name -> heap key
+        self._unparsed: set = set()  # names indexed with defaults (retry on next note)
+        self._heap: List[Tuple[Tuple, str]] = []
+        self._noted: set = set()  # names reported by events, not yet read
+        self._groups: Dict[str, Tuple] = {}  # file name -> batch group (batchable tasks only)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            self._apply_notes()
+            return len(self._entries)
+    
+    def note(self, path: Any) -> None:
+        """Record that a file appeared or changed (thread-safe, no I/O)."""
+        name = Path(str(path)).name
+        if name.endswith(".json") and not name.startswith("."):
+            with self._lock:
+                self._noted.add(name)
+    
+    def refresh(self) -> None:
+        """Diff the directory listing against the index (reads new files only)."""
+        try:
+            with os.scandir(self.inbox) as entries:
+                present = {
+                    entry.name for entry in entries
+                    if entry.name.endswith(".json") and not entry.name.startswith(".")
+                }
+        except FileNotFoundError:
+            present = set()
+        
+        with self._lock:
+            for name in list(self._entries):
+                if name not in present:
+                    self._forget(name)
+            
+            self._noted |= present - self._entries.keys()
+            self._apply_notes()
+    
+    def pop(self) -> Optional[Path]:
+        """Remove and return the most urgent task file, or None if empty."""
+        with self._lock:
+            self._apply_notes()
+            
+            while self._heap:
+                key, name = heapq.heappop(self._heap)
+                if self._entries.get(name) != key:
+                    continue  # Stale heap entry (forgotten or re-keyed)
+                
+                self._forget(name)
+                return self.inbox / name
+        
+        return None
+    
+    def pop_group(self, group: Tuple, limit: int) -> List[Path]:
+        """
+        Remove and return up to `limit` task files in the given batch group,
+        most urgent first.
+        """
+        if limit <= 0:
+            return []
+        
+        with self._lock:
+            self._apply_notes()
+            
+            candidates = [(self._entries[name], name) for name, g in self._groups.items() if g == group]
+            members = heapq.nsmallest(limit, candidates)
+            
+            for _, name in members:
+                self._forget(name)
+            return [self.inbox / name for _, name in members]
+    
+    def _forget(self, name: str) -> None:
+        self._entries.pop(name, None)
+        self._unparsed.discard(name)
+        self._groups.pop(name, None)
+        
+        # Compact lazily-deleted heap entries now and then
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = [(key, n) for key, n in self._heap if self._entries.get(n) == key]
+            heapq.heapify(self._heap)
+    
+    def _apply_notes(self) -> None:
+        """Read and index files reported since the last call."""
+        noted, self._noted = self._noted, set()
+        
+        for name in noted:
+            if name in self._entries and name not in self._unparsed:
+                continue  # Already indexed; task files are immutable in inbox/
+            
+            key = self._read_key(self.inbox / name)
+            if key is None:
+                self._forget(name)
+                continue
+            
+            self._entries[name] = key
+            heapq.heappush(self._heap, (key, name))
+    
+    def _read_key(self, task_file: Path) -> Optional[Tuple]:
+        """Heap key for a task file, or None if it no longer exists."""
+        try:
+            stat = task_file.stat()
+        except FileNotFoundError:
+            return None
+        
+        rank = DEFAULT_RANK
+        created = stat.st_mtime
+        
+        try:
+            with open(task_file, 'r', encoding='utf-8') as f:
+                task = json.load(f)
+            
+            rank = PRIORITY_RANKS.get(str(task.get("priority", "normal")).lower(), DEFAULT_RANK)
+            created_at = parse_created_at(task.get("created_at"))
+            if created_at is not None:
+                created = created_at.timestamp()
+            self._unparsed.discard(task_file.name)
+            
+            group = task_group(task)
+            if group is not None:
+                self._groups[task_file.name] = group
+        
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Partial write or corrupt file: index with defaults, the claim
+            # surfaces the error (and a later event re-reads it)
+            logger.debug(f"Could not read {task_file.name} for indexing: {e}")
+            self._unparsed.add(task_file.name)
+        
+        if self.aging_seconds > 0:
+            # Virtual deadline: each priority level is worth aging_seconds of waiting
+            return (created + rank * self.aging_seconds, task_file.name)
+        return (rank, created, task_file.name)
+
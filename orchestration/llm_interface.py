@@ -7,14 +7,23 @@ ARCHITECTURAL RULES:
 3. Orchestrator uses this to analyze tasks and plan actions
 4. All actions must still go through MCP servers
 5. Respects provider selection from .env
+6. Prompt = stable cached prefix (instructions, vault context, skills) + per-task suffix
+7. Compatible tasks can share one request (reason_batch); plans are fanned back out
+8. Streaming mode (LLM_STREAMING) parses the plan as it arrives: each action
+   is handed to the caller when complete and malformed output aborts early
 """
 
 import os
 import json
+import time
 import logging
-from typing import Dict, Any, List, Optional, TYPE_CHECKING
+import threading
+from collections import OrderedDict, deque
+from typing import Callable, Dict, Any, Iterator, List, Optional, Tuple, TYPE_CHECKING
 from dotenv import load_dotenv
 
+from orchestration.plan_stream import PlanStreamParser, PlanStreamError
+
 # Import LLM providers (conditional based on availability)
 ANTHROPIC_AVAILABLE = False
 OPENAI_AVAILABLE = False
@@ -56,6 +65,37 @@ class LLMInterface:
         self.client: Any = None
         self.model: str = ""
         self.max_tokens = int(os.getenv("MAX_LLM_RESPONSE_TOKENS", "2000"))
+        # The model's output cap: one request never asks for more (batches are split)
+        self.max_output_tokens = int(os.getenv(
+            "LLM_MAX_OUTPUT_TOKENS", "8192" if self.provider == "anthropic" else "16384"
+        ))
+        self.request_timeout = float(os.getenv("LLM_REQUEST_TIMEOUT", "60"))
+        
+        # Streaming: incremental plan parsing (single-task reason() only)
+        self.streaming = os.getenv("LLM_STREAMING", "false").lower() == "true"
+        self.stream_max_preamble = int(os.getenv("LLM_STREAM_MAX_PREAMBLE", "200"))
+        
+        # Prompt caching: Anthropic cache breakpoints on the stable prefix
+        self.prompt_caching = os.getenv("LLM_PROMPT_CACHING", "true").lower() == "true"
+        self.prefix_cache_size = int(os.getenv("LLM_PREFIX_CACHE_SIZE", "32"))
+        self._prefix_cache: "OrderedDict[Tuple, Tuple[str, str]]" = OrderedDict()
+        
+        # Usage stats (shared by worker threads)
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, int] = {
+            "calls": 0,
+            "errors": 0,
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "cache_write_tokens": 0,
+            "output_tokens": 0,
+            "prefix_hits": 0,
+            "prefix_misses": 0,
+            "batch_calls": 0,
+            "batched_tasks": 0,
+            "stream_aborts": 0
+        }
+        self._latencies: deque = deque(maxlen=1000)
         
         if self.provider == "anthropic":
             self._init_anthropic()
@@ -79,7 +119,7 @@ class LLMInterface:
             raise ValueError("ANTHROPIC_API_KEY not found in environment")
         
         from anthropic import Anthropic
-        self.client = Anthropic(api_key=api_key)
+        self.client = Anthropic(api_key=api_key, timeout=self.request_timeout)
         self.model = os.getenv("ANTHROPIC_MODEL", "claude-3-5-sonnet-20241022")
         
         logger.info(f"Anthropic initialized with model: {self.model}")
@@ -96,7 +136,7 @@ class LLMInterface:
             raise ValueError("OPENAI_API_KEY not found in environment")
         
         from openai import OpenAI
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, timeout=self.request_timeout)
         # Use budget-friendly gpt-4o-mini by default (60x cheaper than GPT-4 Turbo)
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
         
@@ -106,7 +146,8 @@ class LLMInterface:
         self,
         task: Dict[str, Any],
         skills: Dict[str, str],
-        context: Optional[str] = None
+        context: Optional[str] = None,
+        on_action: Optional[Callable[[int, Dict[str, Any], Dict[str, Any]], None]] = None
     ) -> Dict[str, Any]:
         """
         Use LLM to reason about a task and generate action plan.
@@ -115,6 +156,9 @@ class LLMInterface:
             task: Task dict from task queue
             skills: Agent skills loaded from vault
             context: Optional additional context
+            on_action: Streaming mode only: called as on_action(index, action,
+                fields) the moment each action is complete, with the plan's
+                top-level fields seen so far. Raising aborts the stream.
         
         Returns:
             Dict with:
@@ -122,22 +166,34 @@ class LLMInterface:
                 - actions: List of actions to execute
                 - requires_approval: Boolean
                 - confidence: Float 0-1
+                - usage: Input/cached/output tokens and latency for this call
+                  (plus first_action_ms when streamed)
         """
         
-        # Build prompt from task and skills
-        prompt = self._build_reasoning_prompt(task, skills, context)
+        # Stable prefix (instructions, vault context, skills) + per-task suffix
+        prefix = self._build_prompt_prefix(skills, context)
+        task_prompt = self._build_task_prompt(task)
         
+        started = time.perf_counter()
         try:
-            if self.provider == "anthropic":
-                return self._reason_anthropic(prompt)
+            if self.streaming:
+                result, usage = self._reason_streaming(prefix, task_prompt, on_action)
+            elif self.provider == "anthropic":
+                result, usage = self._reason_anthropic(prefix, task_prompt)
             elif self.provider == "openai":
-                return self._reason_openai(prompt)
+                result, usage = self._reason_openai(prefix, task_prompt)
             else:
                 # Should never reach here due to __init__ validation
                 raise ValueError(f"Invalid provider: {self.provider}")
+            
+            usage["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+            self._record_usage(usage)
+            result["usage"] = usage
+            return result
         
         except Exception as e:
             logger.error(f"LLM reasoning failed: {e}")
+            self._record_usage(None)
             return {
                 "thought_process": f"Error: {str(e)}",
                 "actions": [],
@@ -146,18 +202,119 @@ class LLMInterface:
                 "error": str(e)
             }
     
+    def reason_batch(
+        self,
+        tasks: List[Dict[str, Any]],
+        skills: Dict[str, str],
+        context: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Reason about several compatible tasks (same type and skills) in one request.
+        
+        Args:
+            tasks: Tasks sharing one skill set
+            skills: Agent skills loaded from vault
+            context: Optional additional context
+        
+        Returns:
+            One result per task, in order (same shape as reason()). Tasks
+            whose plan is missing from the batch response, or the whole batch
+            if the request fails, fall back to individual reason() calls.
+            A batch whose tokens (MAX_LLM_RESPONSE_TOKENS per task) would pass
+            LLM_MAX_OUTPUT_TOKENS is sent as several smaller requests.
+        """
+        per_request = max(1, self.max_output_tokens // self.max_tokens)
+        if len(tasks) > per_request:
+            results = []
+            for start in range(0, len(tasks), per_request):
+                results.extend(self.reason_batch(tasks[start:start + per_request], skills, context))
+            return results
+        
+        if len(tasks) <= 1:
+            return [self.reason(task, skills, context) for task in tasks]
+        
+        prefix = self._build_prompt_prefix(skills, context)
+        batch_prompt = self._build_batch_prompt(tasks)
+        max_tokens = min(self.max_tokens * len(tasks), self.max_output_tokens)
+        
+        started = time.perf_counter()
+        try:
+            if self.provider == "anthropic":
+                response, usage = self._reason_anthropic(prefix, batch_prompt, max_tokens=max_tokens)
+            elif self.provider == "openai":
+                response, usage = self._reason_openai(prefix, batch_prompt, max_tokens=max_tokens)
+            else:
+                raise ValueError(f"Invalid provider: {self.provider}")
+            
+            plans = {
+                str(plan.get("task_id")): plan
+                for plan in response.get("plans", [])
+                if isinstance(plan, dict)
+            }
+        
+        except Exception as e:
+            logger.error(f"Batch reasoning failed, falling back to per-task calls: {e}")
+            self._record_usage(None)
+            return [self.reason(task, skills, context) for task in tasks]
+        
+        usage["latency_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        self._record_usage(usage, batch_size=len(tasks))
+        
+        # Each task is charged an equal share of the request
+        share = {
+            field: round(value / len(tasks)) if field != "latency_ms" else value
+            for field, value in usage.items()
+        }
+        share["batch_size"] = len(tasks)
+        
+        results = []
+        for task in tasks:
+            plan = plans.get(str(task.get("task_id")))
+            if plan is None:
+                logger.warning(f"No plan for {task.get('task_id')} in batch response, reasoning individually")
+                results.append(self.reason(task, skills, context))
+                continue
+            
+            plan.pop("task_id", None)
+            plan.setdefault("actions", [])
+            plan["usage"] = dict(share)
+            results.append(plan)
+        
+        logger.info(f"Batch reasoning complete: {len(plans)}/{len(tasks)} plans")
+        return results
+    
     def _build_reasoning_prompt(
         self,
         task: Dict[str, Any],
         skills: Dict[str, str],
         context: Optional[str]
     ) -> str:
-        """Build structured prompt for LLM reasoning."""
+        """Build the full reasoning prompt as a single string."""
+        return "\n\n".join([*self._build_prompt_prefix(skills, context), self._build_task_prompt(task)])
+    
+    def _build_prompt_prefix(
+        self,
+        skills: Dict[str, str],
+        context: Optional[str]
+    ) -> Tuple[str, str]:
+        """
+        Build the cacheable part of the prompt.
         
-        # Extract task details
-        task_type = task.get("type", "unknown")
-        task_data = task.get("data", {})
-        priority = task.get("priority", "normal")
+        Returns:
+            (instructions + vault context, agent skills). Both are identical
+            for every task that uses the same skills, so providers can serve
+            them from their prompt cache. Memoized in-process as well.
+        """
+        # Vault cache hands back the same str objects, so hashing this key is cheap
+        key = (context or "", tuple(skills.items()))
+        
+        with self._stats_lock:
+            prefix = self._prefix_cache.get(key)
+            if prefix is not None:
+                self._prefix_cache.move_to_end(key)
+                self._stats["prefix_hits"] += 1
+                return prefix
+            self._stats["prefix_misses"] += 1
         
         # Build skills context
         skills_text = "\n\n".join([
@@ -165,28 +322,11 @@ class LLMInterface:
             for name, content in skills.items()
         ])
         
-        prompt = f"""You are the reasoning engine for a Personal AI Employee system.
+        instructions = f"""You are the reasoning engine for a Personal AI Employee system.
 
 Your role is to analyze tasks and generate action plans (NOT execute them).
 
-# Task Details
-- **Type**: {task_type}
-- **Priority**: {priority}
-- **Task ID**: {task.get('task_id')}
-
-# Task Data
-{self._format_task_data(task_data)}
-
-# Available Agent Skills
-{skills_text if skills else "*No specific skills loaded*"}
-
-# Additional Context
-{context if context else "*No additional context*"}
-
----
-
-# Your Task
-Analyze this task and provide:
+For each task, provide:
 
 1. **Thought Process**: Your reasoning about what needs to be done
 2. **Action Plan**: Step-by-step actions to accomplish the task
@@ -213,6 +353,9 @@ Provide your response as structured JSON:
 ```json
 {{
   "thought_process": "Your detailed reasoning here",
+  "risk_assessment": "Potential risks or concerns",
+  "requires_approval": false,
+  "confidence": 0.85,
   "actions": [
     {{
       "mcp_server": "email_server",
@@ -220,18 +363,73 @@ Provide your response as structured JSON:
       "parameters": {{}},
       "description": "What this action does"
     }}
-  ],
-  "risk_assessment": "Potential risks or concerns",
-  "requires_approval": false,
-  "confidence": 0.85
+  ]
 }}
 ```
 
+# Additional Context
+{context if context else "*No additional context*"}"""
+
+        skills_block = f"""# Available Agent Skills
+{skills_text if skills else "*No specific skills loaded*"}"""
+
+        prefix = (instructions, skills_block)
+        
+        with self._stats_lock:
+            self._prefix_cache[key] = prefix
+            while len(self._prefix_cache) > self.prefix_cache_size:
+                self._prefix_cache.popitem(last=False)
+        
+        return prefix
+    
+    def _build_task_prompt(self, task: Dict[str, Any]) -> str:
+        """Build the per-task part of the prompt (never cached)."""
+        return f"""{self._format_task(task)}
+
+---
+
 Now analyze the task and provide your reasoning.
 """
+
+    def _build_batch_prompt(self, tasks: List[Dict[str, Any]]) -> str:
+        """Build the per-batch part of the prompt (never cached)."""
+        sections = "\n\n".join(
+            self._format_task(task, heading=f"# Task {number} of {len(tasks)}")
+            for number, task in enumerate(tasks, 1)
+        )
         
-        return prompt
-    
+        return f"""{sections}
+
+---
+
+Analyze EACH task above independently and provide your reasoning.
+Respond with one plan per task, using the response format above plus the
+task's ID:
+```json
+{{
+  "plans": [
+    {{"task_id": "<Task ID>", "thought_process": "...", "risk_assessment": "...", "requires_approval": false, "confidence": 0.85, "actions": []}}
+  ]
+}}
+```
+"""
+
+    def _format_task(self, task: Dict[str, Any], heading: str = "# Task Details") -> str:
+        """Format one task's details and data for the prompt."""
+        
+        # Extract task details (social/Odoo watchers use task_type and content)
+        task_type = task.get("type") or task.get("task_type", "unknown")
+        task_data = task.get("data") or task.get("content", {})
+        priority = task.get("priority", "normal")
+        
+        return f"""{heading}
+- **Type**: {task_type}
+- **Priority**: {priority}
+- **Task ID**: {task.get('task_id')}
+
+## Task Data
+{self._format_task_data(task_data)}"""
+
     def _format_task_data(self, data: Dict[str, Any]) -> str:
         """Format task data for prompt."""
         if not data:
@@ -243,90 +441,309 @@ Now analyze the task and provide your reasoning.
         
         return "\n".join(formatted)
     
-    def _reason_anthropic(self, prompt: str) -> Dict[str, Any]:
+    def _reason_anthropic(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Use Anthropic Claude for reasoning."""
         if self.provider != "anthropic" or self.client is None:
             raise ValueError("Anthropic client not initialized")
         
         try:
             response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[
-                    {"role": "user", "content": prompt}
-                ]
+                **self._anthropic_request(prefix, task_prompt, max_tokens)
             )
-            
-            # Extract response text
-            response_text = ""
-            for block in response.content:
-                if hasattr(block, 'text'):
-                    response_text = block.text
-                    break
-            
-            if not response_text:
-                raise ValueError("No text content in response")
-            
-            # Try to parse JSON response
-            # Find JSON in response (might be wrapped in markdown)
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            
-            result = json.loads(response_text)
-            
-            logger.info(f"Anthropic reasoning complete: {result.get('confidence', 0)}")
-            
-            return result
+            return self._parse_anthropic_response(response)
         
         except Exception as e:
             logger.error(f"Anthropic reasoning error: {e}")
             raise
     
-    def _reason_openai(self, prompt: str) -> Dict[str, Any]:
+    def _anthropic_request(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build messages.create() arguments for Anthropic."""
+        
+        # One cache breakpoint after the shared instructions, one after the skills
+        system = []
+        for block in prefix:
+            entry: Dict[str, Any] = {"type": "text", "text": block}
+            if self.prompt_caching:
+                entry["cache_control"] = {"type": "ephemeral"}
+            system.append(entry)
+        
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens or self.max_tokens,
+            "system": system,
+            "messages": [
+                {"role": "user", "content": task_prompt}
+            ]
+        }
+    
+    def _parse_anthropic_response(self, response: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Extract the JSON plan and token usage from an Anthropic response."""
+        
+        # Extract response text
+        response_text = ""
+        for block in response.content:
+            if hasattr(block, 'text'):
+                response_text = block.text
+                break
+        
+        if not response_text:
+            raise ValueError("No text content in response")
+        
+        result = json.loads(self._extract_json(response_text))
+        
+        logger.info(f"Anthropic reasoning complete: {result.get('confidence', 0)}")
+        
+        return result, self._anthropic_usage(response)
+    
+    def _extract_json(self, response_text: str) -> str:
+        """Strip a markdown code fence around the JSON plan, if present."""
+        
+        # Find JSON in response (might be wrapped in markdown)
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            return response_text[json_start:json_end].strip()
+        elif "```" in response_text:
+            json_start = response_text.find("```") + 3
+            json_end = response_text.find("```", json_start)
+            return response_text[json_start:json_end].strip()
+        return response_text
+    
+    def _anthropic_usage(self, response: Any) -> Dict[str, Any]:
+        """Token usage of an Anthropic message."""
+        
+        # input_tokens excludes cache reads/writes, which are billed separately
+        usage = getattr(response, "usage", None)
+        uncached = getattr(usage, "input_tokens", 0) or 0
+        cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        
+        return {
+            "input_tokens": uncached + cache_read + cache_write,
+            "cached_input_tokens": cache_read,
+            "cache_write_tokens": cache_write,
+            "output_tokens": getattr(usage, "output_tokens", 0) or 0
+        }
+    
+    def _reason_openai(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """Use OpenAI GPT for reasoning."""
         if self.provider != "openai" or self.client is None:
             raise ValueError("OpenAI client not initialized")
         
         try:
             response = self.client.chat.completions.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a reasoning engine for a Personal AI Employee. Analyze tasks and provide structured JSON action plans."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                response_format={"type": "json_object"}
+                **self._openai_request(prefix, task_prompt, max_tokens)
             )
-            
-            # Extract response
-            response_text = response.choices[0].message.content
-            
-            if not response_text:
-                raise ValueError("No content in response")
-            
-            # Parse JSON
-            result = json.loads(response_text)
-            
-            logger.info(f"OpenAI reasoning complete: {result.get('confidence', 0)}")
-            
-            return result
+            return self._parse_openai_response(response)
         
         except Exception as e:
             logger.error(f"OpenAI reasoning error: {e}")
             raise
     
+    def _openai_request(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build chat.completions.create() arguments for OpenAI."""
+        
+        # OpenAI caches identical prompt prefixes automatically, so the
+        # stable part goes first and the task last
+        return {
+            "model": self.model,
+            "max_tokens": max_tokens or self.max_tokens,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "\n\n".join(prefix)
+                },
+                {
+                    "role": "user",
+                    "content": task_prompt
+                }
+            ],
+            "response_format": {"type": "json_object"}
+        }
+    
+    def _parse_openai_response(self, response: Any) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Extract the JSON plan and token usage from an OpenAI response."""
+        
+        # Extract response
+        response_text = response.choices[0].message.content
+        
+        if not response_text:
+            raise ValueError("No content in response")
+        
+        # Parse JSON
+        result = json.loads(self._extract_json(response_text))
+        
+        logger.info(f"OpenAI reasoning complete: {result.get('confidence', 0)}")
+        
+        return result, self._openai_usage(response)
+    
+    def _openai_usage(self, response: Any) -> Dict[str, Any]:
+        """Token usage of an OpenAI completion (or its final stream chunk)."""
+        usage = getattr(response, "usage", None)
+        details = getattr(usage, "prompt_tokens_details", None)
+        
+        return {
+            "input_tokens": getattr(usage, "prompt_tokens", 0) or 0,
+            "cached_input_tokens": getattr(details, "cached_tokens", 0) or 0,
+            "cache_write_tokens": 0,
+            "output_tokens": getattr(usage, "completion_tokens", 0) or 0
+        }
+    
+    def _reason_streaming(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        on_action: Optional[Callable[[int, Dict[str, Any], Dict[str, Any]], None]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Stream the response and parse the plan as it arrives.
+        
+        Each completed action goes to on_action straight away. Output that
+        cannot be a plan (prose instead of JSON, broken syntax, an action
+        that is not an object) closes the stream at that point instead of
+        after max_tokens.
+        """
+        if self.provider == "anthropic":
+            stream = self._stream_anthropic
+        elif self.provider == "openai":
+            stream = self._stream_openai
+        else:
+            raise ValueError(f"Invalid provider: {self.provider}")
+        
+        parser = PlanStreamParser(max_preamble=self.stream_max_preamble)
+        usage: Dict[str, Any] = {}
+        first_action_ms = None
+        
+        started = time.perf_counter()
+        chunks = stream(prefix, task_prompt, usage)
+        try:
+            for text in chunks:
+                completed = parser.feed(text)
+                if completed and first_action_ms is None:
+                    first_action_ms = round((time.perf_counter() - started) * 1000, 1)
+                
+                first_index = len(parser.actions) - len(completed)
+                for index, action in enumerate(completed, first_index):
+                    if on_action is not None:
+                        on_action(index, action, parser.fields)
+            result = parser.close()
+        
+        except PlanStreamError as e:
+            with self._stats_lock:
+                self._stats["stream_aborts"] += 1
+            logger.error(f"Aborted streamed plan: {e}")
+            raise
+        
+        finally:
+            # Closing the generator closes the HTTP response (stops generation)
+            chunks.close()
+        
+        usage["first_action_ms"] = first_action_ms
+        logger.info(f"Streamed reasoning complete: {result.get('confidence', 0)}")
+        return result, usage
+    
+    def _stream_anthropic(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        usage: Dict[str, Any]
+    ) -> Iterator[str]:
+        """Yield Anthropic text deltas; fills `usage` when the message ends."""
+        if self.provider != "anthropic" or self.client is None:
+            raise ValueError("Anthropic client not initialized")
+        
+        with self.client.messages.stream(**self._anthropic_request(prefix, task_prompt)) as stream:
+            for text in stream.text_stream:
+                yield text
+            usage.update(self._anthropic_usage(stream.get_final_message()))
+    
+    def _stream_openai(
+        self,
+        prefix: Tuple[str, str],
+        task_prompt: str,
+        usage: Dict[str, Any]
+    ) -> Iterator[str]:
+        """Yield OpenAI content deltas; fills `usage` from the final chunk."""
+        if self.provider != "openai" or self.client is None:
+            raise ValueError("OpenAI client not initialized")
+        
+        stream = self.client.chat.completions.create(
+            **self._openai_request(prefix, task_prompt),
+            stream=True,
+            extra_body={"stream_options": {"include_usage": True}}
+        )
+        try:
+            for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                if getattr(chunk, "usage", None):
+                    usage.update(self._openai_usage(chunk))
+        finally:
+            stream.close()
+    
+    def _record_usage(self, usage: Optional[Dict[str, Any]], batch_size: int = 0) -> None:
+        """Accumulate per-call usage into the running stats (None = failed call)."""
+        with self._stats_lock:
+            self._stats["calls"] += 1
+            if usage is None:
+                self._stats["errors"] += 1
+                return
+            
+            if batch_size:
+                self._stats["batch_calls"] += 1
+                self._stats["batched_tasks"] += batch_size
+            
+            for field in ("input_tokens", "cached_input_tokens", "cache_write_tokens", "output_tokens"):
+                self._stats[field] += usage.get(field, 0)
+            self._latencies.append(usage["latency_ms"])
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get token, prompt-cache and latency statistics since startup.
+        
+        Returns:
+            Dict with call/token counters, cached_input_ratio (share of input
+            tokens served from the provider's prompt cache), prefix_hit_rate
+            (in-process prompt memo) and latency percentiles over recent calls
+        """
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            latencies = sorted(self._latencies)
+        
+        successful = stats["calls"] - stats["errors"]
+        prefix_lookups = stats["prefix_hits"] + stats["prefix_misses"]
+        
+        stats["cached_input_ratio"] = (
+            round(stats["cached_input_tokens"] / stats["input_tokens"], 4)
+            if stats["input_tokens"] else 0.0
+        )
+        stats["avg_input_tokens"] = round(stats["input_tokens"] / successful, 1) if successful else 0.0
+        stats["prefix_hit_rate"] = round(stats["prefix_hits"] / prefix_lookups, 4) if prefix_lookups else 0.0
+        stats["latency_p50_ms"] = latencies[(len(latencies) - 1) // 2] if latencies else None
+        stats["latency_p99_ms"] = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] if latencies else None
+        
+        return stats
+    
     def test_connection(self) -> bool:
         """Test LLM connection with simple prompt."""
         try:
@@ -372,7 +789,12 @@ def get_llm_interface() -> LLMInterface:
     global _llm_interface
     
     if _llm_interface is None:
-        _llm_interface = LLMInterface()
+        if os.getenv("LLM_ASYNC_CLIENT", "false").lower() == "true":
+            # Pooled, rate-limited client for the concurrent orchestrator
+            from orchestration.async_llm_interface import AsyncLLMInterface
+            _llm_interface = AsyncLLMInterface()
+        else:
+            _llm_interface = LLMInterface()
     
     return _llm_interface
 
@@ -408,5 +830,6 @@ if __name__ == "__main__":
         print(f"  Confidence: {result.get('confidence')}")
         print(f"  Actions: {len(result.get('actions', []))}")
         print(f"  Requires Approval: {result.get('requires_approval')}")
+        print(f"  Usage: {result.get('usage')}")
     else:
         print(f"❌ {llm.provider.upper()} connection failed")
@@ -0,0 +1,440 @@
+"""
+Log Verifier - Parallel Signature and Chain Verification with Checkpoints
+
+ARCHITECTURAL RULES:
+1. Read-only over the logs; the only file written is the checkpoint log
+2. Per-line work (parse, signature, chain digest) runs in worker processes
+   over block-aligned byte ranges; chain links between ranges and days are
+   stitched sequentially from the digests the workers return
+3. A file that verified clean gets a signed checkpoint (size, entries, last
+   chain hash, Merkle peaks); the next verify resumes where it ended
+4. A checkpoint never hides a problem: a bad signature, a file shorter than
+   its checkpoint or (in full mode) a different Merkle root is reported and
+   the file is verified from the start
+"""
+
+import os
+import json
+import hmac
+import hashlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Union
+import logging
+
+logger = logging.getLogger("log_verifier")
+
+GENESIS_HASH = "0" * 64
+
+# "audit": AuditLogger entries (sha256 over entry + key, no chain)
+# "compliance": ComplianceLogger entries (HMAC-SHA256 + previous_hash chain)
+SCHEMES = ("audit", "compliance")
+
+# Merkle leaves are raw 64 KiB blocks of the log file
+BLOCK_SIZE = 64 * 1024
+
+# json.dumps(..., sort_keys=True) builds a new encoder per call; reuse one
+_canonical = json.JSONEncoder(sort_keys=True).encode
+_canonical_unicode = json.JSONEncoder(sort_keys=True, ensure_ascii=False).encode
+
+
+def _node(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+class _MerkleRange:
+    """
+    Append-only Merkle tree kept as its peaks (one per set bit of the leaf
+    count), so a checkpoint can be extended without the earlier leaves.
+    """
+    
+    def __init__(self, peaks: Optional[List[Optional[str]]] = None, count: int = 0):
+        self.peaks: List[Optional[bytes]] = [bytes.fromhex(p) if p else None for p in (peaks or [])]
+        self.count = count
+    
+    def append(self, leaf: bytes) -> None:
+        carry, height = leaf, 0
+        while height < len(self.peaks) and self.peaks[height] is not None:
+            carry = _node(self.peaks[height], carry)
+            self.peaks[height] = None
+            height += 1
+        if height == len(self.peaks):
+            self.peaks.append(None)
+        self.peaks[height] = carry
+        self.count += 1
+    
+    def root(self, tail: Optional[bytes] = None) -> str:
+        """Root over all full blocks plus the trailing partial block, if any."""
+        acc = tail
+        for peak in self.peaks:
+            if peak is not None:
+                acc = peak if acc is None else _node(peak, acc)
+        return acc.hex() if acc else GENESIS_HASH
+    
+    def state(self) -> List[Optional[str]]:
+        return [p.hex() if p else None for p in self.peaks]
+
+
+def _verify_range(job: Tuple) -> Dict[str, Any]:
+    """
+    Worker: hash the blocks in [hash_from, stop) and verify every line that
+    starts in [line_from, stop).
+    
+    Returns:
+        entries, Merkle leaves, failures (line index within the range, kind,
+        details), previous_hash of the first line and chain_hash of the last
+        (None if that line could not be read)
+    """
+    scheme, key, path, hash_from, line_from, stop, end, aligned = job
+    
+    with open(path, 'rb') as f:
+        f.seek(hash_from)
+        data = f.read(stop - hash_from)
+        leaves = [
+            hashlib.sha256(b"\x00" + data[i:i + BLOCK_SIZE]).digest()
+            for i in range(0, len(data), BLOCK_SIZE)
+        ]
+        
+        start = line_from - hash_from
+        if not aligned and line_from > 0:
+            # Skip the line the previous range is responsible for
+            f.seek(line_from - 1)
+            if f.read(1) != b"\n":
+                newline = data.find(b"\n", start)
+                start = len(data) if newline < 0 else newline + 1
+        
+        if start < len(data) and not data.endswith(b"\n") and stop < end:
+            # Finish the last line, which runs into the next range
+            f.seek(stop)
+            data += f.readline()
+    
+    failures: List[Tuple[int, str, Dict[str, Any]]] = []
+    first_previous: Optional[str] = None
+    last_chain: Optional[str] = None
+    count = 0
+    
+    for raw in data[start:].decode('utf-8', errors='replace').split("\n"):
+        if not raw:
+            continue
+        index = count
+        count += 1
+        
+        try:
+            entry = json.loads(raw)
+            signature = entry.pop("signature", None)
+            
+            if scheme == "audit":
+                canonical = _canonical_unicode(entry)
+                expected = hashlib.sha256((canonical + key).encode('utf-8')).hexdigest()
+                if not signature or signature != expected:
+                    failures.append((index, "signature", {
+                        "timestamp": entry.get("timestamp"),
+                        "action": entry.get("action"),
+                        "task_id": entry.get("task_id")
+                    }))
+                continue
+            
+            chain_hash = entry.pop("chain_hash")
+            previous = entry["previous_hash"]
+            expected = hmac.new(key, _canonical(entry).encode('utf-8'), hashlib.sha256).hexdigest()
+            if not hmac.compare_digest(signature or "", expected):
+                failures.append((index, "signature", {"timestamp": entry.get("timestamp"), "action": entry.get("action")}))
+            
+            # The chain hash covers the signed entry, signature included
+            entry["signature"] = signature
+            linked = hashlib.sha256(previous.encode('utf-8') + _canonical(entry).encode('utf-8')).hexdigest()
+            if linked != chain_hash:
+                failures.append((index, "chain_hash", {"timestamp": entry.get("timestamp"), "action": entry.get("action")}))
+            
+            if index == 0:
+                first_previous = previous
+            elif last_chain is not None and previous != last_chain:
+                failures.append((index, "chain_link", {"expected_previous": last_chain, "actual_previous": previous}))
+            last_chain = chain_hash
+        except Exception as e:
+            failures.append((index, "unreadable", {"error": f"{type(e).__name__}: {e}"}))
+            last_chain = None
+    
+    return {
+        "entries": count,
+        "leaves": leaves,
+        "failures": failures,
+        "first_previous": first_previous,
+        "last_chain": last_chain
+    }
+
+
+def _complete_size(path: Path) -> int:
+    """Bytes up to the end of the last complete line (a line still being written is left out)."""
+    size = path.stat().st_size
+    with open(path, 'rb') as f:
+        position = size
+        while position > 0:
+            step = min(BLOCK_SIZE, position)
+            f.seek(position - step)
+            newline = f.read(step).rfind(b"\n")
+            if newline >= 0:
+                return position - step + newline + 1
+            position -= step
+    return 0
+
+
+def read_last_line(path: Path) -> Tuple[Optional[bytes], int]:
+    """
+    Last complete line of a file, read backwards from the end.
+    
+    Returns:
+        (line without its newline or None if there is none, bytes up to the
+        end of that line)
+    """
+    end = _complete_size(path)
+    if end == 0:
+        return None, 0
+    
+    with open(path, 'rb') as f:
+        tail = b""
+        position = end - 1  # Before the final newline
+        while position > 0:
+            step = min(BLOCK_SIZE, position)
+            f.seek(position - step)
+            tail = f.read(step) + tail
+            position -= step
+            newline = tail.rfind(b"\n")
+            if newline >= 0:
+                return tail[newline + 1:], end
+        return tail, end
+
+
+def last_chain_hash(path: Optional[Path]) -> Optional[str]:
+    """chain_hash of a file's last complete line (None if missing or unreadable)."""
+    if path is None or not path.exists():
+        return None
+    line, _ = read_last_line(path)
+    try:
+        return json.loads(line).get("chain_hash") if line else None
+    except (ValueError, AttributeError):
+        return None
+
+
+class LogVerifier:
+    """
+    Verifies daily JSONL logs in parallel and checkpoints what it verified.
+    
+    Used by AuditLogger.verify_all_logs() and ComplianceLogger.
+    """
+    
+    def __init__(
+        self,
+        scheme: str,
+        key: Union[str, bytes],
+        checkpoint_file: Path,
+        workers: Optional[int] = None,
+        chunk_bytes: Optional[int] = None,
+        parallel_min_bytes: Optional[int] = None
+    ):
+        """
+        Args:
+            scheme: One of SCHEMES
+            key: Signing key the log was written with
+            checkpoint_file: Append-only JSONL of signed checkpoints
+            workers: Worker processes (LOG_VERIFY_WORKERS, default CPU count)
+            chunk_bytes: Bytes per worker job (LOG_VERIFY_CHUNK_MB, default 16)
+            parallel_min_bytes: Below this, verify in-process
+                (LOG_VERIFY_PARALLEL_MIN_MB, default 8)
+        """
+        if scheme not in SCHEMES:
+            raise ValueError(f"scheme must be one of {SCHEMES}, got {scheme!r}")
+        
+        self.scheme = scheme
+        self.key = key.encode('utf-8') if scheme == "compliance" and isinstance(key, str) else key
+        self._checkpoint_key = key.encode('utf-8') if isinstance(key, str) else key
+        self.checkpoint_file = checkpoint_file
+        self.workers = workers or int(os.getenv("LOG_VERIFY_WORKERS", "0")) or os.cpu_count() or 1
+        chunk = chunk_bytes or int(float(os.getenv("LOG_VERIFY_CHUNK_MB", "16")) * 1024 * 1024)
+        self.chunk_bytes = max(BLOCK_SIZE, chunk // BLOCK_SIZE * BLOCK_SIZE)
+        self.parallel_min_bytes = (
+            parallel_min_bytes if parallel_min_bytes is not None
+            else int(float(os.getenv("LOG_VERIFY_PARALLEL_MIN_MB", "8")) * 1024 * 1024)
+        )
+    
+    def verify(
+        self,
+        files: List[Path],
+        previous_file: Optional[Path] = None,
+        full: bool = False
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Verify files as one chronological sequence.
+        
+        Args:
+            files: Daily logs, oldest first
+            previous_file: Log preceding files[0], whose last chain hash may
+                start the first day's chain (compliance scheme)
+            full: Re-verify from the start even where a checkpoint exists,
+                and check the result against it
+        
+        Returns:
+            File name → {"entries", "checked", "resumed", "root", "failures"};
+            failures are dicts with "line", "kind" and kind-specific details
+        """
+        checkpoints, bad_checkpoints = self._load_checkpoints()
+        states: List[Dict[str, Any]] = []
+        jobs: List[Tuple] = []
+        
+        for path in files:
+            end = _complete_size(path)
+            state = {
+                "path": path, "end": end, "entries": 0, "checked": 0, "resumed": False,
+                "merkle": _MerkleRange(), "tail": None, "last_chain": None, "failures": [],
+                "checkpoint": checkpoints.get(path.name), "start_entries": 0
+            }
+            if path.name in bad_checkpoints:
+                state["failures"].append({"line": 0, "kind": "checkpoint", "error": bad_checkpoints[path.name]})
+            
+            line_from = 0
+            checkpoint = state["checkpoint"]
+            if checkpoint and checkpoint["size"] > end:
+                state["failures"].append({
+                    "line": 0, "kind": "checkpoint",
+                    "error": f"File is {end} bytes, checkpoint covers {checkpoint['size']}"
+                })
+                state["checkpoint"] = None
+            elif checkpoint and not full:
+                line_from = checkpoint["size"]
+                state["entries"] = state["start_entries"] = checkpoint["entries"]
+                state["merkle"] = _MerkleRange(checkpoint["peaks"], checkpoint["blocks"])
+                state["last_chain"] = checkpoint["last_chain"]
+                state["resumed"] = True
+            
+            hash_from = state["merkle"].count * BLOCK_SIZE
+            state["jobs"] = 0
+            while hash_from < end:
+                stop = min(end, (hash_from // self.chunk_bytes + 1) * self.chunk_bytes)
+                aligned = state["jobs"] == 0
+                jobs.append((self.scheme, self.key, str(path), hash_from, max(line_from, hash_from), stop, end, aligned))
+                state["jobs"] += 1
+                hash_from = stop
+            states.append(state)
+        
+        to_read = sum(job[5] - job[3] for job in jobs)
+        previous_chain = last_chain_hash(previous_file) if self.scheme == "compliance" else None
+        results = iter(self._run(jobs, parallel=self.workers > 1 and to_read >= self.parallel_min_bytes))
+        
+        reports: Dict[str, Dict[str, Any]] = {}
+        for state in states:
+            for _ in range(state["jobs"]):
+                self._stitch(state, next(results), previous_chain)
+            previous_chain = state["last_chain"]
+            reports[state["path"].name] = self._finish(state, full)
+        
+        return reports
+    
+    def _run(self, jobs: List[Tuple], parallel: bool) -> List[Dict[str, Any]]:
+        """Results in job order, from a process pool or in-process."""
+        if not parallel:
+            return [_verify_range(job) for job in jobs]
+        
+        logger.info(f"Verifying {len(jobs)} ranges with {self.workers} processes")
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            return list(pool.map(_verify_range, jobs))
+    
+    def _stitch(self, state: Dict[str, Any], result: Dict[str, Any], previous_chain: Optional[str]) -> None:
+        """Fold one range's result into its file's state, checking the link to the range before."""
+        base = state["entries"]
+        
+        if self.scheme == "compliance" and result["first_previous"] is not None:
+            if base == 0:
+                allowed = {GENESIS_HASH, previous_chain}
+                expected = previous_chain or GENESIS_HASH
+            else:
+                allowed = {state["last_chain"]}
+                expected = state["last_chain"]
+            if expected is not None and result["first_previous"] not in allowed:
+                state["failures"].append({
+                    "line": base + 1, "kind": "chain_link",
+                    "expected_previous": expected, "actual_previous": result["first_previous"]
+                })
+        
+        for index, kind, details in result["failures"]:
+            state["failures"].append(dict(details, line=base + index + 1, kind=kind))
+        
+        if result["entries"]:
+            state["last_chain"] = result["last_chain"]
+        state["entries"] += result["entries"]
+        
+        checkpoint = state["checkpoint"]
+        for leaf in result["leaves"]:
+            if state["merkle"].count * BLOCK_SIZE + BLOCK_SIZE > state["end"]:
+                state["tail"] = leaf  # Partial last block: not part of the peaks
+                break
+            state["merkle"].append(leaf)
+            if checkpoint and state["merkle"].count == checkpoint["blocks"] and state["merkle"].state() != checkpoint["peaks"]:
+                state["failures"].append({
+                    "line": 0, "kind": "checkpoint",
+                    "error": "Merkle root differs from the checkpoint (verified content changed)"
+                })
+    
+    def _finish(self, state: Dict[str, Any], full: bool) -> Dict[str, Any]:
+        """Build a file's report and checkpoint it if it verified clean."""
+        checkpoint = state["checkpoint"]
+        merkle = state["merkle"]
+        
+        root = merkle.root(state["tail"])
+        already_reported = any(failure["kind"] == "checkpoint" for failure in state["failures"])
+        if full and checkpoint and checkpoint["size"] == state["end"] and root != checkpoint["root"] and not already_reported:
+            state["failures"].append({"line": 0, "kind": "checkpoint", "error": "Merkle root differs from the checkpoint"})
+        
+        if not state["failures"] and (not checkpoint or checkpoint["size"] != state["end"]):
+            self._write_checkpoint({
+                "file": state["path"].name,
+                "size": state["end"],
+                "entries": state["entries"],
+                "last_chain": state["last_chain"],
+                "blocks": merkle.count,
+                "peaks": merkle.state(),
+                "root": root
+            })
+        
+        return {
+            "entries": state["entries"],
+            "checked": state["entries"] - state["start_entries"],
+            "resumed": state["resumed"],
+            "root": root,
+            "failures": sorted(state["failures"], key=lambda failure: failure["line"])
+        }
+    
+    def _sign(self, checkpoint: Dict[str, Any]) -> str:
+        canonical = json.dumps({k: v for k, v in checkpoint.items() if k != "signature"}, sort_keys=True)
+        return hmac.new(self._checkpoint_key, canonical.encode('utf-8'), hashlib.sha256).hexdigest()
+    
+    def _write_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        checkpoint["signature"] = self._sign(checkpoint)
+        try:
+            with open(self.checkpoint_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(checkpoint) + "\n")
+        except OSError as e:
+            # Only costs time: the next verify starts this file from scratch
+            logger.warning(f"Could not write verification checkpoint: {e}")
+    
+    def _load_checkpoints(self) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, str]]:
+        """Latest valid checkpoint per file, and files whose latest checkpoint is invalid."""
+        checkpoints: Dict[str, Dict[str, Any]] = {}
+        bad: Dict[str, str] = {}
+        if not self.checkpoint_file.exists():
+            return checkpoints, bad
+        
+        with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    checkpoint = json.loads(line)
+                    name = checkpoint["file"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+                if hmac.compare_digest(str(checkpoint.get("signature", "")), self._sign(checkpoint)):
+                    checkpoints[name] = checkpoint
+                    bad.pop(name, None)
+                else:
+                    checkpoints.pop(name, None)
+                    bad[name] = "Checkpoint signature is invalid"
+        
+        return checkpoints, bad
@@ -0,0 +1,280 @@
+"""
+MCP Clients - Pooled, Long-Lived MCP Server Clients
+
+ARCHITECTURAL RULES:
+1. One warm client per (server, tenant), built on first use and reused by
+   every later action instead of constructing a server per call (for Odoo
+   that is one /web/session/authenticate per process, not per invoice)
+2. A client serves one thread at a time (a lease holds its lock); leases
+   on other clients are never blocked
+3. A call that raises drops its client so the next lease rebuilds it;
+   servers with sessions (Odoo) log in again themselves when one expires
+4. Clients idle past MCP_CLIENT_IDLE_SECONDS are evicted and closed
+5. Tenant clients read their tokens from secrets/<tenant_id>/; leasing a
+   server that has no per-tenant token file for a tenant raises rather
+   than falling back to the default account
+"""
+
+import os
+import sys
+import time
+import importlib
+import threading
+import contextlib
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import logging
+from dotenv import load_dotenv
+
+# Add MCP servers to path
+sys.path.append(str(Path(__file__).parent.parent / "mcp_servers"))
+
+load_dotenv()
+
+logger = logging.getLogger("mcp_clients")
+
+# name -> (module, class, token file or None, health probe method or None)
+SERVERS: Dict[str, Tuple[str, str, Optional[str], Optional[str]]] = {
+    "facebook": ("facebook_server", "FacebookServer", "facebook_token.json", "get_page_info"),
+    "instagram": ("instagram_server", "InstagramServer", "instagram_token.json", "get_account_info"),
+    "twitter": ("twitter_server", "TwitterServer", "twitter_token.json", "get_user_info"),
+    "linkedin": ("linkedin_server", "LinkedInMCPServer", "linkedin_token.json", "get_profile"),
+    "odoo": ("odoo_server", "OdooServer", "odoo_token.json", "check_session"),
+    "email": ("email_server", "EmailMCP", None, None)
+}
+
+
+class _PooledClient:
+    __slots__ = ("server", "lock", "created", "last_used", "uses")
+    
+    def __init__(self):
+        self.server: Any = None
+        self.lock = threading.Lock()
+        self.created = 0.0
+        self.last_used = time.monotonic()
+        self.uses = 0
+
+
+class ClientPool:
+    """
+    Registry of warm MCP server clients shared by every ActionExecutor in
+    the process.
+    
+    Usage:
+        with get_client_pool().client("odoo", tenant_id) as server:
+            server.create_invoice(...)
+    """
+    
+    def __init__(
+        self,
+        idle_seconds: Optional[float] = None,
+        secrets_dir: Path = Path("./secrets"),
+        factories: Optional[Dict[str, Callable[[Optional[str]], Any]]] = None
+    ):
+        """
+        Args:
+            idle_seconds: Evict clients unused for this long (0 = never);
+                defaults to MCP_CLIENT_IDLE_SECONDS
+            secrets_dir: Root of the per-tenant secrets directories
+            factories: Optional name -> factory(tenant_id) overrides of SERVERS
+        """
+        if idle_seconds is None:
+            idle_seconds = float(os.getenv("MCP_CLIENT_IDLE_SECONDS", "900"))
+        self.idle_seconds = idle_seconds
+        self.secrets_dir = Path(secrets_dir)
+        self.factories = factories or {}
+        
+        self._lock = threading.Lock()
+        self._clients: Dict[Tuple[str, Optional[str]], _PooledClient] = {}
+        self.built = 0
+        self.evicted = 0
+    
+    @contextlib.contextmanager
+    def client(self, name: str, tenant_id: Optional[str] = None) -> Iterator[Any]:
+        """
+        Lease the warm client for a server, building it on first use.
+        
+        Args:
+            name: Server name (a key of SERVERS, e.g. "odoo")
+            tenant_id: Tenant whose credentials to use (None = default secrets)
+        
+        Raises:
+            ImportError: If the MCP server module is not available
+            ValueError: If the server is unknown, or has no per-tenant
+                credentials and tenant_id is given
+        """
+        self.evict_idle()
+        key = (name, tenant_id)
+        entry = self._acquire(key)
+        try:
+            if entry.server is None:
+                try:
+                    entry.server = self._build(name, tenant_id)
+                except Exception:
+                    self._forget(key, entry)
+                    raise
+                entry.created = time.monotonic()
+                self.built += 1
+            
+            try:
+                yield entry.server
+            except Exception:
+                # Unknown state (dead socket, revoked token): start fresh next time
+                self._forget(key, entry)
+                self._close(entry.server)
+                entry.server = None
+                raise
+            finally:
+                entry.last_used = time.monotonic()
+                entry.uses += 1
+        finally:
+            entry.lock.release()
+    
+    def health(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Probe every pooled client; unhealthy ones are dropped.
+        
+        Clients leased by another thread are reported as busy, not probed.
+        
+        Returns:
+            Dict of "name" or "name@tenant" -> {healthy, busy, uses, idle_seconds}
+        """
+        report = {}
+        with self._lock:
+            entries = list(self._clients.items())
+        
+        now = time.monotonic()
+        for (name, tenant_id), entry in entries:
+            label = name if tenant_id is None else f"{name}@{tenant_id}"
+            status = {"healthy": True, "busy": False, "uses": entry.uses,
+                      "idle_seconds": round(now - entry.last_used, 1)}
+            report[label] = status
+            
+            if not entry.lock.acquire(blocking=False):
+                status["busy"] = True
+                continue
+            try:
+                if entry.server is not None:
+                    status["healthy"] = self._probe(name, entry.server)
+                    if not status["healthy"]:
+                        self._forget((name, tenant_id), entry)
+                        self._close(entry.server)
+                        entry.server = None
+            finally:
+                entry.lock.release()
+        return report
+    
+    def evict_idle(self) -> int:
+        """
+        Close clients unused for longer than idle_seconds.
+        
+        Returns:
+            Number of clients evicted
+        """
+        if self.idle_seconds <= 0:
+            return 0
+        
+        cutoff = time.monotonic() - self.idle_seconds
+        with self._lock:
+            idle = [(key, entry) for key, entry in self._clients.items() if entry.last_used < cutoff]
+        
+        evicted = 0
+        for key, entry in idle:
+            if not entry.lock.acquire(blocking=False):
+                continue  # Leased right now, so not idle
+            try:
+                if entry.last_used < cutoff and self._forget(key, entry):
+                    self._close(entry.server)
+                    entry.server = None
+                    evicted += 1
+            finally:
+                entry.lock.release()
+        
+        if evicted:
+            self.evicted += evicted
+            logger.info(f"Evicted {evicted} idle MCP client(s)")
+        return evicted
+    
+    def close(self) -> None:
+        """Close and drop every pooled client."""
+        with self._lock:
+            entries = list(self._clients.values())
+            self._clients.clear()
+        for entry in entries:
+            with entry.lock:
+                self._close(entry.server)
+                entry.server = None
+    
+    def _acquire(self, key: Tuple[str, Optional[str]]) -> _PooledClient:
+        """Lock the registered entry for key, creating it if needed."""
+        while True:
+            with self._lock:
+                entry = self._clients.get(key)
+                if entry is None:
+                    entry = self._clients[key] = _PooledClient()
+            entry.lock.acquire()
+            with self._lock:
+                if self._clients.get(key) is entry:
+                    return entry
+            entry.lock.release()  # Dropped or evicted while we waited
+    
+    def _build(self, name: str, tenant_id: Optional[str]) -> Any:
+        if name in self.factories:
+            return self.factories[name](tenant_id)
+        if name not in SERVERS:
+            raise ValueError(f"Unknown MCP server: {name}")
+        
+        module_name, class_name, token_file, _ = SERVERS[name]
+        if tenant_id is not None and token_file is None:
+            raise ValueError(f"MCP server {name} has no per-tenant credentials (tenant {tenant_id})")
+        server_class = getattr(importlib.import_module(module_name), class_name)
+        if tenant_id is not None:
+            return server_class(token_path=str(self.secrets_dir / tenant_id / token_file))
+        return server_class()
+    
+    @staticmethod
+    def _probe(name: str, server: Any) -> bool:
+        probe = SERVERS.get(name, (None, None, None, None))[3]
+        if probe is None or not hasattr(server, probe):
+            return True
+        try:
+            result = getattr(server, probe)()
+        except Exception as e:
+            logger.warning(f"Health probe failed for {name}: {e}")
+            return False
+        if isinstance(result, dict) and result.get("status") == "error":
+            return False
+        return result is not False
+    
+    def _forget(self, key: Tuple[str, Optional[str]], entry: _PooledClient) -> bool:
+        with self._lock:
+            if self._clients.get(key) is entry:
+                del self._clients[key]
+                return True
+        return False
+    
+    @staticmethod
+    def _close(server: Any) -> None:
+        close = getattr(server, "close", None)
+        if close is None:
+            session = getattr(server, "session", None)
+            close = getattr(session, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception as e:
+                logger.debug(f"Error closing MCP client: {e}")
+
+
+# Singleton instance
+_client_pool = None
+
+
+def get_client_pool() -> ClientPool:
+    """Get singleton MCP client pool."""
+    global _client_pool
+    
+    if _client_pool is None:
+        _client_pool = ClientPool()
+    
+    return _client_pool
@@ -3,6 +3,8 @@ Orchestrator - Main Coordination Loop
 
 ARCHITECTURAL RULES:
 1. Claim-by-move: Only ONE task in pending/ at a time
+   (ORCHESTRATOR_MAX_WORKERS raises the cap for an opt-in worker pool,
+   LLM_BATCH_SIZE claims compatible low/normal tasks together as one batch)
 2. Only component that writes to Dashboard.md
 3. Coordinates watcher → reasoning → action
 4. Enforces Ralph Loop protection
@@ -15,20 +17,44 @@ import sys
 import json
 import shutil
 import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import logging
 from dotenv import load_dotenv
 
+# Running as a script puts orchestration/ on sys.path, where our own
+# watchdog.py would shadow the third-party watchdog package
+_this_dir = Path(__file__).resolve().parent
+sys.path[:] = [p for p in sys.path if Path(p or ".").resolve() != _this_dir]
+
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Filesystem events for instant wakeup (falls back to polling if unavailable)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
 from orchestration.audit_logger import get_audit_logger
 from orchestration.ralph_loop import get_ralph_loop, RalphLoopException
 from orchestration.retry_handler import get_retry_handler, RetryExhausted
 from orchestration.llm_interface import get_llm_interface
 from orchestration.skill_mapper import get_skill_mapper
+from orchestration.inbox_index import InboxIndex, parse_created_at, task_group
+from orchestration.vault_cache import get_vault_cache
+from orchestration.reasoning_cache import get_reasoning_cache
+from orchestration.plan_stream import validate_action
+from orchestration.queue_state import QueueState
+from orchestration.completion_archive import CompletionArchive
 
 load_dotenv()
 
@@ -38,6 +64,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger("orchestrator")
 
+# Reasons the main loop wakes up
+WAKE_INBOX = "inbox"
+WAKE_APPROVALS = "approvals"
+WAKE_WORKER = "worker"
+WAKE_STOP = "stop"
+WAKE_RESCAN = "rescan"
+
+
+class QueueEventHandler(FileSystemEventHandler):
+    """Wakes the orchestrator when files land in a watched queue directory."""
+    
+    def __init__(self, orchestrator: 'Orchestrator', directories: Dict[Path, str]):
+        self.orchestrator = orchestrator
+        self.directories = {directory.resolve(): reason for directory, reason in directories.items()}
+    
+    def _wake_for(self, path: Any) -> None:
+        reason = self.directories.get(Path(str(path)).resolve().parent)
+        if reason:
+            self.orchestrator.wake(reason, path)
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._wake_for(event.src_path)
+    
+    def on_modified(self, event):
+        if not event.is_directory:
+            self._wake_for(event.src_path)
+    
+    def on_moved(self, event):
+        # Only the destination matters (claims move files out of inbox/)
+        if not event.is_directory:
+            self._wake_for(event.dest_path)
+
 
 class Orchestrator:
     """
@@ -71,14 +130,46 @@ class Orchestrator:
         self.retry_handler = get_retry_handler()
         self.llm = get_llm_interface()  # LLM for reasoning (OpenAI or Anthropic)
         self.skill_mapper = get_skill_mapper()  # Auto-detect skills (safety net)
+        self.vault_cache = get_vault_cache()  # Skills/handbook re-read only when edited
+        self.reasoning_cache = get_reasoning_cache()  # Reuse plans for repeated tasks (opt-in)
         
         # State
         self.running = False
-        self.check_interval = int(os.getenv("TASK_QUEUE_CHECK_INTERVAL", "10"))
+        self.check_interval = float(os.getenv("TASK_QUEUE_CHECK_INTERVAL", "10"))
+        self.max_workers = max(1, int(os.getenv("ORCHESTRATOR_MAX_WORKERS", "1")))
+        
+        # Event-driven wakeup: block until inbox/approvals change, rescan on fallback timer
+        self.event_wakeup = os.getenv("ORCHESTRATOR_EVENT_WAKEUP", "true").lower() == "true"
+        self.fallback_interval = float(os.getenv("TASK_QUEUE_FALLBACK_INTERVAL", "60"))
+        self._wakeup = threading.Event()
+        self._wake_lock = threading.Lock()
+        self._wake_reasons: set = set()
+        self._observer: Any = None
+        
+        # Priority-plus-age claim order (INBOX_AGING_SECONDS=0 disables starvation aging)
+        self.inbox_index = InboxIndex(
+            self.inbox,
+            aging_seconds=float(os.getenv("INBOX_AGING_SECONDS", "0"))
+        )
+        
+        # Batched reasoning for bulk low/normal-priority tasks (1 = off)
+        self.batch_size = max(1, int(os.getenv("LLM_BATCH_SIZE", "1")))
+        
+        # Streamed plans: "server.command" actions safe to run before the plan finishes
+        self.stream_early_actions = {
+            name.strip() for name in os.getenv("LLM_STREAM_EARLY_ACTIONS", "").split(",") if name.strip()
+        }
         
         # Validate paths
         self._validate_paths()
         
+        # completed/ is sharded by day (ARCHIVE_COMPACT_DAYS packs old shards)
+        self.archive = CompletionArchive(self.completed)
+        
+        # Dashboard counters, kept current from claim/complete/approval events
+        self.queue_state = QueueState(self.task_queue, self.archive)
+        self._dashboard_hash: Optional[str] = None
+        
         logger.info("Orchestrator initialized")
     
     def _validate_paths(self) -> None:
@@ -96,29 +187,75 @@ class Orchestrator:
         Returns:
             Task dict if claimed, None if no tasks or pending queue occupied
         """
-        # CRITICAL: Only one task in pending at a time
+        tasks = self.claim_tasks(limit=1)
+        return tasks[0] if tasks else None
+    
+    def claim_tasks(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Claim up to `limit` tasks from inbox using claim-by-move.
+        
+        Tasks are taken in priority order (critical → low, oldest first)
+        from the in-memory inbox index. Each file is claimed with an atomic
+        rename into pending/, so two orchestrators racing for the same file
+        can never both win it.
+        
+        Args:
+            limit: Maximum tasks to claim (default: free worker slots)
+        
+        Returns:
+            List of claimed task dicts (empty if none or pending queue full)
+        """
+        # Without filesystem events the index diffs the directory itself
+        # (also while pending/ is full, so the dashboard's inbox count is current)
+        if self._observer is None:
+            self.inbox_index.refresh()
+        
+        # CRITICAL: pending/ never holds more than max_workers tasks
         pending_files = list(self.pending.glob("*.json"))
-        if pending_files:
+        capacity = self.max_workers - len(pending_files)
+        if capacity <= 0:
             logger.info("Pending queue occupied. Waiting...")
-            return None
+            return []
         
-        # Get tasks from inbox
-        inbox_files = sorted(self.inbox.glob("*.json"))
-        if not inbox_files:
-            return None
+        if limit is not None:
+            capacity = min(capacity, limit)
         
-        # Claim first task (FIFO)
-        task_file = inbox_files[0]
+        # Claim most urgent first (priority, then age)
+        claimed = []
+        while len(claimed) < capacity:
+            task_file = self.inbox_index.pop()
+            if task_file is None:
+                break
+            
+            task = self._claim_file(task_file)
+            if task is not None:
+                claimed.append(task)
         
+        return claimed
+    
+    def _claim_file(self, task_file: Path) -> Optional[Dict[str, Any]]:
+        """Claim a single inbox file by moving it to pending/."""
         try:
             # Read task
-            with open(task_file, 'r') as f:
-                task = json.load(f)
+            try:
+                with open(task_file, 'r') as f:
+                    task = json.load(f)
+            except json.JSONDecodeError:
+                # Non-atomic writers: the file may still be mid-write
+                if time.time() - task_file.stat().st_mtime < 2:
+                    logger.debug(f"Task file {task_file.name} still being written")
+                    return None
+                raise
             
-            # Move to pending (claim-by-move)
+            # Move to pending (claim-by-move, atomic on the same filesystem)
             dest_file = self.pending / task_file.name
-            shutil.move(str(task_file), str(dest_file))
+            try:
+                task_file.rename(dest_file)
+            except FileNotFoundError:
+                logger.debug(f"Task file {task_file.name} already claimed")
+                return None
             
+            self.queue_state.claimed(task)
             task_id = task.get("task_id")
             
             # Log claim
@@ -129,7 +266,8 @@ class Orchestrator:
                 details={
                     "source": task.get("source"),
                     "type": task.get("type"),
-                    "priority": task.get("priority")
+                    "priority": task.get("priority"),
+                    "claim_latency_ms": self._claim_latency_ms(task)
                 }
             )
             
@@ -137,6 +275,10 @@ class Orchestrator:
             
             return task
         
+        except FileNotFoundError:
+            # Another orchestrator claimed it between glob and read
+            return None
+        
         except Exception as e:
             logger.error(f"Error claiming task: {e}")
             self.audit_logger.log(
@@ -147,6 +289,39 @@ class Orchestrator:
             )
             return None
     
+    def _claim_latency_ms(self, task: Dict[str, Any]) -> Optional[float]:
+        """Milliseconds between the watcher creating a task and this claim."""
+        created_at = parse_created_at(task.get("created_at"))
+        if created_at is None:
+            return None
+        
+        return round((datetime.now(timezone.utc) - created_at).total_seconds() * 1000, 3)
+    
+    def claim_batch(self, task: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Claim inbox tasks that can share an LLM request with `task`.
+        
+        Args:
+            task: An already-claimed task (the batch leader)
+        
+        Returns:
+            The leader followed by up to LLM_BATCH_SIZE - 1 compatible tasks
+            (same priority, type, trigger and skills)
+        """
+        group = task_group(task)
+        if self.batch_size <= 1 or group is None:
+            return [task]
+        
+        batch = [task]
+        for task_file in self.inbox_index.pop_group(group, self.batch_size - 1):
+            mate = self._claim_file(task_file)
+            if mate is not None:
+                batch.append(mate)
+        
+        if len(batch) > 1:
+            logger.info(f"Claimed batch of {len(batch)} {group[1]} tasks")
+        return batch
+    
     def load_agent_skills(self, required_skills: list) -> Dict[str, str]:
         """
         Load agent skills from Markdown files.
@@ -161,10 +336,10 @@ class Orchestrator:
         
         for skill_name in required_skills:
             skill_file = self.agent_skills_path / f"{skill_name}.md"
+            content = self.vault_cache.read(skill_file)
             
-            if skill_file.exists():
-                with open(skill_file, 'r', encoding='utf-8') as f:
-                    skills[skill_name] = f.read()
+            if content is not None:
+                skills[skill_name] = content
                 logger.info(f"Loaded skill: {skill_name}")
             else:
                 logger.warning(f"Skill not found: {skill_name}")
@@ -204,55 +379,225 @@ class Orchestrator:
             # Use LLM for reasoning
             logger.info(f"Processing task {task_id} - Invoking LLM reasoning engine")
             
-            reasoning_result = self.llm.reason(
-                task=task,
-                skills=skills,
-                context=self._get_vault_context()
-            )
-            
-            # Log reasoning
-            self.audit_logger.log(
-                action="llm_reasoning",
-                task_id=task_id,
-                result="success",
-                details={
-                    "confidence": reasoning_result.get("confidence"),
-                    "actions_planned": len(reasoning_result.get("actions", [])),
-                    "requires_approval": reasoning_result.get("requires_approval")
-                }
-            )
-            
-            # Check if approval required
-            if reasoning_result.get("requires_approval", False):
-                task["hitl_required"] = True
-                task["reasoning_result"] = reasoning_result
-                self._handle_hitl_approval(task)
-                return
+            context = self._get_vault_context()
+            reasoning_result = self.reasoning_cache.lookup(task, skills, context)
             
-            # Execute actions from LLM plan
-            action_results = self._execute_action_plan(task_id, reasoning_result.get("actions", []))
+            dispatched: List[Dict[str, Any]] = []
             
-            # Mark complete
-            result_summary = f"Completed {len(action_results)} actions. Confidence: {reasoning_result.get('confidence', 0)}"
-            self._complete_task(task, success=True, result=result_summary)
+            if reasoning_result is None:
+                if getattr(self.llm, "streaming", False):
+                    on_action, dispatched = self._stream_dispatcher(task_id)
+                    reasoning_result = self.llm.reason(
+                        task=task,
+                        skills=skills,
+                        context=context,
+                        on_action=on_action
+                    )
+                else:
+                    reasoning_result = self.llm.reason(
+                        task=task,
+                        skills=skills,
+                        context=context
+                    )
+                self.reasoning_cache.store(task, skills, context, reasoning_result)
             
+            self._apply_reasoning(task, reasoning_result, dispatched)
+        
         except RalphLoopException as e:
             logger.error(f"Ralph Loop triggered for {task_id}: {e}")
             self._fail_task(task, str(e))
             self._alert_human(task_id, "ralph_loop_triggered", str(e))
         
         except Exception as e:
-            logger.error(f"Error processing task {task_id}: {e}")
+            self._handle_processing_error(task, e)
+    
+    def process_task_batch(self, tasks: List[Dict[str, Any]]) -> None:
+        """
+        Process compatible tasks with one LLM request per skill set.
+        
+        Tasks that turn out to need HITL, or whose skill set matches no
+        other task in the batch, go through process_task() individually.
+        
+        Args:
+            tasks: Tasks claimed together by claim_batch()
+        """
+        groups: Dict[tuple, List[Dict[str, Any]]] = {}
+        
+        for task in tasks:
+            task = self.skill_mapper.add_skills_to_task(task)
+            if task.get("hitl_required", False) or not task.get("task_id"):
+                self.process_task(task)
+            else:
+                groups.setdefault(tuple(task.get("required_skills", [])), []).append(task)
+        
+        for required_skills, group in groups.items():
+            if len(group) == 1:
+                self.process_task(group[0])
+                continue
+            
+            # Track iteration (Ralph Loop protection)
+            ready = []
+            for task in group:
+                try:
+                    self.ralph_loop.track_iteration(task["task_id"])
+                    ready.append(task)
+                except RalphLoopException as e:
+                    logger.error(f"Ralph Loop triggered for {task['task_id']}: {e}")
+                    self._fail_task(task, str(e))
+                    self._alert_human(task["task_id"], "ralph_loop_triggered", str(e))
+            
+            if not ready:
+                continue
             
-            # Try retry
+            results: List[Optional[Dict[str, Any]]] = [None] * len(ready)
             try:
-                self.retry_handler.execute_with_retry(
-                    self._retry_process_task,
-                    task,
-                    task_id=task_id
-                )
-            except RetryExhausted:
-                self._fail_task(task, str(e))
+                skills = self.load_agent_skills(list(required_skills))
+                context = self._get_vault_context()
+                
+                for i, task in enumerate(ready):
+                    results[i] = self.reasoning_cache.lookup(task, skills, context)
+                misses = [task for task, result in zip(ready, results) if result is None]
+                
+                if misses:
+                    logger.info(f"Processing batch of {len(misses)} tasks - Invoking LLM reasoning engine")
+                    
+                    # reason_batch falls back to per-task calls on its own failures
+                    planned = iter(self.llm.reason_batch(tasks=misses, skills=skills, context=context))
+                    for i, result in enumerate(results):
+                        if result is None:
+                            results[i] = next(planned)
+                            self.reasoning_cache.store(ready[i], skills, context, results[i])
+            
+            except Exception as e:
+                # Tasks without a plan go the way a failed process_task() goes
+                for task, reasoning_result in zip(ready, results):
+                    if reasoning_result is None:
+                        self._handle_processing_error(task, e)
+            
+            for task, reasoning_result in zip(ready, results):
+                if reasoning_result is None:
+                    continue
+                try:
+                    self._apply_reasoning(task, reasoning_result)
+                except Exception as e:
+                    self._handle_processing_error(task, e)
+    
+    def _stream_dispatcher(self, task_id: str) -> Tuple[Callable, List[Dict[str, Any]]]:
+        """
+        Build the on_action callback for a streamed plan.
+        
+        Every action is validated the moment it arrives (a malformed one
+        aborts the stream). Leading actions listed in LLM_STREAM_EARLY_ACTIONS
+        are executed straight away, but only once the plan has declared
+        requires_approval: false; everything else waits for the full plan.
+        
+        Returns:
+            (callback, list the early action results are appended to)
+        """
+        dispatched: List[Dict[str, Any]] = []
+        
+        def on_action(index: int, action: Dict[str, Any], fields: Dict[str, Any]) -> None:
+            validate_action(action)
+            
+            # Only a contiguous prefix of the plan may run early, so order is kept
+            if (
+                index == len(dispatched)
+                and fields.get("requires_approval") is False
+                and f"{action['mcp_server']}.{action['command']}" in self.stream_early_actions
+            ):
+                logger.info(f"Dispatching streamed action {index + 1} for {task_id} before the plan is complete")
+                dispatched.extend(self._execute_action_plan(task_id, [action], start=index))
+        
+        return on_action, dispatched
+    
+    def _apply_reasoning(
+        self,
+        task: Dict[str, Any],
+        reasoning_result: Dict[str, Any],
+        dispatched: Optional[List[Dict[str, Any]]] = None
+    ) -> None:
+        """
+        Log an LLM plan, then route it to HITL or execute it.
+        
+        Args:
+            task: Task the plan is for
+            reasoning_result: Plan from the LLM (or the reasoning cache)
+            dispatched: Results of leading actions already executed while
+                the plan was streaming (they are not executed again; if
+                the stream then failed, the task fails instead of being
+                re-planned, which would run them a second time)
+        """
+        task_id = task.get("task_id")
+        dispatched = dispatched or []
+        
+        # Log reasoning (with per-call token and latency usage)
+        usage = reasoning_result.get("usage", {})
+        self.audit_logger.log(
+            action="llm_reasoning",
+            task_id=task_id,
+            result="success",
+            details={
+                "confidence": reasoning_result.get("confidence"),
+                "actions_planned": len(reasoning_result.get("actions", [])),
+                "requires_approval": reasoning_result.get("requires_approval"),
+                "input_tokens": usage.get("input_tokens"),
+                "cached_input_tokens": usage.get("cached_input_tokens"),
+                "latency_ms": usage.get("latency_ms"),
+                "batch_size": usage.get("batch_size", 1),
+                "cache": usage.get("cache"),
+                "first_action_ms": usage.get("first_action_ms"),
+                "dispatched_early": len(dispatched)
+            }
+        )
+        
+        if dispatched and reasoning_result.get("error"):
+            # Early actions already had side effects: record them, never re-plan
+            message = (
+                f"Plan stream failed after {len(dispatched)} early action(s) ran "
+                f"({reasoning_result['error']}); not re-planned"
+            )
+            self.audit_logger.log(
+                action="stream_aborted_after_dispatch",
+                task_id=task_id,
+                result="failure",
+                details={"dispatched": dispatched},
+                error=reasoning_result["error"]
+            )
+            self._fail_task(task, message)
+            self._alert_human(task_id, "stream_aborted_after_dispatch", message)
+            return
+        
+        # Check if approval required
+        if reasoning_result.get("requires_approval", False):
+            task["hitl_required"] = True
+            task["reasoning_result"] = reasoning_result
+            if dispatched:
+                task["dispatched_actions"] = dispatched  # The approver sees what already ran
+            self._handle_hitl_approval(task)
+            return
+        
+        # Execute actions from LLM plan
+        remaining = reasoning_result.get("actions", [])[len(dispatched):]
+        action_results = dispatched + self._execute_action_plan(task_id, remaining, start=len(dispatched))
+        
+        # Mark complete
+        result_summary = f"Completed {len(action_results)} actions. Confidence: {reasoning_result.get('confidence', 0)}"
+        self._complete_task(task, success=True, result=result_summary)
+    
+    def _handle_processing_error(self, task: Dict[str, Any], error: Exception) -> None:
+        """Retry a task that raised during processing, failing it once retries run out."""
+        task_id = task.get("task_id")
+        logger.error(f"Error processing task {task_id}: {error}")
+        
+        # Try retry
+        try:
+            self.retry_handler.execute_with_retry(
+                self._retry_process_task,
+                task,
+                task_id=task_id
+            )
+        except RetryExhausted:
+            self._fail_task(task, str(error))
     
     def _retry_process_task(self, task: Dict[str, Any]) -> None:
         """Retry processing a task."""
@@ -270,39 +615,38 @@ class Orchestrator:
         context_parts = []
         
         # Load business goals
-        goals_file = self.vault_path / "Business_Goals.md"
-        if goals_file.exists():
-            with open(goals_file, 'r', encoding='utf-8') as f:
-                context_parts.append(f"# Business Goals\n{f.read()}")
+        goals = self.vault_cache.read(self.vault_path / "Business_Goals.md")
+        if goals is not None:
+            context_parts.append(f"# Business Goals\n{goals}")
         
         # Load company handbook
-        handbook_file = self.vault_path / "Company_Handbook.md"
-        if handbook_file.exists():
-            with open(handbook_file, 'r', encoding='utf-8') as f:
-                context_parts.append(f"# Company Handbook\n{f.read()}")
+        handbook = self.vault_cache.read(self.vault_path / "Company_Handbook.md")
+        if handbook is not None:
+            context_parts.append(f"# Company Handbook\n{handbook}")
         
         return "\n\n".join(context_parts) if context_parts else ""
     
-    def _execute_action_plan(self, task_id: str, actions: list) -> list:
+    def _execute_action_plan(self, task_id: str, actions: list, start: int = 0) -> list:
         """
         Execute action plan via MCP servers.
         
         Args:
             task_id: Task identifier
             actions: List of actions from LLM reasoning
+            start: Position of the first action in the full plan
         
         Returns:
             List of action results
         """
         results = []
         
-        for idx, action in enumerate(actions):
+        for idx, action in enumerate(actions, start):
             action_id = f"{task_id}_action_{idx}"
             mcp_server = action.get("mcp_server", "unknown")
             command = action.get("command", "unknown")
             parameters = action.get("parameters", {})
             
-            logger.info(f"Executing action {idx+1}/{len(actions)}: {mcp_server}.{command}")
+            logger.info(f"Executing action {idx+1}/{start+len(actions)}: {mcp_server}.{command}")
             
             try:
                 # BRONZE TIER: MCP servers are stubs
@@ -398,6 +742,8 @@ class Orchestrator:
             "reason": "Task requires human approval",
             "status": "pending"
         }
+        if task.get("dispatched_actions"):
+            approval_request["dispatched_actions"] = task["dispatched_actions"]
         
         with open(approval_file, 'w') as f:
             json.dump(approval_request, f, indent=2)
@@ -406,6 +752,7 @@ class Orchestrator:
         pending_file = self.pending / f"{task_id}.json"
         if pending_file.exists():
             shutil.move(str(pending_file), str(self.approvals / f"{task_id}_task.json"))
+        self.queue_state.approval_requested(task)
         
         logger.info(f"Task {task_id} requires HITL approval")
         
@@ -451,6 +798,7 @@ class Orchestrator:
                     # Clean up approval files
                     approved_file.unlink()
                     task_file.unlink()
+                    self.queue_state.approved(task_id)
                     
                     # Log approval
                     self.audit_logger.log(
@@ -487,14 +835,13 @@ class Orchestrator:
                     task["completed_at"] = datetime.now(timezone.utc).isoformat()
                     task["result"] = "Rejected by human approval"
                     
-                    # Save to completed
-                    completed_file = self.completed / f"{task_id}.json"
-                    with open(completed_file, 'w') as f:
-                        json.dump(task, f, indent=2)
+                    # Save to completed (today's shard)
+                    self.archive.add(f"{task_id}.json", json.dumps(task, indent=2))
                     
                     # Clean up approval files
                     rejected_file.unlink()
                     task_file.unlink()
+                    self.queue_state.completed(task)
                     
                     # Log rejection
                     self.audit_logger.log(
@@ -539,6 +886,7 @@ class Orchestrator:
                     logger.info(f"Moving stuck HITL task back to approvals: {task_id}")
                     dest_file = self.approvals / f"{task_id}_task.json"
                     shutil.move(str(stuck_file), str(dest_file))
+                    self.queue_state.approval_requested(task)
             
             except Exception as e:
                 logger.error(f"Error cleaning up stuck task {task_id}: {e}")
@@ -571,13 +919,12 @@ class Orchestrator:
         task["completed_at"] = datetime.now(timezone.utc).isoformat()
         task["result"] = result
         
-        # Save to completed
-        completed_file = self.completed / f"{task_id}.json"
-        with open(completed_file, 'w') as f:
-            json.dump(task, f, indent=2)
+        # Save to completed (today's shard)
+        self.archive.add(f"{task_id}.json", json.dumps(task, indent=2))
         
         # Remove from pending
         actual_pending_file.unlink()
+        self.queue_state.completed(task)
         
         # Reset Ralph Loop counter
         self.ralph_loop.reset_task(task_id)
@@ -614,88 +961,157 @@ class Orchestrator:
         """
         Update Dashboard.md with current status.
         
+        Counts come from the in-memory queue state and inbox index, so an
+        idle pass touches no queue directory. The file is only rewritten
+        when what it shows has changed ("Last Updated" is the time of the
+        last change), and is replaced atomically so Obsidian never reads
+        a half-written dashboard.
+        
         CRITICAL: This is the ONLY place that writes to Dashboard.md
         """
         try:
-            # Get task counts
-            inbox_count = len(list(self.inbox.glob("*.json")))
-            pending_count = len(list(self.pending.glob("*.json")))
-            approval_count = len(list(self.approvals.glob("*.json")))
+            state = self.queue_state.snapshot()
+            view = {
+                **state,
+                "inbox": len(self.inbox_index),
+                "running": self.running,
+                "vault": self.vault_path.exists(),
+                "audit_logs": Path('./audit_logs').exists()
+            }
+            
+            digest = hashlib.sha256(json.dumps(view, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+            if digest == self._dashboard_hash:
+                return
+            
+            dashboard = self._render_dashboard(view)
             
-            # Get recent completions (last 24h)
-            completed_files = sorted(
-                self.completed.glob("*.json"),
-                key=lambda x: x.stat().st_mtime,
-                reverse=True
-            )[:10]
+            # Write dashboard (temp file + rename)
+            tmp_path = self.dashboard_path.with_name(f".{self.dashboard_path.name}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(dashboard)
+            os.replace(tmp_path, self.dashboard_path)
             
-            # Build dashboard content
-            dashboard = f"""# Dashboard - Personal AI Employee
+            self._dashboard_hash = digest
+            logger.debug("Dashboard updated")
+        
+        except Exception as e:
+            logger.error(f"Error updating dashboard: {e}")
+    
+    def _render_dashboard(self, view: Dict[str, Any]) -> str:
+        """Dashboard.md content for a queue-state view."""
+        recent = "\n".join(
+            f"- {'✅' if c['status'] == 'completed' else '❌'} `{c['task_id']}` ({c['type']}) - {c['status']}"
+            for c in view["recent"]
+        ) or "*No completed tasks yet*"
+        
+        return f"""# Dashboard - Personal AI Employee
 
 **Last Updated**: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')} UTC  
-**Status**: {'🟢 Operational' if self.running else '🔴 Stopped'}  
-**Active Tasks**: {pending_count}  
-**Pending Approvals**: {approval_count}
+**Status**: {'🟢 Operational' if view['running'] else '🔴 Stopped'}  
+**Active Tasks**: {view['pending']}  
+**Pending Approvals**: {view['approvals']}
 
 ---
 
 ## 📊 Current Status
 
 ### Active Task
-{self._get_active_task_summary()}
+{self._get_active_task_summary(view['active'])}
 
 ### Today's Activity
-- **Tasks in Inbox**: {inbox_count}
-- **Tasks in Progress**: {pending_count}
-- **Pending Approvals**: {approval_count}
-- **Tasks Completed (recent)**: {len(completed_files)}
+- **Tasks in Inbox**: {view['inbox']}
+- **Tasks in Progress**: {view['pending']}
+- **Pending Approvals**: {view['approvals']}
+- **Tasks Completed (recent)**: {len(view['recent'])}
+
+### Recent Completions
+{recent}
 
 ---
 
 ## 📋 Task Queue Status
 
-- **Inbox**: {inbox_count} tasks
-- **Pending**: {pending_count} tasks (max: 1)
-- **Approvals**: {approval_count} tasks
-- **Completed**: {len(completed_files)} tasks (recent)
+- **Inbox**: {view['inbox']} tasks
+- **Pending**: {view['pending']} tasks (max: {self.max_workers})
+- **Approvals**: {view['approvals']} tasks
+- **Completed**: {view['completed']} tasks
 
 ---
 
 ## 🔧 System Health
 
-- **Orchestrator**: {'🟢 Running' if self.running else '🔴 Stopped'}
-- **Vault**: {'🟢 Accessible' if self.vault_path.exists() else '🔴 Not found'}
-- **Audit Logs**: {'🟢 Active' if Path('./audit_logs').exists() else '🔴 Not configured'}
+- **Orchestrator**: {'🟢 Running' if view['running'] else '🔴 Stopped'}
+- **Vault**: {'🟢 Accessible' if view['vault'] else '🔴 Not found'}
+- **Audit Logs**: {'🟢 Active' if view['audit_logs'] else '🔴 Not configured'}
 
 ---
 
 **Schema Version**: 1.0  
 **Single-Writer Rule**: Only `orchestration/orchestrator.py` may modify this file.
 """
-            
-            # Write dashboard
-            with open(self.dashboard_path, 'w', encoding='utf-8') as f:
-                f.write(dashboard)
-            
-            logger.debug("Dashboard updated")
+
+    def _get_active_task_summary(self, active: Optional[Dict[str, Any]]) -> str:
+        """Get summary of active task."""
+        if not active:
+            return "*None - waiting for new tasks*"
         
-        except Exception as e:
-            logger.error(f"Error updating dashboard: {e}")
+        task_id = str(active.get('task_id') or "")
+        return f"**{active.get('type')}** (ID: {task_id[:8]}...)"
     
-    def _get_active_task_summary(self) -> str:
-        """Get summary of active task."""
-        pending_files = list(self.pending.glob("*.json"))
+    def wake(self, reason: str, path: Any = None) -> None:
+        """Wake the main loop (thread-safe; called by observers and workers)."""
+        if reason == WAKE_INBOX and path is not None:
+            self.inbox_index.note(path)
+        
+        with self._wake_lock:
+            self._wake_reasons.add(reason)
+        self._wakeup.set()
+    
+    def _wait_for_wakeup(self, timeout: Optional[float]) -> set:
+        """
+        Block until woken or the timeout elapses.
         
-        if not pending_files:
-            return "*None - waiting for new tasks*"
+        Returns:
+            Set of wake reasons. A timeout means "rescan everything".
+        """
+        fired = self._wakeup.wait(timeout)
+        self._wakeup.clear()
+        
+        with self._wake_lock:
+            reasons, self._wake_reasons = self._wake_reasons, set()
+        
+        if not fired:
+            return {WAKE_INBOX, WAKE_APPROVALS, WAKE_RESCAN}
+        return reasons
+    
+    def _start_observer(self) -> bool:
+        """Watch inbox/ and approvals/ for changes. Returns True if active."""
+        if not self.event_wakeup:
+            return False
+        
+        if not WATCHDOG_AVAILABLE:
+            logger.warning("watchdog not installed - falling back to polling")
+            return False
         
         try:
-            with open(pending_files[0], 'r') as f:
-                task = json.load(f)
-            
-            return f"**{task.get('type')}** (ID: {task.get('task_id')[:8]}...)"
-        except:
-            return "*Task in progress*"
+            # One recursive watch over task_queue/ so inbox → pending moves are
+            # seen as a pair (unpaired moves are held back by the inotify buffer)
+            handler = QueueEventHandler(self, {self.inbox: WAKE_INBOX, self.approvals: WAKE_APPROVALS})
+            self._observer = Observer()
+            self._observer.schedule(handler, str(self.task_queue), recursive=True)
+            self._observer.start()
+            return True
+        
+        except Exception as e:
+            logger.warning(f"Could not start queue observer, falling back to polling: {e}")
+            self._observer = None
+            return False
+    
+    def _stop_observer(self) -> None:
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
     
     def start(self) -> None:
         """Start orchestrator main loop."""
@@ -705,34 +1121,86 @@ class Orchestrator:
         
         self.running = True
         
-        logger.info("🚀 Orchestrator started")
-        logger.info(f"Checking task queue every {self.check_interval}s")
+        event_driven = self._start_observer()
+        if event_driven:
+            # Fallback rescan catches any missed events (0 disables it)
+            timeout = self.fallback_interval or None
+            logger.info(f"🚀 Orchestrator started (event-driven, fallback rescan every {self.fallback_interval}s)")
+        else:
+            timeout = self.check_interval
+            logger.info("🚀 Orchestrator started")
+            logger.info(f"Checking task queue every {self.check_interval}s")
+        logger.info(f"Worker pool size: {self.max_workers}")
         
         try:
-            while self.running:
-                # Clean up any stuck _task.json files
-                self._cleanup_stuck_tasks()
-                
-                # Check for HITL approvals/rejections
-                self._check_hitl_approvals()
+            with ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="orchestrator-worker"
+            ) as pool:
+                in_flight = set()
                 
-                # Claim and process tasks
-                task = self.claim_task()
+                # First pass scans everything
+                reasons = {WAKE_INBOX, WAKE_APPROVALS, WAKE_RESCAN}
                 
-                if task:
-                    self.process_task(task)
-                
-                # Update dashboard
-                self.update_dashboard()
+                while self.running:
+                    done = {f for f in in_flight if f.done()}
+                    in_flight -= done
+                    self._reap_workers(done)
+                    
+                    if WAKE_APPROVALS in reasons:
+                        # Clean up any stuck _task.json files
+                        self._cleanup_stuck_tasks()
+                        
+                        # Check for HITL approvals/rejections
+                        self._check_hitl_approvals()
+                    
+                    if WAKE_RESCAN in reasons:
+                        # pending/ and approvals/ may have been edited by hand
+                        self.queue_state.rescan()
+                        
+                        # Pack old completed/ shards (no-op unless ARCHIVE_COMPACT_DAYS is set)
+                        self.archive.compact()
+                        
+                        if self._observer is not None:
+                            # Safety net for missed events
+                            self.inbox_index.refresh()
+                    
+                    if reasons & {WAKE_INBOX, WAKE_WORKER}:
+                        # Claim tasks into free worker slots and process concurrently
+                        for task in self.claim_tasks(limit=self.max_workers - len(in_flight)):
+                            batch = self.claim_batch(task)
+                            if len(batch) > 1:
+                                future = pool.submit(self.process_task_batch, batch)
+                            else:
+                                future = pool.submit(self.process_task, task)
+                            future.add_done_callback(lambda _: self.wake(WAKE_WORKER))
+                            in_flight.add(future)
+                    
+                    # Update dashboard (only when something may have changed)
+                    if reasons - {WAKE_STOP}:
+                        self.update_dashboard()
+                    
+                    # Sleep until a queue changes, a worker frees up, or the fallback fires
+                    reasons = self._wait_for_wakeup(timeout)
                 
-                # Wait before next check
-                time.sleep(self.check_interval)
+                # Drain in-flight tasks before shutting the pool down
+                self._reap_workers(wait(in_flight).done)
         
         except KeyboardInterrupt:
             self.stop()
         except Exception as e:
             logger.error(f"Orchestrator error: {e}")
             self.stop()
+        finally:
+            self._stop_observer()
+            self.audit_logger.flush()
+    
+    def _reap_workers(self, done: set) -> None:
+        """Log any unexpected worker exceptions."""
+        for future in done:
+            error = future.exception()
+            if error is not None:
+                logger.error(f"Worker crashed: {error}")
     
     def stop(self) -> None:
         """Stop orchestrator."""
@@ -740,6 +1208,7 @@ class Orchestrator:
             return
         
         self.running = False
+        self.wake(WAKE_STOP)
         self.update_dashboard()
         logger.info("Orchestrator stopped")
 
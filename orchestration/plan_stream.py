@@ -0,0 +1,264 @@
+"""
+Plan Stream - Incremental Parsing of Streamed LLM Action Plans
+
+ARCHITECTURAL RULES:
+1. Text is validated as it arrives: the first character that cannot be
+   part of the JSON plan raises PlanStreamError (the stream is abandoned)
+2. Each element of the top-level "actions" array is handed out as soon
+   as its closing brace arrives, before the rest of the plan
+3. Top-level scalar fields (requires_approval, confidence, ...) are
+   available as soon as they complete
+4. Parsing only; dispatching decisions belong to the orchestrator
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+# Characters a JSON number/true/false/null literal may contain
+_LITERAL_CHARS = set("0123456789+-.eEtruefalsn")
+_WHITESPACE = set(" \t\r\n")
+
+
+class PlanStreamError(ValueError):
+    """Raised as soon as streamed output cannot be a valid action plan."""
+    pass
+
+
+def validate_action(action: Dict[str, Any]) -> None:
+    """
+    Check one planned action's shape before it is dispatched.
+    
+    Raises:
+        PlanStreamError if mcp_server/command are missing or parameters is not an object
+    """
+    for field in ("mcp_server", "command"):
+        if not isinstance(action.get(field), str) or not action[field]:
+            raise PlanStreamError(f"Action is missing '{field}': {action}")
+    if not isinstance(action.get("parameters", {}), dict):
+        raise PlanStreamError(f"Action parameters must be an object: {action}")
+
+
+class _Frame:
+    """One open object or array."""
+    
+    __slots__ = ("kind", "path", "start", "state", "key", "index")
+    
+    def __init__(self, kind: str, path: Tuple, start: int):
+        self.kind = kind  # "object" or "array"
+        self.path = path
+        self.start = start
+        self.state = "key_or_end" if kind == "object" else "value_or_end"
+        self.key: Optional[str] = None
+        self.index = -1
+    
+    def child_path(self) -> Tuple:
+        return self.path + ((self.key,) if self.kind == "object" else (self.index,))
+
+
+class PlanStreamParser:
+    """
+    Push parser for the plan JSON ({"thought_process": ..., "actions": [...], ...}).
+    
+    feed() text chunks as they arrive; it returns the actions completed by
+    that chunk. close() returns the whole plan once the stream has ended.
+    A leading ```json fence (or short preamble) before the opening brace
+    is skipped, as is anything after the closing brace.
+    """
+    
+    def __init__(self, max_preamble: int = 200):
+        self.max_preamble = max_preamble
+        self.fields: Dict[str, Any] = {}  # completed top-level fields
+        self.actions: List[Dict[str, Any]] = []
+        
+        self._text = ""
+        self._pos = 0
+        self._start: Optional[int] = None  # index of the opening brace
+        self._end: Optional[int] = None  # index after the closing brace
+        self._stack: List[_Frame] = []
+        
+        # Token in progress: ("string", start, is_key), ("literal", start) or None
+        self._token: Optional[Tuple] = None
+        self._escaped = False
+    
+    @property
+    def done(self) -> bool:
+        """True once the top-level object has closed."""
+        return self._end is not None
+    
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """
+        Consume the next piece of streamed text.
+        
+        Args:
+            chunk: Text delta from the provider
+        
+        Returns:
+            Actions whose JSON object completed within this chunk
+        
+        Raises:
+            PlanStreamError if the text so far cannot be a valid plan
+        """
+        self._text += chunk
+        completed: List[Dict[str, Any]] = []
+        
+        if self._start is None and not self._find_start():
+            return completed
+        
+        text = self._text
+        while self._pos < len(text) and self._end is None:
+            char = text[self._pos]
+            
+            if self._token is not None and self._token[0] == "string":
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._finish_string(completed)
+                self._pos += 1
+                continue
+            
+            if self._token is not None:
+                # Literal ends at the first character that cannot belong to it
+                if char in _LITERAL_CHARS:
+                    self._pos += 1
+                    continue
+                self._finish_literal(completed)
+            
+            if char not in _WHITESPACE:
+                self._consume(char, completed)
+            self._pos += 1
+        
+        return completed
+    
+    def close(self) -> Dict[str, Any]:
+        """
+        Finish the stream.
+        
+        Returns:
+            The complete plan
+        
+        Raises:
+            PlanStreamError if the stream ended before the plan was complete
+        """
+        if self._end is None:
+            where = "before the plan started" if self._start is None else "mid-plan"
+            raise PlanStreamError(f"Response ended {where} (truncated at {len(self._text)} chars)")
+        
+        plan = json.loads(self._text[self._start:self._end])
+        if not isinstance(plan.get("actions", []), list):
+            raise PlanStreamError("'actions' is not a list")
+        return plan
+    
+    def _find_start(self) -> bool:
+        """Skip the preamble/fence before the plan's opening brace."""
+        brace = self._text.find("{")
+        preamble = self._text if brace < 0 else self._text[:brace]
+        
+        if len(preamble.replace("```json", "").strip()) > self.max_preamble:
+            raise PlanStreamError(f"No JSON plan within the first {self.max_preamble} characters")
+        if brace < 0:
+            return False
+        
+        self._start = self._pos = brace
+        return True
+    
+    def _consume(self, char: str, completed: List[Dict[str, Any]]) -> None:
+        """Apply one structural character to the open container."""
+        if not self._stack:
+            # Only the opening brace gets here (see _find_start)
+            self._stack.append(_Frame("object", (), self._pos))
+            return
+        
+        frame = self._stack[-1]
+        state = frame.state
+        
+        if state == "colon":
+            if char != ":":
+                self._fail(f"expected ':' after key {frame.key!r}")
+            frame.state = "value"
+        
+        elif state in ("key_or_end", "key"):
+            if char == '"':
+                self._token = ("string", self._pos, True)
+            elif char == "}" and state == "key_or_end":
+                self._close_container(completed)
+            else:
+                self._fail("expected a key")
+        
+        elif state == "comma_or_end":
+            if char == ",":
+                frame.state = "key" if frame.kind == "object" else "value"
+            elif char == ("}" if frame.kind == "object" else "]"):
+                self._close_container(completed)
+            else:
+                self._fail("expected ',' or the end of the " + frame.kind)
+        
+        else:  # "value" or "value_or_end"
+            if char == "]" and state == "value_or_end":
+                self._close_container(completed)
+                return
+            
+            if frame.kind == "array":
+                frame.index += 1
+            path = frame.child_path()
+            
+            if char == "{":
+                self._stack.append(_Frame("object", path, self._pos))
+            elif char == "[":
+                self._stack.append(_Frame("array", path, self._pos))
+            elif char == '"':
+                self._token = ("string", self._pos, False)
+            elif char in _LITERAL_CHARS:
+                self._token = ("literal", self._pos)
+            else:
+                self._fail("expected a value")
+    
+    def _finish_string(self, completed: List[Dict[str, Any]]) -> None:
+        _, start, is_key = self._token
+        self._token = None
+        frame = self._stack[-1]
+        
+        if is_key:
+            frame.key = json.loads(self._text[start:self._pos + 1])
+            frame.state = "colon"
+        else:
+            self._value_done(frame.child_path(), start, self._pos + 1, completed)
+    
+    def _finish_literal(self, completed: List[Dict[str, Any]]) -> None:
+        _, start = self._token
+        self._token = None
+        try:
+            json.loads(self._text[start:self._pos])
+        except ValueError:
+            self._fail(f"invalid literal {self._text[start:self._pos]!r}")
+        self._value_done(self._stack[-1].child_path(), start, self._pos, completed)
+    
+    def _close_container(self, completed: List[Dict[str, Any]]) -> None:
+        frame = self._stack.pop()
+        if not self._stack:
+            self._end = self._pos + 1
+            return
+        self._value_done(frame.path, frame.start, self._pos + 1, completed)
+    
+    def _value_done(self, path: Tuple, start: int, end: int, completed: List[Dict[str, Any]]) -> None:
+        """Record a finished value; the parent now expects ',' or its end."""
+        self._stack[-1].state = "comma_or_end"
+        
+        if len(path) == 1:
+            if path[0] == "actions":
+                if self._text[start] != "[":
+                    self._fail("'actions' is not a list")
+            else:
+                self.fields[path[0]] = json.loads(self._text[start:end])
+        
+        elif len(path) == 2 and path[0] == "actions":
+            action = json.loads(self._text[start:end])
+            if not isinstance(action, dict):
+                self._fail(f"action {path[1]} is not an object")
+            self.actions.append(action)
+            completed.append(action)
+    
+    def _fail(self, message: str) -> None:
+        excerpt = self._text[max(0, self._pos - 40):self._pos + 1]
+        raise PlanStreamError(f"Malformed plan at char {self._pos}: {message} (near {excerpt!r})")
@@ -0,0 +1,159 @@
+"""
+Queue State - In-Memory Counters Behind Dashboard.md
+
+ARCHITECTURAL RULES:
+1. task_queue/ stays the source of truth; this is a view the orchestrator
+   keeps current from its own claim / complete / approval events
+2. completed/ is read ONCE at startup (count + newest completions, via the
+   CompletionArchive); after that a completion costs O(1), however large
+   the archive grows
+3. Recent completions are a bounded ring, never a directory sort
+4. pending/ and approvals/ are small and re-scanned on the fallback rescan,
+   which corrects any drift from files moved by hand
+"""
+
+import os
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import logging
+
+from orchestration.completion_archive import CompletionArchive
+
+logger = logging.getLogger("queue_state")
+
+
+def _summary(task: Dict[str, Any]) -> Dict[str, Any]:
+    return {"task_id": task.get("task_id"), "type": task.get("type")}
+
+
+def _completion(task: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "task_id": task.get("task_id"),
+        "type": task.get("type"),
+        "status": task.get("status"),
+        "completed_at": task.get("completed_at")
+    }
+
+
+def _task_files(directory: Path) -> List[os.DirEntry]:
+    """*.json entries of a directory (hidden temp files excluded)."""
+    try:
+        with os.scandir(directory) as entries:
+            return [e for e in entries if e.name.endswith(".json") and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return []
+
+
+def _read_task(path: Any) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            task = json.load(f)
+        return task if isinstance(task, dict) else None
+    except (OSError, ValueError):
+        return None
+
+
+class QueueState:
+    """
+    Counters for pending/, approvals/ and completed/ plus a ring of the
+    most recent completions (thread-safe; workers report completions).
+    
+    inbox/ is not counted here: the orchestrator's InboxIndex already
+    tracks it.
+    """
+    
+    def __init__(self, task_queue: Path, archive: Optional[CompletionArchive] = None, recent: int = 10):
+        self.pending_dir = task_queue / "pending"
+        self.approvals_dir = task_queue / "approvals"
+        self.archive = archive or CompletionArchive(task_queue / "completed")
+        
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}  # task_id -> summary, in claim order
+        self._approvals: set = set()  # task_ids awaiting a human
+        self._completed_count = 0
+        self._recent: deque = deque(maxlen=recent)  # newest last
+        
+        self.rescan(completed=True)
+    
+    def rescan(self, completed: bool = False) -> None:
+        """
+        Rebuild the counters from disk.
+        
+        Args:
+            completed: Also re-count completed/ and reload the recent ring
+                (one pass over the archive; startup only by default)
+        """
+        pending: Dict[str, Dict[str, Any]] = {}
+        for entry in sorted(_task_files(self.pending_dir), key=lambda e: e.name):
+            task = _read_task(entry.path) or {}
+            task_id = task.get("task_id") or entry.name[:-len(".json")]
+            pending[task_id] = _summary({**task, "task_id": task_id})
+        
+        # {task_id}_task.json is the parked task; the {task_id}.json request
+        # is left behind after a decision, so it does not count
+        approvals = {
+            entry.name[:-len("_task.json")]
+            for entry in _task_files(self.approvals_dir) if entry.name.endswith("_task.json")
+        }
+        
+        if completed:
+            completed_count = self.archive.count()
+            recent = []
+            for item in reversed(self.archive.latest(self._recent.maxlen)):
+                try:
+                    recent.append(_completion(json.loads(item.read_bytes())))
+                except (OSError, ValueError, AttributeError):
+                    continue
+        
+        with self._lock:
+            self._pending = pending
+            self._approvals = approvals
+            if completed:
+                self._completed_count = completed_count
+                self._recent.clear()
+                self._recent.extend(recent)
+    
+    def claimed(self, task: Dict[str, Any]) -> None:
+        """A task moved inbox/ → pending/."""
+        with self._lock:
+            self._pending[task.get("task_id")] = _summary(task)
+    
+    def approval_requested(self, task: Dict[str, Any]) -> None:
+        """A task moved pending/ → approvals/."""
+        with self._lock:
+            self._pending.pop(task.get("task_id"), None)
+            self._approvals.add(task.get("task_id"))
+    
+    def approved(self, task_id: str) -> None:
+        """An approved task left approvals/ for inbox/."""
+        with self._lock:
+            self._approvals.discard(task_id)
+    
+    def completed(self, task: Dict[str, Any]) -> None:
+        """A task was written to completed/ (from pending/ or a rejection)."""
+        with self._lock:
+            self._pending.pop(task.get("task_id"), None)
+            self._approvals.discard(task.get("task_id"))
+            self._completed_count += 1
+            self._recent.append(_completion(task))
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Current counters.
+        
+        Returns:
+            pending, approvals and completed counts, the oldest active task
+            (or None) and recent completions (newest first)
+        """
+        with self._lock:
+            active = next(iter(self._pending.values()), None)
+            return {
+                "pending": len(self._pending),
+                "approvals": len(self._approvals),
+                "completed": self._completed_count,
+                "active": dict(active) if active else None,
+                "recent": [dict(c) for c in reversed(self._recent)]
+            }
@@ -12,6 +12,7 @@ ARCHITECTURAL RULES:
 
 import os
 import json
+import threading
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Any, Optional
@@ -40,6 +41,7 @@ class RalphLoop:
         self.max_iterations = int(os.getenv("RALPH_LOOP_MAX_ITERATIONS", "50"))
         self.state_path = Path("./task_queue") / ".ralph_state.json"
         self.iteration_counts: Dict[str, int] = {}
+        self._lock = threading.RLock()  # Worker pool threads share this instance
         self.load_state()
         
         logger.info(f"Ralph Loop initialized. Max iterations: {self.max_iterations}")
@@ -57,11 +59,12 @@ class RalphLoop:
     
     def save_state(self) -> None:
         """Save iteration counts to disk."""
-        try:
-            with open(self.state_path, 'w') as f:
-                json.dump(self.iteration_counts, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save Ralph state: {e}")
+        with self._lock:
+            try:
+                with open(self.state_path, 'w') as f:
+                    json.dump(self.iteration_counts, f, indent=2)
+            except Exception as e:
+                logger.error(f"Could not save Ralph state: {e}")
     
     def track_iteration(self, task_id: str) -> int:
         """
@@ -77,8 +80,9 @@ class RalphLoop:
             RalphLoopException if max iterations exceeded
         """
         # Increment counter
-        current = self.iteration_counts.get(task_id, 0) + 1
-        self.iteration_counts[task_id] = current
+        with self._lock:
+            current = self.iteration_counts.get(task_id, 0) + 1
+            self.iteration_counts[task_id] = current
         
         logger.info(f"Task {task_id}: Iteration {current}/{self.max_iterations}")
         
@@ -104,10 +108,12 @@ class RalphLoop:
     
     def reset_task(self, task_id: str) -> None:
         """Reset iteration count for a task."""
-        if task_id in self.iteration_counts:
+        with self._lock:
+            if task_id not in self.iteration_counts:
+                return
             del self.iteration_counts[task_id]
             self.save_state()
-            logger.info(f"Reset iteration count for task {task_id}")
+        logger.info(f"Reset iteration count for task {task_id}")
     
     def get_status(self, task_id: str) -> Dict[str, Any]:
         """Get status for a task."""
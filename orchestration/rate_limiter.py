@@ -0,0 +1,118 @@
+"""
+Rate Limiter - Token Buckets for Provider Budgets
+
+ARCHITECTURAL RULES:
+1. Budgets are expressed per minute (RPM/TPM), refilled continuously
+2. Callers wait for capacity instead of triggering provider 429s
+3. Waiting never outlives the caller's deadline
+4. Thread-safe; usable from threads (acquire) and asyncio (acquire_async)
+"""
+
+import time
+import asyncio
+import threading
+from typing import Optional
+import logging
+
+logger = logging.getLogger("rate_limiter")
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when a request cannot start before its deadline."""
+    pass
+
+
+class TokenBucket:
+    """
+    Continuous-refill token bucket.
+    
+    capacity tokens are available at once; they refill at
+    capacity / period seconds. A capacity of 0 means unlimited.
+    """
+    
+    def __init__(self, capacity: float, period: float = 60.0, name: str = "bucket"):
+        self.capacity = capacity
+        self.rate = capacity / period if capacity else 0.0
+        self.name = name
+        
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = time.monotonic()
+    
+    @classmethod
+    def per_minute(cls, budget: float, name: str = "bucket", burst_seconds: float = 60.0) -> "TokenBucket":
+        """
+        Bucket for a per-minute budget (e.g. provider RPM or TPM).
+        
+        Args:
+            budget: Tokens per minute (0 = unlimited)
+            name: Label for logs and errors
+            burst_seconds: How many seconds' worth of budget may be spent at once.
+                Providers enforce limits over short intervals too, so a
+                60 RPM budget is safest spent as 1 request/second (burst_seconds=1)
+        """
+        return cls(budget * burst_seconds / 60.0, burst_seconds, name)
+    
+    def reserve(self, amount: float = 1.0) -> float:
+        """
+        Take `amount` tokens now if available.
+        
+        Returns:
+            0.0 if granted, otherwise seconds until it could be granted
+            (nothing is taken)
+        """
+        if not self.capacity:
+            return 0.0
+        
+        # Requests larger than the bucket go through once it is full and
+        # leave the bucket in debt, so the long-run rate still holds
+        needed = min(amount, self.capacity)
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            if self._tokens >= needed:
+                self._tokens -= amount
+                return 0.0
+            return (needed - self._tokens) / self.rate
+    
+    def adjust(self, delta: float) -> None:
+        """Return (positive) or charge (negative) tokens after the fact."""
+        if not self.capacity:
+            return
+        
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + delta)
+    
+    def acquire(self, amount: float = 1.0, deadline: Optional[float] = None) -> None:
+        """
+        Block until `amount` tokens are taken.
+        
+        Args:
+            amount: Tokens to take
+            deadline: time.monotonic() value to give up at
+        
+        Raises:
+            DeadlineExceeded if the tokens would only be available after the deadline
+        """
+        while True:
+            wait = self.reserve(amount)
+            if not wait:
+                return
+            self._check_deadline(wait, deadline)
+            time.sleep(wait)
+    
+    async def acquire_async(self, amount: float = 1.0, deadline: Optional[float] = None) -> None:
+        """asyncio version of acquire()."""
+        while True:
+            wait = self.reserve(amount)
+            if not wait:
+                return
+            self._check_deadline(wait, deadline)
+            await asyncio.sleep(wait)
+    
+    def _check_deadline(self, wait: float, deadline: Optional[float]) -> None:
+        if deadline is not None and time.monotonic() + wait > deadline:
+            raise DeadlineExceeded(f"{self.name}: no capacity before deadline (needs {wait:.2f}s)")
@@ -0,0 +1,361 @@
+"""
+Reasoning Cache - Reuse LLM Plans for Repeated Tasks
+
+ARCHITECTURAL RULES:
+1. Key = normalized hash of (task type, trigger, skills digest, context digest, task payload)
+2. Only the task envelope (task_id, created_at, status...) is dropped from
+   the key; the task content is hashed verbatim
+3. Entries expire after a TTL and are evicted least-recently-used
+4. Only successful plans are stored (never errors)
+5. A hit whose plan has actions, and every near-duplicate (semantic) hit,
+   goes to HITL approval
+6. Persisted to task_queue/ as an append-only JSON-lines log (compacted
+   when it outgrows the cache) so restarts keep the cache
+7. Embeddings are computed outside the lock
+"""
+
+import os
+import json
+import time
+import math
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger("reasoning_cache")
+
+# Envelope fields that differ between otherwise identical tasks
+VOLATILE_FIELDS = {"task_id", "created_at", "claimed_at", "status", "required_skills", "reasoning_result"}
+
+EMBEDDING_DIMENSIONS = 256
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def normalize_payload(task: Dict[str, Any]) -> str:
+    """
+    Canonical text of everything in a task that can change its plan.
+    
+    Only the envelope fields are dropped; content is kept verbatim (a
+    date, amount or name in the instructions is part of what the plan
+    acts on).
+    """
+    payload = {k: v for k, v in task.items() if k not in VOLATILE_FIELDS}
+    return json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def hashing_embedding(text: str) -> List[float]:
+    """
+    Dependency-free embedding: hashed character trigrams, L2-normalized.
+    
+    Good enough to spot template-generated near-duplicates (same
+    instructions, different project name); not a semantic model.
+    """
+    vector = [0.0] * EMBEDDING_DIMENSIONS
+    for i in range(len(text) - 2):
+        bucket = int.from_bytes(hashlib.blake2b(text[i:i + 3].encode("utf-8"), digest_size=4).digest(), "little")
+        vector[bucket % EMBEDDING_DIMENSIONS] += 1.0
+    
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [round(v / norm, 5) for v in vector]
+
+
+def openai_embedding(text: str) -> List[float]:
+    """Embedding from the OpenAI API (requires openai and OPENAI_API_KEY)."""
+    from openai import OpenAI
+    
+    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    response = client.embeddings.create(
+        model=os.getenv("REASONING_CACHE_EMBEDDING_MODEL", "text-embedding-3-small"),
+        input=text[:8000]
+    )
+    return list(response.data[0].embedding)
+
+
+EMBEDDING_BACKENDS: Dict[str, Callable[[str], List[float]]] = {
+    "hashing": hashing_embedding,
+    "openai": openai_embedding
+}
+
+
+class ReasoningCache:
+    """
+    Persistent plan cache in front of LLMInterface.reason().
+    
+    Exact tier: identical normalized payload within the same bucket
+    (type, trigger, skills, vault context) returns the stored plan.
+    Semantic tier (optional): the most similar payload in the same bucket
+    above REASONING_CACHE_SIMILARITY returns its plan, marked for approval.
+    """
+    
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        embed: Optional[Callable[[str], List[float]]] = None
+    ):
+        self.enabled = os.getenv("REASONING_CACHE_ENABLED", "false").lower() == "true"
+        self.path = path or Path(os.getenv("REASONING_CACHE_PATH", "./task_queue/.reasoning_cache.jsonl"))
+        self.ttl_seconds = float(os.getenv("REASONING_CACHE_TTL_SECONDS", "86400"))
+        self.max_entries = int(os.getenv("REASONING_CACHE_MAX_ENTRIES", "500"))
+        self.similarity = float(os.getenv("REASONING_CACHE_SIMILARITY", "0.95"))
+        
+        # Semantic tier is off unless an embedding backend is configured
+        backend = os.getenv("REASONING_CACHE_EMBEDDINGS", "none").lower()
+        self.embed = embed or EMBEDDING_BACKENDS.get(backend)
+        
+        self._lock = threading.Lock()
+        self._log_lines = 0  # Lines in the file, compacted past 2x max_entries
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # key -> entry, LRU order
+        self._stats = {
+            "lookups": 0,
+            "exact_hits": 0,
+            "semantic_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+            "expirations": 0
+        }
+        
+        if self.enabled:
+            self._load()
+            logger.info(f"Reasoning cache enabled: {len(self._entries)} entries, TTL {self.ttl_seconds}s")
+    
+    def lookup(
+        self,
+        task: Dict[str, Any],
+        skills: Dict[str, str],
+        context: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a stored plan for this task.
+        
+        Args:
+            task: Task dict
+            skills: Agent skills the plan would be reasoned with
+            context: Vault context the plan would be reasoned with
+        
+        Returns:
+            Copy of the stored plan with usage["cache"] set to "exact" or
+            "semantic", or None on a miss (or when disabled). A plan with
+            actions always comes back with requires_approval set.
+        """
+        if not self.enabled:
+            return None
+        
+        started = time.perf_counter()
+        bucket, key, text = self._keys(task, skills, context)
+        
+        with self._lock:
+            self._stats["lookups"] += 1
+            self._expire()
+            entry = self._entries.get(key)
+            tier = "exact"
+            if entry is None:
+                candidates = [
+                    e for e in self._entries.values()
+                    if e["bucket"] == bucket and e.get("embedding")
+                ] if self.embed is not None else []
+        
+        if entry is None:
+            entry = self._nearest(text, candidates)
+            tier = "semantic"
+        
+        with self._lock:
+            # An entry evicted while the embedding was computed is a miss
+            if entry is None or entry["key"] not in self._entries:
+                self._stats["misses"] += 1
+                return None
+            
+            self._entries.move_to_end(entry["key"])
+            self._stats[f"{tier}_hits"] += 1
+            plan = json.loads(json.dumps(entry["plan"]))
+        
+        if plan.get("actions") or tier == "semantic":
+            # A reused plan was reasoned for another task: a human reviews it
+            # before anything runs
+            plan["requires_approval"] = True
+        
+        plan["usage"] = {
+            "input_tokens": 0,
+            "cached_input_tokens": 0,
+            "output_tokens": 0,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 3),
+            "cache": tier
+        }
+        
+        logger.info(f"Reasoning cache {tier} hit for {task.get('task_id')}")
+        return plan
+    
+    def store(
+        self,
+        task: Dict[str, Any],
+        skills: Dict[str, str],
+        context: Optional[str],
+        plan: Dict[str, Any]
+    ) -> None:
+        """
+        Remember a plan produced by the LLM.
+        
+        Args:
+            task: Task the plan was reasoned for
+            skills: Agent skills used
+            context: Vault context used
+            plan: Result of LLMInterface.reason() (errors are ignored)
+        """
+        if not self.enabled or plan.get("error") or plan.get("usage", {}).get("cache"):
+            return
+        
+        bucket, key, text = self._keys(task, skills, context)
+        entry = {
+            "key": key,
+            "bucket": bucket,
+            "stored_at": time.time(),
+            "plan": {k: v for k, v in plan.items() if k != "usage"}
+        }
+        if self.embed is not None:
+            try:
+                entry["embedding"] = self.embed(text)
+            except Exception as e:
+                logger.warning(f"Embedding failed, storing exact entry only: {e}")
+        
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._stats["stores"] += 1
+            
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+            
+            if self._log_lines >= 2 * self.max_entries:
+                self._save()
+            else:
+                self._append(entry)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit-rate statistics."""
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        
+        hits = stats["exact_hits"] + stats["semantic_hits"]
+        stats["hit_rate"] = round(hits / stats["lookups"], 4) if stats["lookups"] else 0.0
+        return stats
+    
+    def clear(self) -> None:
+        """Drop every entry (memory and disk)."""
+        with self._lock:
+            self._entries.clear()
+            self._save()
+    
+    def _keys(
+        self,
+        task: Dict[str, Any],
+        skills: Dict[str, str],
+        context: Optional[str]
+    ) -> Tuple[str, str, str]:
+        """(bucket, exact key, normalized payload text) for a task."""
+        skills_digest = _digest(json.dumps(sorted(skills.items())))
+        context_digest = _digest(context or "")
+        bucket = _digest("|".join([
+            str(task.get("task_type") or task.get("type") or "generic"),
+            str(task.get("trigger") or ""),
+            skills_digest,
+            context_digest
+        ]))
+        
+        text = normalize_payload(task)
+        return bucket, _digest(f"{bucket}|{text}"), text
+    
+    def _nearest(self, text: str, candidates: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Most similar candidate above the threshold (called without the lock)."""
+        if not candidates:
+            return None
+        
+        try:
+            query = self.embed(text)
+        except Exception as e:
+            logger.warning(f"Embedding failed, skipping semantic lookup: {e}")
+            return None
+        
+        best, best_score = None, self.similarity
+        for entry in candidates:
+            score = sum(a * b for a, b in zip(query, entry["embedding"]))
+            if score >= best_score:
+                best, best_score = entry, score
+        return best
+    
+    def _expire(self) -> None:
+        """Drop entries older than the TTL (lock held)."""
+        cutoff = time.time() - self.ttl_seconds
+        expired = [key for key, entry in self._entries.items() if entry["stored_at"] < cutoff]
+        for key in expired:
+            del self._entries[key]
+        self._stats["expirations"] += len(expired)
+    
+    def _load(self) -> None:
+        """Replay the log (oldest first, so LRU order and later stores win)."""
+        if not self.path.exists():
+            return
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    self._log_lines += 1
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Torn last line of a crashed append
+                    self._entries.pop(entry["key"], None)
+                    self._entries[entry["key"]] = entry
+        except Exception as e:
+            logger.warning(f"Could not load reasoning cache: {e}")
+            self._entries.clear()
+        
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Append one entry to the log (lock held)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entry) + "\n")
+            self._log_lines += 1
+        except Exception as e:
+            logger.error(f"Could not save reasoning cache: {e}")
+    
+    def _save(self) -> None:
+        """Rewrite the log with the live entries only, atomically (lock held)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in self._entries.values():
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp_path, self.path)
+            self._log_lines = len(self._entries)
+        except Exception as e:
+            logger.error(f"Could not save reasoning cache: {e}")
+
+
+# Singleton instance
+_reasoning_cache = None
+
+
+def get_reasoning_cache() -> ReasoningCache:
+    """Get singleton reasoning cache instance."""
+    global _reasoning_cache
+    
+    if _reasoning_cache is None:
+        _reasoning_cache = ReasoningCache()
+    
+    return _reasoning_cache
@@ -0,0 +1,44 @@
+"""
+Task Writer - The One Path from a Watcher to task_queue/inbox/
+
+ARCHITECTURAL RULES:
+1. Every watcher (BaseWatcher subclasses and the standalone watcher_*.py
+   classes) writes its task files through write_task()
+2. A task file appears complete or not at all: it is written to a hidden
+   temp file and renamed into place, so the orchestrator never reads a
+   half-written task (and wakes on the rename)
+3. Writing a file name that exists replaces it (an event seen twice with
+   a fixed task ID is still one task)
+4. Stateless and thread-safe: watchers hosted in one process
+   (watcher_host.py) share it without locking
+"""
+
+import os
+import json
+import uuid
+from pathlib import Path
+from typing import Any, Dict
+
+
+def write_task(inbox: Path, name: str, task: Dict[str, Any]) -> Path:
+    """
+    Atomically write a task file into an inbox.
+    
+    Args:
+        inbox: task_queue/inbox/ directory (must exist)
+        name: File name, e.g. "odoo_invoice_20250101_120000.json"
+        task: Task dict, written as indented UTF-8 JSON
+    
+    Returns:
+        Path of the task file
+    """
+    task_file = inbox / name
+    tmp_file = inbox / f".{name}.{uuid.uuid4().hex[:8]}.tmp"
+    try:
+        with open(tmp_file, "w", encoding="utf-8") as f:
+            json.dump(task, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, task_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+    return task_file
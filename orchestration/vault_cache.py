@@ -0,0 +1,103 @@
+"""
+Vault Cache - mtime-Invalidated Reads of Vault Markdown
+
+ARCHITECTURAL RULES:
+1. The vault on disk stays the source of truth (cache is in-process only)
+2. A file is re-read only when its mtime or size changes
+3. Missing files are never cached (they may appear later)
+4. Safe to share between worker threads
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+import logging
+
+logger = logging.getLogger("vault_cache")
+
+
+class VaultCache:
+    """
+    Read-through cache for Business_Goals.md, Company_Handbook.md and
+    agent_skills/*.md.
+    
+    Every read costs one stat(); the file is only opened again after an
+    edit (Obsidian, git sync) changes its mtime or size.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: Dict[str, Tuple[Tuple[int, int], str]] = {}  # path -> (signature, content)
+        self.hits = 0
+        self.misses = 0
+    
+    def read(self, path: Path) -> Optional[str]:
+        """
+        Return the file's text, or None if it does not exist.
+        
+        Args:
+            path: File to read
+        
+        Returns:
+            File content (cached until the file changes)
+        """
+        key = str(path)
+        
+        try:
+            stat = os.stat(key)
+        except FileNotFoundError:
+            with self._lock:
+                self._files.pop(key, None)
+            return None
+        
+        signature = (stat.st_mtime_ns, stat.st_size)
+        
+        with self._lock:
+            cached = self._files.get(key)
+            if cached is not None and cached[0] == signature:
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+        
+        with open(key, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        with self._lock:
+            self._files[key] = (signature, content)
+        
+        logger.debug(f"Cached {path}")
+        return content
+    
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop one file (or everything) from the cache."""
+        with self._lock:
+            if path is None:
+                self._files.clear()
+            else:
+                self._files.pop(str(path), None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "files": len(self._files),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+# Singleton instance
+_vault_cache = None
+
+
+def get_vault_cache() -> VaultCache:
+    """Get singleton vault cache instance."""
+    global _vault_cache
+    
+    if _vault_cache is None:
+        _vault_cache = VaultCache()
+    
+    return _vault_cache
@@ -0,0 +1,346 @@
+"""
+Vault Index - Persistent Change Index of Done/ for Content-Triggered Watchers
+
+ARCHITECTURAL RULES:
+1. One SQLite index (WAL) per Done/ folder, named after a hash of the
+   folder's resolved path (task_queue/.vault_index.<hash>.db), shared by
+   every watcher process of that vault: each file is recorded with its
+   mtime, size and content hash, and a change sequence number
+2. A refresh re-lists only the days whose shard or segment changed, plus
+   today's shard; every VAULT_INDEX_FULL_SCAN_SECONDS it stats all days to
+   catch edits in place. A file is read only when its mtime or size moved,
+   and counts as changed only when its hash did
+3. Markdown contents are stored with the entry when read, so watchers
+   share that one read; once every cursor has passed an entry its stored
+   content is dropped and readers fall back to the file
+4. Each watcher keeps a named cursor (last sequence number handled), so
+   after a restart it sees only what changed while it was down
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+from orchestration.completion_archive import LOOSE, ArchivedItem, CompletionArchive
+
+logger = logging.getLogger("vault_index")
+
+TEXT_SUFFIXES = {".md", ".txt", ".json"}
+
+PAGE_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    key TEXT PRIMARY KEY,
+    day TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS files_seq ON files (seq);
+CREATE TABLE IF NOT EXISTS days (day TEXT PRIMARY KEY, signature TEXT);
+CREATE TABLE IF NOT EXISTS cursors (name TEXT PRIMARY KEY, seq INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value REAL NOT NULL);
+"""
+
+
+class IndexedFile:
+    """A Done/ file as recorded in the index (ArchivedItem-compatible reads)."""
+    
+    __slots__ = ("name", "day", "mtime", "size", "hash", "seq", "_content", "_index")
+    
+    def __init__(self, index: "VaultIndex", name: str, day: str, mtime: float, size: int, hash: str, seq: int,
+                 content: Optional[str]):
+        self._index = index
+        self.name = name
+        self.day = day
+        self.mtime = mtime
+        self.size = size
+        self.hash = hash
+        self.seq = seq
+        self._content = content
+    
+    @property
+    def stem(self) -> str:
+        return Path(self.name).stem
+    
+    @property
+    def suffix(self) -> str:
+        return Path(self.name).suffix
+    
+    @property
+    def path(self) -> Path:
+        root = self._index.archive.root
+        return root / self.name if self.day == LOOSE else root / self.day / self.name
+    
+    def read_bytes(self) -> bytes:
+        if self._content is not None:
+            return self._content.encode('utf-8')
+        return self._index.read_file(self.day, self.name)
+    
+    def read_text(self, encoding: str = 'utf-8') -> str:
+        if self._content is not None:
+            return self._content
+        return self.read_bytes().decode(encoding)
+    
+    def __str__(self) -> str:
+        return str(self.path)
+    
+    def __repr__(self) -> str:
+        return f"IndexedFile({self.name!r}, day={self.day!r}, seq={self.seq})"
+
+
+class VaultIndex:
+    """
+    Change index over a CompletionArchive (the vault's Done/ folder).
+    
+    Usage:
+        index = get_vault_index(vault_path / 'Done')
+        cursor = IndexCursor(index, 'odoo_watcher')
+        for item in cursor.new_entries():
+            ...item.read_text()...
+        cursor.commit()
+    """
+    
+    def __init__(self, done_root: Path, db_path: Optional[Path] = None):
+        """
+        Args:
+            done_root: Done/ folder (date-sharded or flat)
+            db_path: Index database (default: .vault_index.<root hash>.db in
+                VAULT_INDEX_DIR, so vaults never share one)
+        """
+        self.archive = CompletionArchive(done_root)
+        if db_path is None:
+            root_hash = hashlib.sha256(str(Path(done_root).resolve()).encode("utf-8")).hexdigest()[:16]
+            db_path = Path(os.getenv("VAULT_INDEX_DIR", "./task_queue")) / f".vault_index.{root_hash}.db"
+        self.db_path = Path(db_path)
+        self.refresh_seconds = float(os.getenv("VAULT_INDEX_REFRESH_SECONDS", "10"))
+        self.full_scan_seconds = float(os.getenv("VAULT_INDEX_FULL_SCAN_SECONDS", "3600"))
+        
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+        self.stats = {"refreshes": 0, "days_listed": 0, "files_read": 0, "changes": 0}
+        
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None, timeout=30)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+    
+    def refresh(self, max_age: float = 0.0) -> int:
+        """
+        Bring the index up to date with Done/.
+        
+        Args:
+            max_age: Skip the refresh if this process refreshed less than
+                max_age seconds ago (watchers sharing a cycle scan once)
+        
+        Returns:
+            Number of new or changed files recorded
+        """
+        with self._lock:
+            if max_age and time.monotonic() - self._last_refresh < max_age:
+                return 0
+            
+            signatures = self.archive.day_signatures()
+            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+            now = time.time()
+            
+            # Serialises refreshes across watcher processes
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                full_scan = now - self._meta("last_full_scan") >= self.full_scan_seconds
+                stored = dict(self._db.execute("SELECT day, signature FROM days").fetchall())
+                
+                changed = 0
+                for day, signature in signatures.items():
+                    encoded = None if signature is None else ",".join(map(str, signature))
+                    if not full_scan and day < today and day != LOOSE and stored.get(day) == encoded and day in stored:
+                        continue
+                    changed += self._refresh_day(day, self.archive.read_day(day))
+                    self._db.execute("INSERT OR REPLACE INTO days (day, signature) VALUES (?, ?)", (day, encoded))
+                
+                for day in stored.keys() - signatures.keys():
+                    self._db.execute("DELETE FROM files WHERE day = ?", (day,))
+                    self._db.execute("DELETE FROM days WHERE day = ?", (day,))
+                
+                if full_scan:
+                    self._set_meta("last_full_scan", now)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            
+            self._last_refresh = time.monotonic()
+            self.stats["refreshes"] += 1
+            self.stats["changes"] += changed
+        
+        if changed:
+            logger.info(f"Vault index: {changed} new or changed files in {self.archive.root}")
+        return changed
+    
+    def changes(self, since: int) -> Iterator[IndexedFile]:
+        """Files changed after sequence number `since`, oldest change first (paged)."""
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT name, day, mtime, size, hash, seq, content FROM files "
+                    "WHERE seq > ? ORDER BY seq LIMIT ?", (since, PAGE_SIZE)
+                ).fetchall()
+            for row in rows:
+                yield IndexedFile(self, *row)
+            if len(rows) < PAGE_SIZE:
+                return
+            since = rows[-1][5]
+    
+    def last_seq(self) -> int:
+        with self._lock:
+            return int(self._meta("last_seq"))
+    
+    def register_cursor(self, name: str) -> int:
+        """Make a cursor known (stored contents are kept for it); returns its position."""
+        with self._lock:
+            self._db.execute("INSERT OR IGNORE INTO cursors (name, seq) VALUES (?, 0)", (name,))
+            return self._db.execute("SELECT seq FROM cursors WHERE name = ?", (name,)).fetchone()[0]
+    
+    def commit_cursor(self, name: str, seq: int) -> None:
+        """Save a watcher's cursor; drop stored contents every cursor has passed."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                self._db.execute("INSERT OR REPLACE INTO cursors (name, seq) VALUES (?, ?)", (name, seq))
+                oldest = self._db.execute("SELECT MIN(seq) FROM cursors").fetchone()[0]
+                pruned = int(self._meta("pruned_seq"))
+                if oldest > pruned:
+                    self._db.execute(
+                        "UPDATE files SET content = NULL WHERE seq > ? AND seq <= ? AND content IS NOT NULL",
+                        (pruned, oldest)
+                    )
+                    self._set_meta("pruned_seq", oldest)
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+    
+    def read_file(self, day: str, name: str) -> bytes:
+        """Contents of a file whose stored copy was dropped (shard file or segment entry)."""
+        path = self.archive.root / name if day == LOOSE else self.archive.root / day / name
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            for item in self.archive.read_day(day):
+                if item.name == name:
+                    return item.read_bytes()
+            raise
+    
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+    
+    def _refresh_day(self, day: str, items: List[ArchivedItem]) -> int:
+        """Record one day's files (transaction and lock held); returns changes."""
+        self.stats["days_listed"] += 1
+        stored: Dict[str, Tuple[float, int, str]] = {
+            row[0]: (row[1], row[2], row[3])
+            for row in self._db.execute("SELECT name, mtime, size, hash FROM files WHERE day = ?", (day,))
+        }
+        
+        changed = 0
+        for item in sorted(items, key=lambda item: (item.mtime, item.name)):
+            previous = stored.pop(item.name, None)
+            if previous is not None and previous[0] == item.mtime and previous[1] == item.size:
+                continue
+            
+            try:
+                data = item.read_bytes()
+            except FileNotFoundError:
+                continue  # Moved away while listing; the next refresh sees where
+            self.stats["files_read"] += 1
+            digest = hashlib.sha256(data).hexdigest()
+            
+            if previous is not None and previous[2] == digest:
+                # Touched, not changed
+                self._db.execute(
+                    "UPDATE files SET mtime = ?, size = ? WHERE key = ?", (item.mtime, len(data), _key(day, item.name))
+                )
+                continue
+            
+            content = None
+            if item.suffix in TEXT_SUFFIXES:
+                try:
+                    content = data.decode('utf-8')
+                except UnicodeDecodeError:
+                    pass
+            seq = int(self._meta("last_seq")) + 1
+            self._set_meta("last_seq", seq)
+            self._db.execute(
+                "INSERT OR REPLACE INTO files (key, day, name, mtime, size, hash, seq, content) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (_key(day, item.name), day, item.name, item.mtime, len(data), digest, seq, content)
+            )
+            changed += 1
+        
+        # Gone from Done/ (deleted or compacted away)
+        for name in stored:
+            self._db.execute("DELETE FROM files WHERE key = ?", (_key(day, name),))
+        return changed
+    
+    def _meta(self, key: str) -> float:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else 0.0
+    
+    def _set_meta(self, key: str, value: float) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+
+class IndexCursor:
+    """
+    "New or changed since the last check" reads for polling watchers.
+    
+    Same contract as ArchiveCursor: commit() after the entries were
+    handled; until then the next check sees them again. The position is
+    persisted, so a restarted watcher does not read everything again.
+    """
+    
+    def __init__(self, index: "VaultIndex", name: str):
+        self.index = index
+        self.name = name
+        self.seq = index.register_cursor(name)
+        self._next: Optional[int] = None
+    
+    def new_entries(self) -> Iterator[IndexedFile]:
+        self.index.refresh(max_age=self.index.refresh_seconds)
+        self._next = self.index.last_seq()
+        return (item for item in self.index.changes(self.seq) if item.seq <= self._next)
+    
+    def commit(self) -> None:
+        if self._next is not None and self._next != self.seq:
+            self.seq = self._next
+            self.index.commit_cursor(self.name, self.seq)
+
+
+def _key(day: str, name: str) -> str:
+    return name if day == LOOSE else f"{day}/{name}"
+
+
+# One index per Done/ folder, shared by the watchers of a process
+_vault_indexes: Dict[str, VaultIndex] = {}
+
+
+def get_vault_index(done_root: Path) -> VaultIndex:
+    """Get the shared index of a Done/ folder."""
+    key = str(Path(done_root).resolve())
+    
+    if key not in _vault_indexes:
+        _vault_indexes[key] = VaultIndex(Path(done_root))
+    
+    return _vault_indexes[key]
@@ -32,6 +32,8 @@ load_dotenv()
 
 # Import ActionExecutor
 from action_executor import ActionExecutor
+from orchestration.activity_log import get_activity_log
+from orchestration.completion_archive import CompletionArchive
 
 # Setup logging
 logging.basicConfig(
@@ -44,11 +46,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Entries kept in Dashboard.md's Recent Tasks section
+RECENT_DASHBOARD_TASKS = 20
+
 class Orchestrator:
     """Main orchestration engine for AI Employee"""
     
-    def __init__(self, vault_path: str = "./obsidian_vault"):
+    def __init__(self, vault_path: str = "./obsidian_vault", tenant_id: Optional[str] = None):
         self.vault_path = Path(vault_path)
+        self.tenant_id = tenant_id
         self.needs_action = self.vault_path / "Needs_Action"
         self.plans = self.vault_path / "Plans"
         self.done = self.vault_path / "Done"
@@ -71,8 +77,14 @@ class Orchestrator:
                        self.logs, self.in_progress, self.briefings]:
             folder.mkdir(parents=True, exist_ok=True)
         
-        # Initialize ActionExecutor
-        self.action_executor = ActionExecutor(self.vault_path)
+        # Initialize ActionExecutor (a tenant's MCP clients use secrets/<tenant_id>/)
+        self.action_executor = ActionExecutor(self.vault_path, tenant_id=tenant_id)
+        
+        # Append-only daily activity log (shared with ActionExecutor)
+        self.activity_log = get_activity_log(self.logs)
+        
+        # /Done is sharded by day: /Done/YYYY-MM-DD/<task>.md
+        self.done_archive = CompletionArchive(self.done)
         
         logger.info(f"Orchestrator initialized with vault: {self.vault_path}")
     
@@ -270,29 +282,38 @@ status: completed
     def _update_dashboard_with_task(self, task_id: str, status: str):
         """
         Update Dashboard.md with task status
+        
+        The Recent Tasks section keeps the newest RECENT_DASHBOARD_TASKS
+        entries (it used to grow by one line per task forever), and the file
+        is replaced atomically so a reader never sees it half-written.
         """
         try:
             dashboard_path = self.vault_path / "Dashboard.md"
             
             # Create simple dashboard entry
-            entry = f"\n- [{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')}] Task `{task_id}`: {status}\n"
+            entry = f"- [{datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M')}] Task `{task_id}`: {status}"
             
             if dashboard_path.exists():
                 content = dashboard_path.read_text(encoding='utf-8')
-                # Append to recent tasks section or create it
-                if "## Recent Tasks" in content:
-                    content = content.replace("## Recent Tasks", f"## Recent Tasks{entry}")
-                else:
-                    content += f"\n## Recent Tasks{entry}"
             else:
                 content = f"""# AI Employee Dashboard
 
 Last Updated: {datetime.now(timezone.utc).isoformat()}
-
-## Recent Tasks{entry}
 """
             
-            dashboard_path.write_text(content, encoding='utf-8')
+            # Split out the Recent Tasks section (newest entry first)
+            head, found, section = content.partition("## Recent Tasks")
+            section, next_heading, tail = section.partition("\n## ")
+            entries = [line for line in section.splitlines() if line.startswith("- [")] if found else []
+            entries = [entry] + entries[:RECENT_DASHBOARD_TASKS - 1]
+            
+            content = head.rstrip("\n") + "\n\n## Recent Tasks\n" + "\n".join(entries) + "\n"
+            if next_heading:
+                content += "\n## " + tail
+            
+            tmp_path = dashboard_path.with_name(f".{dashboard_path.name}.tmp")
+            tmp_path.write_text(content, encoding='utf-8')
+            os.replace(tmp_path, dashboard_path)
             logger.info(f"Updated Dashboard with task {task_id}")
             
         except Exception as e:
@@ -307,8 +328,7 @@ Last Updated: {datetime.now(timezone.utc).isoformat()}
             try:
                 self.execute_approved_action(approved_file)
                 # Move to /Done after execution
-                dest = self.done / approved_file.name
-                approved_file.rename(dest)
+                self.done_archive.move_in(approved_file)
                 logger.info(f"Executed and archived approved action: {approved_file.name}")
             except Exception as e:
                 logger.error(f"Failed to execute approved action {approved_file.name}: {e}")
@@ -316,8 +336,7 @@ Last Updated: {datetime.now(timezone.utc).isoformat()}
         # Process rejections
         for rejected_file in self.rejected.glob("*.md"):
             self.log_rejection(rejected_file)
-            dest = self.done / rejected_file.name
-            rejected_file.rename(dest)
+            self.done_archive.move_in(rejected_file)
             logger.info(f"Logged rejection: {rejected_file.name}")
     
     def execute_approved_action(self, approval_file: Path):
@@ -502,39 +521,12 @@ Last Updated: {datetime.now(timezone.utc).isoformat()}
             return None
     
     def log_action(self, action_data: Dict):
-        """Write action to /Logs/YYYY-MM-DD.json (audit trail)"""
+        """Append action to /Logs/YYYY-MM-DD.jsonl (audit trail)"""
         try:
-            today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-            log_file = self.logs / f"{today}.json"
-            
-            log_entry = {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                **action_data
-            }
-            
-            # Append to daily log file
-            try:
-                if log_file.exists():
-                    logs = json.loads(log_file.read_text(encoding='utf-8'))
-                else:
-                    logs = []
-            except json.JSONDecodeError as e:
-                logger.error(f"Corrupted log file {log_file}, starting fresh: {e}")
-                logs = []
-            except Exception as e:
-                logger.error(f"Error reading log file {log_file}: {e}")
-                logs = []
-            
-            logs.append(log_entry)
-            
-            try:
-                log_file.write_text(json.dumps(logs, indent=2, ensure_ascii=False), encoding='utf-8')
-                logger.debug(f"Action logged to {log_file}")
-            except Exception as e:
-                logger.error(f"Failed to write to log file {log_file}: {e}")
-                
+            self.activity_log.append(action_data)
+            logger.debug(f"Action logged to {self.logs}")
         except Exception as e:
-            logger.error(f"Unexpected error in log_action: {e}")
+            logger.error(f"Failed to write to activity log in {self.logs}: {e}")
     
     def generate_ceo_briefing(self):
         """
@@ -548,9 +540,9 @@ Last Updated: {datetime.now(timezone.utc).isoformat()}
 Generate the Monday Morning CEO Briefing for this week.
 
 Instructions:
-1. Read all files in /Done from the past 7 days
+1. Read all files in the /Done/YYYY-MM-DD/ folders of the past 7 days
 2. Check /Accounting/*.md for financial transactions
-3. Review /Logs/*.json for activity metrics
+3. Review /Logs/*.jsonl for activity metrics (one JSON entry per line)
 4. Compare against Business_Goals.md objectives
 5. Create /Briefings/YYYY-MM-DD_Monday_Briefing.md with:
    - Executive Summary
@@ -610,9 +602,8 @@ Use the CEO Briefing template from planning_skills.md.
                 if result["status"] == "complete":
                     # Move to /Done on successful completion
                     try:
-                        dest = self.done / claimed_task.name
                         if claimed_task.exists():
-                            claimed_task.rename(dest)
+                            self.done_archive.move_in(claimed_task)
                             logger.info(f"Task {claimed_task.name} moved to Done")
                         else:
                             logger.warning(f"Task file {claimed_task.name} disappeared before archiving")
@@ -633,6 +624,9 @@ Use the CEO Briefing template from planning_skills.md.
         # Schedule Monday Morning CEO Briefing (every Monday at 7 AM)
         schedule.every().monday.at("07:00").do(self.generate_ceo_briefing)
         
+        # Pack old /Done shards (no-op unless ARCHIVE_COMPACT_DAYS is set)
+        schedule.every().day.at("03:00").do(self.done_archive.compact)
+        
         # Main loop: check for tasks every 30 seconds
         while True:
             try:
@@ -648,5 +642,14 @@ Use the CEO Briefing template from planning_skills.md.
 
 
 if __name__ == "__main__":
-    orchestrator = Orchestrator()
+    tenant_id = os.getenv("TENANT_ID")
+    if tenant_id:
+        # Platinum: run on the tenant's vault with the tenant's credentials
+        from platinum.tenant_manager import TenantManager
+        tenant = TenantManager().get_tenant(tenant_id)
+        if tenant is None:
+            raise SystemExit(f"Unknown tenant: {tenant_id} (see platinum/tenants.json)")
+        orchestrator = Orchestrator(tenant["vault_path"], tenant_id=tenant_id)
+    else:
+        orchestrator = Orchestrator()
     orchestrator.start()
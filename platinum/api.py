@@ -14,7 +14,7 @@ import json
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from platinum.tenant_manager import TenantManager
-from platinum.compliance_logger import ComplianceLogger
+from platinum.compliance_logger import get_compliance_logger
 
 app = FastAPI(
     title="Personal AI Employee API",
@@ -149,7 +149,7 @@ source: api
     task_file.write_text(task_content, encoding='utf-8')
     
     # Log to compliance
-    compliance = ComplianceLogger(tenant_id)
+    compliance = get_compliance_logger(tenant_id)
     compliance.log_action(
         action="task_created_via_api",
         details={"task_id": task_id, "title": task.title},
@@ -171,7 +171,7 @@ def get_audit_trail(
 ):
     """Get audit trail for tenant"""
     try:
-        compliance = ComplianceLogger(tenant_id)
+        compliance = get_compliance_logger(tenant_id)
         entries = compliance.get_audit_trail(start_date, end_date)
         return {
             "tenant_id": tenant_id,
@@ -192,7 +192,7 @@ def get_compliance_report(
 ):
     """Generate SOC2 compliance report"""
     try:
-        compliance = ComplianceLogger(tenant_id)
+        compliance = get_compliance_logger(tenant_id)
         report = compliance.generate_compliance_report(start_date, end_date)
         return report
     except Exception as e:
@@ -4,14 +4,25 @@ Immutable, cryptographically signed audit trails
 """
 
 import os
+import sys
 import json
 import hashlib
 import hmac
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows: writers are only serialized within a process
+    fcntl = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from orchestration.log_verifier import LogVerifier, read_last_line
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -33,8 +44,17 @@ class ComplianceLogger:
         # In production, use AWS KMS or HSM-stored keys
         self.signing_key = os.getenv('AUDIT_SIGNING_KEY', f'default-key-{tenant_id}').encode('utf-8')
         
+        # Chain head: last hash and the (file, size) it was read from or
+        # written at. A different size means another writer appended.
+        self._lock = threading.Lock()
+        self._head_file: Optional[Path] = None
+        self._head_size = 0
+        
         # Track last log hash for chain verification
         self.last_hash = self._get_last_log_hash()
+        
+        # Parallel verification with signed per-day checkpoints
+        self.verifier = LogVerifier("compliance", self.signing_key, self.log_dir / "verify_checkpoints.jsonl")
     
     def _get_log_file_path(self) -> Path:
         """Get today's log file path"""
@@ -44,20 +64,39 @@ class ComplianceLogger:
     def _get_last_log_hash(self) -> str:
         """Get hash of last log entry for chain verification"""
         log_file = self._get_log_file_path()
+        size = log_file.stat().st_size if log_file.exists() else 0
+        last_hash, _ = self._recover_head(log_file, size)
+        return last_hash
+    
+    def _recover_head(self, log_file: Path, size: int) -> Tuple[str, bool]:
+        """
+        Read the chain head from the end of the log (O(1) in file size)
         
-        if not log_file.exists():
-            return "0" * 64  # Genesis hash
-        
-        try:
-            with open(log_file, 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    last_entry = json.loads(lines[-1])
-                    return last_entry.get('chain_hash', "0" * 64)
-        except Exception:
-            pass
-        
-        return "0" * 64
+        An empty or missing day continues the chain from the latest earlier
+        day, so chains stay linked across day rollovers.
+        
+        Returns:
+            (last chain hash, whether the file ends in a partial line)
+        """
+        source = log_file
+        if size == 0:
+            earlier = [f for f in sorted(self.log_dir.glob("compliance_audit_*.jsonl")) if f.name < log_file.name]
+            source = earlier[-1] if earlier else None
+        
+        last_hash = "0" * 64  # Genesis hash
+        partial = False
+        if source is not None:
+            try:
+                line, complete = read_last_line(source)
+                partial = source == log_file and complete != size
+                if line:
+                    last_hash = json.loads(line).get('chain_hash', last_hash)
+            except Exception as e:
+                logger.warning(f"Could not read chain head from {source.name}: {e}")
+        
+        self._head_file = log_file
+        self._head_size = -1 if partial else size  # A partial line is dealt with on the next write
+        return last_hash, partial
     
     def _compute_signature(self, log_entry: Dict) -> str:
         """Compute HMAC-SHA256 signature of log entry"""
@@ -89,31 +128,48 @@ class ComplianceLogger:
             details: Action-specific details
             risk_level: 'low', 'medium', 'high', 'critical'
         """
-        # Create log entry
-        log_entry = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "tenant_id": self.tenant_id,
-            "action": action,
-            "risk_level": risk_level,
-            "details": details,
-            "previous_hash": self.last_hash
-        }
-        
-        # Compute signature
-        signature = self._compute_signature(log_entry)
-        log_entry["signature"] = signature
-        
-        # Compute chain hash
-        chain_hash = self._compute_chain_hash(log_entry, self.last_hash)
-        log_entry["chain_hash"] = chain_hash
-        
-        # Append to log file (immutable append-only)
-        log_file = self._get_log_file_path()
-        with open(log_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(log_entry) + "\n")
-        
-        # Update last hash
-        self.last_hash = chain_hash
+        with self._lock:
+            log_file = self._get_log_file_path()
+            with open(log_file, 'ab') as f:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)  # Other processes writing this tenant's log
+                try:
+                    size = f.seek(0, os.SEEK_END)
+                    prefix = b""
+                    if (log_file, size) != (self._head_file, self._head_size):
+                        # Another writer appended, or the day rolled over
+                        self.last_hash, partial = self._recover_head(log_file, size)
+                        prefix = b"\n" if partial else b""  # Never extend a half-written line
+                    
+                    # Create log entry
+                    log_entry = {
+                        "timestamp": datetime.utcnow().isoformat() + "Z",
+                        "tenant_id": self.tenant_id,
+                        "action": action,
+                        "risk_level": risk_level,
+                        "details": details,
+                        "previous_hash": self.last_hash
+                    }
+                    
+                    # Compute signature
+                    signature = self._compute_signature(log_entry)
+                    log_entry["signature"] = signature
+                    
+                    # Compute chain hash
+                    chain_hash = self._compute_chain_hash(log_entry, self.last_hash)
+                    log_entry["chain_hash"] = chain_hash
+                    
+                    # Append to log file (immutable append-only)
+                    line = prefix + (json.dumps(log_entry) + "\n").encode('utf-8')
+                    f.write(line)
+                    f.flush()
+                    
+                    # Update last hash
+                    self.last_hash = chain_hash
+                    self._head_size = size + len(line)
+                finally:
+                    if fcntl:
+                        fcntl.flock(f, fcntl.LOCK_UN)
         
         logger.info(f"📝 Audit log: {action} (risk: {risk_level})")
     
@@ -140,58 +196,78 @@ class ComplianceLogger:
         
         logger.info(f"🔍 Verifying log integrity: {log_file}")
         
-        with open(log_file, 'r') as f:
-            lines = f.readlines()
+        # A chain that ran past midnight starts the day from the day before
+        earlier = [f for f in self._log_files() if f.name < log_file.name]
+        report = self.verifier.verify([log_file], previous_file=earlier[-1] if earlier else None, full=True)[log_file.name]
+        
+        result = self._summarize({log_file.name: report})
+        result["merkle_root"] = report["root"]
+        return result
+    
+    def verify_all_logs(self, full: bool = False) -> Dict:
+        """
+        Verify the tenant's whole retention period
         
-        verified = 0
+        Days verified clean before are checkpointed (signed Merkle roots), so
+        only entries appended since the last run are read unless full=True.
+        
+        Args:
+            full: Re-verify every day from the start
+        
+        Returns:
+            Dict with verification results
+        """
+        log_files = self._log_files()
+        if not log_files:
+            return {"status": "no_logs", "message": "No log files found"}
+        
+        logger.info(f"🔍 Verifying {len(log_files)} days of logs for {self.tenant_id}")
+        
+        reports = self.verifier.verify(log_files, full=full)
+        result = self._summarize(reports)
+        result["days"] = len(log_files)
+        result["checked_entries"] = sum(report["checked"] for report in reports.values())
+        result["resumed_days"] = sum(1 for report in reports.values() if report["resumed"])
+        return result
+    
+    def _log_files(self) -> List[Path]:
+        return sorted(self.log_dir.glob("compliance_audit_*.jsonl"))
+    
+    def _summarize(self, reports: Dict[str, Dict]) -> Dict:
+        """Verification result in the verify_log_integrity() format"""
+        total = 0
         tampered = []
         chain_broken = []
+        multi_day = len(reports) > 1
         
-        previous_hash = "0" * 64  # Genesis hash
-        
-        for i, line in enumerate(lines, 1):
-            try:
-                entry = json.loads(line)
+        for name, report in reports.items():
+            total += report["entries"]
+            for failure in report["failures"]:
+                detail = {"file": name} if multi_day else {}
+                detail["line"] = failure["line"]
                 
-                # Verify signature
-                signature = entry.pop('signature')
-                chain_hash = entry.pop('chain_hash')
-                
-                # Recompute signature
-                expected_signature = self._compute_signature(entry)
-                
-                if signature != expected_signature:
-                    tampered.append({
-                        "line": i,
-                        "timestamp": entry.get('timestamp'),
-                        "action": entry.get('action')
-                    })
-                    logger.error(f"❌ Tampered entry at line {i}")
-                
-                # Verify chain
-                if entry.get('previous_hash') != previous_hash:
-                    chain_broken.append({
-                        "line": i,
-                        "expected_previous": previous_hash,
-                        "actual_previous": entry.get('previous_hash')
-                    })
-                    logger.error(f"❌ Chain broken at line {i}")
-                
-                # Verify chain hash
-                expected_chain_hash = self._compute_chain_hash(entry, previous_hash)
-                if chain_hash != expected_chain_hash:
-                    logger.error(f"❌ Chain hash mismatch at line {i}")
-                
-                verified += 1
-                previous_hash = chain_hash
-                
-            except Exception as e:
-                logger.error(f"❌ Error verifying line {i}: {e}")
-        
+                if failure["kind"] == "chain_link":
+                    detail.update(expected_previous=failure["expected_previous"], actual_previous=failure["actual_previous"])
+                    chain_broken.append(detail)
+                    logger.error(f"❌ Chain broken at {name} line {failure['line']}")
+                elif failure["kind"] == "chain_hash":
+                    detail["error"] = "chain_hash_mismatch"
+                    chain_broken.append(detail)
+                    logger.error(f"❌ Chain hash mismatch at {name} line {failure['line']}")
+                elif failure["kind"] == "signature":
+                    detail.update(timestamp=failure.get("timestamp"), action=failure.get("action"))
+                    tampered.append(detail)
+                    logger.error(f"❌ Tampered entry at {name} line {failure['line']}")
+                else:
+                    detail["error"] = failure["error"]
+                    tampered.append(detail)
+                    logger.error(f"❌ Error verifying {name} line {failure['line']}: {failure['error']}")
+        
+        unreadable = sum(1 for detail in tampered if detail["line"] and "error" in detail)
         result = {
             "status": "verified" if not tampered and not chain_broken else "compromised",
-            "total_entries": len(lines),
-            "verified_entries": verified,
+            "total_entries": total,
+            "verified_entries": total - unreadable,
             "tampered_entries": len(tampered),
             "chain_breaks": len(chain_broken),
             "tampered_details": tampered if tampered else None,
@@ -199,7 +275,7 @@ class ComplianceLogger:
         }
         
         if result["status"] == "verified":
-            logger.info(f"✅ Log integrity verified: {verified} entries")
+            logger.info(f"✅ Log integrity verified: {total} entries")
         else:
             logger.error(f"❌ Log integrity compromised: {len(tampered)} tampered, {len(chain_broken)} breaks")
         
@@ -295,6 +371,20 @@ class ComplianceLogger:
         return report
 
 
+# Per-tenant loggers, so the chain head is recovered once per process
+_compliance_loggers: Dict[str, ComplianceLogger] = {}
+_compliance_loggers_lock = threading.Lock()
+
+
+def get_compliance_logger(tenant_id: str) -> ComplianceLogger:
+    """Get or create the tenant's ComplianceLogger"""
+    with _compliance_loggers_lock:
+        compliance = _compliance_loggers.get(tenant_id)
+        if compliance is None:
+            compliance = _compliance_loggers[tenant_id] = ComplianceLogger(tenant_id)
+        return compliance
+
+
 # Example usage
 if __name__ == "__main__":
     logger.info("Testing Compliance Logger...")
@@ -12,8 +12,10 @@ from datetime import datetime
 
 # Add paths
 sys.path.append(str(Path(__file__).parent))
+sys.path.append(str(Path(__file__).parent.parent / "mcp_servers"))
 
 from orchestration.orchestrator import Orchestrator
+from social_scheduler import get_social_scheduler
 
 logger = logging.getLogger(__name__)
 
@@ -141,11 +143,17 @@ class PlatinumOrchestrator(Orchestrator):
             # TODO: Implement token refresh logic
             return False
         
-        # Rate limiting
+        # Rate limiting: wait until the platform's posting budget frees up
         if 'rate limit' in error_str or '429' in error_str:
-            logger.info("🔧 Rate limit detected, increasing backoff...")
+            platform = action.get('platform')
+            if not platform:
+                return False  # No budget to consult, use exponential backoff
             import time
-            time.sleep(60)  # Wait 1 minute
+            wait_time = get_social_scheduler().wait_time(platform)
+            if not wait_time:
+                return False  # Budget shows no block (no Retry-After seen): exponential backoff
+            logger.info(f"🔧 Rate limit detected, waiting {wait_time:.0f}s for {platform} budget...")
+            time.sleep(wait_time)
             return True
         
         # Network issues
@@ -4,6 +4,7 @@ Handles tenant lifecycle, isolation, and configuration
 """
 
 import os
+import sys
 import json
 import shutil
 from pathlib import Path
@@ -11,6 +12,10 @@ from datetime import datetime
 from typing import Dict, List, Optional
 import logging
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from orchestration.completion_archive import CompletionArchive
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -234,7 +239,7 @@ Located at: `{audit_dir}/`
             "tenant_id": tenant_id,
             "status": tenant_config["status"],
             "tasks_in_progress": len(list((vault_path / "In_Progress").glob("*.md"))),
-            "tasks_completed": len(list((vault_path / "Done").glob("*.md"))),
+            "tasks_completed": CompletionArchive(vault_path / "Done").count(),
             "pending_approvals": len(list((vault_path / "Pending_Approval").glob("*.md"))),
             "plans_generated": len(list((vault_path / "Plans").glob("*.md"))),
             "briefings_created": len(list((vault_path / "Briefings").glob("*.md")))
@@ -56,7 +56,7 @@ def setup_gmail_oauth():
         print(f"✅ Token saved to: {token_file}")
         print("\nYou can now run:")
         print("  python watcher_gmail.py")
-        print("  pm2 restart watcher-gmail")
+        print("  pm2 restart watcher-host")
         
         return True
         
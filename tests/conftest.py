@@ -0,0 +1,35 @@
+"""
+Shared pytest fixtures.
+
+`workspace` runs a test inside a throwaway directory with its own
+task_queue/, vault and audit_logs/, so the real queues are never touched.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks.common import StubLLM, install_llm, reset_singletons
+
+
+@pytest.fixture
+def workspace(tmp_path, monkeypatch):
+    """Isolated working directory with fresh component singletons."""
+    vault = tmp_path / "obsidian_vault"
+    (vault / "agent_skills").mkdir(parents=True)
+    (vault / "Dashboard.md").write_text("# Dashboard\n", encoding="utf-8")
+    
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("VAULT_PATH", str(vault))
+    monkeypatch.setenv("DASHBOARD_PATH", str(vault / "Dashboard.md"))
+    monkeypatch.setenv("AUDIT_LOG_PATH", str(tmp_path / "audit_logs"))
+    monkeypatch.setenv("DEPLOYMENT_TIER", "bronze")
+    
+    reset_singletons()
+    install_llm(StubLLM(latency=0))
+    yield tmp_path
+    reset_singletons()
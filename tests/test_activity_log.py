@@ -0,0 +1,68 @@
+"""
+Activity Log Tests - Append-Only JSONL, Torn Lines, Rotation and Migration
+"""
+
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from orchestration.activity_log import ActivityLog
+
+
+@pytest.fixture
+def logs(tmp_path):
+    return tmp_path / "Logs"
+
+
+def today():
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def test_appends_are_one_line_each(logs):
+    activity = ActivityLog(logs)
+    for i in range(3):
+        activity.append({"action_type": "email", "i": i})
+    
+    lines = (logs / f"{today()}.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["i"] for line in lines] == [0, 1, 2]
+    assert [entry["i"] for entry in activity.read_day(today())] == [0, 1, 2]
+
+
+def test_torn_last_line_is_skipped_and_not_extended(logs):
+    ActivityLog(logs).append({"i": 0})
+    with open(logs / f"{today()}.jsonl", "a", encoding="utf-8") as f:
+        f.write('{"timestamp": "2026-01-01T00:00:00", "i": ')  # Crash mid-write
+    
+    restarted = ActivityLog(logs)
+    restarted.append({"i": 1})
+    
+    assert [entry["i"] for entry in restarted.read_day(today())] == [0, 1]
+
+
+def test_rotation_continues_in_numbered_segments(logs, monkeypatch):
+    monkeypatch.setenv("ACTIVITY_LOG_SEGMENT_MB", str(300 / 1024 / 1024))
+    activity = ActivityLog(logs)
+    for i in range(12):
+        activity.append({"i": i, "note": "x" * 50})
+    
+    segments = sorted(p.name for p in logs.glob("*.jsonl"))
+    assert len(segments) > 2
+    assert [entry["i"] for entry in ActivityLog(logs).read_day(today())] == list(range(12))
+
+
+def test_legacy_arrays_are_read_and_migrated(logs):
+    logs.mkdir()
+    (logs / "2026-02-10.json").write_text(json.dumps([{"i": 0}, {"i": 1}], indent=2), encoding="utf-8")
+    (logs / "2026-02-10.jsonl").write_text(json.dumps({"i": 2}) + "\n", encoding="utf-8")
+    (logs / "2026-02-11.json").write_text("[{\"i\": 0}, {\"i\"", encoding="utf-8")  # Corrupt
+    
+    activity = ActivityLog(logs)
+    assert [entry["i"] for entry in activity.read_day("2026-02-10")] == [0, 1, 2]
+    assert activity.days() == ["2026-02-10", "2026-02-11"]
+    
+    assert activity.migrate() == {"2026-02-10": 2}
+    assert not (logs / "2026-02-10.json").exists()
+    assert (logs / "2026-02-10.json.migrated").exists()
+    assert (logs / "2026-02-11.json").exists()  # Corrupt arrays are left alone
+    assert [entry["i"] for entry in activity.read_day("2026-02-10")] == [0, 1, 2]
@@ -0,0 +1,88 @@
+"""
+Async LLM Interface Tests - Rate Limits, Deadlines and Connection Reuse
+
+Runs against benchmarks/fake_llm_server.py on a local port.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.fake_llm_server import FakeLLMServer
+
+
+@pytest.fixture
+def provider(workspace, monkeypatch):
+    server = FakeLLMServer(rpm=3000, latency=0.02, max_inflight=4).start()
+    monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", server.base_url)
+    monkeypatch.setenv("ANTHROPIC_RPM_LIMIT", "3000")
+    monkeypatch.setenv("ANTHROPIC_MAX_CONCURRENCY", "4")
+    monkeypatch.setenv("LLM_MAX_RETRIES", "0")
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def llm(provider):
+    from orchestration import async_llm_interface
+    
+    async_llm_interface._provider_limits.clear()
+    interface = async_llm_interface.AsyncLLMInterface()
+    yield interface
+    interface.close()
+    async_llm_interface._provider_limits.clear()
+
+
+def task(i):
+    return {"task_id": f"t{i}", "type": "email", "data": {"subject": f"Message {i}"}}
+
+
+def test_concurrent_calls_stay_within_provider_limits(provider, llm):
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: llm.reason(task(i), {}), range(60)))
+    
+    assert all("error" not in r for r in results)
+    assert provider.stats["rate_limited"] == 0
+    assert provider.stats["overloaded"] == 0
+    assert provider.stats["peak_inflight"] <= 4
+    assert provider.stats["connections"] <= 4  # Keep-alive pool, not one connection per call
+
+
+def test_missed_deadline_fails_fast(provider, llm):
+    # The provider answers nothing until released: only the deadline can end the call
+    provider.hold.clear()
+    try:
+        result = llm.reason(task(1), {}, deadline=time.monotonic() + 0.1)
+    finally:
+        provider.hold.set()
+    
+    assert "deadline" in result["error"]
+    assert result["requires_approval"] is True
+    
+    # Already past: fails without sending anything
+    requests = provider.stats["requests"]
+    result = llm.reason(task(2), {}, deadline=time.monotonic() - 1)
+    assert "deadline" in result["error"] and provider.stats["requests"] == requests
+
+
+def test_batch_and_plans_match_sync_interface(llm):
+    results = llm.reason_batch([task(i) for i in range(3)], {})
+    
+    assert [r["usage"]["batch_size"] for r in results] == [3, 3, 3]
+    assert llm.get_stats()["batch_calls"] == 1
+
+
+def test_token_bucket_paces_and_respects_deadline():
+    from orchestration.rate_limiter import TokenBucket, DeadlineExceeded
+    
+    bucket = TokenBucket(capacity=2, period=0.1)  # 20 tokens/second
+    started = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    assert 0.08 <= time.monotonic() - started < 0.5
+    
+    with pytest.raises(DeadlineExceeded):
+        bucket.acquire(2, deadline=time.monotonic() + 0.01)
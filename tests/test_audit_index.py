@@ -0,0 +1,83 @@
+"""
+Audit Index Tests - Indexed Queries, Date Pruning and Index Recovery
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+
+from orchestration.audit_index import index_path
+
+
+def make_logger():
+    from orchestration.audit_logger import AuditLogger
+    return AuditLogger()
+
+
+def today_file(audit):
+    return audit.log_path / f"audit_{datetime.now(timezone.utc).strftime('%Y-%m-%d')}.jsonl"
+
+
+def scan(audit, task_id=None, action=None):
+    entries = []
+    for log_file in sorted(audit.log_path.glob("audit_*.jsonl")):
+        for line in log_file.read_text(encoding="utf-8").splitlines():
+            entry = json.loads(line)
+            if (task_id is None or entry["task_id"] == task_id) and (action is None or entry["action"] == action):
+                entries.append(entry)
+    return entries
+
+
+def log_tasks(audit, count=20):
+    for i in range(count):
+        audit.log("task_claimed", f"task_{i % 5}", "success", details={"i": i})
+        audit.log("task_completed", f"task_{i % 5}", "success", details={"i": i})
+
+
+def test_indexed_queries_match_a_full_scan(workspace):
+    audit = make_logger()
+    log_tasks(audit)
+    
+    assert index_path(today_file(audit)).exists()
+    for task_id, action in [("task_3", None), (None, "task_completed"), ("task_1", "task_claimed"), ("missing", None)]:
+        assert audit.get_logs(task_id=task_id, action=action) == scan(audit, task_id, action)
+    
+    # A fresh instance loads the sidecar from disk
+    assert make_logger().get_logs(task_id="task_2") == scan(audit, "task_2")
+
+
+def test_date_range_prunes_daily_files(workspace):
+    audit = make_logger()
+    log_tasks(audit, count=2)
+    old_day = datetime.now(timezone.utc) - timedelta(days=40)
+    old_file = audit.log_path / f"audit_{old_day.strftime('%Y-%m-%d')}.jsonl"
+    old_file.write_text("not json - must never be read\n", encoding="utf-8")
+    
+    recent = audit.get_logs(task_id="task_0", start_date=datetime.now() - timedelta(days=1))  # naive = UTC
+    assert len(recent) == 2
+    assert not index_path(old_file).exists()  # Pruned by its date, never opened
+    assert audit.get_logs(task_id="task_0", end_date=old_day + timedelta(days=1)) == []
+
+
+def test_lines_missing_from_the_index_are_recovered(workspace):
+    audit = make_logger()
+    log_tasks(audit, count=5)
+    
+    # Crash between the log append and the index append
+    with open(today_file(audit), "a", encoding="utf-8") as f:
+        f.write(json.dumps({"timestamp": datetime.now(timezone.utc).isoformat(), "action": "task_claimed", "task_id": "task_9"}) + "\n")
+    audit.log("task_completed", "task_9", "success")
+    
+    assert [e["action"] for e in make_logger().get_logs(task_id="task_9")] == ["task_claimed", "task_completed"]
+    assert make_logger().get_logs(action="task_claimed") == scan(audit, action="task_claimed")
+
+
+def test_rewritten_log_invalidates_a_stale_index(workspace):
+    audit = make_logger()
+    log_tasks(audit, count=5)
+    audit.get_logs(task_id="task_0")
+    
+    lines = today_file(audit).read_text(encoding="utf-8").splitlines(keepends=True)
+    today_file(audit).write_text("".join(lines[2:]), encoding="utf-8")
+    
+    assert audit.get_logs(task_id="task_1") == scan(audit, "task_1")
+    assert make_logger().get_logs(task_id="task_0") == scan(audit, "task_0")
@@ -0,0 +1,92 @@
+"""
+Audit Logger Tests - Buffered Writer, fsync Policies and Drain on Shutdown
+"""
+
+import threading
+
+import pytest
+
+
+def make_logger(monkeypatch, **env):
+    monkeypatch.setenv("AUDIT_LOG_BUFFERED", "true")
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    from orchestration.audit_logger import AuditLogger
+    return AuditLogger()
+
+
+def log_many(audit, threads=4, per_thread=250):
+    def worker(worker_id):
+        for i in range(per_thread):
+            audit.log("task_claimed", f"task_{worker_id}_{i}", "success", details={"i": i})
+    
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+
+
+def test_buffered_writes_are_batched_and_verifiable(workspace, monkeypatch):
+    audit = make_logger(monkeypatch, AUDIT_LOG_FSYNC="never")
+    log_many(audit)
+    
+    # Queries see everything logged so far
+    assert len(audit.get_logs(action="task_claimed")) == 1000
+    assert audit.verify_all_logs()["integrity"] == "OK"
+    assert audit.writer_stats["batches"] < 1000
+    
+    # Per-thread order is preserved
+    entries = audit.get_logs()
+    indexes = [e["details"]["i"] for e in entries if e["task_id"].startswith("task_0_")]
+    assert indexes == sorted(indexes)
+    audit.close()
+
+
+def test_close_drains_queue_and_falls_back_to_sync(workspace, monkeypatch):
+    audit = make_logger(monkeypatch, AUDIT_LOG_FSYNC="batch", AUDIT_LOG_FLUSH_INTERVAL_MS="200")
+    for i in range(50):
+        audit.log("task_completed", f"t{i}", "success")
+    
+    audit.close()
+    assert audit.writer_stats["entries"] == 50
+    assert audit.writer_stats["fsyncs"] >= 1
+    
+    audit.log("task_completed", "after_close", "success")
+    assert len(audit.get_logs()) == 51
+
+
+def test_entry_logged_while_closing_is_not_lost(workspace, monkeypatch):
+    from orchestration.audit_logger import _STOP
+    
+    audit = make_logger(monkeypatch, AUDIT_LOG_FSYNC="never")
+    audit.log("task_claimed", "before_close", "success")
+    closing = threading.Thread(target=audit.close)
+    put = audit._queue.put
+    
+    def put_racing_close(item, *args, **kwargs):
+        if item is not _STOP and not closing.is_alive():
+            # close() starts between this caller's check and its enqueue
+            closing.start()
+            closing.join(timeout=0.5)
+        return put(item, *args, **kwargs)
+    
+    monkeypatch.setattr(audit._queue, "put", put_racing_close)
+    audit.log("task_claimed", "during_close", "success")
+    closing.join()
+    
+    assert [e["task_id"] for e in audit.get_logs()] == ["before_close", "during_close"]
+
+
+def test_full_queue_blocks_instead_of_dropping(workspace, monkeypatch):
+    audit = make_logger(monkeypatch, AUDIT_LOG_QUEUE_SIZE="8", AUDIT_LOG_BATCH_SIZE="4", AUDIT_LOG_FSYNC="never")
+    log_many(audit, threads=4, per_thread=100)
+    audit.close()
+    
+    assert audit.verify_all_logs()["total_entries"] == 400
+    assert audit.writer_stats["max_batch"] <= 4
+
+
+def test_invalid_fsync_policy_is_rejected(workspace, monkeypatch):
+    with pytest.raises(ValueError):
+        make_logger(monkeypatch, AUDIT_LOG_FSYNC="sometimes")
@@ -0,0 +1,104 @@
+"""
+Completion Archive Tests - Day Shards, Time-Bounded Reads, Compaction and Migration
+"""
+
+import os
+import json
+import time
+from datetime import datetime, timezone, timedelta
+
+import pytest
+
+from orchestration.completion_archive import ArchiveCursor, CompletionArchive
+
+DAY = 86400
+
+
+@pytest.fixture
+def archive(tmp_path):
+    return CompletionArchive(tmp_path / "completed", compact_days=0)
+
+
+def put(archive, days_ago, name, text="done"):
+    """Archive a file as if it had been completed `days_ago` days ago."""
+    when = time.time() - days_ago * DAY
+    day = datetime.fromtimestamp(when, tz=timezone.utc).strftime("%Y-%m-%d")
+    path = archive.root / day / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (when, when))
+    return path
+
+
+def test_completions_land_in_todays_shard(archive, tmp_path):
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    archive.add("TASK_1.json", json.dumps({"task_id": "TASK_1"}))
+    finished = tmp_path / "FILE_note.md"
+    finished.write_text("client project", encoding="utf-8")
+    archive.move_in(finished)
+    
+    assert sorted(p.name for p in (archive.root / today).iterdir()) == ["FILE_note.md", "TASK_1.json"]
+    assert [item.name for item in archive.latest(1)] == ["FILE_note.md"]
+    assert archive.count() == 2
+
+
+def test_time_bounded_reads_only_open_matching_shards(archive, monkeypatch):
+    for days_ago in range(30):
+        put(archive, days_ago, f"TASK_{days_ago:02d}.md")
+    
+    scanned = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path=".": scanned.append(os.path.basename(path)) or real_scandir(path))
+    
+    since = datetime.now(timezone.utc) - timedelta(days=2, hours=1)
+    assert [item.name for item in archive.iter_entries(since=since)] == ["TASK_02.md", "TASK_01.md", "TASK_00.md"]
+    assert len(scanned) <= 1 + 4  # The root, then only the shards of the window
+
+
+def test_compaction_keeps_entries_readable(archive):
+    for days_ago in range(10):
+        put(archive, days_ago, f"TASK_{days_ago}.md", text=f"task {days_ago}")
+    before = [(item.name, item.read_text()) for item in archive.iter_entries()]
+    
+    compacted = archive.compact(older_than_days=3)
+    assert len(compacted) >= 6
+    assert len([p for p in archive.root.iterdir() if not p.name.startswith(".")]) <= 4
+    manifest = json.loads((archive.segments / "manifest.json").read_text(encoding="utf-8"))["segments"]
+    assert sum(segment["count"] for segment in manifest.values()) == sum(compacted.values())
+    
+    assert [(item.name, item.read_text()) for item in archive.iter_entries()] == before
+    assert archive.count() == 10
+    
+    # A late file for a compacted day is merged into its segment next time
+    put(archive, 8, "TASK_late.md")
+    archive.compact(older_than_days=3)
+    assert archive.count() == 11
+    assert "TASK_late.md" in {item.name for item in archive.iter_entries(since=time.time() - 9 * DAY)}
+
+
+def test_flat_layout_files_are_read_and_migrated(archive):
+    archive.root.mkdir(parents=True)
+    old = archive.root / "TASK_old.json"
+    old.write_text("{}", encoding="utf-8")
+    os.utime(old, (time.time() - 5 * DAY,) * 2)
+    put(archive, 1, "TASK_new.json")
+    
+    assert [item.name for item in archive.iter_entries()] == ["TASK_old.json", "TASK_new.json"]
+    assert archive.migrate() == 1
+    assert not old.exists()
+    assert [item.name for item in archive.iter_entries()] == ["TASK_old.json", "TASK_new.json"]
+
+
+def test_cursor_returns_only_new_files_after_commit(archive, monkeypatch):
+    import orchestration.completion_archive as completion_archive
+    monkeypatch.setattr(completion_archive, "SETTLE_SECONDS", 0)
+    
+    put(archive, 3, "TASK_a.md")
+    cursor = ArchiveCursor(archive)
+    assert [item.name for item in cursor.new_entries()] == ["TASK_a.md"]
+    assert [item.name for item in cursor.new_entries()] == ["TASK_a.md"]  # Not committed yet
+    cursor.commit()
+    
+    time.sleep(0.01)
+    archive.add("TASK_b.md", "new")
+    assert [item.name for item in cursor.new_entries()] == ["TASK_b.md"]
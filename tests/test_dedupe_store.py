@@ -0,0 +1,49 @@
+"""
+Dedupe Store Tests - Persistence, TTL Expiry and Legacy State Import
+"""
+
+import json
+import time
+
+from orchestration.dedupe_store import DedupeStore
+
+
+def test_keys_survive_restart_and_expire(workspace, monkeypatch):
+    path = workspace / "task_queue" / ".test.keys.db"
+    store = DedupeStore(path, ttl_seconds=3600)
+    
+    assert store.add("done_invoice:report.md", ttl_seconds=0) is True  # 0: never expires
+    assert store.add("done_invoice:report.md") is False
+    store.add_many(["msg_1", "msg_2", "line\nbreak"])
+    store.discard("msg_2")
+    store.close()
+    
+    reopened = DedupeStore(path, ttl_seconds=3600)
+    assert "done_invoice:report.md" in reopened and "line\nbreak" in reopened
+    assert "msg_1" in reopened and "msg_2" not in reopened
+    assert len(reopened) == 3
+    
+    # An hour and a bit later the TTL'd keys read as absent; the sweep deletes them
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 3700)
+    assert "msg_1" not in reopened and "done_invoice:report.md" in reopened
+    assert reopened.sweep() == 2
+    assert sorted(reopened) == ["done_invoice:report.md"]
+    reopened.close()
+
+
+def test_legacy_json_state_is_imported_once(workspace):
+    legacy = workspace / "task_queue" / ".odoo_watcher_state.json"
+    legacy.parent.mkdir(exist_ok=True)
+    legacy.write_text(json.dumps({"processed_items": ["done_invoice:a.md", "review:2026-W41"]}), encoding="utf-8")
+    path = workspace / "task_queue" / ".odoo_watcher.keys.db"
+    
+    store = DedupeStore(path, legacy_state=legacy)
+    assert "done_invoice:a.md" in store and "review:2026-W41" in store
+    store.discard("review:2026-W41")
+    store.close()
+    
+    # The store is not empty any more, so the JSON file is not read again
+    store = DedupeStore(path, legacy_state=legacy)
+    assert "review:2026-W41" not in store and len(store) == 1
+    store.close()
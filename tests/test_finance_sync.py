@@ -0,0 +1,122 @@
+"""
+Finance Sync Tests - Cursor Sync, Concurrent Accounts and Exactly-Once Tasks
+
+Replays transactions from benchmarks/fake_finance_api.py on a local port.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_finance_api import FakeFinanceAPI
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "watchers"))
+
+from finance_watcher import FinanceWatcher
+
+ACCOUNTS = ["access-a", "access-b", "access-c", "access-d"]
+
+
+@pytest.fixture
+def api(workspace):
+    server = FakeFinanceAPI(latency=0.002).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def watcher(api, workspace, monkeypatch):
+    monkeypatch.setenv("FINANCE_API_URL", api.base_url)
+    monkeypatch.setenv("FINANCE_API_KEY", "client-id")
+    monkeypatch.setenv("FINANCE_API_SECRET", "secret")
+    monkeypatch.setenv("FINANCE_ACCOUNT_IDS", ",".join(ACCOUNTS))
+    monkeypatch.setenv("LOG_LEVEL", "WARNING")
+    
+    def connect() -> FinanceWatcher:
+        w = FinanceWatcher()
+        w._connect()
+        return w
+    return connect
+
+
+def inbox_tasks(workspace: Path) -> list:
+    return [json.loads(p.read_text(encoding="utf-8")) for p in (workspace / "task_queue" / "inbox").glob("*.json")]
+
+
+def test_replay_with_a_crash_creates_each_task_once(api, watcher, workspace, monkeypatch):
+    # Small pages so the crash lands mid-account; the 100k replay is in bench_finance_sync.py
+    monkeypatch.setenv("FINANCE_SYNC_PAGE_SIZE", "20")
+    for account in ACCOUNTS:
+        api.post(account, 100)
+    api.inject_mutations(3)
+    
+    created = {}
+    create_task = FinanceWatcher.create_task
+    
+    def counting_create_task(self, **kwargs):
+        transaction_id = kwargs["context"]["transaction_id"]
+        if transaction_id == "access-b-tx-00000050" and transaction_id not in created:
+            created[transaction_id] = 0
+            raise OSError("disk full")  # The first watcher dies part-way through account b
+        created[transaction_id] = created.get(transaction_id, 0) + 1
+        return create_task(self, **kwargs)
+    
+    monkeypatch.setattr(FinanceWatcher, "create_task", counting_create_task)
+    watcher().check_accounts()
+    
+    # b never finished paging, so it has no cursor: a restarted watcher
+    # replays it from the start and skips what already has a task
+    second = watcher()
+    assert set(second.cursors) == set(ACCOUNTS) - {"access-b"}
+    second.check_accounts()
+    
+    tasks = inbox_tasks(workspace)
+    assert len(tasks) == len(created) == 400
+    assert set(created.values()) == {1}
+    assert api.stats["max_in_flight"] > 1
+    assert api.stats["errors"] == 3  # Every injected mutation restart was recovered from
+    
+    # Nothing new: one sync call per account and no tasks
+    calls = api.stats["sync_calls"]
+    assert second.check_accounts() == 0
+    assert api.stats["sync_calls"] - calls == len(ACCOUNTS)
+    
+    # New transactions and a settled pending one: only the new ones become tasks
+    new = api.post("access-c", 3)
+    settled = api.settle("access-a", "access-a-tx-00000000")
+    assert second.check_accounts() == 3
+    ids = {t["context"]["transaction_id"] for t in inbox_tasks(workspace)}
+    assert set(new) <= ids and settled not in ids
+
+
+def test_first_sync_skips_history_before_initial_window(api, watcher, workspace, monkeypatch):
+    monkeypatch.setenv("FINANCE_ACCOUNT_IDS", "access-a")
+    api.post("access-a", 20, date="2020-01-01")
+    api.post("access-a", 5)
+    
+    first = watcher()
+    assert first.check_accounts() == 5
+    
+    api.post("access-a", 2, date="2020-01-02")  # Late-arriving old transactions still count
+    assert watcher().check_accounts() == 2
+    assert len(inbox_tasks(workspace)) == 7
+
+
+def test_mutation_during_pagination_restarts_from_the_starting_cursor(api, watcher, workspace, monkeypatch):
+    monkeypatch.setenv("FINANCE_ACCOUNT_IDS", "access-a")
+    monkeypatch.setenv("FINANCE_SYNC_PAGE_SIZE", "10")
+    api.post("access-a", 5)
+    first = watcher()
+    assert first.check_accounts() == 5
+    start = first.cursors["access-a"]
+    
+    # The fake rejects every cursor handed out mid-pagination before the mutation
+    api.post("access-a", 30)
+    api.inject_mutations(2)
+    assert first.check_accounts() == 30
+    assert api.stats["errors"] == 2
+    assert first.cursors["access-a"] != start
+    assert len(inbox_tasks(workspace)) == 35
@@ -0,0 +1,185 @@
+"""
+Gmail Sync Tests - History API Polling, Batched Fetches and Resync
+
+Runs against benchmarks/fake_gmail_api.py on a local port.
+"""
+
+import sys
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("googleapiclient")
+
+from benchmarks.fake_gmail_api import FakeGmailAPI, gmail_service
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "watchers"))
+
+from gmail_sync import GmailSync
+from gmail_watcher import GmailWatcher
+
+
+@pytest.fixture
+def api(workspace):
+    server = FakeGmailAPI().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def watcher(api, workspace, monkeypatch):
+    credentials = workspace / "secrets" / "gmail_credentials.json"
+    credentials.parent.mkdir()
+    credentials.write_text("{}", encoding="utf-8")
+    monkeypatch.setenv("GMAIL_CREDENTIALS_PATH", str(credentials))
+    monkeypatch.setenv("GMAIL_BATCH_SIZE", "20")
+    
+    def connect() -> GmailWatcher:
+        w = GmailWatcher()
+        w.service = gmail_service(api)
+        w._init_sync()
+        return w
+    return connect
+
+
+def check(watcher: GmailWatcher) -> int:
+    """One iteration of the watch loop."""
+    return watcher.poll()
+
+
+def inbox_tasks(workspace: Path) -> list:
+    return [json.loads(p.read_text(encoding="utf-8")) for p in (workspace / "task_queue" / "inbox").glob("*.json")]
+
+
+def test_incremental_sync_resumes_from_persisted_history_id(api, watcher, workspace):
+    api.deliver(15)
+    first = watcher()
+    
+    # No history ID yet: full resync picks up the latest 10 unread messages
+    assert check(first) == 10
+    assert api.methods == {"getProfile": 1, "messages.list": 1, "messages.get": 20}
+    
+    read = api.deliver(5, labels=("INBOX",))
+    api.deliver(45, important_every=9)
+    api.deliver(3, labels=("SENT",))
+    calls = api.stats["api_calls"]
+    assert check(first) == 45
+    # 1 history call, headers for 50 INBOX messages, bodies for the 45 unread
+    assert api.stats["api_calls"] - calls == 1 + 50 + 45
+    assert api.stats["batch_requests"] == 2 + 3 + 3
+    
+    tasks = inbox_tasks(workspace)
+    assert len(tasks) == 55
+    urgent = next(t for t in tasks if t["context"]["subject"] == "Invoice overdue")
+    assert urgent["priority"] == "high" and urgent["context"]["body"].startswith("Message")
+    assert not any(t["context"]["message_id"] in read for t in tasks)
+    
+    # A restarted watcher resumes from the saved history ID: one call when idle
+    second = watcher()
+    calls = api.stats["api_calls"]
+    assert check(second) == 0
+    assert api.stats["api_calls"] - calls == 1
+    
+    # History older than Gmail keeps: full resync from the current history ID.
+    # Of the 10 latest unread messages it lists, 8 already have tasks
+    api.expire_history()
+    second.sync.history_id = "1001"
+    api.deliver(2)
+    assert check(second) == 2
+    assert len(inbox_tasks(workspace)) == 57
+    assert api.methods["messages.list"] == 2
+    assert json.loads(second.state_file.read_text())["history_id"] == str(api.history_id)
+
+
+def test_triage_skips_bodies_and_throttled_batches_retry(api, workspace, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    sync = GmailSync(gmail_service(api), workspace / "state.json", label_ids=["INBOX"])
+    sync.poll()
+    sync.commit()
+    
+    api.deliver(30, important_every=10)
+    api.throttle = 7
+    messages = sync.poll(keep=lambda m: "IMPORTANT" in m["labels"])
+    sync.fetch_bodies(messages)
+    
+    assert [m["subject"] for m in messages] == ["Invoice overdue"] * 3
+    assert all(m["body"].startswith("Message") for m in messages)
+    assert api.stats["throttled"] == 7
+    assert api.methods["messages.get"] == 30 + 3
+    
+    # Not committed: a crash before the tasks exist reads the same changes again
+    assert len(GmailSync(gmail_service(api), workspace / "state.json", label_ids=["INBOX"]).poll()) == 30
+    sync.commit()
+    assert GmailSync(gmail_service(api), workspace / "state.json", label_ids=["INBOX"]).poll() == []
+
+
+def test_failed_fetch_or_task_write_does_not_advance_the_history_id(api, watcher, workspace, monkeypatch):
+    monkeypatch.setenv("GMAIL_BATCH_RETRIES", "0")
+    first = watcher()
+    check(first)
+    committed = first.sync.history_id
+    
+    # history.list succeeds, then the batch header fetch answers 503
+    api.deliver(5)
+    api.batch_unavailable = 1
+    assert check(first) == 0
+    assert first.sync.history_id == committed
+    assert json.loads(first.state_file.read_text())["history_id"] == committed
+    
+    # The task for one message cannot be written: the others are kept, the ID stays
+    create_task = GmailWatcher.create_task
+    failing = {api.messages[-3]["id"]}
+    
+    def create_task_failing_once(self, **kwargs):
+        if kwargs["context"]["message_id"] in failing:
+            failing.clear()
+            raise OSError("disk full")
+        return create_task(self, **kwargs)
+    
+    monkeypatch.setattr(GmailWatcher, "create_task", create_task_failing_once)
+    assert check(first) == 5
+    assert len(inbox_tasks(workspace)) == 4 and first.sync.history_id == committed
+    
+    # A restart re-reads the same changes: only the missing task is created
+    second = watcher()
+    assert check(second) == 1
+    assert len(inbox_tasks(workspace)) == 5
+    assert second.sync.history_id == str(api.history_id)
+
+
+def test_mail_starred_or_marked_important_later_is_picked_up(api, workspace):
+    # Configured as watcher_gmail.py: important or starred unread mail
+    def new_sync() -> GmailSync:
+        return GmailSync(gmail_service(api), workspace / "state.json", label_ids=["INBOX"],
+                         added_labels=["IMPORTANT", "STARRED"])
+    
+    tasks = set()
+    
+    def keep(message):
+        labels = message["labels"]
+        return ("UNREAD" in labels and ("IMPORTANT" in labels or "STARRED" in labels)
+                and message["message_id"] not in tasks)
+    
+    sync = new_sync()
+    sync.poll()
+    sync.commit()
+    
+    plain = api.deliver(4)
+    important = api.deliver(1, labels=("INBOX", "UNREAD", "IMPORTANT"))
+    tasks.update(m["message_id"] for m in sync.poll(keep=keep))
+    sync.commit()
+    assert tasks == set(important)
+    
+    # Starred / marked important after arriving, plus the already-tasked one starred
+    api.add_labels(plain[:2], ["STARRED"])
+    api.add_labels(plain[2:3], ["IMPORTANT"])
+    api.add_labels(important, ["STARRED"])
+    api.add_labels(plain[3:], ["CATEGORY_UPDATES"])
+    api.mark_read(plain[2:3])
+    messages = sync.poll(keep=keep)
+    sync.commit()
+    assert [m["message_id"] for m in messages] == plain[:2]
+    
+    assert new_sync().poll(keep=keep) == []
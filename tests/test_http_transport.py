@@ -0,0 +1,59 @@
+"""
+HTTP Transport Tests - Keep-Alive Reuse Across the Social Servers, Timeouts and Latency Hooks
+
+Runs against benchmarks/fake_social_api.py (HTTPS, self-signed) on a local port.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+import requests
+
+from benchmarks.fake_social_api import FakeSocialAPI, social_servers
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+import http_transport
+
+
+@pytest.fixture
+def api(workspace, monkeypatch):
+    server = FakeSocialAPI().start()
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", server.ca_file)
+    http_transport.close_all()
+    yield server
+    http_transport.close_all()
+    server.stop()
+
+
+def test_all_servers_share_one_tls_connection(api, workspace):
+    facebook, instagram, twitter, linkedin = social_servers(api, workspace / "secrets")
+    seen = []
+    http_transport.add_observer(lambda method, host, endpoint, status, seconds: seen.append((method, endpoint, status)))
+    
+    for i in range(5):
+        assert facebook.post_message(f"Update {i}")["status"] == "success"
+        assert twitter.post_tweet(f"Tweet {i}")["tweet_id"]
+        assert linkedin.post_update(f"News {i}")["status"] == "success"
+        assert instagram.get_account_info()["status"] == "success"
+    
+    assert api.stats["requests"] == 20
+    assert api.stats["handshakes"] == 1  # Not one per request
+    assert ("POST", "/v19.0/:id/feed", 200) in seen and ("POST", "/2/tweets", 200) in seen
+    
+    stats = http_transport.stats()
+    feed = stats[f"POST 127.0.0.1:{api.server_address[1]}/v19.0/:id/feed"]
+    assert (feed["count"], feed["errors"]) == (5, 0)
+    assert feed["max_seconds"] >= feed["avg_seconds"] > 0
+
+
+def test_requests_time_out_and_posts_are_not_retried(api, workspace, monkeypatch):
+    facebook, _, _, _ = social_servers(api, workspace / "secrets")
+    monkeypatch.setenv("HTTP_READ_TIMEOUT", "0.1")
+    api.latency = 0.5
+    
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        facebook.post_message("Slow endpoint")
+    assert api.stats["requests"] == 1
+    assert list(http_transport.stats().values())[0]["errors"] == 1
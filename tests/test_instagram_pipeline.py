@@ -0,0 +1,66 @@
+"""
+Instagram Pipeline Tests - Concurrent Containers, Status Polling and Publishing
+
+Runs against benchmarks/fake_social_api.py with randomized media processing delays.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_social_api import FakeSocialAPI, social_servers
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+import http_transport
+
+
+@pytest.fixture
+def api(workspace, monkeypatch):
+    server = FakeSocialAPI(processing_delay=(0.05, 0.4), seed=7).start()
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", server.ca_file)
+    monkeypatch.setenv("INSTAGRAM_POLL_INITIAL_SECONDS", "0.02")
+    monkeypatch.setenv("INSTAGRAM_POLL_MAX_SECONDS", "0.1")
+    http_transport.close_all()
+    yield server
+    http_transport.close_all()
+    server.stop()
+
+
+@pytest.fixture
+def instagram(api, workspace):
+    _, server, _, _ = social_servers(api, workspace / "secrets")
+    yield server
+    server.close()
+
+
+def test_posts_publish_once_processed_and_run_concurrently(api, instagram):
+    posts = [{"image_url": f"https://img.example/{i}.jpg", "caption": f"Photo {i}"} for i in range(6)]
+    posts += [{"image_urls": [f"https://img.example/c{i}_{j}.jpg" for j in range(4)], "caption": f"Carousel {i}"}
+              for i in range(2)]
+    
+    started = time.perf_counter()
+    results = instagram.post_many(posts)
+    elapsed = time.perf_counter() - started
+    
+    assert [r["status"] for r in results] == ["success"] * 8
+    assert results[-1]["image_count"] == 4
+    assert api.stats["premature_publishes"] == 0
+    # Polls back off to at most 0.1s, so nothing waits long after it is ready
+    assert max(api.publish_lag()) < 0.3
+    # Processing overlaps: a carousel (items, then the carousel) alone can take 0.8s
+    assert elapsed < 1.5
+
+
+def test_failed_container_does_not_block_other_posts(api, instagram):
+    results = instagram.post_many([
+        {"image_url": "https://img.example/broken.jpg", "caption": "Bad"},
+        {"image_url": "https://img.example/good.jpg", "caption": "Good"}
+    ])
+    
+    assert results[0]["status"] == "error" and "ERROR" in results[0]["message"]
+    assert results[1]["status"] == "success"
+    assert instagram.post_photo("https://img.example/single.jpg", "Single")["status"] == "success"
+    assert len(api.publish_lag()) == 2
@@ -0,0 +1,144 @@
+"""
+LLM Interface Tests - Prompt Prefix Caching and Usage Stats
+
+The provider SDK client is swapped for a recorder, so no API calls are made.
+"""
+
+import json
+from types import SimpleNamespace
+
+PLAN = {"thought_process": "ok", "actions": [], "requires_approval": False, "confidence": 0.9}
+
+
+class RecordingAnthropic:
+    """Stands in for anthropic.Anthropic; reports the system prompt as cached after the first call."""
+    
+    def __init__(self):
+        self.requests = []
+        self.messages = self
+    
+    def create(self, **kwargs):
+        self.requests.append(kwargs)
+        prefix_tokens = sum(len(block["text"]) // 4 for block in kwargs["system"])
+        first = len(self.requests) == 1
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=json.dumps(PLAN))],
+            usage=SimpleNamespace(
+                input_tokens=50,
+                cache_creation_input_tokens=prefix_tokens if first else 0,
+                cache_read_input_tokens=0 if first else prefix_tokens,
+                output_tokens=20
+            )
+        )
+
+
+def make_llm(monkeypatch):
+    monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    from orchestration.llm_interface import LLMInterface
+    
+    llm = LLMInterface()
+    llm.client = RecordingAnthropic()
+    return llm
+
+
+def task(task_id, subject):
+    return {"task_id": task_id, "type": "email", "priority": "normal", "data": {"subject": subject}}
+
+
+def test_anthropic_prefix_is_stable_and_cache_marked(monkeypatch):
+    """Tasks sharing skills send a byte-identical system prefix with cache breakpoints."""
+    llm = make_llm(monkeypatch)
+    skills = {"email_skills": "# Email Skills\n- Reply professionally"}
+    
+    llm.reason(task("t1", "Invoice overdue"), skills, context="# Company Handbook\nBe polite")
+    llm.reason(task("t2", "Meeting tomorrow"), skills, context="# Company Handbook\nBe polite")
+    
+    first, second = llm.client.requests
+    assert first["system"] == second["system"]
+    assert all(block["cache_control"] == {"type": "ephemeral"} for block in first["system"])
+    assert "Company Handbook" in first["system"][0]["text"]
+    assert "Email Skills" in first["system"][1]["text"]
+    
+    # Only the task itself varies between calls
+    assert "Invoice overdue" in first["messages"][0]["content"]
+    assert "Invoice overdue" not in json.dumps(first["system"])
+
+
+def test_usage_stats_report_cache_hits_tokens_and_latency(monkeypatch):
+    llm = make_llm(monkeypatch)
+    skills = {"email_skills": "# Email Skills\n" + "- Reply professionally\n" * 200}
+    
+    results = [llm.reason(task(f"t{i}", "Hello"), skills) for i in range(5)]
+    stats = llm.get_stats()
+    
+    assert stats["calls"] == 5 and stats["errors"] == 0
+    assert stats["prefix_hits"] == 4 and stats["prefix_misses"] == 1
+    assert stats["cached_input_ratio"] > 0.5
+    assert stats["latency_p50_ms"] is not None
+    assert results[-1]["usage"]["cached_input_tokens"] > 0
+
+
+def test_prompt_caching_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("LLM_PROMPT_CACHING", "false")
+    llm = make_llm(monkeypatch)
+    
+    llm.reason(task("t1", "Hello"), {})
+    
+    assert all("cache_control" not in block for block in llm.client.requests[0]["system"])
+
+
+def test_reason_batch_fans_out_plans_from_one_request(monkeypatch):
+    from benchmarks.common import SimulatedAnthropic
+    
+    llm = make_llm(monkeypatch)
+    llm.client = SimulatedAnthropic(base_ms=0, prefill_us=0)
+    tasks = [task(f"t{i}", f"Subject {i}") for i in range(4)]
+    
+    results = llm.reason_batch(tasks, {"email_skills": "# Email"})
+    
+    assert llm.client.requests == 1
+    assert len(results) == 4
+    assert all(r["usage"]["batch_size"] == 4 and "error" not in r for r in results)
+    assert llm.get_stats()["batched_tasks"] == 4
+
+
+def test_reason_batch_reasons_individually_about_missing_plans(monkeypatch):
+    from benchmarks.common import SimulatedAnthropic
+    
+    class DropsLastPlan(SimulatedAnthropic):
+        def create(self, **kwargs):
+            response = super().create(**kwargs)
+            body = json.loads(response.content[0].text)
+            if "plans" in body:
+                body["plans"] = body["plans"][:-1]
+            response.content[0].text = json.dumps(body)
+            return response
+    
+    llm = make_llm(monkeypatch)
+    llm.client = DropsLastPlan(base_ms=0, prefill_us=0)
+    
+    results = llm.reason_batch([task(f"t{i}", "Hi") for i in range(3)], {})
+    
+    assert llm.client.requests == 2  # The batch, then one call for t2
+    assert "batch_size" not in results[2]["usage"]
+
+
+def test_reason_batch_splits_to_stay_under_the_output_cap(monkeypatch):
+    from benchmarks.common import SimulatedAnthropic
+    
+    class RecordsMaxTokens(SimulatedAnthropic):
+        def create(self, **kwargs):
+            self.max_tokens = getattr(self, "max_tokens", []) + [kwargs["max_tokens"]]
+            return super().create(**kwargs)
+    
+    monkeypatch.setenv("MAX_LLM_RESPONSE_TOKENS", "2000")
+    monkeypatch.setenv("LLM_MAX_OUTPUT_TOKENS", "8192")
+    llm = make_llm(monkeypatch)
+    llm.client = RecordsMaxTokens(base_ms=0, prefill_us=0)
+    
+    results = llm.reason_batch([task(f"t{i}", f"Subject {i}") for i in range(9)], {})
+    
+    # 4 tasks x 2000 fit under 8192; 9 tasks go as 4 + 4 + 1, each with its full budget
+    assert llm.client.max_tokens == [8000, 8000, 2000]
+    assert [r["usage"].get("batch_size") for r in results] == [4] * 8 + [None]
@@ -0,0 +1,128 @@
+"""
+Log Verifier Tests - Parallel Ranges, Chain Stitching and Checkpoints
+"""
+
+import json
+
+import pytest
+
+from orchestration.log_verifier import BLOCK_SIZE, LogVerifier
+
+
+@pytest.fixture
+def compliance(workspace):
+    from platinum.compliance_logger import ComplianceLogger
+    return ComplianceLogger("tenant_test", log_dir=workspace / "compliance")
+
+
+def fill(logger, count):
+    for i in range(count):
+        logger.log_action("task_created", {"task_id": f"T{i}", "note": "x" * 200}, "low")
+    return logger._get_log_file_path()
+
+
+def rewrite_line(path, number, change):
+    lines = path.read_text(encoding="utf-8").splitlines(keepends=True)
+    entry = json.loads(lines[number - 1])
+    change(entry)
+    lines[number - 1] = json.dumps(entry) + "\n"
+    path.write_text("".join(lines), encoding="utf-8")
+
+
+def test_parallel_ranges_match_in_process_verification(compliance):
+    log_file = fill(compliance, 600)
+    assert log_file.stat().st_size > 3 * BLOCK_SIZE
+    rewrite_line(log_file, 450, lambda entry: entry["details"].update(note="edited"))
+    
+    def run(**options):
+        verifier = LogVerifier("compliance", compliance.signing_key, compliance.log_dir / "none.jsonl", **options)
+        verifier._write_checkpoint = lambda checkpoint: None
+        return verifier.verify([log_file])[log_file.name]
+    
+    serial = run(workers=1)
+    parallel = run(workers=2, chunk_bytes=BLOCK_SIZE, parallel_min_bytes=0)
+    
+    assert parallel == serial
+    assert serial["entries"] == 600
+    assert [(f["line"], f["kind"]) for f in serial["failures"]] == [(450, "signature"), (450, "chain_hash")]
+
+
+def test_deleted_entry_breaks_the_chain(compliance):
+    log_file = fill(compliance, 5)
+    lines = log_file.read_text(encoding="utf-8").splitlines(keepends=True)
+    log_file.write_text("".join(lines[:2] + lines[3:]), encoding="utf-8")
+    
+    result = compliance.verify_log_integrity()
+    
+    assert result["status"] == "compromised"
+    assert result["tampered_entries"] == 0
+    assert [d["line"] for d in result["chain_break_details"]] == [3]
+
+
+def test_reverify_resumes_from_checkpoint(compliance):
+    fill(compliance, 20)
+    first = compliance.verify_all_logs()
+    assert first["status"] == "verified"
+    assert first["checked_entries"] == 20
+    
+    fill(compliance, 5)
+    second = compliance.verify_all_logs()
+    assert second["status"] == "verified"
+    assert (second["total_entries"], second["checked_entries"], second["resumed_days"]) == (25, 5, 1)
+
+
+def test_truncated_day_is_caught_by_its_checkpoint(compliance):
+    log_file = fill(compliance, 10)
+    assert compliance.verify_all_logs()["status"] == "verified"
+    
+    # The remaining chain is intact; only the checkpoint knows entry 10 existed
+    lines = log_file.read_text(encoding="utf-8").splitlines(keepends=True)
+    log_file.write_text("".join(lines[:-1]), encoding="utf-8")
+    
+    result = compliance.verify_all_logs()
+    assert result["status"] == "compromised"
+    assert "checkpoint covers" in result["tampered_details"][0]["error"]
+
+
+def test_full_reverify_catches_resigned_history(compliance):
+    log_file = fill(compliance, 10)
+    assert compliance.verify_all_logs()["status"] == "verified"
+    
+    # Someone holding the key rewrites and re-signs the last entry, same size
+    def resign(entry):
+        entry.pop("signature"), entry.pop("chain_hash")
+        entry["details"]["note"] = "y" * 200
+        entry["signature"] = compliance._compute_signature(entry)
+        entry["chain_hash"] = compliance._compute_chain_hash(entry, entry["previous_hash"])
+    rewrite_line(log_file, 10, resign)
+    
+    assert compliance.verify_all_logs()["status"] == "verified"  # Nothing new to read
+    result = compliance.verify_all_logs(full=True)
+    assert result["status"] == "compromised"
+    assert "Merkle root" in result["tampered_details"][0]["error"]
+
+
+def test_tampered_checkpoint_is_not_trusted(compliance):
+    fill(compliance, 10)
+    compliance.verify_all_logs()
+    checkpoints = compliance.log_dir / "verify_checkpoints.jsonl"
+    checkpoint = json.loads(checkpoints.read_text(encoding="utf-8"))
+    checkpoint["entries"] = 3
+    checkpoints.write_text(json.dumps(checkpoint) + "\n", encoding="utf-8")
+    
+    result = compliance.verify_all_logs()
+    
+    assert result["status"] == "compromised"
+    assert result["checked_entries"] == 10
+
+
+def test_audit_logger_uses_checkpoints(workspace):
+    from orchestration.audit_logger import AuditLogger
+    audit = AuditLogger()
+    for i in range(30):
+        audit.log("task_claimed", f"t{i}", "success")
+    
+    assert audit.verify_all_logs()["checked_entries"] == 30
+    audit.log("task_completed", "t0", "success")
+    result = audit.verify_all_logs()
+    assert (result["integrity"], result["total_entries"], result["checked_entries"]) == ("OK", 31, 1)
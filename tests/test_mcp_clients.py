@@ -0,0 +1,112 @@
+"""
+MCP Client Pool Tests - Warm Reuse, Session Expiry, Eviction and Health Probes
+
+The Odoo tests run against benchmarks/fake_odoo_server.py on a local port.
+"""
+
+import time
+
+import pytest
+
+from benchmarks.fake_odoo_server import FakeOdooServer
+
+
+@pytest.fixture
+def odoo(workspace, monkeypatch):
+    server = FakeOdooServer().start()
+    monkeypatch.setenv("ODOO_URL", server.base_url)
+    monkeypatch.setenv("ODOO_DB", "test")
+    monkeypatch.setenv("ODOO_PASSWORD", "test")
+    yield server
+    server.stop()
+
+
+class FakeClient:
+    def __init__(self, tenant_id=None):
+        self.tenant_id = tenant_id
+        self.closed = False
+        self.alive = True
+    
+    def check_session(self):
+        return self.alive
+    
+    def close(self):
+        self.closed = True
+
+
+def invoice(i):
+    return {"action_type": "odoo_invoice", "task_id": f"TASK_{i}", "requires_approval": False,
+            "risk_level": "low", "data": {"partner_name": "Acme", "amount": 100.0 + i}}
+
+
+def test_executor_reuses_one_odoo_session_and_relogs_on_expiry(workspace, odoo):
+    from orchestration.action_executor import ActionExecutor
+    
+    executor = ActionExecutor(workspace / "obsidian_vault")
+    for i in range(5):
+        assert executor.execute_action(invoice(i))["result"]["status"] == "success"
+    assert (odoo.stats["authenticate"], odoo.stats["connections"]) == (1, 1)
+    
+    odoo.expire_sessions()
+    assert executor.execute_action(invoice(5))["result"]["status"] == "success"
+    assert odoo.stats["authenticate"] == 2
+    assert executor.clients.built == 1  # Same client, logged in again
+    assert len(odoo.records["account.move"]) == 6
+    health = executor.clients.health()["odoo"]
+    assert (health["healthy"], health["uses"]) == (True, 6)
+
+
+def test_clients_are_per_tenant_and_rebuilt_after_a_failed_call():
+    from orchestration.mcp_clients import ClientPool
+    
+    pool = ClientPool(idle_seconds=0, factories={"odoo": FakeClient})
+    with pool.client("odoo") as default, pool.client("odoo", "acme") as acme:
+        assert (default.tenant_id, acme.tenant_id) == (None, "acme")
+    
+    with pytest.raises(ConnectionError):
+        with pool.client("odoo", "acme") as broken:
+            raise ConnectionError("reset by peer")
+    assert broken.closed
+    
+    with pool.client("odoo", "acme") as rebuilt, pool.client("odoo") as same:
+        assert rebuilt is not acme and same is default
+    assert pool.built == 3
+
+
+def test_idle_clients_are_evicted_and_unhealthy_ones_dropped(monkeypatch):
+    from orchestration.mcp_clients import ClientPool
+    
+    pool = ClientPool(idle_seconds=60, factories={"odoo": FakeClient, "twitter": FakeClient})
+    with pool.client("odoo") as odoo_client:
+        pass
+    with pool.client("twitter", "acme"):
+        pass
+    
+    odoo_client.alive = False
+    report = pool.health()
+    assert report["odoo"]["healthy"] is False and odoo_client.closed
+    assert report["twitter@acme"]["healthy"] is True  # No check_session probe for twitter's fake
+    
+    later = time.monotonic() + 61
+    monkeypatch.setattr(time, "monotonic", lambda: later)
+    assert pool.evict_idle() == 1
+    assert pool.health() == {}
+
+
+def test_tenant_leases_use_tenant_credentials_or_refuse(workspace):
+    import json
+    from orchestration.mcp_clients import ClientPool
+    
+    tenant_secrets = workspace / "secrets" / "acme"
+    tenant_secrets.mkdir(parents=True)
+    (tenant_secrets / "linkedin_token.json").write_text(json.dumps({"access_token": "acme-li"}), encoding="utf-8")
+    
+    pool = ClientPool(idle_seconds=0, secrets_dir=workspace / "secrets")
+    with pool.client("linkedin", "acme") as linkedin:
+        assert linkedin.access_token == "acme-li"
+    
+    # Email has no per-tenant token: never hand a tenant the default account
+    with pytest.raises(ValueError, match="per-tenant"):
+        with pool.client("email", "acme"):
+            pass
+    assert pool.built == 1
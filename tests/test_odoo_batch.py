@@ -0,0 +1,88 @@
+"""
+Odoo Batch RPC Tests - search_read Round Trips, Batched Creates and the Read Cache
+
+Runs against benchmarks/fake_odoo_server.py on a local port.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_odoo_server import FakeOdooServer
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+from odoo_server import OdooServer
+
+
+@pytest.fixture
+def odoo(workspace, monkeypatch):
+    server = FakeOdooServer().start()
+    monkeypatch.setenv("ODOO_URL", server.base_url)
+    monkeypatch.setenv("ODOO_DB", "test")
+    monkeypatch.setenv("ODOO_PASSWORD", "test")
+    yield server
+    server.stop()
+
+
+def test_batch_creates_many_invoices_in_four_round_trips(odoo):
+    client = OdooServer()
+    invoices = [{"partner_name": f"Client {i % 5}", "amount": 100.0 + i, "description": f"Week {i}"} for i in range(50)]
+    
+    result = client.create_invoices(invoices)
+    
+    assert result["status"] == "success" and result["count"] == 50
+    assert odoo.stats["calls"] == 4  # Partner lookup, partner create, move create, post
+    assert len(odoo.records["res.partner"]) == 5
+    
+    # Partners are cached now: only the create and the post go to Odoo
+    client.create_bills([{"vendor_name": "Client 1", "amount": 20.0}, {"vendor_name": "Supplier", "amount": 30.0}])
+    assert odoo.stats["calls"] == 4 + 4
+    assert client.create_invoices(invoices[:10])["count"] == 10
+    assert odoo.stats["calls"] == 8 + 2
+    
+    listed = client.list_invoices(limit=100)
+    assert listed["count"] == 60 and odoo.stats["calls"] == 11
+    assert listed["invoices"][0]["partner"] == "Client 4" and listed["invoices"][0]["amount_total"] == 109.0
+    assert client.list_bills()["bills"][0]["vendor"] == "Supplier"
+
+
+def test_read_cache_is_invalidated_by_writes_and_expires(odoo, monkeypatch):
+    monkeypatch.setenv("ODOO_CACHE_TTL_SECONDS", "0.2")
+    client = OdooServer()
+    
+    assert client.get_balance()["accounts"][0]["code"] == "121000"
+    
+    # Balances moved by anyone else still show up: only the account ids are cached
+    odoo.records["account.account"][0]["current_balance"] = 750.0
+    assert client.get_balance()["balance"] == 750.0
+    assert odoo.methods["account.account.search_read"] == 1 and odoo.methods["account.account.read"] == 1
+    
+    client.create_invoice("Acme", 500.0)
+    client.create_invoice("Acme", 250.0)
+    assert odoo.methods["res.partner.search_read"] == 1  # Second invoice used the cached partner
+    
+    time.sleep(0.25)
+    client.create_invoice("Acme", 100.0)
+    assert odoo.methods["res.partner.search_read"] == 2
+    
+    partner = client.get_partner_balance("acme")
+    assert partner["partner"] == "Acme" and odoo.methods["res.partner.search_read"] == 3
+
+
+def test_single_and_batch_partner_lookups_match_names_exactly(odoo):
+    client = OdooServer()
+    client.create_invoices([{"partner_name": name, "amount": 10.0} for name in ("Acme Holdings", "Acme_Co")])
+    
+    # No substring or wildcard matches: "Acme" and "AcmeXCo" are new partners
+    client.create_invoice("Acme", 20.0)
+    client.create_bills([{"vendor_name": "AcmeXCo", "amount": 30.0}])
+    assert [p["name"] for p in odoo.records["res.partner"]] == ["Acme Holdings", "Acme_Co", "Acme", "AcmeXCo"]
+    
+    # Same name in another case is the same partner, on either path
+    client.cache.clear()
+    client.create_bill("acme_co", 40.0)
+    client.create_invoices([{"partner_name": "ACME", "amount": 50.0}])
+    assert len(odoo.records["res.partner"]) == 4
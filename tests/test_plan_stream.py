@@ -0,0 +1,194 @@
+"""
+Streaming Plan Tests - Incremental Parsing, Fail-Fast and Early Dispatch
+
+Provider calls go to benchmarks/fake_llm_server.py on a local port.
+"""
+
+import json
+
+import pytest
+
+from benchmarks.common import install_llm, write_inbox_tasks
+from benchmarks.fake_llm_server import FakeLLMServer
+from orchestration.plan_stream import PlanStreamParser, PlanStreamError
+
+PLAN = {
+    "thought_process": "Look up the invoice, then send a \"reminder\" {politely}.",
+    "requires_approval": False,
+    "confidence": 0.9,
+    "actions": [
+        {"mcp_server": "odoo_server", "command": "search_read", "parameters": {"domain": [["name", "=", "INV-1"]]}},
+        {"mcp_server": "email_server", "command": "send", "parameters": {"to": "a@b.example", "cc": None}}
+    ]
+}
+
+
+def fenced(plan):
+    return "```json\n" + json.dumps(plan, indent=2) + "\n```"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 10000])
+def test_actions_are_emitted_as_soon_as_they_close(chunk_size):
+    text = fenced(PLAN)
+    parser = PlanStreamParser()
+    seen = []  # (action, characters fed when it was emitted)
+    
+    for start in range(0, len(text), chunk_size):
+        for action in parser.feed(text[start:start + chunk_size]):
+            seen.append((action, min(len(text), start + chunk_size)))
+    
+    assert [action for action, _ in seen] == PLAN["actions"]
+    assert parser.fields["requires_approval"] is False
+    assert parser.close() == PLAN
+    
+    if chunk_size == 1:
+        # The first action is out before the second one has started
+        assert seen[0][1] < text.index('"email_server"')
+
+
+@pytest.mark.parametrize("text, fails_by", [
+    ("I need more information before I can plan this task. " * 10, 210),
+    ('```json\n{"thought_process": "x", "requires_approval": False, "actions": []}', 55),
+    ('{"actions": ["send the email"]}', 30),
+    ('{"confidence": 0.9,}', 20),
+])
+def test_malformed_output_fails_at_the_first_bad_character(text, fails_by):
+    parser = PlanStreamParser()
+    fed = 0
+    with pytest.raises(PlanStreamError):
+        for char in text:
+            fed += 1
+            parser.feed(char)
+    assert fed <= fails_by
+
+
+def test_truncated_plan_is_an_error():
+    parser = PlanStreamParser()
+    parser.feed(json.dumps(PLAN)[:-10])
+    with pytest.raises(PlanStreamError):
+        parser.close()
+
+
+@pytest.fixture
+def streaming_llm(workspace, monkeypatch):
+    server = FakeLLMServer(decode_tps=2000).start()
+    monkeypatch.setenv("LLM_PROVIDER", "anthropic")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setenv("ANTHROPIC_BASE_URL", server.base_url)
+    monkeypatch.setenv("LLM_STREAMING", "true")
+    from orchestration.llm_interface import LLMInterface
+    
+    yield server, LLMInterface()
+    server.stop()
+
+
+def test_streamed_reason_reports_first_action_before_full_plan(streaming_llm):
+    server, llm = streaming_llm
+    server.replay = [fenced(dict(PLAN, risk_assessment="Low. " * 100))]
+    received = []
+    
+    result = llm.reason({"task_id": "t1", "type": "email"}, {}, on_action=lambda i, a, f: received.append(i))
+    
+    assert "error" not in result
+    assert received == [0, 1]
+    assert result["actions"] == PLAN["actions"]
+    assert result["usage"]["output_tokens"] > 0
+    assert 0 < result["usage"]["first_action_ms"] < result["usage"]["latency_ms"]
+
+
+def test_streamed_reason_aborts_malformed_output(streaming_llm):
+    server, llm = streaming_llm
+    server.replay = ["Sorry, I cannot produce a plan for this. " * 200]
+    
+    result = llm.reason({"task_id": "t1", "type": "email"}, {})
+    
+    assert result["requires_approval"] is True
+    assert "No JSON plan" in result["error"]
+    assert llm.get_stats()["stream_aborts"] == 1
+
+
+class StreamingStubLLM:
+    """Replays a plan through on_action the way LLMInterface streaming does."""
+    
+    streaming = True
+    
+    def __init__(self, plan):
+        self.plan = plan
+        self.dispatched_before_return = None
+    
+    def reason(self, task, skills, context=None, on_action=None):
+        fields = {k: v for k, v in self.plan.items() if k != "actions"}
+        for index, action in enumerate(self.plan["actions"]):
+            on_action(index, action, fields)
+        self.dispatched_before_return = self._count_actions()
+        return dict(self.plan, usage={"first_action_ms": 1.0})
+    
+    def _count_actions(self):
+        from orchestration.audit_logger import get_audit_logger
+        return sum(1 for entry in get_audit_logger().get_logs() if entry["action"].startswith("mcp_action_"))
+
+
+def test_orchestrator_dispatches_allowlisted_prefix_early(workspace, monkeypatch):
+    monkeypatch.setenv("LLM_STREAM_EARLY_ACTIONS", "odoo_server.search_read")
+    from orchestration.orchestrator import Orchestrator
+    from orchestration.audit_logger import get_audit_logger
+    
+    llm = StreamingStubLLM(PLAN)
+    install_llm(llm)
+    orchestrator = Orchestrator()
+    write_inbox_tasks(orchestrator.inbox, 1)
+    
+    orchestrator.process_task(orchestrator.claim_task())
+    
+    actions = [e for e in get_audit_logger().get_logs() if e["action"].startswith("mcp_action_")]
+    assert llm.dispatched_before_return == 1
+    assert [e["action"] for e in actions] == ["mcp_action_odoo_server_search_read", "mcp_action_email_server_send"]
+    assert orchestrator.archive.count() == 1
+
+
+def test_orchestrator_waits_when_plan_needs_approval(workspace, monkeypatch):
+    monkeypatch.setenv("LLM_STREAM_EARLY_ACTIONS", "odoo_server.search_read")
+    from orchestration.orchestrator import Orchestrator
+    
+    llm = StreamingStubLLM(dict(PLAN, requires_approval=True))
+    install_llm(llm)
+    orchestrator = Orchestrator()
+    write_inbox_tasks(orchestrator.inbox, 1)
+    
+    orchestrator.process_task(orchestrator.claim_task())
+    
+    assert llm.dispatched_before_return == 0
+    assert len(list(orchestrator.approvals.glob("*_task.json"))) == 1
+
+
+class AbortingStreamStubLLM(StreamingStubLLM):
+    """Dispatches the first action, then the stream breaks (as LLMInterface reports it)."""
+    
+    def reason(self, task, skills, context=None, on_action=None):
+        fields = {k: v for k, v in self.plan.items() if k != "actions"}
+        on_action(0, self.plan["actions"][0], fields)
+        return {"thought_process": "", "actions": [], "requires_approval": True, "confidence": 0.0,
+                "error": "Streamed plan aborted: unterminated JSON"}
+
+
+def test_stream_aborted_after_an_early_action_fails_instead_of_replanning(workspace, monkeypatch):
+    monkeypatch.setenv("LLM_STREAM_EARLY_ACTIONS", "odoo_server.search_read")
+    from orchestration.orchestrator import Orchestrator
+    from orchestration.audit_logger import get_audit_logger
+    
+    install_llm(AbortingStreamStubLLM(PLAN))
+    orchestrator = Orchestrator()
+    write_inbox_tasks(orchestrator.inbox, 1)
+    
+    orchestrator.process_task(orchestrator.claim_task())
+    orchestrator._check_hitl_approvals()
+    
+    logs = get_audit_logger().get_logs()
+    assert [e["action"] for e in logs if e["action"].startswith("mcp_action_")] == ["mcp_action_odoo_server_search_read"]
+    [aborted] = [e for e in logs if e["action"] == "stream_aborted_after_dispatch"]
+    assert len(aborted["details"]["dispatched"]) == 1
+    
+    # Failed and archived: not parked for approval, not back in the inbox
+    assert not list(orchestrator.approvals.iterdir())
+    assert orchestrator.claim_task() is None
+    assert orchestrator.archive.count() == 1
@@ -0,0 +1,77 @@
+"""
+Queue State Tests - Dashboard Counters, Recent Ring and Idle Dashboard Passes
+"""
+
+import os
+import json
+
+from benchmarks.common import write_inbox_tasks
+
+
+def test_counters_follow_claim_complete_and_approval_events(workspace):
+    from orchestration.orchestrator import Orchestrator
+    
+    orchestrator = Orchestrator()
+    write_inbox_tasks(orchestrator.inbox, 3)
+    
+    first = orchestrator.claim_task()
+    assert orchestrator.queue_state.snapshot()["active"]["task_id"] == first["task_id"]
+    orchestrator._complete_task(first, success=True, result="done")
+    
+    second = orchestrator.claim_task()
+    orchestrator._handle_hitl_approval(second)
+    (orchestrator.approvals / f"{second['task_id']}.json.rejected").touch()
+    orchestrator._check_hitl_approvals()
+    
+    third = orchestrator.claim_task()
+    state = orchestrator.queue_state.snapshot()
+    assert (state["pending"], state["approvals"], state["completed"]) == (1, 0, 2)
+    assert [c["status"] for c in state["recent"]] == ["rejected", "completed"]
+    
+    # Same counters as a fresh scan of the directories
+    rescanned = Orchestrator().queue_state.snapshot()
+    assert {k: rescanned[k] for k in ("pending", "approvals", "completed")} == \
+        {k: state[k] for k in ("pending", "approvals", "completed")}
+    assert rescanned["active"]["task_id"] == third["task_id"]
+
+
+def test_startup_counts_archive_and_keeps_newest_completions(workspace):
+    from orchestration.queue_state import QueueState
+    
+    completed = workspace / "task_queue" / "completed"
+    completed.mkdir(parents=True)
+    for i in range(25):
+        task_file = completed / f"TASK_{i:02d}.json"
+        task_file.write_text(json.dumps({"task_id": f"TASK_{i:02d}", "status": "completed"}), encoding="utf-8")
+        os.utime(task_file, (1_700_000_000 + i, 1_700_000_000 + i))
+    
+    state = QueueState(workspace / "task_queue", recent=5).snapshot()
+    assert state["completed"] == 25
+    assert [c["task_id"] for c in state["recent"]] == [f"TASK_{i}" for i in range(24, 19, -1)]
+
+
+def test_idle_dashboard_pass_skips_completed_and_rewrite(workspace, monkeypatch):
+    from orchestration.orchestrator import Orchestrator
+    
+    orchestrator = Orchestrator()
+    write_inbox_tasks(orchestrator.inbox, 2)
+    orchestrator._complete_task(orchestrator.claim_task(), success=True, result="done")
+    
+    orchestrator.update_dashboard()
+    first = orchestrator.dashboard_path.stat()
+    assert "**Completed**: 1 tasks" in orchestrator.dashboard_path.read_text(encoding="utf-8")
+    
+    scanned = []
+    real_scandir = os.scandir
+    monkeypatch.setattr(os, "scandir", lambda path=".": scanned.append(str(path)) or real_scandir(path))
+    
+    orchestrator.update_dashboard()
+    assert scanned == []
+    assert orchestrator.dashboard_path.stat().st_ino == first.st_ino  # Not replaced
+    
+    # A change in the queue re-renders it
+    orchestrator.claim_task()
+    orchestrator.update_dashboard()
+    assert orchestrator.dashboard_path.stat().st_ino != first.st_ino
+    assert "**Active Tasks**: 1" in orchestrator.dashboard_path.read_text(encoding="utf-8")
+    assert not list(orchestrator.dashboard_path.parent.glob(".*.tmp"))
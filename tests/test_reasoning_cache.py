@@ -0,0 +1,140 @@
+"""
+Reasoning Cache Tests - Exact/Semantic Tiers, TTL, LRU and Persistence
+"""
+
+import pytest
+
+PLAN = {"thought_process": "Post it", "actions": [{"mcp_server": "facebook_server"}], "requires_approval": False, "confidence": 0.9}
+SKILLS = {"facebook_skills": "# Facebook"}
+
+
+def task(task_id, project="Website Launch", created_at="2026-02-08T20:19:45"):
+    return {
+        "task_id": task_id,
+        "task_type": "facebook_action",
+        "trigger": "project_completion",
+        "created_at": created_at,
+        "content": {"project_file": f"TASK_{project}.md"},
+        "instructions": f"Announce {project} on Facebook"
+    }
+
+
+@pytest.fixture
+def cache_env(workspace, monkeypatch):
+    monkeypatch.setenv("REASONING_CACHE_ENABLED", "true")
+    return workspace
+
+
+def test_exact_hit_ignores_the_envelope_but_not_the_content(cache_env):
+    from orchestration.reasoning_cache import ReasoningCache
+    
+    cache = ReasoningCache()
+    cache.store(task("fb_1"), SKILLS, "handbook", PLAN)
+    
+    hit = cache.lookup(task("fb_2", created_at="2026-03-01T09:00:00"), SKILLS, "handbook")
+    assert hit["actions"] == PLAN["actions"]
+    assert hit["usage"]["cache"] == "exact"
+    assert hit["requires_approval"] is True  # A reused plan with actions is reviewed
+    
+    # Dates and case in the content are part of the task
+    dated = dict(task("fb_6"), instructions="Announce Website Launch on Facebook on 2026-03-01 09:00:00")
+    cache.store(dated, SKILLS, "handbook", PLAN)
+    assert cache.lookup(dict(dated, instructions=dated["instructions"].replace("03-01", "04-01")), SKILLS, "handbook") is None
+    assert cache.lookup(dict(task("fb_7"), instructions="ANNOUNCE Website Launch on Facebook"), SKILLS, "handbook") is None
+    
+    # Different project, skills or vault context: miss
+    assert cache.lookup(task("fb_3", project="Mobile App"), SKILLS, "handbook") is None
+    assert cache.lookup(task("fb_4"), {"facebook_skills": "# Facebook v2"}, "handbook") is None
+    assert cache.lookup(task("fb_5"), SKILLS, "new handbook") is None
+    
+    stats = cache.get_stats()
+    assert stats["exact_hits"] == 1 and stats["misses"] == 5 and stats["hit_rate"] == round(1 / 6, 4)
+
+
+def test_ttl_and_lru_eviction(cache_env, monkeypatch):
+    monkeypatch.setenv("REASONING_CACHE_MAX_ENTRIES", "2")
+    from orchestration.reasoning_cache import ReasoningCache
+    
+    cache = ReasoningCache()
+    for name in ("Alpha", "Beta"):
+        cache.store(task(f"fb_{name}_1", project=name), SKILLS, None, PLAN)
+    cache.lookup(task("fb_Alpha_2", project="Alpha"), SKILLS)  # Alpha is now most recently used
+    cache.store(task("fb_Gamma_1", project="Gamma"), SKILLS, None, PLAN)
+    
+    assert cache.lookup(task("fb_Beta_2", project="Beta"), SKILLS) is None
+    assert cache.lookup(task("fb_Alpha_3", project="Alpha"), SKILLS) is not None
+    assert cache.get_stats()["evictions"] == 1
+    
+    cache.ttl_seconds = 0
+    assert cache.lookup(task("fb_Gamma_2", project="Gamma"), SKILLS) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_semantic_tier_reuses_near_duplicates_with_approval(cache_env, monkeypatch):
+    monkeypatch.setenv("REASONING_CACHE_EMBEDDINGS", "hashing")
+    monkeypatch.setenv("REASONING_CACHE_SIMILARITY", "0.9")
+    from orchestration.reasoning_cache import ReasoningCache
+    
+    cache = ReasoningCache()
+    embed = cache.embed
+    
+    def unlocked_embed(text):
+        assert not cache._lock.locked()  # Lookups and stores never wait on an embedding
+        return embed(text)
+    cache.embed = unlocked_embed
+    cache.store(task("fb_1", project="Website Launch Phase 1"), SKILLS, None, PLAN)
+    
+    hit = cache.lookup(task("fb_2", project="Website Launch Phase 2"), SKILLS)
+    assert hit["usage"]["cache"] == "semantic"
+    assert hit["requires_approval"] is True
+    
+    assert cache.lookup(task("fb_3", project="Quarterly tax filing for Contoso"), SKILLS) is None
+
+
+def test_entries_persist_and_errors_are_not_cached(cache_env):
+    from orchestration.reasoning_cache import ReasoningCache
+    
+    ReasoningCache().store(task("fb_1"), SKILLS, None, PLAN)
+    ReasoningCache().store(task("fb_x1", project="Failing"), SKILLS, None, dict(PLAN, error="boom"))
+    
+    reloaded = ReasoningCache()
+    assert reloaded.lookup(task("fb_2"), SKILLS) is not None
+    assert reloaded.lookup(task("fb_x2", project="Failing"), SKILLS) is None
+
+
+def test_stores_append_and_the_log_is_compacted(cache_env, monkeypatch):
+    monkeypatch.setenv("REASONING_CACHE_MAX_ENTRIES", "3")
+    from orchestration.reasoning_cache import ReasoningCache
+    
+    cache = ReasoningCache()
+    lines = []
+    for i in range(7):
+        cache.store(task(f"fb_{i}", project=f"Project {i}"), SKILLS, None, PLAN)
+        lines.append(len(cache.path.read_text(encoding="utf-8").splitlines()))
+    
+    # One line per store until the log holds 2x the cache, then a rewrite
+    assert lines == [1, 2, 3, 4, 5, 6, 3]
+    with open(cache.path, "a", encoding="utf-8") as f:
+        f.write('{"key": "torn')  # Crash mid-append
+    
+    reloaded = ReasoningCache()
+    assert reloaded.get_stats()["entries"] == 3
+    assert reloaded.lookup(task("fb_x", project="Project 6"), SKILLS) is not None
+    assert reloaded.lookup(task("fb_x", project="Project 3"), SKILLS) is None
+
+
+def test_orchestrator_skips_llm_on_cache_hit(cache_env):
+    from orchestration.orchestrator import Orchestrator
+    from orchestration.llm_interface import get_llm_interface
+    from benchmarks.common import write_inbox_tasks
+    
+    orchestrator = Orchestrator()
+    write_inbox_tasks(orchestrator.inbox, 1)
+    orchestrator.process_task(orchestrator.claim_task())
+    write_inbox_tasks(orchestrator.inbox, 1)
+    orchestrator.process_task(orchestrator.claim_task())
+    
+    assert get_llm_interface().calls == 1
+    assert orchestrator.reasoning_cache.get_stats()["exact_hits"] == 1
+    assert orchestrator.archive.count() == 1
+    assert len(list(orchestrator.approvals.glob("*_task.json"))) == 1  # The reused plan waits for a human
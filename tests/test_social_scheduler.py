@@ -0,0 +1,145 @@
+"""
+Social Scheduler Tests - Posting at the Platform Ceiling, Rate-Limit Headers and Deadline Queues
+
+Runs against benchmarks/fake_social_api.py with a fixed-window post limit.
+"""
+
+import sys
+import time
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_social_api import FakeSocialAPI, social_servers
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "mcp_servers"))
+
+import http_transport
+from social_scheduler import DeadlineExceeded, get_social_scheduler
+
+
+@pytest.fixture
+def api(workspace, monkeypatch):
+    server = FakeSocialAPI(post_limit=5, post_window=1).start()
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", server.ca_file)
+    monkeypatch.setenv("RATE_LIMIT_RESET_SKEW_SECONDS", "0")  # Same clock as the fake
+    http_transport.close_all()
+    yield server
+    http_transport.close_all()
+    server.stop()
+
+
+def test_posts_at_platform_ceiling_without_429s(api, workspace):
+    _, _, twitter, _ = social_servers(api, workspace / "secrets")
+    
+    started = time.time()
+    for i in range(15):
+        assert twitter.post_tweet(f"Tweet {i}")["tweet_id"]
+    finished = time.time()
+    
+    # 15 posts at 5 per 1s window fill exactly three windows: none wasted, none refused
+    windows = int(finished) - int(started) + 1
+    posts_per_hour = 15 / windows * 3600
+    assert api.stats["rate_limited"] == 0
+    assert len(api.posts) == 15
+    assert posts_per_hour == 5 * 3600
+
+
+def test_retry_after_and_graph_usage_block_posting(workspace, monkeypatch):
+    monkeypatch.setenv("GRAPH_USAGE_WINDOW_SECONDS", "3600")
+    scheduler = get_social_scheduler()
+    
+    scheduler.observe("twitter", "POST", 429, {"retry-after": "30"})
+    assert 29 < scheduler.wait_time("twitter") <= 30
+    
+    usage = {"123": [{"type": "pages", "call_count": 97, "total_time": 10, "estimated_time_to_regain_access": 0}]}
+    scheduler.observe("facebook", "GET", 200, {"x-business-use-case-usage": json.dumps(usage)})
+    assert 107 < scheduler.wait_time("facebook") <= 108  # 3 points over 95%, 36s each
+    
+    scheduler.observe("instagram", "GET", 200, {"x-app-usage": json.dumps({"call_count": 40})})
+    assert scheduler.wait_time("instagram") == 0
+    
+    with pytest.raises(DeadlineExceeded):
+        scheduler.acquire("twitter", deadline=time.monotonic() + 1)
+
+
+def test_only_publishing_calls_draw_from_the_posting_budget(workspace, monkeypatch):
+    monkeypatch.setenv("INSTAGRAM_POST_LIMIT", "1")
+    monkeypatch.setenv("INSTAGRAM_POST_WINDOW_SECONDS", "3600")
+    api = FakeSocialAPI().start()
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", api.ca_file)
+    http_transport.close_all()
+    _, instagram, _, _ = social_servers(api, workspace / "secrets")
+    scheduler = get_social_scheduler()
+    try:
+        # Three item containers, the carousel container and media_publish:
+        # one post, so one slot of a one-post budget
+        images = [f"https://img.example/{i}.jpg" for i in range(3)]
+        post = scheduler.submit("instagram", lambda: instagram.post_carousel(images, "Album"),
+                                deadline=time.monotonic() + 5)
+        assert post.result(10)["status"] == "success"
+        assert len(api.posts) == 5
+        with pytest.raises(DeadlineExceeded):
+            scheduler.acquire("instagram", deadline=time.monotonic() + 1)
+    finally:
+        instagram.close()
+        http_transport.close_all()
+        api.stop()
+
+
+def test_queued_posts_run_earliest_deadline_first(workspace):
+    scheduler = get_social_scheduler()
+    release = threading.Event()
+    sent = []
+    
+    blocker = scheduler.submit("linkedin", lambda: release.wait(5))
+    now = time.monotonic()
+    later = scheduler.submit("linkedin", lambda: sent.append("later"), deadline=now + 60)
+    sooner = scheduler.submit("linkedin", lambda: sent.append("sooner"), deadline=now + 30)
+    expired = scheduler.submit("linkedin", lambda: sent.append("expired"), deadline=now - 1)
+    release.set()
+    
+    assert blocker.result(5) is True
+    later.result(5), sooner.result(5)
+    with pytest.raises(DeadlineExceeded):
+        expired.result(5)
+    assert sent == ["sooner", "later"]
+
+
+def test_platinum_retry_waits_for_budget_then_backs_off(workspace, monkeypatch):
+    # A fresh process: mcp_servers/ is not on sys.path until the orchestrator adds it
+    monkeypatch.setattr(sys, "path", [p for p in sys.path if not p.endswith("mcp_servers")])
+    for module in ("social_scheduler", "platinum.orchestrator_platinum"):
+        monkeypatch.delitem(sys.modules, module, raising=False)
+    from platinum import orchestrator_platinum
+    
+    sleeps = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    
+    class RateLimitedOnce:
+        def __init__(self):
+            self.calls = 0
+        
+        def execute_action(self, action):
+            self.calls += 1
+            if self.calls == 1:
+                raise RuntimeError("429 Too Many Requests: rate limit exceeded")
+            return {"status": "success"}
+    
+    orchestrator = orchestrator_platinum.PlatinumOrchestrator.__new__(orchestrator_platinum.PlatinumOrchestrator)
+    orchestrator.execution_history, orchestrator.failure_patterns = [], {}
+    
+    # The platform's budget knows how long: wait exactly that, then retry
+    orchestrator_platinum.get_social_scheduler().observe("twitter", "POST", 429, {"retry-after": "30"})
+    orchestrator.action_executor = RateLimitedOnce()
+    result = orchestrator._execute_action_with_retry({"id": "a1", "type": "post", "platform": "twitter"})
+    assert result["status"] == "success" and result["attempts"] == 2
+    assert len(sleeps) == 1 and 29 < sleeps[0] <= 30
+    
+    # No block recorded for the platform: exponential backoff instead of a 0s spin
+    sleeps.clear()
+    orchestrator.action_executor = RateLimitedOnce()
+    result = orchestrator._execute_action_with_retry({"id": "a2", "type": "post", "platform": "facebook"})
+    assert result["status"] == "success" and sleeps == [2]
@@ -0,0 +1,107 @@
+"""
+Vault Index Tests - Shared Reads, Persisted Cursors and Change Detection
+"""
+
+import os
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from orchestration.completion_archive import CompletionArchive
+from orchestration.vault_index import IndexCursor, VaultIndex
+
+DAY = 86400
+
+
+@pytest.fixture
+def done(workspace):
+    return CompletionArchive(workspace / "obsidian_vault" / "Done", compact_days=0)
+
+
+def put(archive, days_ago, name, text):
+    when = time.time() - days_ago * DAY
+    day = datetime.fromtimestamp(when, tz=timezone.utc).strftime("%Y-%m-%d")
+    path = archive.root / day / name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (when, when))
+    return path
+
+
+def names(cursor):
+    return sorted(item.name for item in cursor.new_entries())
+
+
+def test_watchers_share_one_read_and_resume_after_restart(done, workspace, monkeypatch):
+    monkeypatch.setenv("VAULT_INDEX_REFRESH_SECONDS", "0")
+    for i in range(5):
+        put(done, 3, f"TASK_{i}.md", f"client project {i}")
+    index = VaultIndex(done.root)
+    odoo, instagram = IndexCursor(index, "odoo_watcher"), IndexCursor(index, "instagram_watcher")
+    
+    assert names(odoo) == names(instagram) == [f"TASK_{i}.md" for i in range(5)]
+    assert index.stats["files_read"] == 5
+    assert next(iter(instagram.new_entries())).read_text() == "client project 0"
+    odoo.commit()
+    instagram.commit()
+    index.close()
+    
+    # Restart: cursors and file signatures come back from the index; nothing is read
+    index = VaultIndex(done.root)
+    odoo, instagram = IndexCursor(index, "odoo_watcher"), IndexCursor(index, "instagram_watcher")
+    assert names(odoo) == [] and index.stats["files_read"] == 0
+    
+    # A new file and an edit; a touch without a content change is not a change
+    put(done, 0, "TASK_new.md", "launch")
+    edited = put(done, 0, "TASK_edit.md", "draft")
+    assert names(odoo) == ["TASK_edit.md", "TASK_new.md"]
+    odoo.commit()
+    edited.write_text("final invoice", encoding="utf-8")
+    os.utime(done.root / datetime.now(timezone.utc).strftime("%Y-%m-%d") / "TASK_new.md")
+    assert names(odoo) == ["TASK_edit.md"]
+    assert [item.read_text() for item in odoo.new_entries()] == ["final invoice"]
+    
+    # The lagging cursor still gets the stored copy of what it has not handled
+    assert len(names(instagram)) == 2
+    odoo.commit()
+    instagram.commit()
+    assert index._db.execute("SELECT COUNT(*) FROM files WHERE content IS NOT NULL").fetchone()[0] == 0
+    assert [item.read_text() for item in IndexCursor(index, "twitter_insights").new_entries()
+            if item.name == "TASK_3.md"] == ["client project 3"]
+
+
+def test_past_shards_are_not_relisted_until_they_change(done, workspace, monkeypatch):
+    monkeypatch.setenv("VAULT_INDEX_REFRESH_SECONDS", "0")
+    for days_ago in range(1, 11):
+        put(done, days_ago, f"TASK_{days_ago}.md", "project")
+    index = VaultIndex(done.root)
+    cursor = IndexCursor(index, "facebook_watcher")
+    assert len(names(cursor)) == 10
+    cursor.commit()
+    
+    listed = index.stats["days_listed"]
+    index.refresh()
+    assert index.stats["days_listed"] == listed  # No shard changed and none is today's
+    
+    # Compaction moves files into segments: same days, same files, no changes
+    done.compact(older_than_days=5)
+    assert names(cursor) == []
+    
+    put(done, 2, "TASK_late.md", "late arrival")
+    assert names(cursor) == ["TASK_late.md"]
+
+
+def test_each_done_folder_gets_its_own_index(done, workspace, monkeypatch):
+    monkeypatch.setenv("VAULT_INDEX_REFRESH_SECONDS", "0")
+    other = CompletionArchive(workspace / "vaults" / "tenant_b" / "Done", compact_days=0)
+    put(done, 1, "TASK_a.md", "tenant a")
+    put(other, 1, "TASK_b.md", "tenant b")
+    
+    index_a, index_b = VaultIndex(done.root), VaultIndex(other.root)
+    assert index_a.db_path != index_b.db_path
+    assert names(IndexCursor(index_a, "odoo_watcher")) == ["TASK_a.md"]
+    assert names(IndexCursor(index_b, "odoo_watcher")) == ["TASK_b.md"]
+    
+    # Same folder by another path: same index
+    assert VaultIndex(workspace / "obsidian_vault" / ".." / "obsidian_vault" / "Done").db_path == index_a.db_path
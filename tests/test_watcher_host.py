@@ -0,0 +1,128 @@
+"""
+Watcher Host Tests - One Scheduler, Supervised Plugins and Shared Task Writes
+"""
+
+import json
+import time
+import asyncio
+import threading
+from pathlib import Path
+
+from watcher_host import PLUGINS, WatcherHost, WatcherPlugin
+
+
+def wait_until(condition, timeout: float = 10) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def run_host(host: WatcherHost, until) -> None:
+    """Run the host until until() holds (or 10 s), then stop it."""
+    async def main() -> None:
+        running = asyncio.create_task(host.run())
+        deadline = time.monotonic() + 10
+        while not until() and time.monotonic() < deadline:
+            await asyncio.sleep(0.02)
+        host.stop()
+        await running
+    asyncio.run(main())
+
+
+def test_failing_and_hung_plugins_restart_without_delaying_the_others():
+    built = {"flaky": 0, "hung": 0}
+    closed = {"flaky": 0, "hung": 0}
+    steady_checks = {}  # When the hang started and when it was given up on
+    release = threading.Event()
+    
+    def steady() -> WatcherPlugin:
+        return WatcherPlugin(0.05, lambda: 1)
+    
+    def flaky() -> WatcherPlugin:
+        built["flaky"] += 1
+        
+        def check() -> int:
+            raise ConnectionError("API down")
+        return WatcherPlugin(0.01, check, lambda: closed.__setitem__("flaky", closed["flaky"] + 1))
+    
+    def hung() -> WatcherPlugin:
+        built["hung"] += 1
+        first = built["hung"] == 1
+        if not first:
+            steady_checks["rebuilt"] = host.stats["steady"]["checks"]
+        
+        def check() -> int:
+            if first:
+                steady_checks["hung"] = host.stats["steady"]["checks"]
+                release.wait()  # Never returns on its own
+            return 0
+        return WatcherPlugin(0.05, check, lambda: closed.__setitem__("hung", closed["hung"] + 1))
+    
+    host = WatcherHost({"steady": steady, "flaky": flaky, "hung": hung},
+                       max_failures=2, check_timeout=1.0, backoff=0.05, backoff_max=0.2, stagger=0)
+    run_host(host, lambda: host.stats["hung"]["checks"] >= 3 and host.stats["flaky"]["restarts"] >= 3)
+    release.set()
+    wait_until(lambda: closed["hung"] == 2)
+    
+    # Ticks kept coming while one plugin hung for a full check timeout (about 20 of them)
+    assert steady_checks["rebuilt"] - steady_checks["hung"] >= 3
+    assert host.stats["steady"]["tasks"] == host.stats["steady"]["checks"]
+    assert host.stats["steady"]["restarts"] == 0
+    
+    # Two failures in a row rebuild the plugin; each instance is closed
+    assert host.stats["flaky"]["restarts"] >= 3
+    assert host.stats["flaky"]["failures"] >= 2 * host.stats["flaky"]["restarts"]
+    assert host.stats["flaky"]["last_error"] in (
+        "WatcherHostError: 2 failed checks in a row", "ConnectionError: API down"  # Stopped between failures
+    )
+    assert built["flaky"] == host.stats["flaky"]["restarts"] + 1 == closed["flaky"]
+    
+    # The hung check timed out; a fresh instance on a fresh thread took over
+    assert host.stats["hung"]["restarts"] == 1 and built["hung"] == 2 == closed["hung"]
+    assert host.stats["hung"]["last_error"] == "CheckTimeout: check still running after 1s"
+    assert {stats["state"] for stats in host.stats.values()} == {"stopped"}
+
+
+def test_watchers_share_one_process_scan_and_task_writer(workspace, monkeypatch):
+    from orchestration import vault_index
+    
+    (workspace / "logs").mkdir()
+    (workspace / "watch_inbox").mkdir()
+    vault = workspace / "obsidian_vault"
+    (vault / "Business_Goals.md").write_text(
+        "# Business Goals\n\n- [x] ✅ Milestone: first 10 clients achieved\n", encoding="utf-8"
+    )
+    done = vault / "Done" / time.strftime("%Y-%m-%d", time.gmtime())
+    done.mkdir(parents=True)
+    (done / "TASK_acme.md").write_text("# Acme\n\nClient project delivered, invoice sent.\n", encoding="utf-8")
+    monkeypatch.setenv("WATCHER_HOST_HEALTH_SECONDS", "0.1")
+    
+    names = ("filesystem", "linkedin", "facebook", "instagram", "twitter", "odoo")
+    host = WatcherHost({name: PLUGINS[name] for name in names}, stagger=0)
+    inbox = workspace / "task_queue" / "inbox"
+    
+    def first_checks_done() -> bool:
+        if all(host.stats[name]["checks"] >= 1 for name in names):
+            if not (workspace / "watch_inbox" / "invoice.txt").exists():
+                (workspace / "watch_inbox" / "invoice.txt").write_text("Invoice #42", encoding="utf-8")
+            return any(inbox.glob("file_invoice_*.json"))
+        return False
+    
+    run_host(host, first_checks_done)
+    
+    tasks = [json.loads(path.read_text(encoding="utf-8")) for path in inbox.glob("*.json")]
+    assert {name: stats["failures"] for name, stats in host.stats.items()} == dict.fromkeys(names, 0)
+    assert {task.get("task_type", task.get("type")) for task in tasks} >= {
+        "file_process", "linkedin_post", "facebook_action", "instagram_action", "twitter_action", "odoo_action"
+    }
+    assert not list(inbox.glob(".*"))  # Every write was a complete rename
+    
+    # Prompts point at the sharded file, not a flat Done/<name>
+    [announcement] = [task for task in tasks if task.get("trigger") == "project_completion"]
+    project_path = announcement["content"]["project_path"]
+    assert Path(project_path).resolve() == done / "TASK_acme.md"
+    assert f"Read full project details from {project_path}" in announcement["instructions"]
+    
+    # Five watchers read Done/ through one index, refreshed once for all of them
+    [index] = vault_index._vault_indexes.values()
+    assert index.stats["refreshes"] == 1
@@ -18,7 +18,11 @@ from pathlib import Path
 from datetime import datetime, timedelta
 from typing import List, Dict
 from dotenv import load_dotenv
-import json
+
+from orchestration.dedupe_store import DedupeStore
+from orchestration.task_writer import write_task
+from orchestration.vault_cache import get_vault_cache
+from orchestration.vault_index import IndexCursor, get_vault_index
 
 # Load environment
 load_dotenv()
@@ -47,13 +51,16 @@ class FacebookWatcher:
     def __init__(self, vault_path: Path = VAULT_PATH):
         self.vault_path = vault_path
         self.done_folder = vault_path / "Done"
+        self.done_cursor = IndexCursor(get_vault_index(self.done_folder), 'facebook_watcher')  # New or changed files only
         self.task_queue = Path('./task_queue/inbox')
         self.business_goals = vault_path / "Business_Goals.md"
         self.handbook = vault_path / "Company_Handbook.md"
         
         # Track what we've already processed
-        self.state_file = Path('./task_queue/.facebook_watcher_state.json')
-        self.processed_tasks = self._load_state()
+        self.processed_tasks = DedupeStore(
+            Path('./task_queue/.facebook_watcher.keys.db'),
+            legacy_state=Path('./task_queue/.facebook_watcher_state.json')
+        )
         self.last_weekly_post = None
         
         # Ensure folders exist
@@ -61,38 +68,13 @@ class FacebookWatcher:
         
         logger.info(f"Facebook Watcher initialized. Vault: {vault_path}")
     
-    def _load_state(self) -> set:
-        """Load processed items from state file"""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get('processed_items', []))
-            except Exception as e:
-                logger.warning(f"Could not load state: {e}")
-        return set()
-    
-    def _save_state(self):
-        """Save processed items to state file"""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump({
-                    'processed_items': list(self.processed_tasks),
-                    'last_updated': datetime.now().isoformat()
-                }, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save state: {e}")
-    
     def check_completed_projects(self) -> List[Dict]:
         """Check /Done folder for high-value completed projects to announce"""
         opportunities = []
         
-        if not self.done_folder.exists():
-            return opportunities
-        
-        for task_file in self.done_folder.glob("*.md"):
+        for task_file in self.done_cursor.new_entries():
             # Skip if already processed
-            if task_file.name in self.processed_tasks:
+            if task_file.suffix != '.md' or task_file.name in self.processed_tasks:
                 continue
             
             try:
@@ -102,15 +84,17 @@ class FacebookWatcher:
                 if self._is_announcement_worthy(content):
                     opportunities.append({
                         'type': 'project_completion',
+                        'key': task_file.name,
                         'file': task_file.name,
+                        'path': str(task_file.path),  # Its date shard under Done/
                         'content_preview': content[:300]
                     })
-                    self.processed_tasks.add(task_file.name)
                     logger.info(f"Found Facebook announcement opportunity: {task_file.name}")
             
             except Exception as e:
                 logger.error(f"Error reading {task_file}: {e}")
         
+        self.done_cursor.commit()
         return opportunities
     
     def _is_announcement_worthy(self, content: str) -> bool:
@@ -130,11 +114,11 @@ class FacebookWatcher:
         """Check Business_Goals.md for milestone achievements"""
         opportunities = []
         
-        if not self.business_goals.exists():
-            return opportunities
-        
         try:
-            content = self.business_goals.read_text(encoding='utf-8')
+            # Shared, mtime-invalidated read (one read per edit for all watchers)
+            content = get_vault_cache().read(self.business_goals)
+            if content is None:
+                return opportunities
             
             # Look for recently checked milestones (marked with [x] or ✅)
             lines = content.split('\n')
@@ -149,10 +133,10 @@ class FacebookWatcher:
                     
                     opportunities.append({
                         'type': 'milestone_achievement',
+                        'key': milestone_key,
                         'content': line.strip(),
                         'context': '\n'.join(lines[max(0, i-2):min(len(lines), i+3)])
                     })
-                    self.processed_tasks.add(milestone_key)
                     logger.info(f"Found milestone for Facebook: {line.strip()[:50]}")
         
         except Exception as e:
@@ -184,7 +168,6 @@ class FacebookWatcher:
     def create_facebook_task(self, opportunity: Dict):
         """Create JSON task file in task_queue/inbox for Claude to generate Facebook post"""
         task_id = f"facebook_{opportunity['type']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        task_file = self.task_queue / f"{task_id}.json"
         
         # Build instructions based on opportunity type
         if opportunity['type'] == 'project_completion':
@@ -196,7 +179,7 @@ Project: {opportunity['file']}
 Preview: {opportunity['content_preview']}
 
 Action Steps:
-1. Read full project details from /Done/{opportunity['file']}
+1. Read full project details from {opportunity['path']}
 2. Create engaging Facebook post highlighting:
    - Project achievement and outcome
    - Business value delivered
@@ -218,6 +201,7 @@ Post Tone:
 """
             content = {
                 'project_file': opportunity['file'],
+                'project_path': opportunity['path'],
                 'content_preview': opportunity['content_preview']
             }
         
@@ -307,14 +291,13 @@ Post Guidelines:
         }
         
         try:
-            with open(task_file, 'w') as f:
-                json.dump(task, f, indent=2)
+            write_task(self.task_queue, f"{task_id}.json", task)
             logger.info(f"Created Facebook task: {task_id} (trigger: {opportunity['type']})")
         except Exception as e:
             logger.error(f"Failed to create task file: {e}")
     
-    def run_check(self):
-        """Run one check cycle"""
+    def run_check(self) -> int:
+        """Run one check cycle; returns the number of opportunities found"""
         logger.info("=== Facebook Watcher Check Cycle ===")
         
         all_opportunities = []
@@ -332,16 +315,19 @@ Post Guidelines:
         all_opportunities.extend(weekly)
         
         # Create tasks for each opportunity
+        # Marked processed once its task exists
         for opportunity in all_opportunities:
             self.create_facebook_task(opportunity)
+            if 'key' in opportunity:
+                self.processed_tasks.add(opportunity['key'])
         
         if all_opportunities:
-            self._save_state()
             logger.info(f"Found {len(all_opportunities)} Facebook posting opportunities")
         else:
             logger.info("No new Facebook posting opportunities")
         
         logger.info("=== Check Cycle Complete ===\n")
+        return len(all_opportunities)
     
     def run(self):
         """Main loop - run checks continuously"""
@@ -6,12 +6,13 @@ Monitors watch_inbox folder and creates tasks in task_queue/inbox
 import os
 import time
 import logging
-import json
 from pathlib import Path
 from datetime import datetime, timezone
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
+from orchestration.task_writer import write_task
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
@@ -73,7 +74,6 @@ class FilesystemWatcher(FileSystemEventHandler):
             
             # Create task file in task_queue/inbox as JSON (per Hackathon 0 spec)
             task_id = f"file_{file_path.stem}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
-            task_file = self.task_queue / f"{task_id}.json"
             
             # CRITICAL FIX: Store FULL content with required_skills
             # This ensures Claude has all information and knows which skills to use
@@ -94,19 +94,23 @@ class FilesystemWatcher(FileSystemEventHandler):
                 'required_skills': ['planning_skills', 'approval_skills']
             }
             
-            with open(task_file, 'w', encoding='utf-8') as f:
-                json.dump(task, f, indent=2, ensure_ascii=False)
+            task_file = write_task(self.task_queue, f"{task_id}.json", task)
             
             logger.info(f"✅ Created task: {task_file.name} (content: {len(content_full)} chars)")
             
         except Exception as e:
             logger.error(f"Error processing file {file_path.name}: {e}")
     
-    def start(self):
-        """Start watching the filesystem"""
+    def observe(self) -> Observer:
+        """Start an observer thread that calls on_created() for new files"""
         observer = Observer()
         observer.schedule(self, str(self.watch_path), recursive=False)
         observer.start()
+        return observer
+    
+    def start(self):
+        """Start watching the filesystem"""
+        observer = self.observe()
         
         logger.info(f"Watching {self.watch_path} for new files...")
         
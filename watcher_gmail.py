@@ -1,20 +1,30 @@
 """
 Gmail Watcher - Hackathon 0 Compliant
 Monitors Gmail for important emails and creates tasks in task_queue/inbox
+
+New mail comes from users.history.list since the history ID saved in
+task_queue/.gmail_state.json (watchers/gmail_sync.py): headers are read
+in batches for triage, bodies only for important or starred unread mail.
 """
 
 import os
+import sys
 import time
 import logging
-import json
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Optional, Any
+from typing import Optional, Any, Dict, List
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "watchers"))
+
+from gmail_sync import GmailSync
+from orchestration.dedupe_store import DedupeStore
+from orchestration.task_writer import write_task
+
 load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -27,8 +37,14 @@ class GmailWatcher:
         self.task_queue = Path(task_queue_path) / "inbox"
         self.task_queue.mkdir(parents=True, exist_ok=True)
         self.check_interval = check_interval
-        self.processed_ids = set()
         self.service: Optional[Any] = None
+        self.sync: Optional[GmailSync] = None
+        
+        # History replays after a crash or resync must not repeat tasks
+        self.processed_ids = DedupeStore(
+            Path(task_queue_path) / ".gmail.keys.db",
+            ttl_seconds=float(os.getenv('DEDUPE_MESSAGE_TTL_DAYS', '30')) * 86400
+        )
         
         # Gmail API setup
         creds_path = os.getenv('GMAIL_CREDENTIALS_PATH', './secrets/gmail_credentials.json')
@@ -37,67 +53,52 @@ class GmailWatcher:
         try:
             self.creds = Credentials.from_authorized_user_file(token_path)
             self.service = build('gmail', 'v1', credentials=self.creds)
+            self.sync = GmailSync(
+                self.service,
+                Path(task_queue_path) / ".gmail_state.json",
+                label_ids=['INBOX'],
+                resync_query='is:unread is:important OR is:unread is:starred',
+                added_labels=['IMPORTANT', 'STARRED'],  # Unread mail starred or marked important later
+                logger=logger
+            )
             logger.info("Gmail watcher initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Gmail API: {e}")
             self.service = None
     
-    def check_for_new_emails(self):
-        """Check for new unread important emails"""
-        if not self.service:
+    def is_important(self, message: Dict[str, Any]) -> bool:
+        """Triage on metadata labels: new, unread and important or starred"""
+        labels = message['labels']
+        return (
+            'UNREAD' in labels and ('IMPORTANT' in labels or 'STARRED' in labels)
+            and message['message_id'] not in self.processed_ids
+        )
+    
+    def check_for_new_emails(self) -> List[Dict[str, Any]]:
+        """Check for new unread important emails (headers and bodies)"""
+        if not self.sync:
             return []
         
         try:
-            # Query for unread important emails
-            results = self.service.users().messages().list(
-                userId='me',
-                q='is:unread is:important OR is:unread is:starred',
-                maxResults=10
-            ).execute()
-            
-            messages = results.get('messages', [])
-            new_messages = [m for m in messages if m['id'] not in self.processed_ids]
-            
+            new_messages = self.sync.poll(keep=self.is_important)
+            self.sync.fetch_bodies(new_messages)
             return new_messages
             
         except HttpError as e:
             logger.error(f"Gmail API error: {e}")
             return []
     
-    def create_task_file(self, message_id: str):
-        if not self.service:
-            logger.error("Gmail service not initialized")
-            return
-            
-        """Create task file in task_queue/inbox for email"""
+    def create_task_file(self, message: Dict[str, Any]) -> bool:
+        """Create task file in task_queue/inbox for email; returns False if it could not be written"""
+        message_id = message['message_id']
         try:
-            msg = self.service.users().messages().get(
-                userId='me',
-                id=message_id,
-                format='full'
-            ).execute()
-            
-            # Extract headers
-            headers = {h['name']: h['value'] for h in msg['payload']['headers']}
-            sender = headers.get('From', 'Unknown')
-            subject = headers.get('Subject', 'No Subject')
-            date = headers.get('Date', '')
-            
-            # Extract body
-            body = ""
-            if 'parts' in msg['payload']:
-                for part in msg['payload']['parts']:
-                    if part['mimeType'] == 'text/plain':
-                        import base64
-                        body = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-                        break
-            elif 'body' in msg['payload'] and 'data' in msg['payload']['body']:
-                import base64
-                body = base64.urlsafe_b64decode(msg['payload']['body']['data']).decode('utf-8')
+            sender = message['from']
+            subject = message['subject']
+            date = message['date']
+            body = message.get('body') or (self.sync.fetch_body(message_id) if self.sync else "")
             
             # Create JSON task file per Hackathon 0 spec
             task_id = f"email_{message_id}_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
-            task_file = self.task_queue / f"{task_id}.json"
             
             # Build task with required_skills for proper skill-based reasoning
             task = {
@@ -130,14 +131,34 @@ Action Steps:
                 'required_skills': ['email_skills', 'approval_skills', 'planning_skills']
             }
             
-            with open(task_file, 'w', encoding='utf-8') as f:
-                json.dump(task, f, indent=2, ensure_ascii=False)
+            task_file = write_task(self.task_queue, f"{task_id}.json", task)
             
             self.processed_ids.add(message_id)
             logger.info(f"✅ Created email task: {task_file.name}")
+            return True
             
         except Exception as e:
             logger.error(f"Error creating task for message {message_id}: {e}")
+            return False
+    
+    def run_check(self) -> int:
+        """Run one check cycle; returns the number of new important emails"""
+        new_emails = self.check_for_new_emails()
+        
+        failed = 0
+        if new_emails:
+            logger.info(f"Found {len(new_emails)} new important email(s)")
+            for msg in new_emails:
+                failed += not self.create_task_file(msg)
+        if self.sync:
+            # A failed fetch already dropped the pending history ID; a failed
+            # task write keeps the old one so the message is read again
+            if failed:
+                logger.warning(f"{failed} email(s) without a task; history ID not advanced")
+                self.sync.rollback()
+            else:
+                self.sync.commit()
+        return len(new_emails)
     
     def run(self):
         """Main watcher loop"""
@@ -145,12 +166,7 @@ Action Steps:
         
         while True:
             try:
-                new_emails = self.check_for_new_emails()
-                
-                if new_emails:
-                    logger.info(f"Found {len(new_emails)} new important email(s)")
-                    for msg in new_emails:
-                        self.create_task_file(msg['id'])
+                self.run_check()
                 
                 time.sleep(self.check_interval)
                 
@@ -0,0 +1,389 @@
+"""
+Watcher Host - Every Watcher in One Process on One asyncio Event Loop
+
+Replaces one pm2 process per watcher (each paying interpreter startup,
+its own dotenv and logging setup and a time.sleep loop) with a single
+process that runs the watchers as plugins.
+
+ARCHITECTURAL RULES:
+1. A plugin is a check interval, a blocking check() (one pass of the
+   watcher's old loop body) and a close(); PLUGINS maps names to
+   factories for the standalone watcher_*.py classes and the watchers/
+   BaseWatcher subclasses (imported only when enabled)
+2. One scheduler: the event loop wakes each plugin at fixed-rate ticks
+   (first ticks staggered); no thread sleeps between checks
+3. Isolation: a plugin's checks run on its own worker thread, so a slow
+   or hung check never delays another watcher, and each plugin has its
+   own supervisor task that no error escapes
+4. Restart: a failed start, WATCHER_HOST_MAX_FAILURES failed checks in a
+   row or a check running past WATCHER_HOST_CHECK_TIMEOUT_SECONDS closes
+   the plugin and builds a new one after an exponential backoff
+5. Task files are written by orchestration/task_writer.write_task() only
+
+Usage:
+    python watcher_host.py
+    python watcher_host.py --watchers odoo,twitter --once
+"""
+
+import os
+import sys
+import signal
+import asyncio
+import logging
+import argparse
+import importlib
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from dotenv import load_dotenv
+
+REPO_ROOT = Path(__file__).resolve().parent
+sys.path.insert(0, str(REPO_ROOT))
+sys.path.append(str(REPO_ROOT / "watchers"))
+
+load_dotenv()
+
+logger = logging.getLogger("watcher_host")
+
+# The watchers pm2 used to start one process each
+DEFAULT_WATCHERS = "filesystem,gmail,linkedin,facebook,instagram,twitter,odoo"
+
+CLOSE_TIMEOUT = 30.0  # Seconds to wait for a plugin's close() before abandoning its thread
+
+
+class WatcherHostError(Exception):
+    """Raised when a plugin has to be restarted."""
+    pass
+
+
+class CheckTimeout(WatcherHostError):
+    """Raised when a check outlives WATCHER_HOST_CHECK_TIMEOUT_SECONDS (its thread is abandoned)."""
+    pass
+
+
+class WatcherPlugin:
+    """One hosted watcher: what the scheduler runs, how often, and its shutdown."""
+    
+    def __init__(
+        self,
+        interval: float,
+        check: Callable[[], Optional[int]],
+        close: Optional[Callable[[], None]] = None
+    ):
+        """
+        Args:
+            interval: Seconds between the starts of two checks
+            check: One blocking check; returns the number of tasks created
+            close: Releases the watcher's resources (stores, observers, clients)
+        """
+        self.interval = interval
+        self.check = check
+        self.close = close or (lambda: None)
+
+
+def _observer_check(observer: Any) -> Callable[[], int]:
+    """Check for event-driven watchers: fails when the observer thread died."""
+    def check() -> int:
+        if not observer.is_alive():
+            raise WatcherHostError("filesystem observer thread stopped")
+        return 0
+    return check
+
+
+def _health_interval() -> float:
+    return float(os.getenv("WATCHER_HOST_HEALTH_SECONDS", "30"))
+
+
+def _filesystem() -> WatcherPlugin:
+    from watcher_filesystem import FilesystemWatcher
+    
+    observer = FilesystemWatcher().observe()
+    
+    def close() -> None:
+        observer.stop()
+        observer.join()
+    return WatcherPlugin(_health_interval(), _observer_check(observer), close)
+
+
+def _gmail() -> WatcherPlugin:
+    from watcher_gmail import GmailWatcher
+    
+    watcher = GmailWatcher()
+    return WatcherPlugin(watcher.check_interval, watcher.run_check, watcher.processed_ids.close)
+
+
+def _linkedin() -> WatcherPlugin:
+    from watcher_linkedin import LinkedInWatcher
+    
+    watcher = LinkedInWatcher()
+    if not watcher.is_authenticated():
+        logger.warning("LinkedIn not authenticated. Limited functionality. Run: python setup_linkedin.py")
+    return WatcherPlugin(watcher.check_interval, watcher.run_check)
+
+
+def _facebook() -> WatcherPlugin:
+    from watcher_facebook import CHECK_INTERVAL, FacebookWatcher
+    
+    watcher = FacebookWatcher()
+    return WatcherPlugin(CHECK_INTERVAL, watcher.run_check, watcher.processed_tasks.close)
+
+
+def _instagram() -> WatcherPlugin:
+    from watcher_instagram import InstagramWatcher
+    
+    watcher = InstagramWatcher()
+    return WatcherPlugin(watcher.check_interval, watcher.run_check, watcher.processed_items.close)
+
+
+def _twitter() -> WatcherPlugin:
+    from watcher_twitter import TwitterWatcher
+    
+    watcher = TwitterWatcher()
+    return WatcherPlugin(watcher.check_interval, watcher.run_check, watcher.processed_items.close)
+
+
+def _odoo() -> WatcherPlugin:
+    from watcher_odoo import OdooWatcher
+    
+    watcher = OdooWatcher()
+    return WatcherPlugin(watcher.check_interval, watcher.run_check, watcher.processed_items.close)
+
+
+def _base_watcher(module: str, class_name: str) -> Callable[[], WatcherPlugin]:
+    """Factory for a watchers/ BaseWatcher subclass: connect(), then poll() on schedule."""
+    def factory() -> WatcherPlugin:
+        watcher = getattr(importlib.import_module(module), class_name)()
+        watcher.connect()
+        watcher.running = True  # stop() only cleans up a running watcher
+        if getattr(watcher, "observer", None) is not None:
+            return WatcherPlugin(_health_interval(), _observer_check(watcher.observer), watcher.stop)
+        return WatcherPlugin(watcher.check_interval, watcher.poll, watcher.stop)
+    return factory
+
+
+PLUGINS: Dict[str, Callable[[], WatcherPlugin]] = {
+    "filesystem": _filesystem,
+    "gmail": _gmail,
+    "linkedin": _linkedin,
+    "facebook": _facebook,
+    "instagram": _instagram,
+    "twitter": _twitter,
+    "odoo": _odoo,
+    "watchers.filesystem": _base_watcher("filesystem_watcher", "FilesystemWatcher"),
+    "watchers.gmail": _base_watcher("gmail_watcher", "GmailWatcher"),
+    "watchers.whatsapp": _base_watcher("whatsapp_watcher", "WhatsAppWatcher"),
+    "watchers.finance": _base_watcher("finance_watcher", "FinanceWatcher")
+}
+
+
+class WatcherHost:
+    """
+    Runs watcher plugins on one event loop, each under its own supervisor.
+    
+    Usage:
+        host = WatcherHost({name: PLUGINS[name] for name in ("odoo", "twitter")})
+        asyncio.run(host.run())  # Until host.stop()
+    """
+    
+    def __init__(
+        self,
+        plugins: Dict[str, Callable[[], WatcherPlugin]],
+        once: bool = False,
+        max_failures: Optional[int] = None,
+        check_timeout: Optional[float] = None,
+        backoff: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        stagger: Optional[float] = None
+    ):
+        """
+        Args:
+            plugins: Plugin name -> factory (called on the plugin's worker thread)
+            once: Run every plugin's check once, then return
+            max_failures: Failed checks in a row before a restart (default: env)
+            check_timeout: Seconds a check may run before a restart (default: env)
+            backoff: First restart delay in seconds, doubled per restart (default: env)
+            backoff_max: Longest restart delay in seconds (default: env)
+            stagger: Seconds between the first checks of consecutive plugins (default: env)
+        """
+        self.plugins = plugins
+        self.once = once
+        self.max_failures = max_failures or int(os.getenv("WATCHER_HOST_MAX_FAILURES", "3"))
+        self.check_timeout = check_timeout or float(os.getenv("WATCHER_HOST_CHECK_TIMEOUT_SECONDS", "900"))
+        self.backoff = backoff if backoff is not None else float(os.getenv("WATCHER_HOST_BACKOFF_SECONDS", "5"))
+        self.backoff_max = backoff_max or float(os.getenv("WATCHER_HOST_BACKOFF_MAX_SECONDS", "300"))
+        self.stagger = stagger if stagger is not None else float(os.getenv("WATCHER_HOST_STAGGER_SECONDS", "1"))
+        
+        self.stats: Dict[str, Dict[str, Any]] = {
+            name: {"state": "waiting", "checks": 0, "failures": 0, "restarts": 0, "tasks": 0, "last_error": None}
+            for name in plugins
+        }
+        self._stopping: Optional[asyncio.Event] = None
+    
+    async def run(self) -> None:
+        """Supervise every plugin until stop() (or one check each with once)."""
+        self._stopping = asyncio.Event()
+        logger.info(f"Hosting {len(self.plugins)} watchers: {', '.join(self.plugins)}")
+        await asyncio.gather(*(
+            asyncio.create_task(self._supervise(name, factory, 0 if self.once else i * self.stagger), name=name)
+            for i, (name, factory) in enumerate(self.plugins.items())
+        ))
+        logger.info("Watcher host stopped")
+    
+    def stop(self) -> None:
+        """Finish running checks, close every plugin and return from run()."""
+        if self._stopping is not None:
+            self._stopping.set()
+    
+    async def _sleep(self, seconds: float) -> bool:
+        """Wait up to seconds; returns True if the host is stopping."""
+        try:
+            await asyncio.wait_for(self._stopping.wait(), timeout=max(0.0, seconds))
+        except asyncio.TimeoutError:
+            pass
+        return self._stopping.is_set()
+    
+    async def _supervise(self, name: str, factory: Callable[[], WatcherPlugin], delay: float) -> None:
+        """Build, schedule and rebuild one plugin; never raises."""
+        loop = asyncio.get_running_loop()
+        stats = self.stats[name]
+        backoff = self.backoff
+        if await self._sleep(delay):
+            return
+        
+        while True:
+            executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"watcher-{name}")
+            plugin = None
+            hung = False
+            succeeded = stats["checks"] - stats["failures"]
+            try:
+                plugin = await loop.run_in_executor(executor, factory)
+                stats["state"] = "running"
+                await self._schedule(name, plugin, executor)
+            except Exception as e:
+                hung = isinstance(e, CheckTimeout)
+                stats["last_error"] = f"{type(e).__name__}: {e}"
+                logger.error(f"{name}: {stats['last_error']}")
+            finally:
+                await self._close(name, plugin, executor, hung)
+            
+            if self._stopping.is_set() or self.once:
+                stats["state"] = "stopped"
+                return
+            
+            if stats["checks"] - stats["failures"] > succeeded:
+                backoff = self.backoff  # It worked for a while: not a crash loop
+            stats["state"] = "backoff"
+            logger.warning(f"{name}: restarting in {backoff:g}s")
+            if await self._sleep(backoff):
+                stats["state"] = "stopped"
+                return
+            stats["restarts"] += 1
+            backoff = min(backoff * 2, self.backoff_max)
+    
+    async def _schedule(self, name: str, plugin: WatcherPlugin, executor: ThreadPoolExecutor) -> None:
+        """Run checks at fixed-rate ticks; returns on stop, raises when a restart is due."""
+        loop = asyncio.get_running_loop()
+        stats = self.stats[name]
+        failures = 0
+        next_check = loop.time()
+        
+        while True:
+            stats["checks"] += 1
+            try:
+                created = await asyncio.wait_for(loop.run_in_executor(executor, plugin.check), self.check_timeout)
+                stats["tasks"] += created or 0
+                failures = 0
+            except asyncio.TimeoutError:
+                stats["failures"] += 1
+                raise CheckTimeout(f"check still running after {self.check_timeout:g}s")
+            except Exception as e:
+                stats["failures"] += 1
+                failures += 1
+                stats["last_error"] = f"{type(e).__name__}: {e}"
+                logger.error(f"{name}: check failed ({failures}/{self.max_failures}): {e}", exc_info=True)
+                if failures >= self.max_failures:
+                    raise WatcherHostError(f"{failures} failed checks in a row") from e
+            
+            if self.once:
+                return
+            # A check longer than the interval delays the next one instead of bunching them up
+            next_check = max(next_check + plugin.interval, loop.time())
+            if await self._sleep(next_check - loop.time()):
+                return
+    
+    async def _close(
+        self,
+        name: str,
+        plugin: Optional[WatcherPlugin],
+        executor: ThreadPoolExecutor,
+        hung: bool = False
+    ) -> None:
+        """Close the plugin on its own thread, then let the thread go."""
+        loop = asyncio.get_running_loop()
+        if plugin is not None and hung:
+            # Queued behind the hung check: runs if it ever returns, and the
+            # new instance does not wait for it
+            executor.submit(plugin.close)
+        elif plugin is not None:
+            try:
+                await asyncio.wait_for(loop.run_in_executor(executor, plugin.close), CLOSE_TIMEOUT)
+            except Exception as e:
+                logger.error(f"{name}: close failed: {type(e).__name__}: {e}")
+        executor.shutdown(wait=False)
+
+
+def enabled_plugins(names: Optional[str] = None) -> Dict[str, Callable[[], WatcherPlugin]]:
+    """
+    Factories for a comma-separated list of plugin names.
+    
+    Args:
+        names: e.g. "odoo,twitter" (default: WATCHER_HOST_WATCHERS)
+    
+    Returns:
+        Name -> factory, in the order given
+    """
+    names = names or os.getenv("WATCHER_HOST_WATCHERS", DEFAULT_WATCHERS)
+    selected = [name.strip() for name in names.split(",") if name.strip()]
+    unknown = [name for name in selected if name not in PLUGINS]
+    if unknown:
+        raise ValueError(f"Unknown watchers: {', '.join(unknown)} (known: {', '.join(PLUGINS)})")
+    return {name: PLUGINS[name] for name in selected}
+
+
+async def _serve(host: WatcherHost) -> None:
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, host.stop)
+        except NotImplementedError:  # Windows: KeyboardInterrupt still ends the process
+            pass
+    await host.run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--watchers", help=f"Comma-separated plugin names (default: WATCHER_HOST_WATCHERS or {DEFAULT_WATCHERS})")
+    parser.add_argument("--once", action="store_true", help="Run one check per watcher, then exit")
+    args = parser.parse_args()
+    
+    # Configured before any watcher module is imported, so their own
+    # logging.basicConfig() calls are no-ops and everything lands here
+    Path("logs").mkdir(exist_ok=True)
+    logging.basicConfig(
+        level=os.getenv("LOG_LEVEL", "INFO"),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[
+            logging.FileHandler("logs/watcher_host.log", encoding="utf-8"),
+            logging.StreamHandler()
+        ]
+    )
+    
+    host = WatcherHost(enabled_plugins(args.watchers), once=args.once)
+    asyncio.run(_serve(host))
+    for name, stats in host.stats.items():
+        logger.info(f"{name}: {stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,11 @@ from dotenv import load_dotenv
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from orchestration.dedupe_store import DedupeStore
+from orchestration.task_writer import write_task
+from orchestration.vault_cache import get_vault_cache
+from orchestration.vault_index import IndexCursor, get_vault_index
+
 load_dotenv()
 
 # Configure logging
@@ -51,8 +56,13 @@ class InstagramWatcher:
         self.check_interval = int(os.getenv('INSTAGRAM_CHECK_INTERVAL', '3600'))  # 1 hour
         
         # Track processed items
-        self.state_file = Path('./task_queue/.instagram_watcher_state.json')
-        self.processed_items = self._load_state()
+        self.processed_items = DedupeStore(
+            Path('./task_queue/.instagram_watcher.keys.db'),
+            legacy_state=Path('./task_queue/.instagram_watcher_state.json')
+        )
+        
+        # Done/ is read incrementally (only files new or changed since the last check)
+        self.done_cursor = IndexCursor(get_vault_index(self.vault_path / 'Done'), 'instagram_watcher')
         
         # Visual keywords for triggering posts
         self.visual_keywords = [
@@ -69,32 +79,9 @@ class InstagramWatcher:
             'development', 'progress', 'work-in-progress', 'wip'
         ]
     
-    def _load_state(self) -> set:
-        """Load processed items from state file"""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get('processed_items', []))
-            except Exception as e:
-                logger.warning(f"Could not load state: {e}")
-        return set()
-    
-    def _save_state(self):
-        """Save processed items to state file"""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump({
-                    'processed_items': list(self.processed_items),
-                    'last_updated': datetime.now().isoformat()
-                }, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save state: {e}")
-    
     def _create_task(self, trigger_type: str, content: Dict[str, Any]):
         """Create Instagram task in inbox"""
         task_id = f"instagram_{trigger_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        task_file = self.task_queue / f"{task_id}.json"
         
         task = {
             'task_id': task_id,
@@ -107,8 +94,7 @@ class InstagramWatcher:
             'required_skills': ['instagram_skills', 'social_skills', 'approval_skills', 'planning_skills']
         }
         
-        with open(task_file, 'w') as f:
-            json.dump(task, f, indent=2)
+        write_task(self.task_queue, f"{task_id}.json", task)
         
         logger.info(f"Created Instagram task: {task_id} (trigger: {trigger_type})")
     
@@ -228,12 +214,8 @@ Content Mix Goals:
     def check_visual_content(self) -> List[Dict]:
         """Check Done folder for visual content"""
         triggers = []
-        done_path = self.vault_path / 'Done'
         
-        if not done_path.exists():
-            return triggers
-        
-        for item in done_path.iterdir():
+        for item in self.done_cursor.new_entries():
             item_key = f"visual_content:{item.name}"
             
             if item_key in self.processed_items:
@@ -241,7 +223,7 @@ Content Mix Goals:
             
             # Read item content
             try:
-                if item.is_file() and item.suffix == '.md':
+                if item.suffix == '.md':
                     content = item.read_text(encoding='utf-8').lower()
                     
                     # Check for visual keywords
@@ -270,11 +252,11 @@ Content Mix Goals:
         triggers = []
         goals_file = self.vault_path / 'Business_Goals.md'
         
-        if not goals_file.exists():
-            return triggers
-        
         try:
-            content = goals_file.read_text(encoding='utf-8')
+            # Shared, mtime-invalidated read (one read per edit for all watchers)
+            content = get_vault_cache().read(goals_file)
+            if content is None:
+                return triggers
             lines = content.split('\n')
             
             for i, line in enumerate(lines):
@@ -326,6 +308,27 @@ Content Mix Goals:
         
         return triggers
     
+    def run_check(self) -> int:
+        """Run one check cycle; returns the number of tasks created"""
+        logger.info("Checking for Instagram opportunities...")
+        
+        all_triggers = []
+        all_triggers.extend(self.check_visual_content())
+        all_triggers.extend(self.check_business_milestones())
+        all_triggers.extend(self.check_weekly_schedule())
+        
+        for trigger in all_triggers:
+            self._create_task(trigger['type'], trigger['content'])
+            self.processed_items.add(trigger['key'])
+        self.done_cursor.commit()
+        
+        if all_triggers:
+            logger.info(f"Created {len(all_triggers)} Instagram tasks")
+        else:
+            logger.info("No new Instagram opportunities found")
+        
+        return len(all_triggers)
+    
     def monitor(self):
         """Main monitoring loop"""
         logger.info("Instagram watcher started")
@@ -334,23 +337,7 @@ Content Mix Goals:
         
         while True:
             try:
-                logger.info("Checking for Instagram opportunities...")
-                
-                all_triggers = []
-                all_triggers.extend(self.check_visual_content())
-                all_triggers.extend(self.check_business_milestones())
-                all_triggers.extend(self.check_weekly_schedule())
-                
-                for trigger in all_triggers:
-                    self._create_task(trigger['type'], trigger['content'])
-                    self.processed_items.add(trigger['key'])
-                
-                if all_triggers:
-                    self._save_state()
-                    logger.info(f"Created {len(all_triggers)} Instagram tasks")
-                else:
-                    logger.info("No new Instagram opportunities found")
-                
+                self.run_check()
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}", exc_info=True)
             
@@ -25,6 +25,10 @@ from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from dotenv import load_dotenv
 
+from orchestration.task_writer import write_task
+from orchestration.vault_cache import get_vault_cache
+from orchestration.vault_index import IndexCursor, get_vault_index
+
 load_dotenv()
 
 logging.basicConfig(
@@ -44,7 +48,7 @@ class LinkedInWatcher:
         self.vault = Path(vault_path)
         self.task_queue = Path(task_queue_path)
         self.inbox = self.task_queue / "inbox"  # PLATINUM TIER: Create drafts, not direct tasks
-        self.done = self.vault / "Done"
+        self.done_cursor = IndexCursor(get_vault_index(self.vault / "Done"), 'linkedin_watcher')
         self.business_goals = self.vault / "Business_Goals.md"
         
         self.token_path = Path(os.getenv('LINKEDIN_TOKEN_PATH', './secrets/linkedin_token.json'))
@@ -126,11 +130,11 @@ class LinkedInWatcher:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
         
         try:
-            for done_file in self.done.glob("*.md"):
-                # Check file modification time
-                mtime = datetime.fromtimestamp(done_file.stat().st_mtime, tz=timezone.utc)
+            # Only files new or changed since the last check
+            for done_file in self.done_cursor.new_entries():
+                mtime = datetime.fromtimestamp(done_file.mtime, tz=timezone.utc)
                 
-                if mtime > cutoff_time:
+                if done_file.suffix == '.md' and mtime >= cutoff_time:
                     # Read file to check if it's post-worthy
                     content = done_file.read_text(encoding='utf-8')
                     
@@ -170,9 +174,9 @@ class LinkedInWatcher:
         milestones = []
         
         try:
-            if self.business_goals.exists():
-                content = self.business_goals.read_text(encoding='utf-8')
-                
+            # Shared, mtime-invalidated read (one read per edit for all watchers)
+            content = get_vault_cache().read(self.business_goals)
+            if content is not None:
                 # Look for milestone indicators
                 milestone_keywords = [
                     'achieved', 'reached', 'surpassed', 'milestone',
@@ -248,8 +252,7 @@ class LinkedInWatcher:
         }
         
         try:
-            with open(task_file, 'w', encoding='utf-8') as f:
-                json.dump(task_data, f, indent=2, ensure_ascii=False)
+            write_task(self.inbox, task_file.name, task_data)
             
             logger.info(f"✅ Created DRAFT task (JSON): {task_file.name}")
             logger.info(f"   🔐 Draft will be reviewed locally before execution")
@@ -260,6 +263,21 @@ class LinkedInWatcher:
         except Exception as e:
             logger.error(f"Failed to create LinkedIn draft task: {e}")
     
+    def run_check(self) -> int:
+        """Run one check cycle; returns the number of opportunities found"""
+        logger.info("🔍 Checking for LinkedIn posting opportunities...")
+        
+        # Look for posting opportunities
+        opportunities = self.check_for_posting_opportunities()
+        
+        if opportunities:
+            logger.info(f"✨ Found {len(opportunities)} posting opportunities")
+            self.create_linkedin_post_task(opportunities)
+        else:
+            logger.info("📭 No new posting opportunities found")
+        self.done_cursor.commit()
+        return len(opportunities)
+    
     def run(self):
         """Main watcher loop"""
         logger.info("🚀 LinkedIn watcher started")
@@ -271,16 +289,7 @@ class LinkedInWatcher:
         
         while True:
             try:
-                logger.info("🔍 Checking for LinkedIn posting opportunities...")
-                
-                # Look for posting opportunities
-                opportunities = self.check_for_posting_opportunities()
-                
-                if opportunities:
-                    logger.info(f"✨ Found {len(opportunities)} posting opportunities")
-                    self.create_linkedin_post_task(opportunities)
-                else:
-                    logger.info("📭 No new posting opportunities found")
+                self.run_check()
                 
                 # Sleep until next check
                 logger.info(f"😴 Sleeping for {self.check_interval} seconds...")
@@ -27,6 +27,11 @@ from dotenv import load_dotenv
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from orchestration.dedupe_store import DedupeStore
+from orchestration.task_writer import write_task
+from orchestration.vault_cache import get_vault_cache
+from orchestration.vault_index import IndexCursor, get_vault_index
+
 load_dotenv()
 
 # Configure logging
@@ -53,8 +58,13 @@ class OdooWatcher:
         self.check_interval = int(os.getenv('ODOO_CHECK_INTERVAL', '3600'))  # 1 hour
         
         # Track processed items
-        self.state_file = Path('./task_queue/.odoo_watcher_state.json')
-        self.processed_items = self._load_state()
+        self.processed_items = DedupeStore(
+            Path('./task_queue/.odoo_watcher.keys.db'),
+            legacy_state=Path('./task_queue/.odoo_watcher_state.json')
+        )
+        
+        # Done/ is read incrementally (only files new or changed since the last check)
+        self.done_cursor = IndexCursor(get_vault_index(self.vault_path / 'Done'), 'odoo_watcher')
         
         # Financial keywords
         self.invoice_keywords = [
@@ -68,32 +78,9 @@ class OdooWatcher:
             'cost', 'spent', 'bought', 'subscription'
         ]
     
-    def _load_state(self) -> set:
-        """Load processed items from state file"""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get('processed_items', []))
-            except Exception as e:
-                logger.warning(f"Could not load state: {e}")
-        return set()
-    
-    def _save_state(self):
-        """Save processed items to state file"""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump({
-                    'processed_items': list(self.processed_items),
-                    'last_updated': datetime.now().isoformat()
-                }, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save state: {e}")
-    
     def _create_task(self, trigger_type: str, content: Dict[str, Any]):
         """Create Odoo task in inbox"""
         task_id = f"odoo_{trigger_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        task_file = self.task_queue / f"{task_id}.json"
         
         task = {
             'task_id': task_id,
@@ -106,8 +93,7 @@ class OdooWatcher:
             'required_skills': ['odoo_skills', 'finance_skills', 'approval_skills', 'planning_skills']
         }
         
-        with open(task_file, 'w') as f:
-            json.dump(task, f, indent=2)
+        write_task(self.task_queue, f"{task_id}.json", task)
         
         logger.info(f"Created Odoo task: {task_id} (trigger: {trigger_type})")
     
@@ -289,19 +275,15 @@ Report Format (Markdown):
     def check_done_folder(self) -> List[Dict]:
         """Check Done folder for completed projects requiring invoicing"""
         triggers = []
-        done_path = self.vault_path / 'Done'
         
-        if not done_path.exists():
-            return triggers
-        
-        for item in done_path.iterdir():
+        for item in self.done_cursor.new_entries():
             item_key = f"done_invoice:{item.name}"
             
             if item_key in self.processed_items:
                 continue
             
             try:
-                if item.is_file() and item.suffix == '.md':
+                if item.suffix == '.md':
                     content = item.read_text(encoding='utf-8').lower()
                     
                     # Check for invoice-worthy items
@@ -364,11 +346,11 @@ Report Format (Markdown):
         triggers = []
         goals_file = self.vault_path / 'Business_Goals.md'
         
-        if not goals_file.exists():
-            return triggers
-        
         try:
-            content = goals_file.read_text(encoding='utf-8')
+            # Shared, mtime-invalidated read (one read per edit for all watchers)
+            content = get_vault_cache().read(goals_file)
+            if content is None:
+                return triggers
             lines = content.split('\n')
             
             for i, line in enumerate(lines):
@@ -444,6 +426,28 @@ Report Format (Markdown):
         words = [w for w in name.split() if len(w) > 2]
         return words[0] if words else "Unknown Vendor"
     
+    def run_check(self) -> int:
+        """Run one check cycle; returns the number of tasks created"""
+        logger.info("Checking for Odoo financial events...")
+        
+        all_triggers = []
+        all_triggers.extend(self.check_done_folder())
+        all_triggers.extend(self.check_watch_inbox())
+        all_triggers.extend(self.check_business_goals())
+        all_triggers.extend(self.check_weekly_review())
+        
+        for trigger in all_triggers:
+            self._create_task(trigger['type'], trigger['content'])
+            self.processed_items.add(trigger['key'])
+        self.done_cursor.commit()
+        
+        if all_triggers:
+            logger.info(f"Created {len(all_triggers)} Odoo tasks")
+        else:
+            logger.info("No new financial events found")
+        
+        return len(all_triggers)
+    
     def monitor(self):
         """Main monitoring loop"""
         logger.info("Odoo watcher started")
@@ -452,24 +456,7 @@ Report Format (Markdown):
         
         while True:
             try:
-                logger.info("Checking for Odoo financial events...")
-                
-                all_triggers = []
-                all_triggers.extend(self.check_done_folder())
-                all_triggers.extend(self.check_watch_inbox())
-                all_triggers.extend(self.check_business_goals())
-                all_triggers.extend(self.check_weekly_review())
-                
-                for trigger in all_triggers:
-                    self._create_task(trigger['type'], trigger['content'])
-                    self.processed_items.add(trigger['key'])
-                
-                if all_triggers:
-                    self._save_state()
-                    logger.info(f"Created {len(all_triggers)} Odoo tasks")
-                else:
-                    logger.info("No new financial events found")
-                
+                self.run_check()
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}", exc_info=True)
             
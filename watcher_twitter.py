@@ -26,6 +26,11 @@ from dotenv import load_dotenv
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+from orchestration.dedupe_store import DedupeStore
+from orchestration.task_writer import write_task
+from orchestration.vault_cache import get_vault_cache
+from orchestration.vault_index import IndexCursor, get_vault_index
+
 load_dotenv()
 
 # Configure logging
@@ -51,13 +56,21 @@ class TwitterWatcher:
         self.check_interval = int(os.getenv('TWITTER_CHECK_INTERVAL', '1800'))  # 30 minutes
         
         # Track processed items
-        self.state_file = Path('./task_queue/.twitter_watcher_state.json')
-        self.processed_items = self._load_state()
+        self.processed_items = DedupeStore(
+            Path('./task_queue/.twitter_watcher.keys.db'),
+            legacy_state=Path('./task_queue/.twitter_watcher_state.json')
+        )
         
         # Track recent tweets to avoid over-posting
         self.recent_tweets_file = Path('./task_queue/.twitter_recent.json')
         self.recent_tweets = self._load_recent_tweets()
         
+        # Done/ is read incrementally: each check only sees files new or
+        # changed since it last ran (quick wins also only the last 24h)
+        done_index = get_vault_index(self.vault_path / 'Done')
+        self.quick_win_cursor = IndexCursor(done_index, 'twitter_quick_wins')
+        self.insight_cursor = IndexCursor(done_index, 'twitter_insights')
+        
         # Timely/breaking news keywords
         self.breaking_keywords = [
             'breaking', 'just', 'now', 'today', 'urgent',
@@ -73,28 +86,6 @@ class TwitterWatcher:
             'analysis', 'trend', 'observation'
         ]
     
-    def _load_state(self) -> set:
-        """Load processed items from state file"""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get('processed_items', []))
-            except Exception as e:
-                logger.warning(f"Could not load state: {e}")
-        return set()
-    
-    def _save_state(self):
-        """Save processed items to state file"""
-        try:
-            with open(self.state_file, 'w') as f:
-                json.dump({
-                    'processed_items': list(self.processed_items),
-                    'last_updated': datetime.now().isoformat()
-                }, f, indent=2)
-        except Exception as e:
-            logger.error(f"Could not save state: {e}")
-    
     def _load_recent_tweets(self) -> List[Dict]:
         """Load recent tweets from tracking file"""
         if self.recent_tweets_file.exists():
@@ -156,7 +147,6 @@ class TwitterWatcher:
     def _create_task(self, trigger_type: str, content: Dict[str, Any]):
         """Create Twitter task in inbox"""
         task_id = f"twitter_{trigger_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        task_file = self.task_queue / f"{task_id}.json"
         
         task = {
             'task_id': task_id,
@@ -169,8 +159,7 @@ class TwitterWatcher:
             'required_skills': ['twitter_skills', 'social_skills', 'approval_skills', 'planning_skills']
         }
         
-        with open(task_file, 'w') as f:
-            json.dump(task, f, indent=2)
+        write_task(self.task_queue, f"{task_id}.json", task)
         
         logger.info(f"Created Twitter task: {task_id} (trigger: {trigger_type})")
     
@@ -294,11 +283,11 @@ Content Ideas by Day:
         
         goals_file = self.vault_path / 'Business_Goals.md'
         
-        if not goals_file.exists():
-            return triggers
-        
         try:
-            content = goals_file.read_text(encoding='utf-8')
+            # Shared, mtime-invalidated read (one read per edit for all watchers)
+            content = get_vault_cache().read(goals_file)
+            if content is None:
+                return triggers
             lines = content.split('\n')
             
             # Check for recently added lines with breaking keywords
@@ -331,20 +320,11 @@ Content Ideas by Day:
         if not self._check_rate_limit('quick_win'):
             return triggers
         
-        done_path = self.vault_path / 'Done'
-        
-        if not done_path.exists():
-            return triggers
-        
         # Check items added in last 24 hours
-        cutoff = datetime.now() - timedelta(hours=24)
+        cutoff = (datetime.now() - timedelta(hours=24)).timestamp()
         
-        for item in done_path.iterdir():
-            if item.is_file() and item.suffix == '.md':
-                # Check if recent
-                if datetime.fromtimestamp(item.stat().st_mtime) < cutoff:
-                    continue
-                
+        for item in self.quick_win_cursor.new_entries():
+            if item.suffix == '.md' and item.mtime >= cutoff:
                 item_key = f"quick_win:{item.name}"
                 
                 if item_key in self.processed_items:
@@ -382,19 +362,14 @@ Content Ideas by Day:
             return triggers
         
         # Check Done folder for lessons learned
-        done_path = self.vault_path / 'Done'
-        
-        if not done_path.exists():
-            return triggers
-        
-        for item in done_path.iterdir():
+        for item in self.insight_cursor.new_entries():
             item_key = f"insight:{item.name}"
             
             if item_key in self.processed_items:
                 continue
             
             try:
-                if item.is_file() and item.suffix == '.md':
+                if item.suffix == '.md':
                     content = item.read_text(encoding='utf-8').lower()
                     
                     has_insight = any(kw in content for kw in self.insight_keywords)
@@ -439,6 +414,30 @@ Content Ideas by Day:
         
         return triggers
     
+    def run_check(self) -> int:
+        """Run one check cycle; returns the number of tasks created"""
+        logger.info("Checking for Twitter opportunities...")
+        
+        all_triggers = []
+        all_triggers.extend(self.check_breaking_news())
+        all_triggers.extend(self.check_quick_wins())
+        all_triggers.extend(self.check_insights())
+        all_triggers.extend(self.check_weekly_schedule())
+        
+        for trigger in all_triggers:
+            self._create_task(trigger['type'], trigger['content'])
+            self.processed_items.add(trigger['key'])
+            self._track_tweet(trigger['type'], trigger['key'])
+        self.quick_win_cursor.commit()
+        self.insight_cursor.commit()
+        
+        if all_triggers:
+            logger.info(f"Created {len(all_triggers)} Twitter tasks")
+        else:
+            logger.info("No new Twitter opportunities found")
+        
+        return len(all_triggers)
+    
     def monitor(self):
         """Main monitoring loop"""
         logger.info("Twitter watcher started")
@@ -447,25 +446,7 @@ Content Ideas by Day:
         
         while True:
             try:
-                logger.info("Checking for Twitter opportunities...")
-                
-                all_triggers = []
-                all_triggers.extend(self.check_breaking_news())
-                all_triggers.extend(self.check_quick_wins())
-                all_triggers.extend(self.check_insights())
-                all_triggers.extend(self.check_weekly_schedule())
-                
-                for trigger in all_triggers:
-                    self._create_task(trigger['type'], trigger['content'])
-                    self.processed_items.add(trigger['key'])
-                    self._track_tweet(trigger['type'], trigger['key'])
-                
-                if all_triggers:
-                    self._save_state()
-                    logger.info(f"Created {len(all_triggers)} Twitter tasks")
-                else:
-                    logger.info("No new Twitter opportunities found")
-                
+                self.run_check()
             except Exception as e:
                 logger.error(f"Error in monitor loop: {e}", exc_info=True)
             
@@ -11,6 +11,9 @@ Available Watchers:
 - GmailWatcher (Silver) - Watches Gmail inbox
 - WhatsAppWatcher (Silver) - Watches WhatsApp Web
 - FinanceWatcher (Silver) - Watches bank transactions
+
+Polling watchers implement connect() and poll(); watcher_host.py runs
+them (and the standalone watcher_*.py classes) in one process.
 """
 
 from watchers.base_watcher import BaseWatcher, WatcherError, WatcherConfigError, WatcherConnectionError
@@ -9,6 +9,7 @@ ARCHITECTURAL RULES:
 """
 
 import os
+import sys
 import json
 import uuid
 from abc import ABC, abstractmethod
@@ -18,6 +19,10 @@ from typing import Dict, Any, Optional
 import logging
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestration.task_writer import write_task
+
 load_dotenv()
 
 # Configure logging
@@ -57,7 +62,8 @@ class BaseWatcher(ABC):
         context: Dict[str, Any],
         priority: str = "normal",
         required_skills: Optional[list] = None,
-        hitl_required: bool = False
+        hitl_required: bool = False,
+        task_id: Optional[str] = None
     ) -> str:
         """
         Create a task file in task_queue/inbox/
@@ -68,11 +74,13 @@ class BaseWatcher(ABC):
             priority: "critical", "high", "normal", "low"
             required_skills: List of agent skill files needed (e.g., ["email_skills", "finance_skills"])
             hitl_required: Whether this task requires human approval
+            task_id: Fixed ID for an event that may be seen again (writing the
+                     same event twice then replaces one inbox file); default: new UUID
         
         Returns:
             task_id: UUID of created task
         """
-        task_id = str(uuid.uuid4())
+        task_id = task_id or str(uuid.uuid4())
         
         task = {
             "task_id": task_id,
@@ -86,10 +94,7 @@ class BaseWatcher(ABC):
             "status": "pending"
         }
         
-        task_file = self.inbox_path / f"{task_id}.json"
-        
-        with open(task_file, "w", encoding="utf-8") as f:
-            json.dump(task, f, indent=2, ensure_ascii=False)
+        write_task(self.inbox_path, f"{task_id}.json", task)
         
         self.logger.info(
             f"Task created: {task_id} | Type: {task_type} | Priority: {priority} | HITL: {hitl_required}"
@@ -134,6 +139,27 @@ class BaseWatcher(ABC):
         """
         pass
     
+    def connect(self) -> None:
+        """
+        Open connections to the event source before the first poll().
+        
+        Default: nothing to connect.
+        """
+        pass
+    
+    def poll(self) -> int:
+        """
+        Check once for new events and create their tasks.
+        
+        Polling watchers implement this: start() calls it every
+        check_interval, and the watcher host (watcher_host.py) schedules
+        it instead of running start(). Event-driven watchers do not.
+        
+        Returns:
+            Number of tasks created
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not poll")
+    
     def is_running(self) -> bool:
         """Check if watcher is currently running."""
         return self.running
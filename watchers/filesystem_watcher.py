@@ -121,6 +121,13 @@ class FilesystemWatcher(BaseWatcher):
         except Exception as e:
             self.logger.error(f"Error processing file {file_path}: {e}")
     
+    def connect(self) -> None:
+        """Start the observer; it calls on_event() from its own thread."""
+        self.observer = Observer()
+        event_handler = FilesystemEventHandler(self)
+        self.observer.schedule(event_handler, str(self.watch_path), recursive=False)
+        self.observer.start()
+    
     def start(self) -> None:
         """Start watching the directory."""
         if self.running:
@@ -128,13 +135,7 @@ class FilesystemWatcher(BaseWatcher):
             return
         
         try:
-            # Create observer
-            self.observer = Observer()
-            event_handler = FilesystemEventHandler(self)
-            self.observer.schedule(event_handler, str(self.watch_path), recursive=False)
-            
-            # Start observer
-            self.observer.start()
+            self.connect()
             self.running = True
             
             self.logger.info(f"Filesystem watcher started. Monitoring: {self.watch_path}")
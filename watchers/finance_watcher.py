@@ -4,65 +4,138 @@ Finance Watcher - Silver Tier
 Watches bank/finance accounts for transactions via API.
 Creates tasks for transactions requiring attention.
 
+Transactions are pulled incrementally, Plaid /transactions/sync style:
+each account keeps a cursor (task_queue/.finance_cursors.json), so a
+check returns only what was added since the last one. Accounts sync
+concurrently, and a transaction_id produces at most one task.
+
 DEPLOYMENT TIER: Silver
-DEPENDENCIES: plaid-python (or other finance API client)
+DEPENDENCIES: requests (speaks the Plaid REST API directly)
 NOTE: This is a template - adapt to your finance provider
 """
 
 import os
+import sys
+import json
 import time
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
-try:
-    from plaid import Client as PlaidClient  # type: ignore
-    from plaid.errors import PlaidError  # type: ignore
-    PLAID_AVAILABLE = True
-except ImportError:
-    PlaidClient = None  # type: ignore
-    PlaidError = None  # type: ignore
-    PLAID_AVAILABLE = False
+import requests
+from requests.adapters import HTTPAdapter
 
 from base_watcher import BaseWatcher, WatcherConfigError, WatcherConnectionError
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestration.dedupe_store import DedupeStore
+
 load_dotenv()
 
+# Plaid error: the item changed while paging; restart from the cursor the pagination started at
+MUTATION_DURING_PAGINATION = "TRANSACTIONS_SYNC_MUTATION_DURING_PAGINATION"
+
+
+class FinanceAPIError(Exception):
+    """Error response from the finance API (Plaid error_code / error_message)."""
+    
+    def __init__(self, code: str, message: str):
+        super().__init__(f"{code}: {message}")
+        self.code = code
+
+
+class TransactionsSyncClient:
+    """
+    Minimal Plaid /transactions/sync client over a pooled keep-alive session.
+    
+    Usage:
+        client = TransactionsSyncClient("https://sandbox.plaid.com", client_id, secret)
+        page = client.sync(access_token, cursor=None)
+        # page: added, modified, removed, next_cursor, has_more
+    """
+    
+    def __init__(self, base_url: str, client_id: str, secret: str, pool_size: int = 4, timeout: float = 30.0):
+        self.base_url = base_url.rstrip("/")
+        self.client_id = client_id
+        self.secret = secret
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def sync(self, access_token: str, cursor: Optional[str] = None, count: int = 500) -> Dict[str, Any]:
+        """One page of changes since cursor (None: from the beginning)."""
+        body: Dict[str, Any] = {
+            "client_id": self.client_id,
+            "secret": self.secret,
+            "access_token": access_token,
+            "count": count
+        }
+        if cursor:
+            body["cursor"] = cursor
+        response = self.session.post(f"{self.base_url}/transactions/sync", json=body, timeout=self.timeout)
+        data = response.json()
+        if response.status_code != 200:
+            raise FinanceAPIError(data.get("error_code", str(response.status_code)), data.get("error_message", ""))
+        return data
+    
+    def close(self) -> None:
+        self.session.close()
+
 
 class FinanceWatcher(BaseWatcher):
     """
     Watches bank accounts for transactions.
     
     Configuration (.env):
-        FINANCE_API_KEY: Finance API key (e.g., Plaid)
+        FINANCE_API_URL: Plaid API base URL, e.g. https://sandbox.plaid.com
+                         (unset: stub mode, fake transactions)
+        FINANCE_API_KEY: Finance API key / client ID (e.g., Plaid)
         FINANCE_API_SECRET: Finance API secret
-        FINANCE_ACCOUNT_IDS: Comma-separated account IDs to monitor
+        FINANCE_ACCOUNT_IDS: Comma-separated access tokens of the accounts to monitor
         FINANCE_CHECK_INTERVAL: Seconds between checks (default: 300)
         FINANCE_ALERT_THRESHOLD: Transaction amount for alerts (default: 1000)
+        FINANCE_SYNC_CONCURRENCY: Accounts synced at once (default: 4)
+        FINANCE_SYNC_PAGE_SIZE: Transactions per sync call (default: 500, Plaid's maximum)
+        FINANCE_INITIAL_DAYS: History turned into tasks on an account's first sync (default: 7)
     
     Usage:
         watcher = FinanceWatcher()
         watcher.start()
     
     NOTES:
-    - This is a template using Plaid API
+    - This is a template using the Plaid API
     - Adapt to your finance provider (Yodlee, Stripe, etc.)
-    - For Bronze tier, use stub implementation
+    - For Bronze tier, leave FINANCE_API_URL unset (stub implementation)
     """
     
     def __init__(self):
         super().__init__("finance_watcher")
         
         # Get configuration
+        self.api_url = os.getenv("FINANCE_API_URL", "")
         self.api_key = os.getenv("FINANCE_API_KEY")
         self.api_secret = os.getenv("FINANCE_API_SECRET")
-        self.account_ids = os.getenv("FINANCE_ACCOUNT_IDS", "").split(",")
+        self.account_ids = [a.strip() for a in os.getenv("FINANCE_ACCOUNT_IDS", "").split(",") if a.strip()]
         self.check_interval = int(os.getenv("FINANCE_CHECK_INTERVAL", "300"))
         self.alert_threshold = float(os.getenv("FINANCE_ALERT_THRESHOLD", "1000"))
+        self.concurrency = max(1, int(os.getenv("FINANCE_SYNC_CONCURRENCY", "4")))
+        self.page_size = int(os.getenv("FINANCE_SYNC_PAGE_SIZE", "500"))
+        self.initial_days = int(os.getenv("FINANCE_INITIAL_DAYS", "7"))
+        
+        self.client: Optional[TransactionsSyncClient] = None
         
-        self.client = None
-        self.last_check_time = None
+        # Per-account sync cursors, and transaction IDs that already have a task
+        self.cursor_file = self.inbox_path.parent / ".finance_cursors.json"
+        self.cursors: Dict[str, str] = self._load_cursors()
+        self._cursor_lock = threading.Lock()
+        self.processed_ids = DedupeStore(self.inbox_path.parent / ".finance_watcher.keys.db")
         
         # Validate configuration
         if not self.api_key or not self.api_secret:
@@ -71,74 +144,132 @@ class FinanceWatcher(BaseWatcher):
                 "Set FINANCE_API_KEY and FINANCE_API_SECRET in .env"
             )
         
-        if not PLAID_AVAILABLE:
+        if not self.api_url:
             self.logger.warning(
-                "Plaid library not installed. "
-                "Using stub implementation. "
-                "Install: pip install plaid-python"
+                "FINANCE_API_URL not set. "
+                "Using stub implementation."
             )
     
     def _connect(self) -> None:
         """Connect to finance API."""
-        if not PLAID_AVAILABLE or not PlaidClient:
-            self.logger.warning("Running in stub mode (Plaid not installed)")
+        if not self.api_url:
+            self.logger.warning("Running in stub mode (FINANCE_API_URL not set)")
             return
         
         try:
-            # Initialize Plaid client (example)
-            self.client = PlaidClient(  # type: ignore
-                client_id=self.api_key,
-                secret=self.api_secret,
-                environment='sandbox'  # Change to 'production' for real use
+            self.client = TransactionsSyncClient(
+                self.api_url,
+                client_id=self.api_key or "",
+                secret=self.api_secret or "",
+                pool_size=self.concurrency
             )
             self.logger.info("Connected to finance API")
             
         except Exception as e:
             raise WatcherConnectionError(f"Failed to connect to finance API: {e}")
     
-    def _get_recent_transactions(self) -> List[Dict[str, Any]]:
-        """Get recent transactions from all monitored accounts."""
-        if not PLAID_AVAILABLE or not self.client:
+    def _load_cursors(self) -> Dict[str, str]:
+        """Load per-account sync cursors."""
+        if self.cursor_file.exists():
+            try:
+                with open(self.cursor_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('cursors', {})
+            except Exception as e:
+                self.logger.warning(f"Could not load finance cursors: {e}")
+        return {}
+    
+    def _save_cursor(self, account_id: str, cursor: str) -> None:
+        """Persist one account's cursor (temp file + rename)."""
+        with self._cursor_lock:
+            self.cursors[account_id] = cursor
+            tmp_file = self.cursor_file.with_name(f".{self.cursor_file.name}.tmp")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'cursors': self.cursors,
+                    'updated_at': datetime.now(timezone.utc).isoformat()
+                }, f)
+            os.replace(tmp_file, self.cursor_file)
+    
+    def check_accounts(self) -> int:
+        """
+        Sync every account (concurrently) and create tasks for new transactions.
+        
+        Returns:
+            Number of tasks created
+        """
+        if not self.client:
             # Stub implementation for Bronze tier
-            return self._get_stub_transactions()
+            transactions = self._get_stub_transactions()
+            for transaction in transactions:
+                self.on_event(transaction)
+            return len(transactions)
         
-        try:
-            # Calculate date range
-            end_date = datetime.now().date()
-            start_date = end_date - timedelta(days=1)  # Last 24 hours
-            
-            # If first run, go back 7 days
-            if not self.last_check_time:
-                start_date = end_date - timedelta(days=7)
-            
-            all_transactions = []
-            
-            # Fetch transactions for each account
-            for account_id in self.account_ids:
-                if not account_id.strip():
-                    continue
-                
+        created = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="finance-sync") as pool:
+            futures = {pool.submit(self._sync_account, account_id): account_id for account_id in self.account_ids}
+            for future, account_id in futures.items():
                 try:
-                    response = self.client.Transactions.get(
-                        access_token=account_id,  # In real usage, this would be account token
-                        start_date=str(start_date),
-                        end_date=str(end_date)
-                    )
-                    
-                    transactions = response['transactions']
-                    all_transactions.extend(transactions)
-                    
-                except Exception as e:  # type: ignore
-                    # Catch PlaidError if available, otherwise general Exception
-                    self.logger.error(f"Error fetching transactions for {account_id}: {e}")
+                    created += future.result()
+                except Exception as e:
+                    # One failing account must not hold back the others; its cursor did not move
+                    self.logger.error(f"Error syncing transactions for {account_id}: {e}")
+        return created
+    
+    def _sync_account(self, account_id: str) -> int:
+        """
+        Page through an account's changes since its cursor.
+        
+        The cursor is saved only once paging is done (has_more false): a
+        mid-pagination cursor is not valid to start from. A mutation
+        during pagination, or a crash, replays from the starting cursor;
+        transactions already marked processed are skipped, and a task
+        rewritten by the replay keeps its ID.
+        """
+        assert self.client is not None
+        first_sync = account_id not in self.cursors
+        since = (datetime.now().date() - timedelta(days=self.initial_days)).isoformat() if first_sync else None
+        start_cursor = cursor = self.cursors.get(account_id)
+        created = 0
+        restarts = 0
+        
+        while True:
+            try:
+                page = self.client.sync(account_id, cursor, count=self.page_size)
+            except FinanceAPIError as e:
+                if e.code == MUTATION_DURING_PAGINATION and restarts < 3:
+                    restarts += 1
+                    cursor = start_cursor  # Pages already seen are deduplicated
                     continue
+                raise
             
-            self.last_check_time = datetime.now(timezone.utc)
-            return all_transactions
+            for transaction in page.get('added', []):
+                if since and transaction.get('date', since) < since:
+                    continue  # Older than the first-run window
+                if self._is_new(transaction):
+                    self.on_event(transaction)
+                    self.processed_ids.add(transaction['transaction_id'])
+                    created += 1
             
-        except Exception as e:
-            self.logger.error(f"Error fetching transactions: {e}")
-            return []
+            # Corrections to transactions that already have a task are not new events
+            if page.get('modified') or page.get('removed'):
+                self.logger.info(
+                    f"{account_id}: {len(page.get('modified', []))} modified, "
+                    f"{len(page.get('removed', []))} removed transactions"
+                )
+            
+            cursor = page['next_cursor']
+            if not page.get('has_more'):
+                self._save_cursor(account_id, cursor)
+                if created:
+                    self.logger.info(f"{account_id}: {created} new transactions")
+                return created
+    
+    def _is_new(self, transaction: Dict[str, Any]) -> bool:
+        """A transaction gets one task; a posted one does not repeat its pending version's."""
+        if not transaction.get('transaction_id') or transaction['transaction_id'] in self.processed_ids:
+            return False
+        pending_id = transaction.get('pending_transaction_id')
+        return not (pending_id and pending_id in self.processed_ids)
     
     def _get_stub_transactions(self) -> List[Dict[str, Any]]:
         """
@@ -202,7 +333,8 @@ class FinanceWatcher(BaseWatcher):
         """
         metadata = self._categorize_transaction(transaction)
         
-        # Create task
+        # Create task (same transaction, same task ID: a replay rewrites one file)
+        transaction_id = transaction.get('transaction_id')
         self.create_task(
             task_type="finance_transaction",
             context={
@@ -217,7 +349,8 @@ class FinanceWatcher(BaseWatcher):
             },
             priority=metadata['priority'],
             required_skills=["finance_skills"],
-            hitl_required=metadata['hitl_required']
+            hitl_required=metadata['hitl_required'],
+            task_id=str(uuid.uuid5(uuid.NAMESPACE_URL, f"finance:{transaction_id}")) if transaction_id else None
         )
         
         self.logger.info(
@@ -225,6 +358,17 @@ class FinanceWatcher(BaseWatcher):
             f"${abs(transaction.get('amount', 0)):.2f}"
         )
     
+    def connect(self) -> None:
+        """Set up the API client (stub mode without FINANCE_API_URL)."""
+        self._connect()
+    
+    def poll(self) -> int:
+        """Sync new transactions and create their tasks."""
+        created = self.check_accounts()
+        if created:
+            self.logger.info(f"Created {created} transaction tasks")
+        return created
+    
     def start(self) -> None:
         """Start watching finance accounts."""
         if self.running:
@@ -232,7 +376,7 @@ class FinanceWatcher(BaseWatcher):
             return
         
         # Connect to API
-        self._connect()
+        self.connect()
         
         self.running = True
         
@@ -244,15 +388,7 @@ class FinanceWatcher(BaseWatcher):
         
         try:
             while self.running:
-                # Get recent transactions
-                transactions = self._get_recent_transactions()
-                
-                if transactions:
-                    self.logger.info(f"Found {len(transactions)} transactions")
-                    
-                    # Process each transaction
-                    for transaction in transactions:
-                        self.on_event(transaction)
+                self.poll()
                 
                 # Wait before next check
                 time.sleep(self.check_interval)
@@ -269,6 +405,8 @@ class FinanceWatcher(BaseWatcher):
             return
         
         self.running = False
+        if self.client:
+            self.client.close()
         self.logger.info("Finance watcher stopped")
 
 
@@ -284,8 +422,8 @@ def main():
     Setup Instructions:
     1. Sign up for Plaid API (or your finance provider)
     2. Get API credentials
-    3. Set FINANCE_API_KEY and FINANCE_API_SECRET in .env
-    4. Link your bank accounts and get account IDs
+    3. Set FINANCE_API_URL, FINANCE_API_KEY and FINANCE_API_SECRET in .env
+    4. Link your bank accounts and get their access tokens
     5. Set FINANCE_ACCOUNT_IDS in .env
     
     For Bronze tier: Runs in stub mode (generates fake transactions)
@@ -0,0 +1,298 @@
+"""
+Gmail Sync - Incremental Mailbox Sync over the History API
+
+Shared by watchers/gmail_watcher.py and watcher_gmail.py.
+
+ARCHITECTURAL RULES:
+1. A poll is one users.history.list call (plus pages) from the persisted
+   history ID; new message IDs come from its messageAdded records, and
+   from labelAdded records that put one of added_labels on an existing
+   message (e.g. mail starred after it arrived). The caller's triage and
+   dedupe decide whether a re-surfaced message is new to it
+2. No history ID yet, or Gmail answers 404 (the ID is older than the
+   mailbox history Gmail keeps): full resync with messages.list, then
+   continue from the profile's current history ID
+3. Message headers (format='metadata') and bodies (format='full') are
+   fetched through the batch endpoint, GMAIL_BATCH_SIZE per request;
+   bodies only for the messages the caller keeps after triage
+4. The history ID is written to the state file by commit(), once the
+   caller has created a task for every message it kept. A failed poll or
+   fetch drops the pending ID, and a caller whose task write failed calls
+   rollback(): the next poll re-reads the same changes (at-least-once),
+   it never skips mail
+"""
+
+import os
+import json
+import time
+import base64
+import logging
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from googleapiclient.errors import HttpError
+
+# Headers triage needs; everything else waits for the full fetch
+METADATA_HEADERS = ['Subject', 'From', 'To', 'Date']
+
+# Batch sub-requests worth sending again
+RETRYABLE_STATUSES = {403, 429, 500, 502, 503, 504}
+
+
+class GmailSync:
+    """
+    Incremental Gmail sync from a persisted history ID.
+    
+    Usage:
+        sync = GmailSync(service, Path('./task_queue/.gmail_watcher_state.json'),
+                         label_ids=['INBOX'], resync_query='label:INBOX is:unread',
+                         added_labels=['STARRED'])
+        messages = sync.poll()          # Metadata of new messages
+        sync.fetch_bodies(messages)     # Adds 'body' to the ones kept
+        ...create tasks...
+        sync.commit()                   # Persist the new history ID
+                                        # (rollback() if a task failed)
+    """
+    
+    def __init__(
+        self,
+        service: Any,
+        state_file: Path,
+        label_ids: Optional[List[str]] = None,
+        resync_query: str = "is:unread",
+        added_labels: Optional[List[str]] = None,
+        logger: Optional[logging.Logger] = None
+    ):
+        self.service = service
+        self.state_file = Path(state_file)
+        self.label_ids = [label.strip() for label in (label_ids or []) if label.strip()]
+        self.resync_query = resync_query
+        self.added_labels = {label.strip() for label in (added_labels or []) if label.strip()}
+        self.logger = logger or logging.getLogger("watchers.gmail_sync")
+        
+        self.batch_size = min(int(os.getenv("GMAIL_BATCH_SIZE", "50")), 100)  # Gmail caps a batch at 100
+        self.resync_max_results = int(os.getenv("GMAIL_MAX_RESULTS", "10"))
+        self.max_retries = int(os.getenv("GMAIL_BATCH_RETRIES", "3"))
+        
+        self.history_id: Optional[str] = self._load_state()
+        self._pending_history_id: Optional[str] = None
+    
+    def _load_state(self) -> Optional[str]:
+        """Load the last committed history ID."""
+        if self.state_file.exists():
+            try:
+                with open(self.state_file, 'r', encoding='utf-8') as f:
+                    return json.load(f).get('history_id')
+            except Exception as e:
+                self.logger.warning(f"Could not load Gmail sync state: {e}")
+        return None
+    
+    def _save_state(self) -> None:
+        """Write the history ID atomically (temp file + rename)."""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.state_file.with_name(f".{self.state_file.name}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'history_id': self.history_id,
+                'updated_at': datetime.now(timezone.utc).isoformat()
+            }, f)
+        os.replace(tmp_file, self.state_file)
+    
+    def poll(self, keep: Optional[Callable[[Dict[str, Any]], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch the messages added since the last commit.
+        
+        Args:
+            keep: Triage predicate on a message's metadata; messages it
+                  rejects are dropped before any body is fetched
+        
+        Returns:
+            Message metadata dicts (see _parse_metadata), oldest first
+        
+        Raises:
+            HttpError: Gmail failed and retries did not help; nothing is committed
+        """
+        try:
+            message_ids = None
+            if self.history_id:
+                try:
+                    message_ids = self._history_since(self.history_id)
+                except HttpError as e:
+                    if e.resp.status != 404:
+                        raise
+                    self.logger.warning(f"History ID {self.history_id} expired, running a full resync")
+            if message_ids is None:
+                message_ids = self._full_resync()
+            
+            messages = self.fetch_metadata(message_ids)
+            if keep:
+                messages = [m for m in messages if keep(m)]
+            return messages
+        except BaseException:
+            self.rollback()
+            raise
+    
+    def commit(self) -> None:
+        """Persist the history ID reached by the last poll() (call once every kept message has its task)."""
+        if self._pending_history_id and self._pending_history_id != self.history_id:
+            self.history_id = self._pending_history_id
+            self._save_state()
+        self._pending_history_id = None
+    
+    def rollback(self) -> None:
+        """Forget the last poll(): the next one reads the same changes again."""
+        self._pending_history_id = None
+    
+    def _history_since(self, start_history_id: str) -> List[str]:
+        """IDs of messages added to the watched labels, or given one of added_labels, since start_history_id."""
+        message_ids: Dict[str, None] = {}  # Ordered set
+        page_token = None
+        while True:
+            params: Dict[str, Any] = {
+                'userId': 'me',
+                'startHistoryId': start_history_id,
+                'historyTypes': ['messageAdded', 'labelAdded'] if self.added_labels else ['messageAdded'],
+                'maxResults': 500
+            }
+            if len(self.label_ids) == 1:
+                params['labelId'] = self.label_ids[0]  # Gmail filters a single label server-side
+            if page_token:
+                params['pageToken'] = page_token
+            response = self.service.users().history().list(**params).execute()
+            
+            for record in response.get('history', []):
+                for added in record.get('messagesAdded', []):
+                    message = added['message']
+                    if self._in_watched_labels(message.get('labelIds', [])):
+                        message_ids[message['id']] = None
+                for labeled in record.get('labelsAdded', []):
+                    message = labeled['message']
+                    newly = self.added_labels & set(labeled.get('labelIds', []))
+                    if newly and self._in_watched_labels(message.get('labelIds', [])):
+                        message_ids[message['id']] = None
+            
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                self._pending_history_id = response.get('historyId', start_history_id)
+                return list(message_ids)
+    
+    def _full_resync(self) -> List[str]:
+        """Latest unread messages by query; continues from the current history ID."""
+        # Read the history ID first: mail arriving during the listing is
+        # reported again by the next history call rather than missed
+        profile = self.service.users().getProfile(userId='me').execute()
+        self._pending_history_id = str(profile['historyId'])
+        
+        results = self.service.users().messages().list(
+            userId='me',
+            q=self.resync_query,
+            maxResults=self.resync_max_results
+        ).execute()
+        message_ids = [m['id'] for m in results.get('messages', [])]
+        message_ids.reverse()  # messages.list is newest first
+        
+        self.logger.info(f"Full resync: {len(message_ids)} messages, history ID {self._pending_history_id}")
+        return message_ids
+    
+    def _in_watched_labels(self, label_ids: List[str]) -> bool:
+        return not self.label_ids or any(label in label_ids for label in self.label_ids)
+    
+    def fetch_metadata(self, message_ids: List[str]) -> List[Dict[str, Any]]:
+        """Headers, labels and snippet of each message, through batch requests."""
+        try:
+            responses = self._batch_get(message_ids, format='metadata', metadataHeaders=METADATA_HEADERS)
+        except BaseException:
+            self.rollback()
+            raise
+        return [self._parse_metadata(responses[mid]) for mid in message_ids if mid in responses]
+    
+    def fetch_bodies(self, messages: List[Dict[str, Any]]) -> None:
+        """Add the plain text 'body' to each message dict, through batch requests."""
+        try:
+            responses = self._batch_get([m['message_id'] for m in messages], format='full')
+        except BaseException:
+            self.rollback()
+            raise
+        for message in messages:
+            full = responses.get(message['message_id'])
+            message['body'] = get_message_body(full['payload']) if full else "[Message deleted]"
+    
+    def fetch_body(self, message_id: str) -> str:
+        """Plain text body of one message."""
+        message = self.service.users().messages().get(userId='me', id=message_id, format='full').execute()
+        return get_message_body(message['payload'])
+    
+    def _batch_get(self, message_ids: List[str], **params: Any) -> Dict[str, Dict[str, Any]]:
+        """
+        messages.get for every ID, GMAIL_BATCH_SIZE sub-requests per HTTP request.
+        
+        Deleted messages (404) are left out. Rate-limited and 5xx
+        sub-requests are sent again in a later batch with backoff.
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        pending = list(message_ids)
+        attempt = 0
+        while pending:
+            failed: List[str] = []
+            errors: Dict[str, HttpError] = {}
+            
+            def callback(request_id: str, response: Dict[str, Any], exception: Optional[HttpError]) -> None:
+                if exception is None:
+                    results[request_id] = response
+                elif exception.resp.status == 404:
+                    self.logger.info(f"Message {request_id} was deleted before it could be read")
+                elif exception.resp.status in RETRYABLE_STATUSES:
+                    failed.append(request_id)
+                    errors[request_id] = exception
+                else:
+                    raise exception
+            
+            for start in range(0, len(pending), self.batch_size):
+                batch = self.service.new_batch_http_request(callback=callback)
+                for message_id in pending[start:start + self.batch_size]:
+                    batch.add(
+                        self.service.users().messages().get(userId='me', id=message_id, **params),
+                        request_id=message_id
+                    )
+                batch.execute()
+            
+            if failed and attempt >= self.max_retries:
+                raise errors[failed[0]]
+            if failed:
+                attempt += 1
+                time.sleep(0.5 * 2 ** (attempt - 1))
+            pending = failed
+        return results
+    
+    @staticmethod
+    def _parse_metadata(message: Dict[str, Any]) -> Dict[str, Any]:
+        headers = {h['name']: h['value'] for h in message.get('payload', {}).get('headers', [])}
+        return {
+            "message_id": message['id'],
+            "thread_id": message.get('threadId', message['id']),
+            "subject": headers.get('Subject', 'No Subject'),
+            "from": headers.get('From', 'Unknown'),
+            "to": headers.get('To', 'Unknown'),
+            "date": headers.get('Date', 'Unknown'),
+            "labels": message.get('labelIds', []),
+            "snippet": message.get('snippet', '')
+        }
+
+
+def get_message_body(payload: Dict[str, Any]) -> str:
+    """Extract the plain text body from a format='full' payload."""
+    if 'parts' in payload:
+        # Multipart message
+        for part in payload['parts']:
+            if part['mimeType'] == 'text/plain':
+                data = part['body'].get('data', '')
+                if data:
+                    return base64.urlsafe_b64decode(data).decode('utf-8')
+    else:
+        # Simple message
+        data = payload.get('body', {}).get('data', '')
+        if data:
+            return base64.urlsafe_b64decode(data).decode('utf-8')
+    
+    return "[No plain text body]"
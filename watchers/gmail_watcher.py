@@ -4,16 +4,18 @@ Gmail Watcher - Silver Tier
 Watches Gmail inbox for new emails via Gmail API.
 Creates tasks for emails that match configured criteria.
 
+Polls incrementally: users.history.list from the history ID persisted
+in task_queue/.gmail_watcher_state.json (see watchers/gmail_sync.py),
+so an idle check is one API call and a restart resumes where it stopped.
+
 DEPLOYMENT TIER: Silver
 DEPENDENCIES: google-api-python-client, google-auth
 """
 
 import os
 import pickle
-import base64
 from pathlib import Path
-from typing import Any, List, Dict, Optional
-from email.mime.text import MIMEText
+from typing import Any, List, Dict, Optional, Union
 from datetime import datetime, timezone
 
 from google.auth.transport.requests import Request
@@ -24,9 +26,15 @@ from googleapiclient.errors import HttpError
 from typing import cast
 
 from base_watcher import BaseWatcher, WatcherConfigError, WatcherConnectionError
+from gmail_sync import GmailSync
 from dotenv import load_dotenv
+import sys
 import time
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestration.dedupe_store import DedupeStore
+
 load_dotenv()
 
 # Gmail API scopes
@@ -42,6 +50,9 @@ class GmailWatcher(BaseWatcher):
         GMAIL_TOKEN_PATH: Path to store OAuth2 token
         GMAIL_WATCH_LABELS: Comma-separated labels to watch (default: INBOX)
         GMAIL_CHECK_INTERVAL: Seconds between checks (default: 60)
+        GMAIL_MAX_RESULTS: Unread messages picked up by a full resync (default: 10)
+        GMAIL_BATCH_SIZE: messages.get calls per batch request (default: 50)
+        DEDUPE_MESSAGE_TTL_DAYS: How long a handled message ID is remembered (default: 30)
     
     Usage:
         watcher = GmailWatcher()
@@ -58,7 +69,14 @@ class GmailWatcher(BaseWatcher):
         self.check_interval = int(os.getenv("GMAIL_CHECK_INTERVAL", "60"))
         
         self.service = None
-        self.last_history_id = None
+        self.sync: Optional[GmailSync] = None
+        self.state_file = self.inbox_path.parent / ".gmail_watcher_state.json"
+        
+        # History replays after a crash or resync must not repeat tasks
+        self.processed_ids = DedupeStore(
+            self.inbox_path.parent / ".gmail_watcher.keys.db",
+            ttl_seconds=float(os.getenv("DEDUPE_MESSAGE_TTL_DAYS", "30")) * 86400
+        )
         
         # Validate configuration
         if not Path(self.credentials_path).exists():
@@ -104,105 +122,74 @@ class GmailWatcher(BaseWatcher):
             self.logger.info("Connected to Gmail API")
         except Exception as e:
             raise WatcherConnectionError(f"Failed to connect to Gmail: {e}")
+        self._init_sync()
+    
+    def _init_sync(self) -> None:
+        """Start incremental sync on the connected service."""
+        query = " OR ".join(f"label:{label.strip()}" for label in self.watch_labels) + " is:unread"
+        self.sync = GmailSync(
+            self.service,
+            self.state_file,
+            label_ids=self.watch_labels,
+            resync_query=query,
+            added_labels=self.watch_labels,  # Unread mail moved into a watched label
+            logger=self.logger
+        )
     
     def _get_message_details(self, message_id: str) -> Optional[Dict[str, Any]]:
-        """Get full message details."""
-        if not self.service:
+        """Get headers and body of one message."""
+        if not self.sync:
             return None
         
         try:
-            message = self.service.users().messages().get(
-                userId='me',
-                id=message_id,
-                format='full'
-            ).execute()
-            
-            # Parse headers
-            headers = message['payload']['headers']
-            subject = next((h['value'] for h in headers if h['name'] == 'Subject'), 'No Subject')
-            from_email = next((h['value'] for h in headers if h['name'] == 'From'), 'Unknown')
-            to_email = next((h['value'] for h in headers if h['name'] == 'To'), 'Unknown')
-            date = next((h['value'] for h in headers if h['name'] == 'Date'), 'Unknown')
-            
-            # Get body
-            body = self._get_message_body(message['payload'])
-            
-            # Get thread ID
-            thread_id = message.get('threadId', message_id)
-            
-            return {
-                "message_id": message_id,
-                "thread_id": thread_id,
-                "subject": subject,
-                "from": from_email,
-                "to": to_email,
-                "date": date,
-                "body": body[:5000],  # Limit body size
-                "labels": message.get('labelIds', []),
-                "snippet": message.get('snippet', '')
-            }
+            messages = self.sync.fetch_metadata([message_id])
+            if not messages:
+                return None
+            self.sync.fetch_bodies(messages)
+            details = messages[0]
+            details["body"] = details["body"][:5000]  # Limit body size
+            return details
             
         except HttpError as e:
             self.logger.error(f"Error fetching message {message_id}: {e}")
             return None
     
-    def _get_message_body(self, payload: Dict) -> str:
-        """Extract message body from payload."""
-        if 'parts' in payload:
-            # Multipart message
-            for part in payload['parts']:
-                if part['mimeType'] == 'text/plain':
-                    data = part['body'].get('data', '')
-                    if data:
-                        return base64.urlsafe_b64decode(data).decode('utf-8')
-        else:
-            # Simple message
-            data = payload['body'].get('data', '')
-            if data:
-                return base64.urlsafe_b64decode(data).decode('utf-8')
-        
-        return "[No plain text body]"
+    def _is_unread(self, message: Dict[str, Any]) -> bool:
+        """Triage on metadata: only new mail still unread gets a body fetch and a task."""
+        return 'UNREAD' in message['labels'] and message['message_id'] not in self.processed_ids
     
-    def _check_for_new_messages(self) -> List[str]:
-        """Check for new messages matching watch criteria."""
-        if not self.service:
+    def _check_for_new_messages(self) -> List[Dict[str, Any]]:
+        """
+        Get messages added to the watched labels since the last check.
+        
+        One history.list call when nothing changed; otherwise batched
+        header fetches, then batched body fetches for unread mail.
+        """
+        if not self.sync:
             return []
         
         try:
-            # Build query
-            query_parts = []
-            for label in self.watch_labels:
-                query_parts.append(f"label:{label.strip()}")
-            query = " OR ".join(query_parts)
-            query += " is:unread"  # Only unread messages
-            
-            # List messages
-            results = self.service.users().messages().list(
-                userId='me',
-                q=query,
-                maxResults=10  # Process in batches
-            ).execute()
-            
-            messages = results.get('messages', [])
+            messages = self.sync.poll(keep=self._is_unread)
+            self.sync.fetch_bodies(messages)
+            for message in messages:
+                message["body"] = message["body"][:5000]  # Limit body size
             
             if messages:
-                self.logger.info(f"Found {len(messages)} unread messages")
-                return [msg['id'] for msg in messages]
-            
-            return []
+                self.logger.info(f"Found {len(messages)} new unread messages")
+            return messages
             
         except HttpError as e:
             self.logger.error(f"Error checking for messages: {e}")
             return []
     
-    def on_event(self, message_id: str) -> None:
+    def on_event(self, message: Union[str, Dict[str, Any]]) -> None:
         """
         Handle a new email by creating a task.
         
         Args:
-            message_id: Gmail message ID
+            message: Message details from _check_for_new_messages, or a Gmail message ID
         """
-        details = self._get_message_details(message_id)
+        details = self._get_message_details(message) if isinstance(message, str) else message
         
         if not details:
             return
@@ -229,9 +216,33 @@ class GmailWatcher(BaseWatcher):
             required_skills=["email_skills"],
             hitl_required=hitl_required
         )
+        self.processed_ids.add(details['message_id'])
         
         self.logger.info(f"Task created for email: {details['subject'][:50]}")
     
+    def connect(self) -> None:
+        """Connect to Gmail and load the sync state."""
+        self._connect()
+    
+    def poll(self) -> int:
+        """Create tasks for new messages, then move the history ID past them (only if all were created)."""
+        messages = self._check_for_new_messages()
+        failed = 0
+        for message in messages:
+            try:
+                self.on_event(message)
+            except Exception as e:
+                failed += 1
+                self.logger.error(f"Could not create a task for message {message['message_id']}: {e}")
+        
+        if failed:
+            # Created tasks are deduplicated when the same changes are read again
+            self.logger.warning(f"{failed} message(s) without a task; history ID not advanced")
+            self.sync.rollback()
+        else:
+            self.sync.commit()
+        return len(messages)
+    
     def start(self) -> None:
         """Start watching Gmail."""
         if self.running:
@@ -239,7 +250,7 @@ class GmailWatcher(BaseWatcher):
             return
         
         # Connect to Gmail
-        self._connect()
+        self.connect()
         
         self.running = True
         
@@ -247,12 +258,7 @@ class GmailWatcher(BaseWatcher):
         
         try:
             while self.running:
-                # Check for new messages
-                message_ids = self._check_for_new_messages()
-                
-                # Process each message
-                for message_id in message_ids:
-                    self.on_event(message_id)
+                self.poll()
                 
                 # Wait before next check
                 time.sleep(self.check_interval)
@@ -10,6 +10,7 @@ WARNING: Requires browser automation, can be fragile
 """
 
 import os
+import sys
 import json
 import time
 from pathlib import Path
@@ -29,6 +30,10 @@ except ImportError:
 from base_watcher import BaseWatcher, WatcherConfigError, WatcherConnectionError
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from orchestration.dedupe_store import DedupeStore
+
 load_dotenv()
 
 
@@ -39,6 +44,7 @@ class WhatsAppWatcher(BaseWatcher):
     Configuration (.env):
         WHATSAPP_SESSION_PATH: Path to store session data
         WHATSAPP_CHECK_INTERVAL: Seconds between checks (default: 10)
+        DEDUPE_MESSAGE_TTL_DAYS: How long a seen message is remembered (default: 30)
     
     Usage:
         watcher = WhatsAppWatcher()
@@ -65,7 +71,11 @@ class WhatsAppWatcher(BaseWatcher):
         self.page: Optional[Page] = None  # type: ignore
         self.playwright: Optional[Playwright] = None  # type: ignore
         
-        self.last_message_ids = set()
+        # Seen messages survive restarts (task_queue/.whatsapp_watcher.keys.db)
+        self.last_message_ids = DedupeStore(
+            self.inbox_path.parent / ".whatsapp_watcher.keys.db",
+            ttl_seconds=float(os.getenv("DEDUPE_MESSAGE_TTL_DAYS", "30")) * 86400
+        )
     
     def _launch_browser(self) -> None:
         """Launch browser with persistent context."""
@@ -206,6 +216,33 @@ class WhatsAppWatcher(BaseWatcher):
         
         self.logger.info(f"Task created for WhatsApp message from: {chat_details['contact']}")
     
+    def connect(self) -> None:
+        """Launch the browser and open WhatsApp Web."""
+        self._launch_browser()
+        self._connect_whatsapp()
+    
+    def poll(self) -> int:
+        """Create tasks for unread chats not seen before."""
+        created = 0
+        unread_chats = self._get_unread_chats()
+        
+        if unread_chats:
+            self.logger.info(f"Found {len(unread_chats)} unread chats")
+            
+            # Process each chat
+            for chat in unread_chats:
+                details = self._get_chat_details(chat)
+                if details:
+                    # Generate unique ID for this message
+                    msg_id = f"{details['contact']}_{details['last_message'][:20]}"
+                    
+                    # Only process if not seen before
+                    if msg_id not in self.last_message_ids:
+                        self.on_event(details)
+                        self.last_message_ids.add(msg_id)
+                        created += 1
+        return created
+    
     def start(self) -> None:
         """Start watching WhatsApp."""
         if self.running:
@@ -213,8 +250,7 @@ class WhatsAppWatcher(BaseWatcher):
             return
         
         # Launch browser and connect
-        self._launch_browser()
-        self._connect_whatsapp()
+        self.connect()
         
         self.running = True
         
@@ -222,23 +258,7 @@ class WhatsAppWatcher(BaseWatcher):
         
         try:
             while self.running:
-                # Get unread chats
-                unread_chats = self._get_unread_chats()
-                
-                if unread_chats:
-                    self.logger.info(f"Found {len(unread_chats)} unread chats")
-                    
-                    # Process each chat
-                    for chat in unread_chats:
-                        details = self._get_chat_details(chat)
-                        if details:
-                            # Generate unique ID for this message
-                            msg_id = f"{details['contact']}_{details['last_message'][:20]}"
-                            
-                            # Only process if not seen before
-                            if msg_id not in self.last_message_ids:
-                                self.on_event(details)
-                                self.last_message_ids.add(msg_id)
+                self.poll()
                 
                 # Wait before next check
                 time.sleep(self.check_interval)